@@ -1,9 +1,32 @@
-from fastapi import APIRouter, HTTPException, Response, status
+from itertools import islice
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from pydantic import ValidationError
 
-from jukebox.adapters.inbound.admin.api.models import DiscInput, DiscOutput, DiscPatchInput
+from jukebox.adapters.inbound.admin.api.models import (
+    DiscBatchInput,
+    DiscBatchOutput,
+    DiscInput,
+    DiscOutput,
+    DiscPatchInput,
+    DiscSearchOutput,
+    DiscSearchResultOutput,
+)
 from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
-from jukebox.domain.use_cases import AddDisc, EditDisc, GetDisc, ListDiscs, RemoveDisc
+from jukebox.domain.errors import InvalidDiscChangesError
+from jukebox.domain.use_cases import (
+    AddDisc,
+    BulkApplyDiscChanges,
+    EditDisc,
+    GetDisc,
+    ListDiscs,
+    RemoveDisc,
+    SearchDiscs,
+)
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
 
 
 def build_discs_router(
@@ -12,6 +35,8 @@ def build_discs_router(
     remove_disc: RemoveDisc,
     edit_disc: EditDisc,
     get_disc: GetDisc,
+    search_discs: SearchDiscs,
+    bulk_apply_disc_changes: BulkApplyDiscChanges,
 ) -> APIRouter:
     router = APIRouter(prefix="/api/v1", tags=["discs"])
 
@@ -22,6 +47,38 @@ def build_discs_router(
         except Exception as err:
             raise HTTPException(status_code=500, detail=f"Server error: {err!s}")
 
+    @router.get("/discs:search", response_model=DiscSearchOutput, summary="Search discs")
+    def search_discs_route(
+        q: str,
+        offset: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[int, Query(ge=1, le=SEARCH_MAX_LIMIT)] = SEARCH_DEFAULT_LIMIT,
+    ) -> DiscSearchOutput:
+        try:
+            results = search_discs.execute(q)
+        except Exception as err:
+            raise HTTPException(status_code=500, detail=f"Server error: {err!s}")
+
+        return DiscSearchOutput(
+            query=q,
+            total=len(results),
+            offset=offset,
+            limit=limit,
+            results=[
+                DiscSearchResultOutput(tag_id=tag_id, disc=DiscOutput(**disc.model_dump()))
+                for tag_id, disc in islice(results.items(), offset, offset + limit)
+            ],
+        )
+
+    @router.post("/discs:batch", response_model=DiscBatchOutput, summary="Apply a batch of disc changes")
+    def apply_disc_changes_route(batch: DiscBatchInput) -> DiscBatchOutput:
+        try:
+            summary = bulk_apply_disc_changes.execute(batch.changes)
+            return DiscBatchOutput(**summary.model_dump())
+        except InvalidDiscChangesError as err:
+            raise HTTPException(status_code=409, detail=err.errors)
+        except Exception as err:
+            raise HTTPException(status_code=500, detail=f"Server error: {err!s}")
+
     @router.get("/discs/{tag_id}", response_model=DiscOutput, summary="Get a disc")
     def get_disc_route(tag_id: str) -> Disc:
         try:
@@ -2,7 +2,7 @@ from typing import Any
 
 from pydantic import BaseModel, RootModel
 
-from jukebox.domain.entities import CurrentTagStatus, Disc
+from jukebox.domain.entities import CurrentTagStatus, Disc, DiscChange, DiscChangesSummary
 
 
 class DiscInput(Disc):
@@ -31,6 +31,18 @@ class DiscPatchInput(BaseModel):
     option: DiscPatchOptionInput | None = None
 
 
+class DiscChangeInput(DiscChange):
+    pass
+
+
+class DiscBatchInput(BaseModel):
+    changes: list[DiscChangeInput]
+
+
+class DiscBatchOutput(DiscChangesSummary):
+    pass
+
+
 class CurrentTagStatusOutput(CurrentTagStatus):
     pass
 
@@ -40,6 +52,19 @@ class CurrentTagDiscOutput(BaseModel):
     disc: DiscOutput
 
 
+class DiscSearchResultOutput(BaseModel):
+    tag_id: str
+    disc: DiscOutput
+
+
+class DiscSearchOutput(BaseModel):
+    query: str
+    total: int
+    offset: int
+    limit: int
+    results: list[DiscSearchResultOutput]
+
+
 class SettingsResetInput(BaseModel):
     path: str
 
@@ -10,9 +10,13 @@ try:
     from jukebox.adapters.inbound.admin.api.models import (
         CurrentTagDiscOutput,
         CurrentTagStatusOutput,
+        DiscBatchInput,
+        DiscBatchOutput,
         DiscInput,
         DiscOutput,
         DiscPatchInput,
+        DiscSearchOutput,
+        DiscSearchResultOutput,
         SettingsPatchInput,
         SettingsResetInput,
     )
@@ -21,7 +25,16 @@ except ModuleNotFoundError as e:
     if e.name != "fastapi":
         raise
     raise MissingOptionalDependencyError("The `api_controller` module", "api", "jukebox-admin api") from e
-from jukebox.domain.use_cases import AddDisc, EditDisc, GetCurrentTagStatus, GetDisc, ListDiscs, RemoveDisc
+from jukebox.domain.use_cases import (
+    AddDisc,
+    BulkApplyDiscChanges,
+    EditDisc,
+    GetCurrentTagStatus,
+    GetDisc,
+    ListDiscs,
+    RemoveDisc,
+    SearchDiscs,
+)
 from jukebox.settings.entities import SelectedSonosGroupSettings
 from jukebox.settings.selected_sonos_group_repository import SettingsSelectedSonosGroupRepository
 from jukebox.settings.service_protocols import SettingsService
@@ -33,9 +46,13 @@ __all__ = [
     "APIController",
     "CurrentTagDiscOutput",
     "CurrentTagStatusOutput",
+    "DiscBatchInput",
+    "DiscBatchOutput",
     "DiscInput",
     "DiscOutput",
     "DiscPatchInput",
+    "DiscSearchOutput",
+    "DiscSearchResultOutput",
     "SettingsPatchInput",
     "SettingsResetInput",
     "SonosSelectionInput",
@@ -86,6 +103,8 @@ class APIController:
         remove_disc: RemoveDisc,
         edit_disc: EditDisc,
         get_disc: GetDisc,
+        search_discs: SearchDiscs,
+        bulk_apply_disc_changes: BulkApplyDiscChanges,
         get_current_tag_status: GetCurrentTagStatus,
         settings_service: SettingsService,
         sonos_service: SonosService,
@@ -95,6 +114,8 @@ class APIController:
         self.remove_disc = remove_disc
         self.edit_disc = edit_disc
         self.get_disc = get_disc
+        self.search_discs = search_discs
+        self.bulk_apply_disc_changes = bulk_apply_disc_changes
         self.get_current_tag_status = get_current_tag_status
         self.settings_service = settings_service
         self.sonos_service = sonos_service
@@ -114,6 +135,8 @@ class APIController:
                 remove_disc=self.remove_disc,
                 edit_disc=self.edit_disc,
                 get_disc=self.get_disc,
+                search_discs=self.search_discs,
+                bulk_apply_disc_changes=self.bulk_apply_disc_changes,
             )
         )
         self.app.include_router(
@@ -1,16 +1,27 @@
 import typer
 
 from jukebox.adapters.inbound.admin.cli_display import display_disc, display_library_line, display_library_table
+from jukebox.adapters.inbound.admin.cli_import import read_disc_changes_csv
 from jukebox.admin.library_commands import (
     CliAddCommand,
     CliEditCommand,
     CliGetCommand,
+    CliImportCommand,
     CliListCommand,
     CliRemoveCommand,
     CliSearchCommand,
 )
 from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
-from jukebox.domain.use_cases import AddDisc, EditDisc, GetDisc, ListDiscs, RemoveDisc, ResolveTagId, SearchDiscs
+from jukebox.domain.use_cases import (
+    AddDisc,
+    BulkApplyDiscChanges,
+    EditDisc,
+    GetDisc,
+    ListDiscs,
+    RemoveDisc,
+    ResolveTagId,
+    SearchDiscs,
+)
 
 
 class CLIController:
@@ -23,6 +34,7 @@ class CLIController:
         get_disc: GetDisc,
         search_discs: SearchDiscs,
         resolve_tag_id: ResolveTagId,
+        bulk_apply_disc_changes: BulkApplyDiscChanges,
     ):
         self.add_disc = add_disc
         self.list_discs = list_discs
@@ -31,10 +43,17 @@ class CLIController:
         self.get_disc = get_disc
         self.search_discs = search_discs
         self.resolve_tag_id = resolve_tag_id
+        self.bulk_apply_disc_changes = bulk_apply_disc_changes
 
     def run(
         self,
-        command: CliAddCommand | CliListCommand | CliRemoveCommand | CliEditCommand | CliGetCommand | CliSearchCommand,
+        command: CliAddCommand
+        | CliListCommand
+        | CliRemoveCommand
+        | CliEditCommand
+        | CliGetCommand
+        | CliSearchCommand
+        | CliImportCommand,
     ) -> None:
         match command:
             case CliAddCommand():
@@ -49,6 +68,8 @@ class CLIController:
                 self.get_disc_flow(command)
             case CliSearchCommand():
                 self.search_discs_flow(command)
+            case CliImportCommand():
+                self.import_discs_flow(command)
 
     def add_disc_flow(self, command: CliAddCommand) -> None:
         tag = self.resolve_tag_id.execute(command.tag, command.use_current_tag)
@@ -108,3 +129,8 @@ class CLIController:
             return
         typer.echo(f"Found {len(results)} disc(s) matching '{command.query}':")
         display_library_table(results)
+
+    def import_discs_flow(self, command: CliImportCommand) -> None:
+        changes = read_disc_changes_csv(command.path)
+        summary = self.bulk_apply_disc_changes.execute(changes)
+        typer.echo(f"✅ {summary.added} disc(s) added and {summary.updated} updated from {command.path}")
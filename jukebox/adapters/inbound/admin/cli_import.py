@@ -0,0 +1,54 @@
+import csv
+
+from pydantic import ValidationError
+
+from jukebox.domain.entities import DiscChange
+
+REQUIRED_COLUMNS = ("tag_id", "uri")
+METADATA_COLUMNS = ("artist", "album", "track", "playlist")
+_DELIMITERS = ",;\t"
+
+
+def read_disc_changes_csv(path: str) -> list[DiscChange]:
+    """Read one `upsert` change per row of a CSV file with a header row.
+
+    Columns are `tag_id` and `uri`, then optionally `artist`, `album`, `track`,
+    `playlist` and `shuffle`; other columns are ignored. Comma, semicolon and tab
+    delimiters are detected. Every invalid row is reported in a single `ValueError`.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as csv_file:
+        sample = csv_file.read(64 * 1024)
+        csv_file.seek(0)
+        try:
+            dialect: type[csv.Dialect] | csv.Dialect = csv.Sniffer().sniff(sample, delimiters=_DELIMITERS)
+        except csv.Error:
+            dialect = csv.excel
+
+        reader = csv.DictReader(csv_file, dialect=dialect)
+        missing_columns = [column for column in REQUIRED_COLUMNS if column not in (reader.fieldnames or [])]
+        if missing_columns:
+            raise ValueError(f"Missing CSV columns: {', '.join(missing_columns)}")
+
+        changes: list[DiscChange] = []
+        errors: list[str] = []
+        for row in reader:
+            values = {column: (value or "").strip() or None for column, value in row.items() if column is not None}
+            try:
+                changes.append(
+                    DiscChange(
+                        action="upsert",
+                        tag_id=values["tag_id"],
+                        disc={
+                            "uri": values["uri"],
+                            "metadata": {column: values.get(column) for column in METADATA_COLUMNS},
+                            "option": {"shuffle": values.get("shuffle") or False},
+                        },
+                    )
+                )
+            except ValidationError as err:
+                details = ", ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in err.errors())
+                errors.append(f"Line {reader.line_num}: {details}")
+
+    if errors:
+        raise ValueError("Invalid CSV rows, nothing was imported:\n" + "\n".join(errors))
+    return changes
@@ -20,7 +20,16 @@ from jukebox.adapters.inbound.admin.ui_pages.library import DiscForm, LibraryUIP
 from jukebox.adapters.inbound.admin.ui_pages.settings import SettingsUIPageBuilder
 from jukebox.adapters.inbound.admin.ui_pages.sonos import SonosSelectionForm, SonosUIPageBuilder
 from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
-from jukebox.domain.use_cases import AddDisc, EditDisc, GetCurrentTagStatus, GetDisc, ListDiscs, RemoveDisc
+from jukebox.domain.use_cases import (
+    AddDisc,
+    BulkApplyDiscChanges,
+    EditDisc,
+    GetCurrentTagStatus,
+    GetDisc,
+    ListDiscs,
+    RemoveDisc,
+    SearchDiscs,
+)
 from jukebox.settings.definitions import get_setting_definition
 from jukebox.settings.errors import SettingsError
 from jukebox.settings.selected_sonos_group_repository import SettingsSelectedSonosGroupRepository
@@ -44,6 +53,8 @@ class UIController(APIController):
         remove_disc: RemoveDisc,
         edit_disc: EditDisc,
         get_disc: GetDisc,
+        search_discs: SearchDiscs,
+        bulk_apply_disc_changes: BulkApplyDiscChanges,
         get_current_tag_status: GetCurrentTagStatus,
         settings_service: SettingsService,
         sonos_service: SonosService,
@@ -62,6 +73,8 @@ class UIController(APIController):
             remove_disc,
             edit_disc,
             get_disc,
+            search_discs,
+            bulk_apply_disc_changes,
             get_current_tag_status,
             settings_service,
             sonos_service,
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+
+from jukebox.domain.entities import CurrentTagState, Idle, NoTag, PlaybackState, TagEvent
+from jukebox.domain.ports import AsyncPlayerPort, AsyncReaderPort
+from jukebox.domain.use_cases import AsyncHandleTagEvent, PrefetchDisc, SyncCurrentTag
+from jukebox.shared.timing import DEFAULT_LOOP_INTERVAL_SECONDS
+
+from .loop_pacer import LoopPacer
+from .reader_power_saver import ReaderPowerSaver
+from .tag_event_producer import DEFAULT_TAG_EVENT_QUEUE_SIZE
+
+LOGGER = logging.getLogger("jukebox")
+
+
+class AsyncCLIController:
+    """Asyncio controller running tag reads and playback as concurrent tasks.
+
+    Reads are paced on their own task and queued, so player commands and
+    current-tag persistence never delay the next read, and other coroutines
+    can share the same event loop through `serve`.
+    """
+
+    def __init__(
+        self,
+        reader: AsyncReaderPort,
+        handle_tag_event: AsyncHandleTagEvent,
+        sync_current_tag: SyncCurrentTag,
+        loop_interval_seconds: float = DEFAULT_LOOP_INTERVAL_SECONDS,
+        event_queue_size: int = DEFAULT_TAG_EVENT_QUEUE_SIZE,
+        pacer: LoopPacer | None = None,
+        power_saver: ReaderPowerSaver | None = None,
+        prefetch_disc: PrefetchDisc | None = None,
+        player: AsyncPlayerPort | None = None,
+    ):
+        self.reader = reader
+        self.handle_tag_event = handle_tag_event
+        self.sync_current_tag = sync_current_tag
+        self.loop_interval_seconds = loop_interval_seconds
+        self.event_queue_size = event_queue_size
+        self.pacer = pacer or LoopPacer(loop_interval_seconds)
+        self.power_saver = power_saver
+        self.prefetch_disc = prefetch_disc
+        self.player = player
+        self.dropped_events = 0
+        self._reader_error: Exception | None = None
+
+    def run(self):
+        """Run the main event loop until interrupted."""
+        asyncio.run(self.serve())
+
+    async def serve(self):
+        """Read and handle tag events on the running event loop, closing the player once it stops."""
+        # None is queued once as a wake-up marker when the reader task dies.
+        events: asyncio.Queue[TagEvent | None] = asyncio.Queue(maxsize=self.event_queue_size)
+        reader_task = asyncio.create_task(self._read_tags(events), name="jukebox-reader")
+        try:
+            await self._handle_events(events)
+        finally:
+            reader_task.cancel()
+            if self.player is not None:
+                await self.player.close()
+
+    async def _read_tags(self, events: asyncio.Queue[TagEvent | None]) -> None:
+        previous_tag_id: str | None = None
+        while True:
+            loop_started = time.monotonic()
+            try:
+                tag_id = await self.reader.read()
+            except Exception as err:  # ruff: ignore[BLE001]
+                LOGGER.error("Reader task stopped: %s", err)
+                self._reader_error = err
+                self._put(events, None)
+                return
+            tag_event = TagEvent(tag_id=tag_id, timestamp=time.monotonic())
+            self._put(events, tag_event)
+            if self.prefetch_disc is not None and tag_id is not None and tag_id != previous_tag_id:
+                await asyncio.to_thread(self.prefetch_disc.execute, tag_event)
+            previous_tag_id = tag_id
+            await asyncio.sleep(self.pacer.remaining_sleep(loop_started, time.monotonic()))
+
+    async def _handle_events(self, events: asyncio.Queue[TagEvent | None]) -> None:
+        state: PlaybackState = Idle()
+        current_tag_state: CurrentTagState = NoTag()
+
+        while True:
+            tag_event = await events.get()
+            if tag_event is None:
+                assert self._reader_error is not None
+                raise self._reader_error
+            current_tag_state = await asyncio.to_thread(self.sync_current_tag.execute, tag_event, current_tag_state)
+            state = await self.handle_tag_event.execute(tag_event, state)
+            self._observe(tag_event, state)
+
+    def _put(self, events: asyncio.Queue[TagEvent | None], tag_event: TagEvent | None) -> None:
+        if events.full():
+            events.get_nowait()
+            self.dropped_events += 1
+            LOGGER.debug("Tag event queue full; dropped oldest event (%d dropped)", self.dropped_events)
+        events.put_nowait(tag_event)
+
+    def _observe(self, tag_event: TagEvent, state: PlaybackState) -> None:
+        self.pacer.observe(tag_event, state)
+        if self.power_saver is not None:
+            self.power_saver.observe(tag_event, state)
@@ -1,11 +1,22 @@
 import time
 from time import sleep
+from typing import Literal
 
 from jukebox.domain.entities import CurrentTagState, Idle, NoTag, PlaybackState, TagEvent
-from jukebox.domain.ports import ReaderPort
-from jukebox.domain.use_cases import HandleTagEvent, SyncCurrentTag
+from jukebox.domain.ports import PlayerPort, ReaderPort
+from jukebox.domain.use_cases import HandleTagEvent, PrefetchDisc, SyncCurrentTag
 from jukebox.shared.timing import DEFAULT_LOOP_INTERVAL_SECONDS
 
+from .loop_pacer import LoopPacer
+from .reader_power_saver import ReaderPowerSaver
+from .tag_event_producer import DEFAULT_TAG_EVENT_QUEUE_SIZE, ThreadedTagEventProducer
+
+ReaderMode = Literal["inline", "threaded"]
+
+# Upper bound on a single blocking wait for the next queued event, so the
+# consumer regularly notices a dead reader thread.
+EVENT_WAIT_TIMEOUT_SECONDS = 1.0
+
 
 class CLIController:
     """CLI controller orchestrating the main loop."""
@@ -16,23 +27,83 @@ class CLIController:
         handle_tag_event: HandleTagEvent,
         sync_current_tag: SyncCurrentTag,
         loop_interval_seconds: float = DEFAULT_LOOP_INTERVAL_SECONDS,
+        reader_mode: ReaderMode = "inline",
+        event_queue_size: int = DEFAULT_TAG_EVENT_QUEUE_SIZE,
+        pacer: LoopPacer | None = None,
+        power_saver: ReaderPowerSaver | None = None,
+        prefetch_disc: PrefetchDisc | None = None,
+        player: PlayerPort | None = None,
     ):
         self.reader = reader
         self.handle_tag_event = handle_tag_event
         self.sync_current_tag = sync_current_tag
         self.loop_interval_seconds = loop_interval_seconds
+        self.reader_mode = reader_mode
+        self.event_queue_size = event_queue_size
+        self.pacer = pacer or LoopPacer(loop_interval_seconds)
+        self.power_saver = power_saver
+        self.prefetch_disc = prefetch_disc
+        self.player = player
 
     def run(self):
-        """Run the main event loop."""
+        """Run the main event loop, closing the player once it stops."""
+        try:
+            if self.reader_mode == "threaded":
+                self._run_threaded()
+            else:
+                self._run_inline()
+        finally:
+            if self.player is not None:
+                self.player.close()
+
+    def _run_inline(self):
         state: PlaybackState = Idle()
         current_tag_state: CurrentTagState = NoTag()
+        previous_tag_id: str | None = None
 
         while True:
             loop_started = time.monotonic()
             tag_id = self.reader.read()
             tag_event = TagEvent(tag_id=tag_id, timestamp=time.monotonic())
+            # Nothing runs alongside here, but the disc lookup is remembered and the player prepares the URI.
+            if self.prefetch_disc is not None and tag_id is not None and tag_id != previous_tag_id:
+                self.prefetch_disc.execute(tag_event)
+            previous_tag_id = tag_id
             current_tag_state = self.sync_current_tag.execute(tag_event, current_tag_state)
             state = self.handle_tag_event.execute(tag_event, state)
-            remaining_sleep = self.loop_interval_seconds - (time.monotonic() - loop_started)
+            self._observe(tag_event, state)
+            remaining_sleep = self.pacer.remaining_sleep(loop_started, time.monotonic())
             if remaining_sleep > 0:
                 sleep(remaining_sleep)
+
+    def _run_threaded(self):
+        """Consume events produced by a background reader thread.
+
+        Reads keep their own cadence while player and current-tag I/O run here,
+        so a slow speaker does not delay removal detection, and a new tag's disc
+        can be prefetched on the reader thread before its event is handled.
+        """
+        state: PlaybackState = Idle()
+        current_tag_state: CurrentTagState = NoTag()
+        producer = ThreadedTagEventProducer(
+            reader=self.reader,
+            pacer=self.pacer,
+            max_queue_size=self.event_queue_size,
+            prefetch_disc=self.prefetch_disc,
+        )
+        producer.start()
+        try:
+            while True:
+                tag_event = producer.get(timeout=EVENT_WAIT_TIMEOUT_SECONDS)
+                if tag_event is None:
+                    continue
+                current_tag_state = self.sync_current_tag.execute(tag_event, current_tag_state)
+                state = self.handle_tag_event.execute(tag_event, state)
+                self._observe(tag_event, state)
+        finally:
+            producer.stop(timeout=EVENT_WAIT_TIMEOUT_SECONDS)
+
+    def _observe(self, tag_event: TagEvent, state: PlaybackState) -> None:
+        self.pacer.observe(tag_event, state)
+        if self.power_saver is not None:
+            self.power_saver.observe(tag_event, state)
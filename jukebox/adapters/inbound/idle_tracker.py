@@ -0,0 +1,17 @@
+from jukebox.domain.entities import Idle, PlaybackState, TagEvent
+
+
+class IdleTracker:
+    """Tells whether playback has been stopped without any tag for long enough."""
+
+    def __init__(self, idle_after_seconds: float):
+        self.idle_after_seconds = idle_after_seconds
+        self._idle_since: float | None = None
+
+    def update(self, tag_event: TagEvent, state: PlaybackState) -> bool:
+        if tag_event.tag_id is not None or not isinstance(state, Idle):
+            self._idle_since = None
+            return False
+        if self._idle_since is None:
+            self._idle_since = tag_event.timestamp
+        return tag_event.timestamp - self._idle_since >= self.idle_after_seconds
@@ -0,0 +1,119 @@
+import logging
+from typing import Literal
+
+from jukebox.domain.entities import PlaybackState, TagEvent
+from jukebox.shared.timing import DEFAULT_LOOP_INTERVAL_SECONDS
+
+from .idle_tracker import IdleTracker
+
+LOGGER = logging.getLogger("jukebox")
+
+LoopPacing = Literal["fixed", "adaptive"]
+
+CADENCE_REPORT_INTERVAL_SECONDS = 60.0
+# Weight of the newest loop period in the smoothed cadence.
+CADENCE_SMOOTHING = 0.1
+
+
+class LoopPacer:
+    """Paces reads at a fixed interval and tracks the achieved cadence.
+
+    The interval is measured from the start of a loop, so time spent blocking in
+    `reader.read()` counts towards it instead of being added on top.
+    """
+
+    def __init__(
+        self,
+        loop_interval_seconds: float = DEFAULT_LOOP_INTERVAL_SECONDS,
+        reader_budget_seconds: float = 0.0,
+        report_interval_seconds: float = CADENCE_REPORT_INTERVAL_SECONDS,
+    ):
+        self.loop_interval_seconds = loop_interval_seconds
+        self.reader_budget_seconds = reader_budget_seconds
+        self.report_interval_seconds = report_interval_seconds
+        self._last_loop_started: float | None = None
+        self._mean_period: float | None = None
+        self._last_report_at: float | None = None
+        if reader_budget_seconds > loop_interval_seconds:
+            LOGGER.warning(
+                "Reader may block for %.3fs per read, longer than the %.3fs loop interval; "
+                "the loop cannot run faster than the reader",
+                reader_budget_seconds,
+                loop_interval_seconds,
+            )
+
+    @property
+    def interval_seconds(self) -> float:
+        """Target time between the starts of two consecutive reads."""
+        return self.loop_interval_seconds
+
+    @property
+    def achieved_cadence_hz(self) -> float | None:
+        """Smoothed number of reads per second, or None before the second read."""
+        if not self._mean_period:
+            return None
+        return 1 / self._mean_period
+
+    def observe(self, tag_event: TagEvent, state: PlaybackState) -> None:
+        """Feed back the outcome of a handled event; fixed pacing ignores it."""
+
+    def remaining_sleep(self, loop_started: float, now: float) -> float:
+        """Record a finished loop and return how long to sleep before the next read."""
+        self._record_loop(loop_started)
+        return max(self.interval_seconds - (now - loop_started), 0.0)
+
+    def _record_loop(self, loop_started: float) -> None:
+        if self._last_loop_started is not None:
+            period = loop_started - self._last_loop_started
+            if self._mean_period is None:
+                self._mean_period = period
+            else:
+                self._mean_period += CADENCE_SMOOTHING * (period - self._mean_period)
+        self._last_loop_started = loop_started
+
+        if self._last_report_at is None:
+            self._last_report_at = loop_started
+        elif loop_started - self._last_report_at >= self.report_interval_seconds:
+            self._last_report_at = loop_started
+            cadence = self.achieved_cadence_hz
+            LOGGER.debug(
+                "Read cadence %.2f Hz (target interval %.3fs, reader budget %.3fs)",
+                cadence or 0.0,
+                self.interval_seconds,
+                self.reader_budget_seconds,
+            )
+
+
+class AdaptiveLoopPacer(LoopPacer):
+    """Slows reads down after a long idle period without any tag.
+
+    Reads stay at the loop interval while a tag is present or playback is
+    waiting for it to come back, so removal detection keeps its resolution.
+    """
+
+    def __init__(
+        self,
+        loop_interval_seconds: float = DEFAULT_LOOP_INTERVAL_SECONDS,
+        idle_loop_interval_seconds: float = 1.0,
+        idle_after_seconds: float = 60.0,
+        reader_budget_seconds: float = 0.0,
+        report_interval_seconds: float = CADENCE_REPORT_INTERVAL_SECONDS,
+    ):
+        super().__init__(loop_interval_seconds, reader_budget_seconds, report_interval_seconds)
+        self.idle_loop_interval_seconds = idle_loop_interval_seconds
+        self.idle_after_seconds = idle_after_seconds
+        self._idle_tracker = IdleTracker(idle_after_seconds)
+        self._idle = False
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval_for(self._idle)
+
+    def observe(self, tag_event: TagEvent, state: PlaybackState) -> None:
+        idle = self._idle_tracker.update(tag_event, state)
+        if idle != self._idle:
+            LOGGER.debug("Switching to %s read pacing (%.3fs)", "idle" if idle else "active", self._interval_for(idle))
+            self._idle = idle
+
+    def _interval_for(self, idle: bool) -> float:
+        return self.idle_loop_interval_seconds if idle else self.loop_interval_seconds
@@ -0,0 +1,29 @@
+import logging
+
+from jukebox.domain.entities import PlaybackState, TagEvent
+from jukebox.domain.ports import AsyncReaderPort, ReaderPort
+
+from .idle_tracker import IdleTracker
+
+LOGGER = logging.getLogger("jukebox")
+
+
+class ReaderPowerSaver:
+    """Switches the reader to low power once playback has been idle without a tag for a while.
+
+    The reader only records the hint here; it applies it between its own reads,
+    so this is safe to call from a thread other than the one reading.
+    """
+
+    def __init__(self, reader: ReaderPort | AsyncReaderPort, idle_after_seconds: float):
+        self.reader = reader
+        self._idle_tracker = IdleTracker(idle_after_seconds)
+        self._low_power = False
+
+    def observe(self, tag_event: TagEvent, state: PlaybackState) -> None:
+        low_power = self._idle_tracker.update(tag_event, state)
+        if low_power == self._low_power:
+            return
+        LOGGER.info("%s reader low power mode", "Entering" if low_power else "Leaving")
+        self.reader.set_low_power(low_power)
+        self._low_power = low_power
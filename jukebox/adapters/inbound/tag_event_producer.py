@@ -0,0 +1,101 @@
+import logging
+import queue
+import threading
+import time
+
+from jukebox.domain.entities import TagEvent
+from jukebox.domain.ports import ReaderPort
+from jukebox.domain.use_cases import PrefetchDisc
+
+from .loop_pacer import LoopPacer
+
+LOGGER = logging.getLogger("jukebox")
+
+DEFAULT_TAG_EVENT_QUEUE_SIZE = 16
+
+
+class ThreadedTagEventProducer:
+    """Polls the reader on a background thread and queues timestamped tag events.
+
+    The queue is bounded: when the consumer falls behind, the oldest event is
+    dropped so the consumer always catches up to the most recent reads. With a
+    `prefetch_disc`, the disc of a newly seen tag is looked up on this thread
+    right after its event is queued, while the consumer may still be busy.
+    """
+
+    def __init__(
+        self,
+        reader: ReaderPort,
+        pacer: LoopPacer | None = None,
+        max_queue_size: int = DEFAULT_TAG_EVENT_QUEUE_SIZE,
+        prefetch_disc: PrefetchDisc | None = None,
+    ):
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
+        self.reader = reader
+        self.pacer = pacer or LoopPacer()
+        self.prefetch_disc = prefetch_disc
+        self.dropped_events = 0
+        # None is queued once as a wake-up marker when the reader thread dies.
+        self._events: queue.Queue[TagEvent | None] = queue.Queue(maxsize=max_queue_size)
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("Tag event producer already started")
+        self._thread = threading.Thread(target=self._run, name="jukebox-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get(self, timeout: float | None = None) -> TagEvent | None:
+        """Return the next queued event, or None if none arrived within timeout.
+
+        Re-raises the reader error once the queue has been drained if the
+        producer thread died.
+        """
+        try:
+            tag_event = self._events.get(timeout=timeout)
+        except queue.Empty:
+            tag_event = None
+        if tag_event is None and self._error is not None:
+            raise self._error
+        return tag_event
+
+    def _run(self) -> None:
+        previous_tag_id: str | None = None
+        while not self._stop_event.is_set():
+            loop_started = time.monotonic()
+            try:
+                tag_id = self.reader.read()
+            except Exception as err:  # ruff: ignore[BLE001]
+                LOGGER.error("Reader thread stopped: %s", err)
+                self._error = err
+                self._put(None)
+                return
+            tag_event = TagEvent(tag_id=tag_id, timestamp=time.monotonic())
+            self._put(tag_event)
+            if self.prefetch_disc is not None and tag_id is not None and tag_id != previous_tag_id:
+                self.prefetch_disc.execute(tag_event)
+            previous_tag_id = tag_id
+            remaining_sleep = self.pacer.remaining_sleep(loop_started, time.monotonic())
+            if remaining_sleep > 0:
+                self._stop_event.wait(remaining_sleep)
+
+    def _put(self, tag_event: TagEvent | None) -> None:
+        while True:
+            try:
+                self._events.put_nowait(tag_event)
+                return
+            except queue.Full:
+                try:
+                    self._events.get_nowait()
+                except queue.Empty:
+                    continue
+                self.dropped_events += 1
+                LOGGER.debug("Tag event queue full; dropped oldest event (%d dropped)", self.dropped_events)
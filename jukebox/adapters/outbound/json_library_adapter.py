@@ -2,74 +2,215 @@ import json
 import logging
 import os
 import tempfile
-from contextlib import suppress
+import threading
+from collections.abc import Collection, Iterator
+from contextlib import contextmanager, suppress
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # Windows: journal writes are not locked between processes.
+    fcntl = None  # type: ignore[assignment]
 
 from pydantic import ValidationError
 
-from jukebox.domain.entities import Disc, Library
+from jukebox.adapters.outbound.json_library_reader import iter_library_entries
+from jukebox.domain.entities import Disc, DiscSearchIndex, Library
 from jukebox.domain.repositories import LibraryRepository
 
 LOGGER = logging.getLogger("jukebox")
 
+JOURNAL_COMPACTION_SIZE = 256 * 1024
+
+FileState = tuple[int, int]
+
 
 class JsonLibraryAdapter(LibraryRepository):
-    """JSON file-based implementation of LibraryRepository."""
+    """JSON file-based implementation of LibraryRepository.
 
-    def __init__(self, filepath: str):
+    The file is read one disc at a time: an invalid disc is logged and skipped
+    instead of emptying the whole library, and is written back as is.
+
+    In journaled mode, each change is appended as one JSON line to a journal
+    next to the library file instead of rewriting the whole file. The journal
+    is replayed on load, whatever the mode, and folded into the library file
+    once it reaches `JOURNAL_COMPACTION_SIZE` bytes or on any full write.
+    Appends, compaction and loads hold a lock file next to the journal, so an
+    entry appended by another process is never dropped by a compaction.
+    """
+
+    def __init__(self, filepath: str, journaled: bool = False):
         self.filepath = filepath
+        self.journaled = journaled
+        library_root, _ = os.path.splitext(filepath)
+        self.journal_path = f"{library_root}.journal.jsonl"
+        # The journal itself is unlinked on compaction, so it cannot carry the lock.
+        self.journal_lock_path = f"{library_root}.journal.lock"
+        self._journal_lock_state = threading.local()
         self._cached_library: Library | None = None
-        self._cached_file_state: tuple[int, int] | None = None
+        self._cached_file_state: tuple[FileState | None, FileState | None] | None = None
+        self._cached_search_index: DiscSearchIndex | None = None
+        self._invalid_entries: dict[str, Any] = {}
+
+    @contextmanager
+    def _journal_lock(self, exclusive: bool) -> Iterator[None]:
+        """Hold the journal lock; nested uses on the same thread reuse the outer one."""
+        if fcntl is None or getattr(self._journal_lock_state, "held", False):
+            yield
+            return
+
+        directory = os.path.dirname(self.journal_lock_path) or "."
+        if exclusive:
+            os.makedirs(directory, exist_ok=True)
+        elif not os.path.isdir(directory):
+            # Nothing was ever written to a missing directory, so there is nothing to guard.
+            yield
+            return
+
+        with open(self.journal_lock_path, "a", encoding="utf-8") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._journal_lock_state.held = True
+            try:
+                yield
+            finally:
+                self._journal_lock_state.held = False
 
     def _load_from_disk(self) -> Library:
+        with self._journal_lock(exclusive=False):
+            return self._load_library_and_journal()
+
+    def _load_library_and_journal(self) -> Library:
+        discs: dict[str, Disc] = {}
+        invalid_entries: dict[str, Any] = {}
         try:
             with open(self.filepath, encoding="utf-8") as f:
-                data = json.load(f)
-                return Library.model_validate(data)
+                for tag_id, data in iter_library_entries(f):
+                    try:
+                        discs[tag_id] = Disc.model_validate(data)
+                        invalid_entries.pop(tag_id, None)
+                    except ValidationError as err:
+                        discs.pop(tag_id, None)
+                        invalid_entries[tag_id] = data
+                        LOGGER.warning(
+                            "Skipping invalid disc: filepath: %s, tag_id: %s, error: %s", self.filepath, tag_id, err
+                        )
         except FileNotFoundError:
             LOGGER.warning("No library file found, starting with an empty library: %s", self.filepath)
-            return Library()
-        except (json.JSONDecodeError, ValidationError) as err:
+        except ValueError as err:
             LOGGER.warning(
-                "Error deserializing library, continuing with empty library: filepath: %s, error: %s",
+                "Error deserializing library, continuing with the %d discs read before the error: filepath: %s, error: %s",
+                len(discs),
                 self.filepath,
                 err,
             )
-            return Library()
 
-    def _write_library(self, library: Library) -> None:
+        self._replay_journal(discs, invalid_entries)
+        self._invalid_entries = invalid_entries
+        return Library(discs=discs)
+
+    def _replay_journal(self, discs: dict[str, Disc], invalid_entries: dict[str, Any]) -> None:
+        try:
+            with open(self.journal_path, encoding="utf-8") as journal_file:
+                for line_number, line in enumerate(journal_file, start=1):
+                    if not line.endswith("\n"):
+                        # Still being appended by another process.
+                        break
+                    try:
+                        entry = json.loads(line)
+                        tag_id = entry["tag_id"]
+                        match entry["op"]:
+                            case "put":
+                                discs[tag_id] = Disc.model_validate(entry["disc"])
+                            case "remove":
+                                discs.pop(tag_id, None)
+                            case op:
+                                raise ValueError(f"Unknown operation: {op!r}")
+                        invalid_entries.pop(tag_id, None)
+                    except (KeyError, TypeError, ValueError) as err:
+                        LOGGER.warning(
+                            "Skipping invalid journal entry: filepath: %s, line: %d, error: %s",
+                            self.journal_path,
+                            line_number,
+                            err,
+                        )
+        except FileNotFoundError:
+            return
+
+    @staticmethod
+    def _fsync_directory(directory: str) -> None:
+        directory_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+    def _write_library(self, library: Library, invalid_entries: dict[str, Any]) -> None:
+        data = library.model_dump()
+        # Invalid discs are written back untouched so fixing them by hand stays possible.
+        for tag_id, entry in invalid_entries.items():
+            data["discs"].setdefault(tag_id, entry)
+
         directory = os.path.dirname(self.filepath) or "."
         os.makedirs(directory, exist_ok=True)
         temp_fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".library-", suffix=".json")
 
         try:
             with os.fdopen(temp_fd, "w", encoding="utf-8") as file_obj:
-                json.dump(library.model_dump(), file_obj, indent=2, ensure_ascii=False)
+                json.dump(data, file_obj, indent=2, ensure_ascii=False)
                 file_obj.flush()
                 os.fsync(file_obj.fileno())
 
             os.replace(temp_path, self.filepath)
-
-            directory_fd = os.open(directory, os.O_RDONLY)
-            try:
-                os.fsync(directory_fd)
-            finally:
-                os.close(directory_fd)
+            # The library file now holds every journaled change; replaying them again would be harmless.
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+            self._fsync_directory(directory)
         except Exception:
             with suppress(FileNotFoundError):
                 os.unlink(temp_path)
             raise
 
-    def _get_file_state(self) -> tuple[int, int] | None:
+    def _append_to_journal(self, entries: list[dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.journal_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        is_new_journal = not os.path.exists(self.journal_path)
+        lines = "".join(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n" for entry in entries)
+
+        with open(self.journal_path, "a", encoding="utf-8") as journal_file:
+            offset = journal_file.tell()
+            try:
+                journal_file.write(lines)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+            except Exception:
+                # Never leave half a line for the next entry to be appended to.
+                journal_file.truncate(offset)
+                raise
+
+        if is_new_journal:
+            self._fsync_directory(directory)
+
+    @staticmethod
+    def _get_path_state(path: str) -> FileState | None:
         try:
-            stat_result = os.stat(self.filepath)
+            stat_result = os.stat(path)
         except FileNotFoundError:
             return None
 
         return stat_result.st_mtime_ns, stat_result.st_size
 
+    def _get_file_state(self) -> tuple[FileState | None, FileState | None] | None:
+        library_state = self._get_path_state(self.filepath)
+        journal_state = self._get_path_state(self.journal_path)
+        if library_state is None and journal_state is None:
+            return None
+
+        return library_state, journal_state
+
     def _update_cache(self, library: Library) -> None:
-        self._cached_library = library.model_copy(deep=True)
+        self._cached_library = library
         self._cached_file_state = self._get_file_state()
+        self._cached_search_index = None
 
     def _get_cached_library(self) -> Library:
         file_state = self._get_file_state()
@@ -79,49 +220,128 @@ class JsonLibraryAdapter(LibraryRepository):
         library = self._load_from_disk()
         self._cached_library = library
         self._cached_file_state = file_state
+        self._cached_search_index = None
         return library
 
     @staticmethod
-    def _copy_disc(disc: Disc) -> Disc:
-        return disc.model_copy(deep=True)
+    def _with_discs(library: Library, discs: dict[str, Disc]) -> Library:
+        # Discs are frozen, so a new library only needs a new mapping; the
+        # cached library and the discs it shares are never mutated in place.
+        return library.model_copy(update={"discs": discs})
 
-    def _persist_library(self, library: Library) -> None:
-        self._write_library(library)
+    def _without_invalid_entry(self, tag_id: str) -> dict[str, Any]:
+        return {key: entry for key, entry in self._invalid_entries.items() if key != tag_id}
+
+    def _persist_library(self, library: Library, invalid_entries: dict[str, Any] | None = None) -> None:
+        invalid_entries = self._invalid_entries if invalid_entries is None else invalid_entries
+        with self._journal_lock(exclusive=True):
+            self._write_library(library, invalid_entries)
+        self._invalid_entries = invalid_entries
         self._update_cache(library)
 
+    def _commit(self, library: Library, invalid_entries: dict[str, Any], journal_entries: list[dict[str, Any]]) -> None:
+        if not self.journaled:
+            self._persist_library(library, invalid_entries)
+            return
+
+        with self._journal_lock(exclusive=True):
+            # Entries appended by another process since the library was loaded are not in it.
+            is_cache_current = self._cached_file_state == self._get_file_state()
+            self._append_to_journal(journal_entries)
+            self._invalid_entries = invalid_entries
+            if is_cache_current:
+                self._update_cache(library)
+            else:
+                self._cached_library = None
+
+            journal_state = self._get_path_state(self.journal_path)
+            if journal_state is not None and journal_state[1] >= JOURNAL_COMPACTION_SIZE:
+                try:
+                    self.compact()
+                except OSError as err:
+                    # The change is safe in the journal; compaction is retried after the next one.
+                    LOGGER.warning("Error compacting library journal: filepath: %s, error: %s", self.journal_path, err)
+
+    def compact(self) -> None:
+        """Fold the journal into the library file and remove it."""
+        # Held from reading the journal to removing it, so no append lands in between.
+        with self._journal_lock(exclusive=True):
+            if not os.path.exists(self.journal_path):
+                return
+            self._persist_library(self._get_cached_library())
+
+    def revision(self) -> tuple[FileState | None, FileState | None] | None:
+        return self._get_file_state()
+
     def list_discs(self) -> dict[str, Disc]:
-        return {tag_id: self._copy_disc(disc) for tag_id, disc in self._get_cached_library().discs.items()}
+        return dict(self._get_cached_library().discs)
+
+    def list_tag_ids(self) -> set[str]:
+        return set(self._get_cached_library().discs) | set(self._invalid_entries)
 
     def get_disc(self, tag_id: str) -> Disc | None:
-        disc = self._get_cached_library().discs.get(tag_id)
-        if disc is None:
-            return None
+        return self._get_cached_library().discs.get(tag_id)
 
-        return self._copy_disc(disc)
+    def search_index(self) -> DiscSearchIndex:
+        library = self._get_cached_library()
+        if self._cached_search_index is None:
+            self._cached_search_index = DiscSearchIndex(library.discs)
+        return self._cached_search_index
 
     def add_disc(self, tag_id: str, disc: Disc) -> None:
         library = self._get_cached_library()
         if tag_id in library.discs:
             raise ValueError(f"Already existing tag: tag_id='{tag_id}'")
 
-        updated_library = library.model_copy(deep=True)
-        updated_library.discs[tag_id] = self._copy_disc(disc)
-        self._persist_library(updated_library)
+        self._commit(
+            self._with_discs(library, {**library.discs, tag_id: disc}),
+            self._without_invalid_entry(tag_id),
+            [{"op": "put", "tag_id": tag_id, "disc": disc.model_dump()}],
+        )
 
     def update_disc(self, tag_id: str, disc: Disc) -> None:
         library = self._get_cached_library()
         if tag_id not in library.discs:
             raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
 
-        updated_library = library.model_copy(deep=True)
-        updated_library.discs[tag_id] = self._copy_disc(disc)
-        self._persist_library(updated_library)
+        self._commit(
+            self._with_discs(library, {**library.discs, tag_id: disc}),
+            self._without_invalid_entry(tag_id),
+            [{"op": "put", "tag_id": tag_id, "disc": disc.model_dump()}],
+        )
 
     def remove_disc(self, tag_id: str) -> None:
         library = self._get_cached_library()
-        if tag_id not in library.discs:
+        if tag_id not in library.discs and tag_id not in self._invalid_entries:
             raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
 
-        updated_library = library.model_copy(deep=True)
-        updated_library.discs.pop(tag_id)
-        self._persist_library(updated_library)
+        discs = {key: disc for key, disc in library.discs.items() if key != tag_id}
+        self._commit(
+            self._with_discs(library, discs),
+            self._without_invalid_entry(tag_id),
+            [{"op": "remove", "tag_id": tag_id}],
+        )
+
+    def save_discs(self, discs: dict[str, Disc], removed_tag_ids: Collection[str] = ()) -> None:
+        library = self._get_cached_library()
+        for tag_id in removed_tag_ids:
+            if tag_id not in library.discs and tag_id not in self._invalid_entries:
+                raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
+
+        removed = set(removed_tag_ids)
+        new_discs = {tag_id: disc for tag_id, disc in library.discs.items() if tag_id not in removed}
+        new_discs.update(discs)
+        invalid_entries = {
+            tag_id: entry
+            for tag_id, entry in self._invalid_entries.items()
+            if tag_id not in removed and tag_id not in discs
+        }
+        self._commit(
+            self._with_discs(library, new_discs),
+            invalid_entries,
+            [{"op": "remove", "tag_id": tag_id} for tag_id in removed_tag_ids]
+            + [{"op": "put", "tag_id": tag_id, "disc": disc.model_dump()} for tag_id, disc in discs.items()],
+        )
+
+    def replace_discs(self, discs: dict[str, Disc]) -> None:
+        self._persist_library(Library(discs=dict(discs)), invalid_entries={})
@@ -0,0 +1,179 @@
+import json
+import re
+from collections.abc import Iterator
+from typing import Any, TextIO
+
+READ_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+_STRUCTURAL_CHAR = re.compile(r'[{}\[\],"]')
+_STRING_SPECIAL_CHAR = re.compile(r'["\\]')
+
+
+class _MalformedValueError(ValueError):
+    """A value that is not valid JSON but ends where the enclosing object goes on."""
+
+    def __init__(self, text: str):
+        super().__init__(f"Malformed JSON value: {text[:80]!r}")
+        self.text = text
+
+
+class _JsonStream:
+    """Reads JSON values one at a time from a text file, keeping only a chunk in memory."""
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or an empty string at the end of the file."""
+        while True:
+            match = _WHITESPACE.match(self._buffer, self._position)
+            self._position = match.end() if match else self._position
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found or 'end of file'!r}")
+        self._position += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # Incomplete or malformed: only read on as far as the value goes.
+                return self._delimited_value()
+            # A number is only complete once followed by a character that cannot continue it.
+            if isinstance(value, int | float) and not self._ends_number(end) and self._fill():
+                continue
+            self._position = end
+            return value
+
+    def _delimited_value(self) -> Any:
+        end = self._value_end()
+        text = self._buffer[self._position : end]
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as err:
+            if end is None:
+                # Cut off by the end of the file: there is nothing left to resume from.
+                raise
+            self._position = end
+            raise _MalformedValueError(text) from err
+        self._position = len(self._buffer) if end is None else end
+        return value
+
+    def _value_end(self) -> int | None:
+        """Index just past the current value, or None if the file ends first.
+
+        Only strings and brackets are followed, so a malformed value still ends
+        at its closing bracket, or else at the next `,` or closing bracket of
+        the enclosing object or array.
+        """
+        # Kept relative to the start of the value, since `_fill` moves the buffer.
+        offset = 0
+        depth = 0
+        in_string = False
+        while True:
+            index = self._position + offset
+            if index >= len(self._buffer):
+                if not self._fill():
+                    return None
+                continue
+            pattern = _STRING_SPECIAL_CHAR if in_string else _STRUCTURAL_CHAR
+            match = pattern.search(self._buffer, index)
+            if match is None:
+                offset = len(self._buffer) - self._position
+                continue
+            index = match.start()
+            char = self._buffer[index]
+            offset = index + 1 - self._position
+            if in_string:
+                if char == "\\":
+                    offset += 1
+                    continue
+                in_string = False
+            elif char == '"':
+                in_string = True
+                continue
+            elif char in "{[":
+                depth += 1
+                continue
+            elif depth == 0:
+                # A `,` or the closing bracket of the enclosing object or array.
+                return index
+            elif char == ",":
+                continue
+            else:
+                depth -= 1
+            if depth == 0:
+                return index + 1
+
+    def _ends_number(self, end: int) -> bool:
+        return end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS
+
+    def object_keys(self) -> Iterator[str]:
+        """Keys of the object being read; the caller reads the value of each key before the next one."""
+        self.expect("{")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise ValueError("Expected an object key")
+            key = self.value()
+            self.expect(":")
+            yield key
+            if self.peek() == ",":
+                self._position += 1
+                continue
+            self.expect("}")
+            return
+
+
+def iter_library_entries(file: TextIO, chunk_size: int = READ_CHUNK_SIZE) -> Iterator[tuple[str, Any]]:
+    """Yield the raw `(tag_id, data)` entries of a library file one at a time.
+
+    Entries are yielded as soon as they are read, so the ones before a syntax
+    error are still yielded before the `ValueError` is raised. A disc that is
+    not valid JSON is yielded as its raw text and reading goes on with the
+    next one.
+    """
+    stream = _JsonStream(file, chunk_size)
+    for key in stream.object_keys():
+        if key != "discs":
+            stream.value()
+            continue
+        if stream.peek() != "{":
+            raise ValueError("Expected `discs` to be an object")
+        for tag_id in stream.object_keys():
+            try:
+                data = stream.value()
+            except _MalformedValueError as err:
+                data = err.text
+            yield tag_id, data
+
+    if stream.peek():
+        raise ValueError("Unexpected data after the library object")
@@ -0,0 +1,65 @@
+import json
+import logging
+import os
+import tempfile
+
+from pydantic import ValidationError
+
+from jukebox.settings.entities import ResolvedSonosGroupRuntime
+from jukebox.sonos.group_cache import SonosGroupCachePort
+
+LOGGER = logging.getLogger("jukebox")
+
+
+class JsonSonosGroupCacheAdapter(SonosGroupCachePort):
+    """JSON sidecar holding the last Sonos group resolved by discovery.
+
+    The cache only speeds up startup: an unreadable or invalid file is treated
+    as empty and a failed write is logged, never raised.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+
+    def load(self) -> ResolvedSonosGroupRuntime | None:
+        try:
+            with open(self.filepath, encoding="utf-8") as cache_file:
+                return ResolvedSonosGroupRuntime.model_validate(json.load(cache_file))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, ValidationError) as err:
+            LOGGER.warning("Ignoring unreadable Sonos group cache: filepath: %s, error: %s", self.filepath, err)
+            return None
+
+    def save(self, group: ResolvedSonosGroupRuntime) -> None:
+        directory = os.path.dirname(self.filepath) or "."
+        temp_path = None
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=directory,
+                delete=False,
+                prefix=".sonos-group-",
+                suffix=".tmp",
+            ) as temp_file:
+                temp_path = temp_file.name
+                json.dump(group.model_dump(mode="json"), temp_file, indent=2, ensure_ascii=False)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+
+            os.replace(temp_path, self.filepath)
+        except OSError as err:
+            LOGGER.warning("Error writing Sonos group cache: filepath: %s, error: %s", self.filepath, err)
+        finally:
+            if temp_path is not None and os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def clear(self) -> None:
+        try:
+            os.unlink(self.filepath)
+        except FileNotFoundError:
+            return
+        except OSError as err:
+            LOGGER.warning("Error removing Sonos group cache: filepath: %s, error: %s", self.filepath, err)
@@ -0,0 +1,19 @@
+from jukebox.domain.repositories import LibraryRepository
+from jukebox.settings.entities import LibraryBackend
+from jukebox.shared.config_utils import get_library_database_path
+
+from .json_library_adapter import JsonLibraryAdapter
+from .sqlite_library_adapter import SqliteLibraryAdapter
+
+
+def build_library_repository(library_path: str, library_backend: LibraryBackend = "json") -> LibraryRepository:
+    """Build the library repository of the configured backend for a library path."""
+    match library_backend:
+        case "json":
+            return JsonLibraryAdapter(library_path)
+        case "json_journal":
+            return JsonLibraryAdapter(library_path, journaled=True)
+        case "sqlite":
+            return SqliteLibraryAdapter(get_library_database_path(library_path))
+        case _:
+            raise ValueError(f"Unknown library backend: {library_backend}")
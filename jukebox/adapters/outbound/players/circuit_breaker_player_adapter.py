@@ -0,0 +1,152 @@
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Literal
+
+from jukebox.domain.errors import PlayerUnreachableError
+from jukebox.domain.ports import PlayerPort
+
+LOGGER = logging.getLogger("jukebox")
+
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BASE_OPEN_SECONDS = 5.0
+CIRCUIT_MAX_OPEN_SECONDS = 300.0
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+@dataclass
+class _Circuit:
+    state: CircuitState = "closed"
+    consecutive_failures: int = 0
+    consecutive_opens: int = 0
+    open_until: float = 0.0
+
+
+class CircuitBreakerPlayerAdapter(PlayerPort):
+    """Stops sending commands to a player that keeps being unreachable.
+
+    After `failure_threshold` consecutive unreachable errors the circuit opens:
+    commands fail immediately with a `retry_after_seconds` hint instead of
+    reaching the player, and so without triggering its recovery. Once the open
+    period is over, a single command is let through as a probe; its success
+    closes the circuit, its failure opens it again for twice as long. Open
+    periods are jittered so several jukeboxes do not probe in lockstep.
+
+    Errors other than `PlayerUnreachableError` mean the player answered, and
+    reset the failure count.
+
+    One circuit is kept per playback target, as named by `target_key` at the
+    time of each command, so an unreachable speaker or group does not block
+    commands to another one.
+    """
+
+    def __init__(
+        self,
+        player: PlayerPort,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_open_seconds: float = CIRCUIT_BASE_OPEN_SECONDS,
+        max_open_seconds: float = CIRCUIT_MAX_OPEN_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        jitter: Callable[[], float] = random.random,
+        target_key: Callable[[], Hashable] = lambda: None,
+    ):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        self.player = player
+        self.failure_threshold = failure_threshold
+        self.base_open_seconds = base_open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.clock = clock
+        self.jitter = jitter
+        self.target_key = target_key
+        self._lock = threading.Lock()
+        # Only targets that failed have an entry; the others are closed.
+        self._circuits: dict[Hashable, _Circuit] = {}
+
+    @property
+    def state(self) -> CircuitState:
+        """State of the circuit of the current playback target."""
+        target = self.target_key()
+        with self._lock:
+            circuit = self._circuits.get(target)
+            return "closed" if circuit is None else circuit.state
+
+    def play(self, uri: str, shuffle: bool = False) -> None:
+        self._call("play", lambda: self.player.play(uri, shuffle))
+
+    def pause(self) -> None:
+        self._call("pause", self.player.pause)
+
+    def resume(self) -> None:
+        self._call("resume", self.player.resume)
+
+    def stop(self) -> None:
+        self._call("stop", self.player.stop)
+
+    def prepare(self, uri: str) -> None:
+        # Local work only: it neither reaches the player nor counts towards the circuit.
+        self.player.prepare(uri)
+
+    def close(self) -> None:
+        self.player.close()
+
+    def _call(self, command_name: str, command: Callable[[], None]) -> None:
+        # The target is fixed before the call: recovery may move the player to another one.
+        target = self.target_key()
+        self._before_call(target, command_name)
+        try:
+            command()
+        except PlayerUnreachableError:
+            self._on_unreachable(target, command_name)
+            raise
+        except Exception:
+            self._on_answered(target)
+            raise
+        self._on_answered(target)
+
+    def _before_call(self, target: Hashable, command_name: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(target)
+            if circuit is None or circuit.state == "closed":
+                return
+
+            now = self.clock()
+            if circuit.state == "open" and now >= circuit.open_until:
+                LOGGER.info("Probing unreachable player with %s", command_name)
+                circuit.state = "half_open"
+                return
+
+            # Open, or half-open with a probe already in flight.
+            retry_after_seconds = max(circuit.open_until - now, 0.0)
+        raise PlayerUnreachableError(
+            f"Player is unreachable; {command_name} skipped for {retry_after_seconds:.1f}s",
+            retry_after_seconds=retry_after_seconds,
+        )
+
+    def _on_answered(self, target: Hashable) -> None:
+        with self._lock:
+            circuit = self._circuits.pop(target, None)
+        if circuit is not None and circuit.state != "closed":
+            LOGGER.info("Player is reachable again")
+
+    def _on_unreachable(self, target: Hashable, command_name: str) -> None:
+        with self._lock:
+            circuit = self._circuits.setdefault(target, _Circuit())
+            circuit.consecutive_failures += 1
+            if circuit.state == "closed" and circuit.consecutive_failures < self.failure_threshold:
+                return
+
+            open_seconds = self._open_seconds(circuit)
+            circuit.consecutive_opens += 1
+            circuit.state = "open"
+            circuit.open_until = self.clock() + open_seconds
+        LOGGER.warning("Player unreachable after %s; pausing commands for %.1fs", command_name, open_seconds)
+
+    def _open_seconds(self, circuit: _Circuit) -> float:
+        ceiling = min(self.base_open_seconds * 2**circuit.consecutive_opens, self.max_open_seconds)
+        # Keep at least half of the backoff so a probe never comes too early.
+        return ceiling * (0.5 + self.jitter() / 2)
@@ -0,0 +1,36 @@
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from jukebox.domain.ports import AsyncPlayerPort, PlayerPort
+
+
+class ExecutorPlayerAdapter(AsyncPlayerPort):
+    """Runs a blocking PlayerPort on a dedicated worker thread.
+
+    A single worker keeps player commands in the order they were issued.
+    """
+
+    def __init__(self, player: PlayerPort, executor: ThreadPoolExecutor | None = None):
+        self.player = player
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="jukebox-player")
+
+    async def play(self, uri: str, shuffle: bool = False) -> None:
+        await self._run(functools.partial(self.player.play, uri, shuffle))
+
+    async def pause(self) -> None:
+        await self._run(self.player.pause)
+
+    async def resume(self) -> None:
+        await self._run(self.player.resume)
+
+    async def stop(self) -> None:
+        await self._run(self.player.stop)
+
+    async def close(self) -> None:
+        await self._run(self.player.close)
+        self.executor.shutdown(wait=False)
+
+    async def _run(self, call: Callable[[], None]) -> None:
+        await asyncio.get_running_loop().run_in_executor(self.executor, call)
@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+from requests.exceptions import RequestException
+from soco import SoCo
+from soco.exceptions import SoCoException
+from urllib3.exceptions import HTTPError
+
+LOGGER = logging.getLogger("jukebox")
+
+# Sonos sends events asynchronously; state evented this soon after one of our own
+# commands may still describe the speaker before the command took effect.
+EVENT_SETTLE_SECONDS = 1.0
+
+_SUBSCRIPTION_ERRORS = (HTTPError, OSError, RequestException, SoCoException)
+
+
+@dataclass(frozen=True)
+class SonosTransportSnapshot:
+    """Coordinator transport state as last evented by the speaker."""
+
+    transport_state: str | None = None
+    number_of_tracks: int | None = None
+    play_mode: str | None = None
+    transport_uri: str | None = None
+    received_at: float = 0.0
+
+    @property
+    def queue_is_source(self) -> bool:
+        return self.transport_uri is not None and self.transport_uri.startswith("x-rincon-queue:")
+
+
+class SonosEventMonitor:
+    """Follows a Sonos coordinator through AVTransport and ZoneGroupTopology events.
+
+    Events keep a cached transport state, so the player can skip commands that
+    would not change anything, and keep SoCo's group topology up to date, so a
+    coordinator change is noticed without running discovery again.
+    """
+
+    def __init__(self, settle_seconds: float = EVENT_SETTLE_SECONDS):
+        self.settle_seconds = settle_seconds
+        self.speaker: SoCo | None = None
+        self._subscriptions: list = []
+        self._lock = threading.Lock()
+        self._transport: SonosTransportSnapshot | None = None
+        self._trusted_after = 0.0
+        self._coordinator_uid: str | None = None
+
+    @property
+    def is_active(self) -> bool:
+        with self._lock:
+            return bool(self._subscriptions) and all(sub.is_subscribed for sub in self._subscriptions)
+
+    def start(self, speaker: SoCo) -> bool:
+        """Subscribe to the events of `speaker`, replacing any previous subscriptions."""
+        self.stop()
+        self.speaker = speaker
+        try:
+            transport_subscription = speaker.avTransport.subscribe(auto_renew=True)
+            transport_subscription.callback = self._on_transport_event
+            transport_subscription.auto_renew_fail = self._on_renew_failure
+            self._subscriptions.append(transport_subscription)
+
+            topology_subscription = speaker.zoneGroupTopology.subscribe(auto_renew=True)
+            topology_subscription.callback = self._on_topology_event
+            topology_subscription.auto_renew_fail = self._on_renew_failure
+            self._subscriptions.append(topology_subscription)
+        except _SUBSCRIPTION_ERRORS as err:
+            LOGGER.warning("Failed to subscribe to Sonos events, falling back to blind commands: %s", err)
+            self.stop()
+            return False
+
+        LOGGER.info("Subscribed to Sonos transport and topology events")
+        return True
+
+    def stop(self) -> None:
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+            self._transport = None
+            self._coordinator_uid = None
+        for subscription in subscriptions:
+            try:
+                subscription.unsubscribe()
+            except _SUBSCRIPTION_ERRORS as err:
+                LOGGER.debug("Failed to unsubscribe from Sonos events: %s", err)
+
+    def expect_change(self) -> None:
+        """Distrust state evented before a command just sent has settled."""
+        with self._lock:
+            self._trusted_after = time.monotonic() + self.settle_seconds
+
+    def transport(self) -> SonosTransportSnapshot | None:
+        """Return the evented transport state, or None when it cannot be trusted."""
+        if not self.is_active:
+            return None
+        with self._lock:
+            transport = self._transport
+            if transport is None or transport.received_at < self._trusted_after:
+                return None
+            return transport
+
+    def coordinator_changed(self) -> bool:
+        """Whether the monitored speaker stopped coordinating its group since subscribing."""
+        with self._lock:
+            coordinator_uid = self._coordinator_uid
+        speaker = self.speaker
+        return speaker is not None and coordinator_uid is not None and coordinator_uid != speaker.uid
+
+    def current_coordinator(self) -> SoCo | None:
+        """Coordinator of the monitored speaker's group, from evented topology."""
+        speaker = self.speaker
+        if speaker is None:
+            return None
+        group = speaker.group
+        return group.coordinator if group is not None else None
+
+    def _on_transport_event(self, event) -> None:
+        variables = event.variables
+        with self._lock:
+            previous = self._transport or SonosTransportSnapshot()
+            self._transport = SonosTransportSnapshot(
+                transport_state=variables.get("transport_state", previous.transport_state),
+                number_of_tracks=_as_int(variables.get("number_of_tracks"), previous.number_of_tracks),
+                play_mode=variables.get("current_play_mode", previous.play_mode),
+                transport_uri=variables.get("av_transport_uri", previous.transport_uri),
+                received_at=time.monotonic(),
+            )
+        LOGGER.debug("Sonos transport evented: %s", self._transport)
+
+    def _on_topology_event(self, event) -> None:
+        speaker = self.speaker
+        payload = event.variables.get("zone_group_state")
+        if speaker is None or not payload:
+            return
+        # SoCo stops polling the topology while subscribed, so feed it the event.
+        speaker.zone_group_state.process_payload(payload=payload, source="event", source_ip=speaker.ip_address)
+        coordinator = self.current_coordinator()
+        if coordinator is None:
+            return
+        with self._lock:
+            previous_uid, self._coordinator_uid = self._coordinator_uid, coordinator.uid
+        if previous_uid is not None and previous_uid != coordinator.uid:
+            LOGGER.info("Sonos group of `%s` is now coordinated by `%s`", speaker.player_name, coordinator.player_name)
+
+    def _on_renew_failure(self, err: Exception) -> None:
+        LOGGER.warning("Sonos event subscription expired, falling back to blind commands: %s", err)
+        with self._lock:
+            self._transport = None
+
+
+def _as_int(value, default: int | None) -> int | None:
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
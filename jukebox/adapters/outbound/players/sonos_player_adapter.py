@@ -1,5 +1,11 @@
 import logging
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Literal
 
 import soco
 from requests.exceptions import RequestException
@@ -8,7 +14,7 @@ from soco.exceptions import SoCoException, SoCoUPnPException
 from soco.plugins.sharelink import ShareLinkPlugin
 from urllib3.exceptions import HTTPError
 
-from jukebox.domain.errors import PlaybackError
+from jukebox.domain.errors import PlaybackError, PlayerUnreachableError
 from jukebox.domain.ports import PlayerPort
 from jukebox.settings.entities import ResolvedSonosGroupRuntime
 from jukebox.settings.errors import ErrorCode, InvalidSettingsError
@@ -18,9 +24,35 @@ from jukebox.sonos.service import (
     playback_target_from_runtime_group,
 )
 
+from .sonos_event_monitor import SonosEventMonitor
+from .sonos_session_pool import SonosHttpSessionPool
+
 LOGGER = logging.getLogger("jukebox")
 _SONOS_TRANSPORT_ERRORS = (HTTPError, OSError, RequestException, SoCoException)
 
+SonosPlayStrategy = Literal["standard", "fast"]
+
+# The fast play strategy only trusts what it set on the speaker for this long;
+# changes made from the Sonos app in between are not observed.
+KNOWN_TRANSPORT_STATE_TTL_SECONDS = 300.0
+
+_GROUP_OPERATION_MAX_WORKERS = 8
+
+_PREPARED_URIS_MAX_SIZE = 32
+
+
+@dataclass(frozen=True)
+class _KnownTransportState:
+    """Queue and transport state last applied to the speaker by this adapter."""
+
+    play_mode: str | None = None
+    queue_empty: bool = False
+    queue_is_source: bool = False
+    updated_at: float = 0.0
+
+
+_UNKNOWN_TRANSPORT_STATE = _KnownTransportState()
+
 
 def _log_upnp_failure(command_name: str, err: SoCoUPnPException) -> None:
     if "UPnP Error 804" in str(err.message):
@@ -44,9 +76,21 @@ class SonosPlayerAdapter(PlayerPort):
         name: str | None = None,
         group: ResolvedSonosGroupRuntime | None = None,
         *,
+        play_strategy: SonosPlayStrategy = "standard",
+        session_pool: SonosHttpSessionPool | None = None,
+        event_monitor: SonosEventMonitor | None = None,
         sonos_playback_target_resolver: SonosPlaybackTargetResolver,
     ):
         self.manual_name = name
+        self.play_strategy = play_strategy
+        self._transport_state = _UNKNOWN_TRANSPORT_STATE
+        # URI -> whether it is a share link; filled by `prepare`.
+        self._prepared_uris: OrderedDict[str, bool] = OrderedDict()
+        self._prepared_uris_lock = threading.Lock()
+        self.session_pool = session_pool
+        self.event_monitor = event_monitor
+        if session_pool is not None:
+            session_pool.install()
         self.group = group
         self.playback_target = playback_target_from_runtime_group(group)
         self.sonos_playback_target_resolver = sonos_playback_target_resolver
@@ -54,18 +98,26 @@ class SonosPlayerAdapter(PlayerPort):
 
         try:
             if group is not None:
-                coordinator_host = host or group.coordinator.host
-                self.speaker = SoCo(coordinator_host)
                 # Apply the saved selection once at startup. Later regrouping in the
                 # Sonos app is intentionally left alone until jukebox restarts.
-                self._enforce_group(group)
+                self._start_group(host, group)
             elif host:
                 self.speaker = SoCo(host)
             else:
                 self.speaker = self._discover(name)
 
             speaker_info = self._refresh_speaker_metadata()
-        except (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException) as err:
+        except (
+            HTTPError,
+            OSError,
+            RequestException,
+            RuntimeError,
+            ValueError,
+            SoCoException,
+            SoCoUPnPException,
+        ) as err:
+            if session_pool is not None:
+                session_pool.uninstall()
             raise InvalidSettingsError(
                 f"Failed to initialize Sonos player: {err}",
                 code=ErrorCode.INVALID_EFFECTIVE,
@@ -77,6 +129,28 @@ class SonosPlayerAdapter(PlayerPort):
             speaker_info.get("software_version", None),
         )
         self.sharelink = ShareLinkPlugin(self.speaker)
+        self._start_event_monitor()
+
+    def _start_group(self, host: str | None, group: ResolvedSonosGroupRuntime) -> None:
+        try:
+            self.speaker = SoCo(host or group.coordinator.host)
+            self._enforce_group(group)
+            return
+        except (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException) as err:
+            if self.playback_target is None:
+                raise
+            # The group may come from the last known group cache, with hosts that are stale by now.
+            LOGGER.warning("Failed to apply the Sonos group, resolving it again: %s", err)
+            self.sonos_playback_target_resolver.invalidate_playback_target(self.playback_target)
+            resolved_group = self.sonos_playback_target_resolver.resolve_playback_target(self.playback_target)
+            if resolved_group == group:
+                raise
+
+        group = resolved_group
+        self.speaker = SoCo(group.coordinator.host)
+        self._enforce_group(group)
+        self.group = group
+        self.playback_target = playback_target_from_runtime_group(group)
 
     @staticmethod
     def _discover(name: str | None = None) -> SoCo:
@@ -107,39 +181,94 @@ class SonosPlayerAdapter(PlayerPort):
         if group.is_partial:
             LOGGER.warning("Applying Sonos group best-effort with missing saved members: %s", group.missing_member_uids)
 
-        try:
-            for member in group.members:
-                if member.uid == group.coordinator.uid:
-                    continue
-
-                speaker = speakers_by_uid[member.uid]
-                if self._is_joined_to_coordinator(speaker, coordinator):
-                    continue
-
-                rollback_coordinator = self._get_rollback_coordinator_for_join(speaker)
-                LOGGER.info(
-                    "Joining Sonos speaker `%s` to `%s` before playback",
-                    speaker.player_name,
-                    coordinator.player_name,
-                )
-                speaker.join(coordinator)
-                applied_operations.append(("join", speaker, rollback_coordinator))
+        other_speakers = [
+            speakers_by_uid[member.uid] for member in group.members if member.uid != group.coordinator.uid
+        ]
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(other_speakers), _GROUP_OPERATION_MAX_WORKERS)),
+            thread_name_prefix="jukebox-sonos-group",
+        ) as executor:
+            memberships = list(
+                executor.map(lambda speaker: self._inspect_membership(speaker, coordinator), other_speakers)
+            )
 
-            current_group = coordinator.group
-            if current_group is not None:
-                for current_member in list(current_group.members):
-                    if current_member.uid in desired_member_uids or self._is_nonstandalone_group_member(current_member):
+            try:
+                joins = []
+                for speaker, membership in zip(other_speakers, memberships, strict=True):
+                    joined, rollback_coordinator = membership
+                    if joined:
                         continue
-
                     LOGGER.info(
-                        "Removing Sonos speaker `%s` from coordinator group before playback",
-                        current_member.player_name,
+                        "Joining Sonos speaker `%s` to `%s` before playback",
+                        speaker.player_name,
+                        coordinator.player_name,
+                    )
+                    joins.append(
+                        ("join", speaker, rollback_coordinator, lambda speaker=speaker: speaker.join(coordinator))
                     )
-                    current_member.unjoin()
-                    applied_operations.append(("unjoin", current_member, None))
-        except Exception:
-            self._rollback_group_changes(applied_operations, coordinator)
-            raise
+                self._apply_group_operations(executor, joins, applied_operations)
+
+                unjoins = []
+                current_group = coordinator.group
+                if current_group is not None:
+                    for current_member in list(current_group.members):
+                        if current_member.uid in desired_member_uids or self._is_nonstandalone_group_member(
+                            current_member
+                        ):
+                            continue
+
+                        LOGGER.info(
+                            "Removing Sonos speaker `%s` from coordinator group before playback",
+                            current_member.player_name,
+                        )
+                        unjoins.append(("unjoin", current_member, None, current_member.unjoin))
+                self._apply_group_operations(executor, unjoins, applied_operations)
+            except Exception:
+                self._rollback_group_changes(applied_operations, coordinator)
+                raise
+
+    def _inspect_membership(self, speaker: SoCo, coordinator: SoCo) -> tuple[bool, SoCo | None]:
+        started_at = time.monotonic()
+        joined = self._is_joined_to_coordinator(speaker, coordinator)
+        rollback_coordinator = None if joined else self._get_rollback_coordinator_for_join(speaker)
+        LOGGER.debug(
+            "Inspected Sonos group membership of `%s` in %.0f ms",
+            speaker.player_name,
+            (time.monotonic() - started_at) * 1000,
+        )
+        return joined, rollback_coordinator
+
+    @staticmethod
+    def _apply_group_operations(executor: ThreadPoolExecutor, operations, applied_operations: list) -> None:
+        """Run a batch of join/unjoin operations concurrently, recording those that succeeded.
+
+        The first failure, in submission order, is raised once the whole batch has settled
+        so that every operation that did go through is known to the rollback.
+        """
+
+        def timed(operation_name: str, speaker: SoCo, apply: Callable[[], None]) -> None:
+            started_at = time.monotonic()
+            apply()
+            LOGGER.debug(
+                "Sonos %s for `%s` took %.0f ms",
+                operation_name,
+                speaker.player_name,
+                (time.monotonic() - started_at) * 1000,
+            )
+
+        futures = [
+            (operation_name, speaker, rollback_target, executor.submit(timed, operation_name, speaker, apply))
+            for operation_name, speaker, rollback_target, apply in operations
+        ]
+        errors = []
+        for operation_name, speaker, rollback_target, future in futures:
+            error = future.exception()
+            if error is None:
+                applied_operations.append((operation_name, speaker, rollback_target))
+            else:
+                errors.append(error)
+        if errors:
+            raise errors[0]
 
     def _rollback_group_changes(self, applied_operations, coordinator: SoCo) -> None:
         for operation, speaker, rollback_target in reversed(applied_operations):
@@ -227,28 +356,79 @@ class SonosPlayerAdapter(PlayerPort):
             member_uids=(uid,),
         )
 
-    def _execute_with_recovery(self, command_name: str, command: Callable[[], None]) -> None:
+    def _log_connection_reuse(self, command_name: str) -> None:
+        if self.session_pool is None or not LOGGER.isEnabledFor(logging.DEBUG):
+            return
+        for stats in self.session_pool.stats():
+            LOGGER.debug(
+                "%s: %d of %d Sonos HTTP requests to %s reused an open connection",
+                command_name,
+                stats.reused,
+                stats.requests,
+                stats.host,
+            )
+
+    def _start_event_monitor(self) -> None:
+        if self.event_monitor is not None:
+            self.event_monitor.start(self.speaker)
+
+    def _follow_coordinator_change(self, command_name: str) -> None:
+        monitor = self.event_monitor
+        if monitor is None or not monitor.coordinator_changed():
+            return
+        coordinator = monitor.current_coordinator()
+        if coordinator is None:
+            return
+
+        LOGGER.info(
+            "%s: Sonos player `%s` was regrouped, sending commands to its coordinator `%s`",
+            command_name,
+            self.speaker_name,
+            coordinator.player_name,
+        )
+        self.speaker = coordinator
+        self._forget_transport_state()
+        self._refresh_speaker_metadata()
+        self.sharelink = ShareLinkPlugin(self.speaker)
+        self._start_event_monitor()
+
+    def _run_command(self, command: Callable[[], None]) -> None:
         try:
             command()
+        finally:
+            if self.event_monitor is not None:
+                self.event_monitor.expect_change()
+
+    def _execute_with_recovery(self, command_name: str, command: Callable[[], None]) -> None:
+        try:
+            self._follow_coordinator_change(command_name)
+            self._run_command(command)
+            self._log_connection_reuse(command_name)
             return
         except SoCoUPnPException as err:
+            self._forget_transport_state()
             _log_upnp_failure(command_name, err)
             raise PlaybackError(str(err)) from err
         except _SONOS_TRANSPORT_ERRORS as err:
+            self._forget_transport_state()
             LOGGER.warning("%s failed for Sonos player `%s`: %s", command_name, self.speaker_name, err)
             original_error = err
 
         if not self._recover_speaker(command_name):
-            raise PlaybackError(str(original_error)) from original_error
+            raise PlayerUnreachableError(str(original_error)) from original_error
 
         try:
-            command()
+            self._run_command(command)
         except SoCoUPnPException as err:
+            self._forget_transport_state()
             _log_upnp_failure(command_name, err)
             raise PlaybackError(str(err)) from err
         except _SONOS_TRANSPORT_ERRORS as err:
+            self._forget_transport_state()
+            self._invalidate_playback_target()
             LOGGER.warning("%s failed after Sonos recovery for `%s`: %s", command_name, self.speaker_name, err)
-            raise PlaybackError(str(err)) from err
+            raise PlayerUnreachableError(str(err)) from err
+        self._log_connection_reuse(command_name)
 
     def _recover_speaker(self, command_name: str) -> bool:
         playback_target = self.playback_target
@@ -262,8 +442,32 @@ class SonosPlayerAdapter(PlayerPort):
         return False
 
     def _recover_playback_target(self, command_name: str, playback_target: SonosPlaybackTarget) -> bool:
+        resolved_group = self._resolve_playback_target(command_name, playback_target)
+        if resolved_group is None:
+            return False
+
+        if not self._try_switch_to_resolved_group(command_name, resolved_group):
+            # The resolver may have answered from cached topology that is now stale.
+            self.sonos_playback_target_resolver.invalidate_playback_target(playback_target)
+            resolved_group = self._resolve_playback_target(command_name, playback_target)
+            if resolved_group is None or not self._try_switch_to_resolved_group(command_name, resolved_group):
+                return False
+
+        LOGGER.info(
+            "%s recovered Sonos player `%s` at `%s`",
+            command_name,
+            self.speaker_name,
+            resolved_group.coordinator.host,
+        )
+        return True
+
+    def _resolve_playback_target(
+        self,
+        command_name: str,
+        playback_target: SonosPlaybackTarget,
+    ) -> ResolvedSonosGroupRuntime | None:
         try:
-            resolved_group = self.sonos_playback_target_resolver.resolve_playback_target(playback_target)
+            return self.sonos_playback_target_resolver.resolve_playback_target(playback_target)
         except (
             HTTPError,
             OSError,
@@ -274,8 +478,9 @@ class SonosPlayerAdapter(PlayerPort):
             SoCoUPnPException,
         ) as err:
             LOGGER.warning("%s could not re-resolve Sonos player `%s`: %s", command_name, self.speaker_name, err)
-            return False
+            return None
 
+    def _try_switch_to_resolved_group(self, command_name: str, resolved_group: ResolvedSonosGroupRuntime) -> bool:
         try:
             self._switch_to_resolved_group(resolved_group)
         except (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException) as err:
@@ -286,15 +491,12 @@ class SonosPlayerAdapter(PlayerPort):
                 err,
             )
             return False
-
-        LOGGER.info(
-            "%s recovered Sonos player `%s` at `%s`",
-            command_name,
-            self.speaker_name,
-            resolved_group.coordinator.host,
-        )
         return True
 
+    def _invalidate_playback_target(self) -> None:
+        if self.playback_target is not None:
+            self.sonos_playback_target_resolver.invalidate_playback_target(self.playback_target)
+
     def _switch_to_resolved_group(self, resolved_group: ResolvedSonosGroupRuntime) -> None:
         enforce_group = self.group is not None
         self.speaker = SoCo(resolved_group.coordinator.host)
@@ -304,12 +506,14 @@ class SonosPlayerAdapter(PlayerPort):
         self.playback_target = playback_target_from_runtime_group(resolved_group)
         self._refresh_speaker_metadata()
         self.sharelink = ShareLinkPlugin(self.speaker)
+        self._start_event_monitor()
 
     def _recover_by_name(self, command_name: str) -> bool:
         try:
             self.speaker = self._discover(self.manual_name)
             self._refresh_speaker_metadata()
             self.sharelink = ShareLinkPlugin(self.speaker)
+            self._start_event_monitor()
         except (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException) as err:
             LOGGER.warning("%s could not rediscover Sonos player named `%s`: %s", command_name, self.manual_name, err)
             return False
@@ -317,18 +521,74 @@ class SonosPlayerAdapter(PlayerPort):
         LOGGER.info("%s rediscovered Sonos player `%s`", command_name, self.speaker_name)
         return True
 
+    def _evented_transport_state(self) -> _KnownTransportState | None:
+        if self.event_monitor is None:
+            return None
+        transport = self.event_monitor.transport()
+        if transport is None:
+            return None
+        return _KnownTransportState(
+            play_mode=transport.play_mode,
+            queue_empty=transport.number_of_tracks == 0,
+            queue_is_source=transport.queue_is_source,
+            updated_at=transport.received_at,
+        )
+
+    def _evented_transport_is(self, *states: str) -> bool:
+        if self.event_monitor is None:
+            return False
+        transport = self.event_monitor.transport()
+        return transport is not None and transport.transport_state in states
+
+    def _known_transport_state(self) -> _KnownTransportState:
+        evented_state = self._evented_transport_state()
+        if evented_state is not None:
+            return evented_state
+        state = self._transport_state
+        if self.play_strategy != "fast" or state is _UNKNOWN_TRANSPORT_STATE:
+            return _UNKNOWN_TRANSPORT_STATE
+        if time.monotonic() - state.updated_at > KNOWN_TRANSPORT_STATE_TTL_SECONDS:
+            return _UNKNOWN_TRANSPORT_STATE
+        return state
+
+    def _remember_transport_state(self, play_mode: str | None, queue_empty: bool, queue_is_source: bool) -> None:
+        if self.play_strategy != "fast":
+            return
+        self._transport_state = _KnownTransportState(
+            play_mode=play_mode,
+            queue_empty=queue_empty,
+            queue_is_source=queue_is_source,
+            updated_at=time.monotonic(),
+        )
+
+    def _forget_transport_state(self) -> None:
+        self._transport_state = _UNKNOWN_TRANSPORT_STATE
+
     def play(self, uri: str, shuffle: bool = False) -> None:
         def command() -> None:
             LOGGER.info("Playing `%s` on the player `%s`", uri, self.speaker_name)
-            self.speaker.clear_queue()
+            play_mode = "SHUFFLE_NOREPEAT" if shuffle else "NORMAL"
+            known_state = self._known_transport_state()
+            if not known_state.queue_empty:
+                self.speaker.clear_queue()
             _ = self.handle_uri(uri)
-            self.speaker.play_mode = "SHUFFLE_NOREPEAT" if shuffle else "NORMAL"
-            self.speaker.play_from_queue(index=0, start=True)
+            if known_state.play_mode != play_mode:
+                self.speaker.play_mode = play_mode
+            if known_state.queue_is_source:
+                # The queue was emptied before adding the disc, so the transport
+                # already points at its first track: only Play is needed.
+                self.speaker.avTransport.Play([("InstanceID", 0), ("Speed", 1)])
+            else:
+                self.speaker.play_from_queue(index=0, start=True)
+            self._remember_transport_state(play_mode, queue_empty=False, queue_is_source=True)
 
         self._execute_with_recovery("play", command)
 
     def pause(self) -> None:
         def command() -> None:
+            if self._evented_transport_is("PAUSED_PLAYBACK", "STOPPED", "NO_MEDIA_PRESENT"):
+                LOGGER.debug("Player `%s` is not playing, skipping pause", self.speaker_name)
+                return
             LOGGER.info("Pausing player `%s`", self.speaker_name)
             self.speaker.pause()
 
@@ -336,6 +596,9 @@ class SonosPlayerAdapter(PlayerPort):
 
     def resume(self) -> None:
         def command() -> None:
+            if self._evented_transport_is("PLAYING", "TRANSITIONING"):
+                LOGGER.debug("Player `%s` is already playing, skipping resume", self.speaker_name)
+                return
             LOGGER.info("Resuming player `%s`", self.speaker_name)
             self.speaker.play()
 
@@ -343,12 +606,51 @@ class SonosPlayerAdapter(PlayerPort):
 
     def stop(self) -> None:
         def command() -> None:
+            known_state = self._known_transport_state()
+            if known_state.queue_empty:
+                LOGGER.debug("Queue of player `%s` is already empty, skipping stop", self.speaker_name)
+                return
             LOGGER.info("Stopping player `%s` and clearing its queue", self.speaker_name)
             self.speaker.clear_queue()
+            self._remember_transport_state(
+                known_state.play_mode, queue_empty=True, queue_is_source=known_state.queue_is_source
+            )
 
         self._execute_with_recovery("stop", command)
 
+    def close(self) -> None:
+        """Stop following speaker events and give SoCo back its own HTTP requests."""
+        if self.event_monitor is not None:
+            self.event_monitor.stop()
+        if self.session_pool is not None:
+            self.session_pool.uninstall()
+
+    def target_key(self) -> str | None:
+        """Identify where commands currently go: the coordinator host, else its household."""
+        host = getattr(self.speaker, "ip_address", None)
+        if isinstance(host, str) and host:
+            return host
+        if self.playback_target is not None:
+            return self.playback_target.household_id
+        return None
+
+    def prepare(self, uri: str) -> None:
+        with self._prepared_uris_lock:
+            if uri in self._prepared_uris:
+                self._prepared_uris.move_to_end(uri)
+                return
+        is_share_link = self.sharelink.is_share_link(uri)
+        with self._prepared_uris_lock:
+            self._prepared_uris[uri] = is_share_link
+            if len(self._prepared_uris) > _PREPARED_URIS_MAX_SIZE:
+                self._prepared_uris.popitem(last=False)
+        LOGGER.debug("Prepared `%s` for the player `%s`", uri, self.speaker_name)
+
     def handle_uri(self, uri):
-        if self.sharelink.is_share_link(uri):
+        with self._prepared_uris_lock:
+            is_share_link = self._prepared_uris.get(uri)
+        if is_share_link is None:
+            is_share_link = self.sharelink.is_share_link(uri)
+        if is_share_link:
             return self.sharelink.add_share_link_to_queue(uri, position=1)
         return self.speaker.add_uri_to_queue(uri, position=1)
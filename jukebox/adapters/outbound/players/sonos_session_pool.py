@@ -0,0 +1,198 @@
+import itertools
+import logging
+import threading
+import weakref
+from dataclasses import dataclass
+from types import ModuleType
+from urllib.parse import urlsplit
+
+import requests
+import soco.core
+import soco.services
+from requests.adapters import HTTPAdapter
+
+LOGGER = logging.getLogger("jukebox")
+
+# SoCo sends its UPnP requests through these modules' module-level `requests`.
+_SOCO_REQUEST_MODULES: tuple[ModuleType, ...] = (soco.core, soco.services)
+
+
+@dataclass(frozen=True)
+class SonosConnectionStats:
+    host: str
+    requests: int
+    connections: int
+
+    @property
+    def reused(self) -> int:
+        """Requests sent over an already open connection."""
+        return max(self.requests - self.connections, 0)
+
+
+class SonosHttpSessionPool:
+    """Keep-alive HTTP sessions per Sonos speaker host, shared by all SoCo calls.
+
+    SoCo opens a new TCP connection for every UPnP request. Once installed, the
+    pool routes those requests through a `requests.Session` per host so that
+    consecutive playback commands reuse the same connection. `requests.Session`
+    is not thread-safe, so each thread gets its own session per host, closed
+    once the thread ends.
+
+    Installing patches SoCo for the whole process: the owner must call
+    `uninstall` when it is done, which puts back whatever was installed before.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        # Sessions of live threads by thread token, so `close` and `stats` can reach them.
+        self._thread_sessions: dict[int, dict[str, requests.Session]] = {}
+        self._thread_tokens = itertools.count()
+        self._request_counts: dict[str, int] = {}
+        # Connections opened by sessions that are closed by now, per host.
+        self._closed_connections: dict[str, int] = {}
+        self._previous_requests: dict[ModuleType, object] = {}
+        self._lock = threading.Lock()
+
+    def install(self) -> None:
+        """Route SoCo's UPnP requests through this pool."""
+        facade = _SoCoRequests(self)
+        for module in _SOCO_REQUEST_MODULES:
+            current = getattr(module, "requests", requests)
+            if isinstance(current, _SoCoRequests) and current.pool is self:
+                continue
+            if isinstance(current, _SoCoRequests):
+                LOGGER.warning("Replacing the Sonos HTTP session pool installed in %s", module.__name__)
+            self._previous_requests[module] = current
+            module.requests = facade
+
+    def uninstall(self) -> None:
+        """Put back what SoCo used before `install` and close the sessions."""
+        for module, previous in self._previous_requests.items():
+            current = getattr(module, "requests", None)
+            # Pools installed on top of this one are chained through their own
+            # `_previous_requests`: unlink this pool from that chain.
+            while isinstance(current, _SoCoRequests) and current.pool is not self:
+                newer_pool = current.pool
+                current = newer_pool._previous_requests.get(module)
+                if isinstance(current, _SoCoRequests) and current.pool is self:
+                    newer_pool._previous_requests[module] = previous
+                    break
+            else:
+                if isinstance(current, _SoCoRequests):
+                    module.requests = previous
+        self._previous_requests.clear()
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            thread_sessions = list(self._thread_sessions.values())
+            self._thread_sessions.clear()
+            self._request_counts.clear()
+            self._closed_connections.clear()
+        for sessions in thread_sessions:
+            for session in list(sessions.values()):
+                session.close()
+            sessions.clear()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self._session_for(url).request(method, url, **kwargs)
+
+    def stats(self) -> list[SonosConnectionStats]:
+        """Requests and opened connections per speaker host since the pool was created."""
+        with self._lock:
+            sessions = [item for thread_sessions in self._thread_sessions.values() for item in thread_sessions.items()]
+            request_counts = dict(self._request_counts)
+            connections = dict(self._closed_connections)
+        for host, session in sessions:
+            connections[host] = connections.get(host, 0) + _opened_connections(session, host)
+        return [
+            SonosConnectionStats(host=host, requests=request_counts.get(host, 0), connections=host_connections)
+            for host, host_connections in sorted(connections.items())
+        ]
+
+    def _session_for(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc
+        thread_sessions = self._current_thread_sessions()
+        with self._lock:
+            self._thread_sessions.setdefault(thread_sessions.token, thread_sessions.sessions)
+            session = thread_sessions.sessions.get(host)
+            if session is None:
+                LOGGER.debug("Opening keep-alive HTTP session to Sonos speaker at %s", host)
+                session = requests.Session()
+                thread_sessions.sessions[host] = session
+            self._request_counts[host] = self._request_counts.get(host, 0) + 1
+        return session
+
+    def _current_thread_sessions(self) -> "_ThreadSessions":
+        thread_sessions = getattr(self._local, "sessions", None)
+        if thread_sessions is None:
+            thread_sessions = _ThreadSessions(next(self._thread_tokens))
+            # Thread-local values are dropped with their thread, which closes its sessions.
+            weakref.finalize(
+                thread_sessions,
+                _close_thread_sessions,
+                thread_sessions.token,
+                thread_sessions.sessions,
+                self._thread_sessions,
+                self._closed_connections,
+                self._lock,
+            )
+            self._local.sessions = thread_sessions
+        return thread_sessions
+
+
+class _ThreadSessions:
+    """Sessions of one thread, per host."""
+
+    def __init__(self, token: int):
+        self.token = token
+        self.sessions: dict[str, requests.Session] = {}
+
+
+def _close_thread_sessions(
+    token: int,
+    sessions: dict[str, requests.Session],
+    thread_sessions: dict[int, dict[str, requests.Session]],
+    closed_connections: dict[str, int],
+    lock: threading.Lock,
+) -> None:
+    with lock:
+        if thread_sessions.pop(token, None) is None:
+            # Already closed along with the whole pool.
+            return
+        items = list(sessions.items())
+        for host, session in items:
+            closed_connections[host] = closed_connections.get(host, 0) + _opened_connections(session, host)
+        sessions.clear()
+    for _, session in items:
+        session.close()
+
+
+def _opened_connections(session: requests.Session, host: str) -> int:
+    adapter = session.get_adapter(f"http://{host}/")
+    if not isinstance(adapter, HTTPAdapter):
+        return 0
+    # Each session only talks to one host, so every urllib3 pool belongs to it.
+    # urllib3's pool container cannot be iterated directly, only through its keys.
+    pools = adapter.poolmanager.pools
+    pool_keys = pools.keys()
+    return sum(pools[key].num_connections for key in pool_keys)
+
+
+class _SoCoRequests:
+    """Stands in for the `requests` module inside SoCo and sends through the pool."""
+
+    def __init__(self, pool: SonosHttpSessionPool):
+        self.pool = pool
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.pool.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.pool.request("GET", url, **kwargs)
+
+    def post(self, url: str, data=None, **kwargs) -> requests.Response:
+        return self.pool.request("POST", url, data=data, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(requests, name)
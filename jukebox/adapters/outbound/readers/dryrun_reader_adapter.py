@@ -17,6 +17,10 @@ class DryrunReaderAdapter(ReaderPort):
         self.uid = None
         self.hold_until = None
 
+    @property
+    def read_budget_seconds(self) -> float:
+        return DEFAULT_LOOP_INTERVAL_SECONDS
+
     def read(self) -> str | None:
         if self.uid is not None and self.hold_until is not None and time.monotonic() < self.hold_until:
             LOGGER.info("Reading tag %s", self.uid)
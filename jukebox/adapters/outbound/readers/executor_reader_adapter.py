@@ -0,0 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from jukebox.domain.ports import AsyncReaderPort, ReaderPort
+
+
+class ExecutorReaderAdapter(AsyncReaderPort):
+    """Runs a blocking ReaderPort on a dedicated worker thread.
+
+    A single worker keeps reads serialized, since reader drivers are not
+    thread-safe.
+    """
+
+    def __init__(self, reader: ReaderPort, executor: ThreadPoolExecutor | None = None):
+        self.reader = reader
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="jukebox-reader")
+
+    @property
+    def read_budget_seconds(self) -> float:
+        return self.reader.read_budget_seconds
+
+    def set_low_power(self, enabled: bool) -> None:
+        self.reader.set_low_power(enabled)
+
+    async def read(self) -> str | None:
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self.reader.read)
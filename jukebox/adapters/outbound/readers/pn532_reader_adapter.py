@@ -9,6 +9,13 @@ except ModuleNotFoundError as err:
     raise MissingOptionalDependencyError("The `pn532` reader", "pn532", "jukebox ...") from err
 
 from jukebox.domain.ports import ReaderPort
+from jukebox.pn532.profiles import (
+    DEFAULT_PN532_TIMING,
+    DEFAULT_SPI_MAX_SPEED_HZ,
+    Pn532DetectionMode,
+    Pn532SpiTransferMode,
+    Pn532TimingParams,
+)
 from jukebox.shared.timing import DEFAULT_NFC_READ_TIMEOUT_SECONDS
 
 LOGGER = logging.getLogger("jukebox")
@@ -23,14 +30,27 @@ def spi_active():
 
 
 class Pn532ReaderAdapter(ReaderPort):
-    """Adapter for Pn532 NFC reader implementing ReaderPort."""
+    """Adapter for Pn532 NFC reader implementing ReaderPort.
+
+    In ``auto_poll`` detection mode the PN532 runs InAutoPoll on its own and each
+    read only collects its result, instead of sending InListPassiveTarget per read.
+
+    In low power mode the PN532 is put in PowerDown after every read that found
+    no tag; the next read wakes it up over SPI. Low power mode is ignored in
+    ``auto_poll`` detection mode: PowerDown would abort InAutoPoll, and every
+    read would then have to wake the PN532 up and start polling again.
+    """
 
     def __init__(
         self,
         read_timeout_seconds: float = DEFAULT_NFC_READ_TIMEOUT_SECONDS,
+        detection_mode: Pn532DetectionMode = "passive_target",
+        timing: Pn532TimingParams = DEFAULT_PN532_TIMING,
         spi_reset: int | None = None,
         spi_cs: int | None = None,
         spi_irq: int | None = None,
+        spi_max_speed_hz: int = DEFAULT_SPI_MAX_SPEED_HZ,
+        spi_transfer_mode: Pn532SpiTransferMode = "standard",
     ):
         if not spi_active():
             error_message = (
@@ -40,8 +60,21 @@ class Pn532ReaderAdapter(ReaderPort):
             LOGGER.error(error_message)
             raise RuntimeError("SPI interface not enabled. Use raspi-config to enable it.")
 
-        self.pn532 = PN532_SPI(debug=False, reset=spi_reset, cs=spi_cs, irq=spi_irq)
+        self.pn532 = PN532_SPI(
+            debug=False,
+            reset=spi_reset,
+            cs=spi_cs,
+            irq=spi_irq,
+            write_delay=timing.write_delay_seconds,
+            read_delay=timing.read_delay_seconds,
+            cs_delay=timing.cs_delay_seconds,
+            max_speed_hz=spi_max_speed_hz,
+            burst=spi_transfer_mode == "burst",
+        )
+        self._timing = timing
         self.read_timeout_seconds = read_timeout_seconds
+        self.detection_mode = detection_mode
+        self._low_power = False
         _ic, ver, rev, _support = self.pn532.get_firmware_version()
         LOGGER.info("Found PN532 with firmware version: %s.%s", ver, rev)
         self._firmware_version: tuple[int, int] = (ver, rev)
@@ -51,8 +84,68 @@ class Pn532ReaderAdapter(ReaderPort):
     def firmware_version(self) -> tuple[int, int]:
         return self._firmware_version
 
+    @property
+    def timing(self) -> Pn532TimingParams:
+        return self._timing
+
+    @timing.setter
+    def timing(self, timing: Pn532TimingParams) -> None:
+        """Apply new frame path delays without re-initializing the PN532."""
+        self.pn532.write_delay = timing.write_delay_seconds
+        self.pn532.read_delay = timing.read_delay_seconds
+        self.pn532.cs_delay = timing.cs_delay_seconds
+        self._timing = timing
+
+    @property
+    def transfer_mode(self) -> Pn532SpiTransferMode:
+        return "burst" if self.pn532.burst else "standard"
+
+    @transfer_mode.setter
+    def transfer_mode(self, transfer_mode: Pn532SpiTransferMode) -> None:
+        self.pn532.burst = transfer_mode == "burst"
+
+    @property
+    def read_budget_seconds(self) -> float:
+        return self.read_timeout_seconds
+
+    def set_low_power(self, enabled: bool) -> None:
+        # Only record the hint: PowerDown is sent from read(), on the reading thread.
+        self._low_power = enabled
+
+    def ping(self) -> bool:
+        """Run one GetFirmwareVersion exchange and tell whether it succeeded."""
+        try:
+            self.pn532.get_firmware_version()
+        except (RuntimeError, OSError):
+            return False
+        return True
+
+    def probe_detection(self) -> bool:
+        """Start InListPassiveTarget then InAutoPoll and tell whether the PN532 acknowledged both.
+
+        No tag is needed: only the command exchanges are checked, and these are
+        the first to fail when the SPI delays are too short.
+        """
+        try:
+            return self.pn532.start_passive_target(timeout=self.read_timeout_seconds) and self.pn532.start_auto_poll(
+                timeout=self.read_timeout_seconds
+            )
+        except (RuntimeError, OSError):
+            return False
+
     def read(self) -> str | None:
-        rawuid = self.pn532.read_passive_target(timeout=self.read_timeout_seconds)
+        if self.detection_mode == "auto_poll":
+            rawuid = self.pn532.read_auto_poll_target(timeout=self.read_timeout_seconds)
+        else:
+            rawuid = self.pn532.read_passive_target(timeout=self.read_timeout_seconds)
         if rawuid is None:
+            if self._low_power and self.detection_mode != "auto_poll":
+                self._power_down()
             return None
         return parse_raw_uid(rawuid)
+
+    def _power_down(self) -> None:
+        try:
+            self.pn532.power_down()
+        except (RuntimeError, OSError) as err:
+            LOGGER.warning("Failed to put the PN532 in PowerDown; continuing at full power: %s", err)
@@ -5,8 +5,12 @@ import select
 import socket
 import struct
 import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait as wait_for_futures
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, TypeVar
+from urllib.parse import urlsplit
 
 from requests.exceptions import RequestException
 from soco.exceptions import SoCoException, SoCoUPnPException
@@ -20,6 +24,8 @@ from jukebox.sonos.discovery import (
 )
 
 LOGGER = logging.getLogger("jukebox")
+_T = TypeVar("_T")
+_R = TypeVar("_R")
 _SONOS_TRANSPORT_ERRORS = (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException)
 
 
@@ -35,7 +41,12 @@ _SSDP_RESPONSE_POLL_INTERVAL_SECONDS = 0.1
 _SSDP_MULTICAST_GROUP = "239.255.255.250"
 _SSDP_MULTICAST_PORT = 1900
 _MAX_SCAN_NETWORK_PREFIX = 22
+_SPEAKER_PROBE_MAX_WORKERS = 8
+_SPEAKER_PROBE_TIMEOUT_SECONDS = 10.0
 _HOUSEHOLD_HEADER_RE = re.compile(rb"(?im)^x-rincon-household:\s*([^\r\n]+)")
+_LOCATION_HEADER_RE = re.compile(rb"(?im)^location:\s*([^\r\n]+)")
+_SSDP_SEARCH_ATTEMPTS = 3
+_SSDP_SEARCH_INTERVAL_SECONDS = 0.25
 _PLAYER_SEARCH = (
     "M-SEARCH * HTTP/1.1\r\n"
     f"HOST: {_SSDP_MULTICAST_GROUP}:{_SSDP_MULTICAST_PORT}\r\n"
@@ -47,28 +58,71 @@ _PLAYER_SEARCH = (
 
 
 class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
+    def __init__(
+        self,
+        max_workers: int = _SPEAKER_PROBE_MAX_WORKERS,
+        probe_timeout_seconds: float = _SPEAKER_PROBE_TIMEOUT_SECONDS,
+    ):
+        self.max_workers = max_workers
+        self.probe_timeout_seconds = probe_timeout_seconds
+
     def discover_speakers(self) -> list[DiscoveredSonosSpeaker]:
         snapshot = self._discover_network_snapshot()
         return self._recover_snapshot_speakers(snapshot)
 
     def discover_household_speakers(self, household_id: str) -> list[DiscoveredSonosSpeaker]:
+        speakers = self._discover_targeted_household_speakers(household_id)
+        if speakers:
+            return speakers
+
         snapshot = self._discover_household_snapshot(household_id)
         return sort_sonos_speakers(
             [speaker for speaker in self._recover_snapshot_speakers(snapshot) if speaker.household_id == household_id]
         )
 
+    def inspect_speaker(self, uid: str, host: str) -> DiscoveredSonosSpeaker:
+        try:
+            return self._resolve_speaker_by_host(uid, host)
+        except ValueError as err:
+            raise SonosDiscoveryError(str(err)) from err
+
+    def _probe_speakers(self, probe: Callable[[_T], _R], items: Iterable[_T]) -> list[tuple[_T, _R | None]]:
+        """Run a network probe per speaker concurrently, giving up on those still running at the deadline.
+
+        Results keep the order of `items`; a probe that missed the deadline yields None.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)),
+            thread_name_prefix="jukebox-sonos-probe",
+        )
+        try:
+            futures = [executor.submit(probe, item) for item in items]
+            _, pending = wait_for_futures(futures, timeout=self.probe_timeout_seconds)
+        finally:
+            # Do not wait for probes that missed the deadline: SoCo's own request timeout ends them.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if pending:
+            LOGGER.debug("%d Sonos speaker probe(s) missed the %ss deadline", len(pending), self.probe_timeout_seconds)
+        return [
+            (item, None if future in pending else future.result()) for item, future in zip(items, futures, strict=True)
+        ]
+
     def _recover_snapshot_speakers(self, snapshot: _SonosDiscoverySnapshot) -> list[DiscoveredSonosSpeaker]:
         speakers_by_uid = {speaker.uid: speaker for speaker in snapshot.speakers}
-        for expected_uid, hosts in snapshot.retry_hosts_by_uid.items():
-            for host in hosts:
-                try:
-                    recovered = self._resolve_speaker_by_host(expected_uid, host)
-                except ValueError:
-                    continue
-
-                existing = speakers_by_uid.get(recovered.uid)
-                speakers_by_uid[recovered.uid] = self._choose_preferred(existing, recovered)
-                break
+        probed = self._probe_speakers(
+            lambda retry: self._recover_speaker(*retry),
+            snapshot.retry_hosts_by_uid.items(),
+        )
+        for _, recovered in probed:
+            if recovered is None:
+                continue
+            existing = speakers_by_uid.get(recovered.uid)
+            speakers_by_uid[recovered.uid] = self._choose_preferred(existing, recovered)
 
         recovered_speakers = sort_sonos_speakers(list(speakers_by_uid.values()))
         if not recovered_speakers and snapshot.normalization_errors:
@@ -78,6 +132,14 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
             )
         return recovered_speakers
 
+    def _recover_speaker(self, expected_uid: str, hosts: list[str]) -> DiscoveredSonosSpeaker | None:
+        for host in hosts:
+            try:
+                return self._resolve_speaker_by_host(expected_uid, host)
+            except ValueError:
+                continue
+        return None
+
     def _discover_network_snapshot(self) -> _SonosDiscoverySnapshot:
         import soco
         import soco.discovery
@@ -130,40 +192,14 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
     # ref: https://soco.readthedocs.io/en/latest/api/soco.discovery.html#soco.discovery.discover
     def _discover_multicast_network_speakers(self) -> set[Any]:
         import soco
-        import soco.discovery
         from requests.exceptions import RequestException
         from soco.exceptions import SoCoException, SoCoUPnPException
         from urllib3.exceptions import HTTPError
 
-        # To make that multicast probe reliable, we send it from each local IPv4
-        # interface via IP_MULTICAST_IF; otherwise we may only probe one network path
-        # and miss reachable households.
-        #
-        # This uses a private SoCo helper because there is no public equivalent for
-        # enumerating the interface IPv4 addresses to bind the multicast sockets to.
-        interface_addresses = soco.discovery._find_ipv4_addresses()
-        if not interface_addresses:
-            return set()
-
-        sockets = []
-        for interface_address in interface_addresses:
-            try:
-                multicast_socket = self._create_multicast_socket(interface_address)
-            except OSError:
-                continue
-            sockets.append(multicast_socket)
-
-        if not sockets:
-            return set()
-
+        sockets = self._open_multicast_sockets()
         try:
             for _ in range(3):
-                for multicast_socket in list(sockets):
-                    try:
-                        multicast_socket.sendto(_PLAYER_SEARCH, (_SSDP_MULTICAST_GROUP, _SSDP_MULTICAST_PORT))
-                    except OSError:
-                        sockets.remove(multicast_socket)
-                        multicast_socket.close()
+                self._send_player_search(sockets)
 
             if not sockets:
                 return set()
@@ -173,16 +209,83 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
             for multicast_socket in sockets:
                 multicast_socket.close()
 
-        speakers = set()
-        for hosts in household_hosts.values():
+        def household_zones(hosts: list[str]) -> set[Any]:
             for host in hosts:
                 try:
-                    speakers.update(soco.SoCo(host).all_zones)
-                    break
+                    return set(soco.SoCo(host).all_zones)
                 except (HTTPError, OSError, RequestException, RuntimeError, SoCoException, SoCoUPnPException):
                     continue
+            return set()
+
+        speakers = set()
+        for _, zones in self._probe_speakers(household_zones, household_hosts.values()):
+            speakers.update(zones or set())
         return speakers
 
+    def _discover_targeted_household_speakers(self, household_id: str) -> list[DiscoveredSonosSpeaker] | None:
+        """Find a household from the first speaker that answers for it, or None to fall back to full discovery.
+
+        The search stops listening as soon as the household answers. Its topology then
+        comes from that one speaker, and the household from the SSDP answer, so no
+        speaker is asked for its household or zones again.
+        """
+        import soco
+
+        sockets = self._open_multicast_sockets()
+        try:
+            host = self._collect_household_host(sockets, household_id)
+        finally:
+            for multicast_socket in sockets:
+                multicast_socket.close()
+
+        if host is None:
+            LOGGER.debug("Sonos household `%s` did not answer the targeted search", household_id)
+            return None
+
+        try:
+            return sort_sonos_speakers(
+                [
+                    DiscoveredSonosSpeaker(
+                        uid=zone.uid,
+                        name=zone.player_name,
+                        host=zone.ip_address,
+                        household_id=household_id,
+                        is_visible=getattr(zone, "is_visible", True) is not False,
+                    )
+                    for zone in soco.SoCo(host).all_zones
+                ]
+            )
+        except _SONOS_TRANSPORT_ERRORS as err:
+            LOGGER.debug("Failed to read Sonos household `%s` topology from %s: %s", household_id, host, err)
+            return None
+
+    def _open_multicast_sockets(self) -> list[socket.socket]:
+        import soco.discovery
+
+        # To make that multicast probe reliable, we send it from each local IPv4
+        # interface via IP_MULTICAST_IF; otherwise we may only probe one network path
+        # and miss reachable households.
+        #
+        # This uses a private SoCo helper because there is no public equivalent for
+        # enumerating the interface IPv4 addresses to bind the multicast sockets to.
+        sockets = []
+        for interface_address in soco.discovery._find_ipv4_addresses() or ():
+            try:
+                multicast_socket = self._create_multicast_socket(interface_address)
+            except OSError:
+                continue
+            sockets.append(multicast_socket)
+        return sockets
+
+    @staticmethod
+    def _send_player_search(sockets: list[socket.socket]) -> None:
+        for multicast_socket in list(sockets):
+            try:
+                multicast_socket.sendto(_PLAYER_SEARCH, (_SSDP_MULTICAST_GROUP, _SSDP_MULTICAST_PORT))
+            except OSError:
+                sockets.remove(multicast_socket)
+                multicast_socket.close()
+
     @staticmethod
     def _create_multicast_socket(interface_address: str) -> socket.socket:
         multicast_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
@@ -213,21 +316,49 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
                 household_id = _extract_sonos_household_id(response)
                 if household_id is None:
                     continue
+                host = _extract_location_host(response) or address[0]
                 hosts = household_hosts.setdefault(household_id, [])
-                if address[0] not in hosts:
-                    hosts.append(address[0])
+                if host not in hosts:
+                    hosts.append(host)
 
         return household_hosts
 
+    def _collect_household_host(self, sockets: list[socket.socket], household_id: str) -> str | None:
+        """Wait for the first speaker of `household_id` to answer, repeating the search until one does."""
+        deadline = time.monotonic() + _SSDP_RESPONSE_TIMEOUT_SECONDS
+        searches_sent = 0
+        next_search_at = time.monotonic()
+
+        while sockets:
+            now = time.monotonic()
+            if now >= deadline:
+                return None
+
+            if searches_sent < _SSDP_SEARCH_ATTEMPTS and now >= next_search_at:
+                self._send_player_search(sockets)
+                searches_sent += 1
+                next_search_at = now + _SSDP_SEARCH_INTERVAL_SECONDS
+                continue
+
+            wait_until = next_search_at if searches_sent < _SSDP_SEARCH_ATTEMPTS else deadline
+            ready_sockets, _, _ = select.select(
+                sockets,
+                [],
+                [],
+                min(min(wait_until, deadline) - now, _SSDP_RESPONSE_POLL_INTERVAL_SECONDS),
+            )
+            for ready_socket in ready_sockets:
+                response, address = ready_socket.recvfrom(1024)
+                if _extract_sonos_household_id(response) == household_id:
+                    return _extract_location_host(response) or address[0]
+
+        return None
+
     def _normalize_snapshot(self, discovered: set[Any]) -> _SonosDiscoverySnapshot:
         normalization_errors = []
         available_speakers = set(discovered)
-        for speaker in list(discovered):
-            try:
-                available_speakers.update(speaker.all_zones)
-            except _SONOS_TRANSPORT_ERRORS as exc:
-                LOGGER.debug("Failed to expand zones for %s: %s", speaker, exc)
-                available_speakers.add(speaker)
+        for speaker, zones in self._probe_speakers(_expand_speaker_zones, discovered):
+            available_speakers.update(zones or {speaker})
 
         if not available_speakers:
             return _SonosDiscoverySnapshot(
@@ -238,16 +369,17 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
 
         speakers_by_uid = {}
         retry_hosts_by_uid = {}
-        for speaker in available_speakers:
-            expected_uid = _safe_speaker_uid(speaker)
-            normalized, error = self._normalize_speaker(speaker)
+        for speaker, probed in self._probe_speakers(self._probe_speaker, available_speakers):
+            if probed is None:
+                normalization_errors.append(f"{_safe_speaker_identifier(speaker)}: timed out")
+                continue
+
+            normalized, error, expected_uid, host = probed
             if normalized is None:
                 if error is not None:
                     normalization_errors.append(error)
-                if expected_uid is not None:
-                    host = _safe_speaker_host(speaker)
-                    if host is not None:
-                        retry_hosts_by_uid.setdefault(expected_uid, set()).add(host)
+                if expected_uid is not None and host is not None:
+                    retry_hosts_by_uid.setdefault(expected_uid, set()).add(host)
                 continue
 
             existing = speakers_by_uid.get(normalized.uid)
@@ -259,6 +391,15 @@ class SoCoSonosDiscoveryAdapter(SonosDiscoveryPort):
             normalization_errors=normalization_errors,
         )
 
+    def _probe_speaker(
+        self,
+        speaker: "_SonosSpeakerLike",
+    ) -> tuple[DiscoveredSonosSpeaker | None, str | None, str | None, str | None]:
+        normalized, error = self._normalize_speaker(speaker)
+        if normalized is not None:
+            return normalized, None, None, None
+        return None, error, _safe_speaker_uid(speaker), _safe_speaker_host(speaker)
+
     def _resolve_speaker_by_host(self, expected_uid: str, host: str) -> DiscoveredSonosSpeaker:
         from requests.exceptions import RequestException
         from soco import SoCo
@@ -336,6 +477,14 @@ class _SonosSpeakerLike(Protocol):
     all_zones: set[Any]
 
 
+def _expand_speaker_zones(speaker: "_SonosSpeakerLike") -> set[Any] | None:
+    try:
+        return set(speaker.all_zones)
+    except _SONOS_TRANSPORT_ERRORS as exc:
+        LOGGER.debug("Failed to expand zones for %s: %s", speaker, exc)
+        return None
+
+
 def _safe_speaker_identifier(speaker: "_SonosSpeakerLike") -> str:
     ip_address = _safe_speaker_host(speaker)
     if ip_address:
@@ -374,6 +523,14 @@ def _extract_sonos_household_id(response: bytes) -> str | None:
     return match.group(1).decode("utf-8", "ignore").strip() or None
 
 
+def _extract_location_host(response: bytes) -> str | None:
+    match = _LOCATION_HEADER_RE.search(response)
+    if match is None:
+        return None
+    location = match.group(1).decode("utf-8", "ignore").strip()
+    return urlsplit(location).hostname or None
+
+
 def _build_private_ipv4_networks_to_scan() -> list[str]:
     import ifaddr
 
@@ -0,0 +1,176 @@
+import os
+import sqlite3
+import threading
+from collections.abc import Collection, Hashable, Iterator
+from contextlib import contextmanager
+
+from jukebox.domain.entities import Disc, DiscMetadata, DiscOption, DiscSearchIndex
+from jukebox.domain.repositories import LibraryRepository
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS discs (
+    tag_id TEXT PRIMARY KEY,
+    uri TEXT NOT NULL,
+    artist TEXT,
+    album TEXT,
+    track TEXT,
+    playlist TEXT,
+    shuffle INTEGER NOT NULL DEFAULT 0,
+    is_test INTEGER NOT NULL DEFAULT 0
+);
+-- Search goes through DiscSearchIndex, so metadata columns are not indexed;
+-- drop the indexes created by earlier versions.
+DROP INDEX IF EXISTS discs_artist;
+DROP INDEX IF EXISTS discs_album;
+DROP INDEX IF EXISTS discs_playlist;
+"""
+
+_DISC_COLUMNS = "tag_id, uri, artist, album, track, playlist, shuffle, is_test"
+_INSERT_DISC = f"INSERT INTO discs ({_DISC_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+# Updating in place keeps the rowid, and so the position of the tag in the library.
+_UPSERT_DISC = (
+    f"{_INSERT_DISC} ON CONFLICT (tag_id) DO UPDATE SET uri = excluded.uri, artist = excluded.artist, "
+    "album = excluded.album, track = excluded.track, playlist = excluded.playlist, "
+    "shuffle = excluded.shuffle, is_test = excluded.is_test"
+)
+
+
+def _disc_from_row(row: sqlite3.Row) -> Disc:
+    return Disc(
+        uri=row["uri"],
+        metadata=DiscMetadata(artist=row["artist"], album=row["album"], track=row["track"], playlist=row["playlist"]),
+        option=DiscOption(shuffle=bool(row["shuffle"]), is_test=bool(row["is_test"])),
+    )
+
+
+def _row_from_disc(tag_id: str, disc: Disc) -> tuple:
+    return (
+        tag_id,
+        disc.uri,
+        disc.metadata.artist,
+        disc.metadata.album,
+        disc.metadata.track,
+        disc.metadata.playlist,
+        int(disc.option.shuffle),
+        int(disc.option.is_test),
+    )
+
+
+class SqliteLibraryAdapter(LibraryRepository):
+    """SQLite implementation of LibraryRepository, one row per tag.
+
+    Each write touches only its own row in a single transaction, and lookups go
+    through the primary key instead of loading the whole library. The database
+    runs in WAL mode so the jukebox keeps reading while the admin writes.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._connection: sqlite3.Connection | None = None
+        self._write_count = 0
+        self._search_index: tuple[Hashable, DiscSearchIndex] | None = None
+        # One connection shared by the admin server threads, serialized here.
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+            connection = sqlite3.connect(self.filepath, check_same_thread=False, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=5000")
+            self._ensure_schema(connection)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def _ensure_schema(connection: sqlite3.Connection) -> None:
+        (user_version,) = connection.execute("PRAGMA user_version").fetchone()
+        if user_version > _SCHEMA_VERSION:
+            raise RuntimeError(f"Unsupported library database version {user_version}: expected {_SCHEMA_VERSION}")
+        connection.executescript(_SCHEMA)
+        connection.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            self._write_count += 1
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def revision(self) -> tuple[int, int]:
+        # data_version only moves for commits from other connections, so count our own writes too.
+        with self._lock:
+            (data_version,) = self._connect().execute("PRAGMA data_version").fetchone()
+            return data_version, self._write_count
+
+    def list_discs(self) -> dict[str, Disc]:
+        with self._lock:
+            rows = self._connect().execute(f"SELECT {_DISC_COLUMNS} FROM discs ORDER BY rowid").fetchall()
+        return {row["tag_id"]: _disc_from_row(row) for row in rows}
+
+    def get_disc(self, tag_id: str) -> Disc | None:
+        with self._lock:
+            row = self._connect().execute(f"SELECT {_DISC_COLUMNS} FROM discs WHERE tag_id = ?", (tag_id,)).fetchone()
+        return None if row is None else _disc_from_row(row)
+
+    def search_index(self) -> DiscSearchIndex:
+        revision = self.revision()
+        cached = self._search_index
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+
+        search_index = DiscSearchIndex(self.list_discs())
+        self._search_index = (revision, search_index)
+        return search_index
+
+    def add_disc(self, tag_id: str, disc: Disc) -> None:
+        try:
+            with self._transaction() as connection:
+                connection.execute(_INSERT_DISC, _row_from_disc(tag_id, disc))
+        except sqlite3.IntegrityError as err:
+            raise ValueError(f"Already existing tag: tag_id='{tag_id}'") from err
+
+    def update_disc(self, tag_id: str, disc: Disc) -> None:
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE discs SET uri = ?, artist = ?, album = ?, track = ?, playlist = ?, shuffle = ?, is_test = ? "
+                "WHERE tag_id = ?",
+                (*_row_from_disc(tag_id, disc)[1:], tag_id),
+            )
+            if cursor.rowcount == 0:
+                raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
+
+    def remove_disc(self, tag_id: str) -> None:
+        with self._transaction() as connection:
+            cursor = connection.execute("DELETE FROM discs WHERE tag_id = ?", (tag_id,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
+
+    def save_discs(self, discs: dict[str, Disc], removed_tag_ids: Collection[str] = ()) -> None:
+        with self._transaction() as connection:
+            for tag_id in removed_tag_ids:
+                cursor = connection.execute("DELETE FROM discs WHERE tag_id = ?", (tag_id,))
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
+            connection.executemany(_UPSERT_DISC, [_row_from_disc(tag_id, disc) for tag_id, disc in discs.items()])
+
+    def replace_discs(self, discs: dict[str, Disc]) -> None:
+        with self._transaction() as connection:
+            connection.execute("DELETE FROM discs")
+            connection.executemany(_INSERT_DISC, [_row_from_disc(tag_id, disc) for tag_id, disc in discs.items()])
@@ -1,6 +1,6 @@
 import sys
 import traceback
-from typing import Annotated, Never
+from typing import Annotated, Literal, Never
 
 import typer
 from pydantic import ValidationError
@@ -10,8 +10,10 @@ from jukebox.admin.library_commands import (
     CliAddCommand,
     CliEditCommand,
     CliGetCommand,
+    CliImportCommand,
     CliListCommand,
     CliListCommandModes,
+    CliMigrateCommand,
     CliRemoveCommand,
     CliSearchCommand,
     InteractiveCliCommand,
@@ -46,10 +48,17 @@ from .di_container import (
     build_admin_ui_app,
     build_cli_controller,
     build_interactive_cli_controller,
+    build_library_repository,
     build_settings_service,
 )
 from .pn532_command_handlers import execute_pn532_command
-from .pn532_commands import Pn532ProbeCommand, Pn532ProfilesCommand, Pn532SelectCommand, is_pn532_command
+from .pn532_commands import (
+    Pn532CalibrateCommand,
+    Pn532ProbeCommand,
+    Pn532ProfilesCommand,
+    Pn532SelectCommand,
+    is_pn532_command,
+)
 from .sonos_households import GroupedSonosHousehold
 
 
@@ -171,6 +180,7 @@ def _run_library_command(ctx: typer.Context, command: object) -> None:
                 settings_service=settings_service,
                 build_cli_controller=build_cli_controller,
                 build_interactive_cli_controller=build_interactive_cli_controller,
+                build_library_repository=build_library_repository,
             )
         except (ValueError, RuntimeError) as err:
             _exit_error(str(err))
@@ -479,6 +489,18 @@ def pn532_probe(ctx: typer.Context) -> None:
     _run_command(ctx, Pn532ProbeCommand(type="pn532_probe"))
 
 
+@pn532_app.command("calibrate")
+def pn532_calibrate(
+    ctx: typer.Context,
+    samples: Annotated[
+        int,
+        typer.Option("--samples", min=1, help="consecutive successful exchanges required to accept a delay"),
+    ] = 20,
+) -> None:
+    """Measure the shortest safe SPI delays of the attached PN532 and persist them to settings."""
+    _run_command(ctx, Pn532CalibrateCommand(type="pn532_calibrate", samples=samples))
+
+
 @library_app.command("add")
 def library_add(
     ctx: typer.Context,
@@ -582,15 +604,37 @@ def library_get(
 @library_app.command("search")
 def library_search(
     ctx: typer.Context,
-    query: Annotated[str, typer.Argument(help="Search query (matches artist, album, track, playlist, or tag)")],
+    query: Annotated[str, typer.Argument(help="Search query (words of artist, album, track, playlist, or tag)")],
 ) -> None:
     _run_library_command(ctx, CliSearchCommand(type="search", query=query))
 
 
+@library_app.command("import")
+def library_import(
+    ctx: typer.Context,
+    path: Annotated[str, typer.Argument(help="CSV file with tag_id, uri, artist, album, track, playlist, shuffle")],
+) -> None:
+    """Add or update the discs listed in a CSV file, in a single write."""
+    _run_library_command(ctx, CliImportCommand(type="import", path=path))
+
+
 @library_app.command("interactive")
 def library_interactive(ctx: typer.Context) -> None:
     _run_library_command(ctx, InteractiveCliCommand(type="interactive"))
 
 
+@library_app.command("migrate")
+def library_migrate(
+    ctx: typer.Context,
+    to: Annotated[Literal["json", "sqlite"], typer.Option("--to", help="Backend to copy the library into")],
+    overwrite: Annotated[
+        bool,
+        typer.Option("--overwrite", help="Replace the discs already stored in the target backend"),
+    ] = False,
+) -> None:
+    """Copy the library between the JSON file and the SQLite database next to it."""
+    _run_library_command(ctx, CliMigrateCommand(type="migrate", to=to, overwrite=overwrite))
+
+
 def main(args: list[str] | None = None) -> None:
     app(args=args, prog_name="jukebox-admin")
@@ -2,6 +2,7 @@ from collections.abc import Callable
 from importlib import import_module
 from typing import Protocol
 
+from jukebox.settings.entities import LibraryBackend
 from jukebox.settings.selected_sonos_group_repository import SettingsSelectedSonosGroupRepository
 from jukebox.settings.service_protocols import SettingsService
 from jukebox.shared.errors import MissingOptionalDependencyError
@@ -48,15 +49,16 @@ def _load_uvicorn(command_name: str, extra_name: str, source_command: str):
 
 
 def _build_server_app(
-    build_app: Callable[[str, AdminServices], AppController],
+    build_app: Callable[[str, AdminServices, LibraryBackend], AppController],
     library_path: str,
+    library_backend: LibraryBackend,
     services: AdminServices,
     command_name: str,
     extra_name: str,
     source_command: str,
 ):
     try:
-        return build_app(library_path, services)
+        return build_app(library_path, services, library_backend)
     except ModuleNotFoundError as err:
         if err.name in {"fastapi", "fastui"}:
             _raise_optional_extra_error(command_name, extra_name, source_command, err)
@@ -215,8 +217,8 @@ def execute_server_command(
     verbose: bool,
     command: object,
     services: AdminServices,
-    build_api_app: Callable[[str, AdminServices], AppController],
-    build_ui_app: Callable[[str, AdminServices], AppController],
+    build_api_app: Callable[[str, AdminServices, LibraryBackend], AppController],
+    build_ui_app: Callable[[str, AdminServices, LibraryBackend], AppController],
     source_command: str,
 ) -> None:
     runtime_config = services.settings.resolve_admin_runtime(verbose=verbose)
@@ -226,6 +228,7 @@ def execute_server_command(
         api = _build_server_app(
             build_app=build_api_app,
             library_path=runtime_config.library_path,
+            library_backend=runtime_config.library_backend,
             services=services,
             command_name="api",
             extra_name="api",
@@ -239,6 +242,7 @@ def execute_server_command(
         ui = _build_server_app(
             build_app=build_ui_app,
             library_path=runtime_config.library_path,
+            library_backend=runtime_config.library_backend,
             services=services,
             command_name="ui",
             extra_name="ui",
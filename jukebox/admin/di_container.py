@@ -1,10 +1,11 @@
 from typing import cast
 
-from jukebox.adapters.outbound.json_library_adapter import JsonLibraryAdapter
+from jukebox.adapters.outbound.library_repositories import build_library_repository
 from jukebox.adapters.outbound.sonos_discovery_adapter import SoCoSonosDiscoveryAdapter
 from jukebox.adapters.outbound.text_current_tag_adapter import TextCurrentTagAdapter
 from jukebox.domain.use_cases import (
     AddDisc,
+    BulkApplyDiscChanges,
     EditDisc,
     GetCurrentTagStatus,
     GetDisc,
@@ -13,6 +14,7 @@ from jukebox.domain.use_cases import (
     ResolveTagId,
     SearchDiscs,
 )
+from jukebox.settings.entities import LibraryBackend
 from jukebox.settings.file_settings_repository import FileSettingsRepository
 from jukebox.settings.resolve import SettingsService as SettingsServiceImpl
 from jukebox.settings.resolve import build_environment_settings_overrides
@@ -20,6 +22,7 @@ from jukebox.settings.service_protocols import SettingsService
 from jukebox.settings.types import JsonObject
 from jukebox.shared.config_utils import get_current_tag_path
 from jukebox.sonos.service import DefaultSonosService, SonosService
+from jukebox.sonos.topology_cache import SonosTopologyCache
 
 from .commands import ApiCommand, UiCommand
 from .services import AdminServices
@@ -61,8 +64,8 @@ def build_admin_services(
     return AdminServices(settings=settings_service, sonos=sonos_service)
 
 
-def build_admin_api_app(library_path: str, services: AdminServices):
-    repository = JsonLibraryAdapter(library_path)
+def build_admin_api_app(library_path: str, services: AdminServices, library_backend: LibraryBackend = "json"):
+    repository = build_library_repository(library_path, library_backend)
     current_tag_repository = TextCurrentTagAdapter(get_current_tag_path(library_path))
 
     from jukebox.adapters.inbound.admin.api_controller import APIController
@@ -73,14 +76,16 @@ def build_admin_api_app(library_path: str, services: AdminServices):
         RemoveDisc(repository),
         EditDisc(repository),
         GetDisc(repository),
+        SearchDiscs(repository),
+        BulkApplyDiscChanges(repository),
         GetCurrentTagStatus(current_tag_repository, repository),
         services.settings,
         services.sonos,
     )
 
 
-def build_admin_ui_app(library_path: str, services: AdminServices):
-    repository = JsonLibraryAdapter(library_path)
+def build_admin_ui_app(library_path: str, services: AdminServices, library_backend: LibraryBackend = "json"):
+    repository = build_library_repository(library_path, library_backend)
     current_tag_repository = TextCurrentTagAdapter(get_current_tag_path(library_path))
 
     from jukebox.adapters.inbound.admin.ui_controller import UIController
@@ -91,6 +96,8 @@ def build_admin_ui_app(library_path: str, services: AdminServices):
         RemoveDisc(repository),
         EditDisc(repository),
         GetDisc(repository),
+        SearchDiscs(repository),
+        BulkApplyDiscChanges(repository),
         GetCurrentTagStatus(current_tag_repository, repository),
         services.settings,
         services.sonos,
@@ -98,11 +105,12 @@ def build_admin_ui_app(library_path: str, services: AdminServices):
 
 
 def build_sonos_service() -> SonosService:
-    return DefaultSonosService(SoCoSonosDiscoveryAdapter())
+    topology_cache = SonosTopologyCache(SoCoSonosDiscoveryAdapter())
+    return DefaultSonosService(topology_cache, topology_cache=topology_cache)
 
 
-def build_cli_controller(library_path: str):
-    repository = JsonLibraryAdapter(library_path)
+def build_cli_controller(library_path: str, library_backend: LibraryBackend = "json"):
+    repository = build_library_repository(library_path, library_backend)
     current_tag_repository = TextCurrentTagAdapter(get_current_tag_path(library_path))
     get_current_tag_status = GetCurrentTagStatus(current_tag_repository, repository)
 
@@ -116,11 +124,12 @@ def build_cli_controller(library_path: str):
         GetDisc(repository),
         SearchDiscs(repository),
         ResolveTagId(get_current_tag_status),
+        BulkApplyDiscChanges(repository),
     )
 
 
-def build_interactive_cli_controller(library_path: str):
-    repository = JsonLibraryAdapter(library_path)
+def build_interactive_cli_controller(library_path: str, library_backend: LibraryBackend = "json"):
+    repository = build_library_repository(library_path, library_backend)
     current_tag_repository = TextCurrentTagAdapter(get_current_tag_path(library_path))
 
     from jukebox.adapters.inbound.admin.interactive_cli_controller import InteractiveCLIController
@@ -1,9 +1,12 @@
 from collections.abc import Callable
 from typing import Protocol
 
+from jukebox.domain.repositories import LibraryRepository
+from jukebox.domain.use_cases import MigrateLibrary
+from jukebox.settings.entities import LibraryBackend
 from jukebox.settings.service_protocols import SettingsService
 
-from .library_commands import InteractiveCliCommand
+from .library_commands import CliMigrateCommand, InteractiveCliCommand
 
 
 class LibraryController(Protocol):
@@ -18,15 +21,29 @@ def execute_library_command(
     verbose: bool,
     command: object,
     settings_service: SettingsService,
-    build_cli_controller: Callable[[str], LibraryController],
-    build_interactive_cli_controller: Callable[[str], InteractiveLibraryController],
+    build_cli_controller: Callable[[str, LibraryBackend], LibraryController],
+    build_interactive_cli_controller: Callable[[str, LibraryBackend], InteractiveLibraryController],
+    build_library_repository: Callable[[str, LibraryBackend], LibraryRepository],
+    stdout_fn: Callable[[str], None] = print,
 ) -> None:
     runtime_config = settings_service.resolve_admin_runtime(verbose=verbose)
 
+    if isinstance(command, CliMigrateCommand):
+        source_backend: LibraryBackend = "sqlite" if command.to == "json" else "json"
+        migrated_count = MigrateLibrary(
+            source=build_library_repository(runtime_config.library_path, source_backend),
+            target=build_library_repository(runtime_config.library_path, command.to),
+        ).execute(overwrite=command.overwrite)
+        stdout_fn(f"Migrated {migrated_count} discs from the {source_backend} library to the {command.to} library")
+        # The journaled JSON backend reads and writes the same file as the JSON one.
+        if runtime_config.library_backend.removesuffix("_journal") != command.to:
+            stdout_fn(f"Run `jukebox-admin settings set paths.library_backend {command.to}` to use it")
+        return
+
     if isinstance(command, InteractiveCliCommand):
-        interactive_cli = build_interactive_cli_controller(runtime_config.library_path)
+        interactive_cli = build_interactive_cli_controller(runtime_config.library_path, runtime_config.library_backend)
         interactive_cli.run()
         return
 
-    cli = build_cli_controller(runtime_config.library_path)
+    cli = build_cli_controller(runtime_config.library_path, runtime_config.library_backend)
     cli.run(command)
@@ -55,5 +55,16 @@ class CliSearchCommand(BaseModel):
     query: str
 
 
+class CliMigrateCommand(BaseModel):
+    type: Literal["migrate"]
+    to: Literal["json", "sqlite"]
+    overwrite: bool = False
+
+
+class CliImportCommand(BaseModel):
+    type: Literal["import"]
+    path: str
+
+
 class InteractiveCliCommand(BaseModel):
     type: Literal["interactive"]
@@ -1,25 +1,43 @@
 import dataclasses
+import time
 from collections.abc import Callable
-from typing import Any, cast
+from typing import Any, cast, get_args
 
 from jukebox.pn532.profiles import (
+    DEFAULT_PN532_TIMING,
+    DEFAULT_SPI_MAX_SPEED_HZ,
     PN532_PROFILES,
     Pn532ConnectionParams,
+    Pn532DetectionMode,
     Pn532Protocol,
+    Pn532SpiTransferMode,
+    Pn532TimingParams,
     SpiConnectionParams,
-    resolve_connection_params,
 )
+from jukebox.settings.pn532_resolution import resolve_pn532_connection, resolve_pn532_timing
 from jukebox.settings.service_protocols import SettingsService
 from jukebox.shared.errors import MissingOptionalDependencyError
 from jukebox.shared.terminal_ui import table
 
-from .pn532_commands import Pn532ProbeCommand, Pn532ProfilesCommand, Pn532SelectCommand
+from .pn532_commands import Pn532CalibrateCommand, Pn532ProbeCommand, Pn532ProfilesCommand, Pn532SelectCommand
+
+# Calibration halves each delay until an exchange fails or the delay would drop
+# below the floor, then keeps the smallest passing value multiplied by the safety
+# factor. Calibrated delays never go below the floor.
+CALIBRATION_MIN_DELAY_SECONDS = 0.0002
+CALIBRATION_SAFETY_FACTOR = 2.0
+
+PROBE_LATENCY_SAMPLES = 10
 
 
 def _default_build_pn532_reader(
     read_timeout_seconds: float,
     protocol: Pn532Protocol,
     connection: Pn532ConnectionParams,
+    detection_mode: Pn532DetectionMode = "passive_target",
+    timing: Pn532TimingParams = DEFAULT_PN532_TIMING,
+    spi_max_speed_hz: int = DEFAULT_SPI_MAX_SPEED_HZ,
+    spi_transfer_mode: Pn532SpiTransferMode = "standard",
 ) -> Any:
     from jukebox.adapters.outbound.readers.pn532_reader_adapter import Pn532ReaderAdapter
 
@@ -28,9 +46,13 @@ def _default_build_pn532_reader(
             raise ValueError(f"Expected SpiConnectionParams for protocol 'spi', got {type(connection).__name__}")
         return Pn532ReaderAdapter(
             read_timeout_seconds=read_timeout_seconds,
+            detection_mode=detection_mode,
+            timing=timing,
             spi_reset=connection.reset,
             spi_cs=connection.cs,
             spi_irq=connection.irq,
+            spi_max_speed_hz=spi_max_speed_hz,
+            spi_transfer_mode=spi_transfer_mode,
         )
     raise ValueError(f"Unsupported PN532 protocol: {protocol}")
 
@@ -124,41 +146,171 @@ def execute_pn532_command(
 
     if isinstance(command, Pn532ProbeCommand):
         pn532 = settings_service.get_effective_settings().jukebox.reader.pn532
-        overrides = SpiConnectionParams(reset=pn532.spi.reset, cs=pn532.spi.cs, irq=pn532.spi.irq)
-        resolved = resolve_connection_params(pn532.board_profile, pn532.protocol, overrides)
+        resolved = resolve_pn532_connection(pn532)
 
         stdout_fn(render_pn532_probe_setup_output(pn532.board_profile, pn532.protocol, resolved))
 
-        try:
-            reader = build_pn532_reader(
-                read_timeout_seconds=pn532.read_timeout_seconds,
-                protocol=pn532.protocol,
-                connection=resolved,
-            )
-        except MissingOptionalDependencyError as err:
-            raise MissingOptionalDependencyError("The `pn532` command", "pn532", "jukebox-admin pn532 ...") from err
-        except RuntimeError:
-            raise
-        except Exception as err:
-            msg = str(err)
-            if any(s in msg.lower() for s in ("not permitted", "permission", "bad gpio")):
-                raise RuntimeError(
-                    "GPIO error — your pin configuration may be incorrect.\n"
-                    "Update it with: jukebox-admin pn532 select\n"
-                    "Re-run with `--verbose` for details."
-                ) from err
-            raise RuntimeError(msg) from err
+        reader = _build_reader_for_command(
+            build_pn532_reader,
+            read_timeout_seconds=pn532.read_timeout_seconds,
+            protocol=pn532.protocol,
+            connection=resolved,
+            detection_mode=pn532.detection_mode,
+            spi_max_speed_hz=pn532.spi.max_speed_hz,
+            spi_transfer_mode=pn532.spi.transfer_mode,
+            timing=resolve_pn532_timing(pn532),
+        )
 
         ver, rev = reader.firmware_version
         stdout_fn(f"PN532 firmware version: {ver}.{rev}")
 
+        stdout_fn(render_pn532_latency_output(_measure_transfer_latencies(reader, PROBE_LATENCY_SAMPLES)))
+
         uid = reader.read()
         stdout_fn(f"Tag UID: {uid}" if uid else "No tag detected")
         return
 
+    if isinstance(command, Pn532CalibrateCommand):
+        pn532 = settings_service.get_effective_settings().jukebox.reader.pn532
+        resolved = resolve_pn532_connection(pn532)
+        # Calibration always starts from the profile defaults, not from previously calibrated values.
+        baseline = PN532_PROFILES[pn532.board_profile].timing
+
+        stdout_fn(render_pn532_probe_setup_output(pn532.board_profile, pn532.protocol, resolved))
+
+        reader = _build_reader_for_command(
+            build_pn532_reader,
+            read_timeout_seconds=pn532.read_timeout_seconds,
+            protocol=pn532.protocol,
+            connection=resolved,
+            detection_mode=pn532.detection_mode,
+            spi_max_speed_hz=pn532.spi.max_speed_hz,
+            spi_transfer_mode=pn532.spi.transfer_mode,
+            timing=baseline,
+        )
+        calibrated = calibrate_pn532_timing(reader, baseline, command.samples)
+        if calibrated is None:
+            raise RuntimeError(
+                "PN532 exchanges fail even with the default timing.\nCheck the wiring with: jukebox-admin pn532 probe"
+            )
+
+        for f in dataclasses.fields(calibrated):
+            settings_service.set_persisted_value(
+                f"jukebox.reader.pn532.timing.{f.name}", str(getattr(calibrated, f.name))
+            )
+        stdout_fn(render_pn532_calibrate_output(baseline, calibrated))
+        return
+
     raise TypeError("Unsupported PN532 command")
 
 
+def calibrate_pn532_timing(reader: Any, baseline: Pn532TimingParams, samples: int) -> Pn532TimingParams | None:
+    """Find the shortest delays for which *samples* consecutive exchanges succeed.
+
+    Each sample runs GetFirmwareVersion and starts both target detection commands.
+    Delays are calibrated one at a time, the others staying at their current value,
+    and never below `CALIBRATION_MIN_DELAY_SECONDS`. Returns None when the reader
+    already fails with the *baseline* delays.
+    """
+    reader.timing = baseline
+    if not _exchanges_succeed(reader, samples):
+        return None
+
+    calibrated = baseline
+    for f in dataclasses.fields(baseline):
+        shortest = getattr(baseline, f.name)
+        for candidate in _candidate_delays(shortest):
+            reader.timing = dataclasses.replace(calibrated, **{f.name: candidate})
+            if not _exchanges_succeed(reader, samples):
+                break
+            shortest = candidate
+        safe = max(round(shortest * CALIBRATION_SAFETY_FACTOR, 6), CALIBRATION_MIN_DELAY_SECONDS)
+        safe = min(getattr(baseline, f.name), safe)
+        calibrated = dataclasses.replace(calibrated, **{f.name: safe})
+
+    reader.timing = calibrated
+    return calibrated
+
+
+def _candidate_delays(start: float | None) -> list[float]:
+    candidates = []
+    delay = (start or 0.0) / 2
+    while delay >= CALIBRATION_MIN_DELAY_SECONDS:
+        candidates.append(delay)
+        delay /= 2
+    return candidates
+
+
+def _exchanges_succeed(reader: Any, samples: int) -> bool:
+    return all(reader.ping() and reader.probe_detection() for _ in range(samples))
+
+
+def _measure_transfer_latencies(reader: Any, samples: int) -> dict[str, dict[str, float | None]]:
+    """Return the mean round-trip in seconds per exchange and transfer mode.
+
+    Both a GetFirmwareVersion exchange, which the PN532 answers right away, and
+    the start of the target detection commands, which involve the RF field, are
+    measured. None means at least one exchange failed in that mode. The
+    configured mode is restored afterwards.
+    """
+    exchanges: dict[str, Callable[[], bool]] = {
+        "GetFirmwareVersion": reader.ping,
+        "target detection": reader.probe_detection,
+    }
+    configured_mode = reader.transfer_mode
+    latencies: dict[str, dict[str, float | None]] = {name: {} for name in exchanges}
+    try:
+        for mode in get_args(Pn532SpiTransferMode):
+            reader.transfer_mode = mode
+            for name, exchange in exchanges.items():
+                started = time.perf_counter()
+                succeeded = all(exchange() for _ in range(samples))
+                latencies[name][mode] = (time.perf_counter() - started) / samples if succeeded else None
+    finally:
+        reader.transfer_mode = configured_mode
+    return latencies
+
+
+def _build_reader_for_command(build_pn532_reader: Callable[..., Any], **kwargs: Any) -> Any:
+    try:
+        return build_pn532_reader(**kwargs)
+    except MissingOptionalDependencyError as err:
+        raise MissingOptionalDependencyError("The `pn532` command", "pn532", "jukebox-admin pn532 ...") from err
+    except RuntimeError:
+        raise
+    except Exception as err:
+        msg = str(err)
+        if any(s in msg.lower() for s in ("not permitted", "permission", "bad gpio")):
+            raise RuntimeError(
+                "GPIO error — your pin configuration may be incorrect.\n"
+                "Update it with: jukebox-admin pn532 select\n"
+                "Re-run with `--verbose` for details."
+            ) from err
+        raise RuntimeError(msg) from err
+
+
+def render_pn532_latency_output(latencies: dict[str, dict[str, float | None]]) -> str:
+    lines = []
+    for exchange, by_mode in latencies.items():
+        measured = "  ".join(
+            f"{mode}={'failed' if latency is None else f'{latency * 1000:.1f} ms'}" for mode, latency in by_mode.items()
+        )
+        lines.append(f"Round-trip latency ({exchange}) — {measured}")
+    return "\n".join(lines)
+
+
+def render_pn532_calibrate_output(baseline: Pn532TimingParams, calibrated: Pn532TimingParams) -> str:
+    rows = [
+        [f.name, _format_delay_ms(getattr(baseline, f.name)), _format_delay_ms(getattr(calibrated, f.name))]
+        for f in dataclasses.fields(calibrated)
+    ]
+    return "Calibrated PN532 timing saved:\n\n" + table(["delay", "default (ms)", "calibrated (ms)"], rows)
+
+
+def _format_delay_ms(delay: float | None) -> str:
+    return "-" if delay is None else f"{delay * 1000:g}"
+
+
 def render_pn532_probe_setup_output(
     board_profile: str,
     protocol: str,
@@ -1,6 +1,6 @@
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Pn532ProfilesCommand(BaseModel):
@@ -16,5 +16,10 @@ class Pn532ProbeCommand(BaseModel):
     type: Literal["pn532_probe"]
 
 
+class Pn532CalibrateCommand(BaseModel):
+    type: Literal["pn532_calibrate"]
+    samples: int = Field(default=20, ge=1)
+
+
 def is_pn532_command(command: object) -> bool:
-    return isinstance(command, (Pn532ProfilesCommand, Pn532SelectCommand, Pn532ProbeCommand))
+    return isinstance(command, (Pn532ProfilesCommand, Pn532SelectCommand, Pn532ProbeCommand, Pn532CalibrateCommand))
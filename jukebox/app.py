@@ -4,8 +4,17 @@ from typing import Annotated, Literal, Never
 
 import typer
 
+from jukebox.adapters.inbound.async_cli_controller import AsyncCLIController
 from jukebox.adapters.inbound.cli_controller import CLIController
-from jukebox.di_container import build_jukebox, build_runtime_resolver, build_settings_service
+from jukebox.di_container import (
+    build_async_jukebox,
+    build_jukebox,
+    build_loop_pacer,
+    build_reader_power_saver,
+    build_runtime_resolver,
+    build_settings_service,
+    build_sonos_service,
+)
 from jukebox.settings.errors import SettingsError
 from jukebox.shared.config_utils import get_package_version
 from jukebox.shared.logger import set_logger
@@ -113,17 +122,46 @@ def _run(state: JukeboxCliState) -> None:
 
     try:
         settings_service = build_settings_service(**{k: v for k, v in asdict(state).items() if k != "verbose"})
-        runtime_resolver = build_runtime_resolver(settings_service)
+        # One service for the process: startup resolution and player recovery share its topology cache.
+        sonos_service = build_sonos_service()
+        runtime_resolver = build_runtime_resolver(settings_service, sonos_service)
         runtime_config = runtime_resolver.resolve(verbose=state.verbose)
-        reader, handle_tag_event, sync_current_tag = build_jukebox(runtime_config)
+        if runtime_config.reader_mode == "async":
+            async_reader, async_handle_tag_event, sync_current_tag = build_async_jukebox(runtime_config, sonos_service)
+            pacer = build_loop_pacer(runtime_config, async_reader.read_budget_seconds)
+            power_saver = build_reader_power_saver(runtime_config, async_reader)
+        else:
+            reader, handle_tag_event, sync_current_tag = build_jukebox(runtime_config, sonos_service)
+            pacer = build_loop_pacer(runtime_config, reader.read_budget_seconds)
+            power_saver = build_reader_power_saver(runtime_config, reader)
     except SettingsError as err:
         _exit_error(str(err))
 
+    if runtime_config.reader_mode == "async":
+        AsyncCLIController(
+            reader=async_reader,
+            handle_tag_event=async_handle_tag_event,
+            sync_current_tag=sync_current_tag,
+            loop_interval_seconds=runtime_config.loop_interval_seconds,
+            event_queue_size=runtime_config.event_queue_size,
+            pacer=pacer,
+            power_saver=power_saver,
+            prefetch_disc=async_handle_tag_event.prefetch_disc,
+            player=async_handle_tag_event.player,
+        ).run()
+        return
+
     controller = CLIController(
         reader=reader,
         handle_tag_event=handle_tag_event,
         sync_current_tag=sync_current_tag,
         loop_interval_seconds=runtime_config.loop_interval_seconds,
+        reader_mode=runtime_config.reader_mode,
+        event_queue_size=runtime_config.event_queue_size,
+        pacer=pacer,
+        power_saver=power_saver,
+        prefetch_disc=handle_tag_event.prefetch_disc,
+        player=handle_tag_event.player,
     )
     controller.run()
 
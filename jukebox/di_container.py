@@ -1,9 +1,18 @@
+import logging
 from typing import Literal
 
-from jukebox.adapters.outbound.json_library_adapter import JsonLibraryAdapter
+from jukebox.adapters.inbound.loop_pacer import AdaptiveLoopPacer, LoopPacer
+from jukebox.adapters.inbound.reader_power_saver import ReaderPowerSaver
+from jukebox.adapters.outbound.json_sonos_group_cache_adapter import JsonSonosGroupCacheAdapter
+from jukebox.adapters.outbound.library_repositories import build_library_repository
+from jukebox.adapters.outbound.players.circuit_breaker_player_adapter import CircuitBreakerPlayerAdapter
 from jukebox.adapters.outbound.players.dryrun_player_adapter import DryrunPlayerAdapter
+from jukebox.adapters.outbound.players.executor_player_adapter import ExecutorPlayerAdapter
+from jukebox.adapters.outbound.players.sonos_event_monitor import SonosEventMonitor
 from jukebox.adapters.outbound.players.sonos_player_adapter import SonosPlayerAdapter
+from jukebox.adapters.outbound.players.sonos_session_pool import SonosHttpSessionPool
 from jukebox.adapters.outbound.readers.dryrun_reader_adapter import DryrunReaderAdapter
+from jukebox.adapters.outbound.readers.executor_reader_adapter import ExecutorReaderAdapter
 from jukebox.adapters.outbound.sonos_discovery_adapter import SoCoSonosDiscoveryAdapter
 from jukebox.adapters.outbound.text_current_tag_adapter import TextCurrentTagAdapter
 from jukebox.domain.entities import (
@@ -12,15 +21,19 @@ from jukebox.domain.entities import (
     CurrentTagContext,
     TransitionContext,
 )
-from jukebox.domain.use_cases import HandleTagEvent, SyncCurrentTag
+from jukebox.domain.ports import AsyncReaderPort, ReaderPort
+from jukebox.domain.use_cases import AsyncHandleTagEvent, HandleTagEvent, PrefetchDisc, SyncCurrentTag
 from jukebox.settings.entities import ResolvedJukeboxRuntimeConfig
 from jukebox.settings.file_settings_repository import FileSettingsRepository
 from jukebox.settings.resolve import SettingsService as SettingsServiceImpl
 from jukebox.settings.resolve import build_environment_settings_overrides
 from jukebox.settings.runtime_resolver import JukeboxRuntimeResolver
 from jukebox.settings.service_protocols import SettingsService
-from jukebox.shared.config_utils import get_current_tag_path
-from jukebox.sonos.service import DefaultSonosService, SonosPlaybackTargetResolver
+from jukebox.shared.config_utils import get_current_tag_path, get_sonos_group_cache_path
+from jukebox.sonos.service import DefaultSonosService, SonosPlaybackTargetResolver, SonosService
+from jukebox.sonos.topology_cache import SonosTopologyCache
+
+LOGGER = logging.getLogger("jukebox")
 
 
 def build_settings_service(
@@ -88,8 +101,8 @@ def build_settings_service(
     )
 
 
-def build_runtime_resolver(settings_service: SettingsService) -> JukeboxRuntimeResolver:
-    return JukeboxRuntimeResolver(settings_service, DefaultSonosService(SoCoSonosDiscoveryAdapter()))
+def build_runtime_resolver(settings_service: SettingsService, sonos_service: SonosService) -> JukeboxRuntimeResolver:
+    return JukeboxRuntimeResolver(settings_service, sonos_service)
 
 
 def build_jukebox(
@@ -98,19 +111,23 @@ def build_jukebox(
 ):
     """Build and wire all dependencies for Jukebox."""
 
-    library = JsonLibraryAdapter(config.library_path)
+    library = build_library_repository(config.library_path, config.library_backend)
     current_tag_repository = TextCurrentTagAdapter(get_current_tag_path(config.library_path))
 
     match config.player_type:
         case "sonos":
             if sonos_playback_target_resolver is None:
                 sonos_playback_target_resolver = build_sonos_playback_target_resolver()
-            player = SonosPlayerAdapter(
+            sonos_player = SonosPlayerAdapter(
                 host=config.sonos_host,
                 name=config.sonos_name,
                 group=config.sonos_group,
+                play_strategy=config.sonos_play_strategy,
+                session_pool=SonosHttpSessionPool(),
+                event_monitor=SonosEventMonitor() if config.sonos_event_subscription == "enabled" else None,
                 sonos_playback_target_resolver=sonos_playback_target_resolver,
             )
+            player = CircuitBreakerPlayerAdapter(sonos_player, target_key=sonos_player.target_key)
         case "dryrun":
             player = DryrunPlayerAdapter()
         case _:
@@ -125,9 +142,13 @@ def build_jukebox(
                 case "spi", conn if isinstance(conn, SpiConnectionParams):
                     reader = Pn532ReaderAdapter(
                         read_timeout_seconds=config.pn532_read_timeout_seconds,
+                        detection_mode=config.pn532_detection_mode,
+                        timing=config.pn532_timing,
                         spi_reset=conn.reset,
                         spi_cs=conn.cs,
                         spi_irq=conn.irq,
+                        spi_max_speed_hz=config.pn532_spi_max_speed_hz,
+                        spi_transfer_mode=config.pn532_spi_transfer_mode,
                     )
                 case "spi", conn:
                     raise ValueError(f"Expected SpiConnectionParams for protocol 'spi', got {type(conn).__name__}")
@@ -151,10 +172,70 @@ def build_jukebox(
         player=player,
         library=library,
         ctx=ctx,
+        prefetch_disc=PrefetchDisc(library=library, player=player),
     )
 
     return reader, handle_tag_event, sync_current_tag
 
 
+def build_async_jukebox(
+    config: ResolvedJukeboxRuntimeConfig,
+    sonos_playback_target_resolver: SonosPlaybackTargetResolver | None = None,
+):
+    """Build Jukebox dependencies for the asyncio runtime, wrapping blocking adapters in executors."""
+
+    reader, handle_tag_event, sync_current_tag = build_jukebox(config, sonos_playback_target_resolver)
+    async_handle_tag_event = AsyncHandleTagEvent(
+        player=ExecutorPlayerAdapter(handle_tag_event.player),
+        library=handle_tag_event.library,
+        ctx=handle_tag_event.ctx,
+        prefetch_disc=handle_tag_event.prefetch_disc,
+    )
+    return ExecutorReaderAdapter(reader), async_handle_tag_event, sync_current_tag
+
+
+def build_loop_pacer(config: ResolvedJukeboxRuntimeConfig, reader_budget_seconds: float) -> LoopPacer:
+    """Build the read loop pacer, bounded by how long the reader itself blocks."""
+
+    match config.loop_pacing:
+        case "adaptive":
+            return AdaptiveLoopPacer(
+                loop_interval_seconds=config.loop_interval_seconds,
+                idle_loop_interval_seconds=config.idle_loop_interval_seconds,
+                idle_after_seconds=config.idle_after_seconds,
+                reader_budget_seconds=reader_budget_seconds,
+            )
+        case "fixed":
+            return LoopPacer(config.loop_interval_seconds, reader_budget_seconds)
+        case _:
+            raise ValueError(f"Unknown loop pacing: {config.loop_pacing}")
+
+
+def build_reader_power_saver(
+    config: ResolvedJukeboxRuntimeConfig, reader: ReaderPort | AsyncReaderPort
+) -> ReaderPowerSaver | None:
+    """Build the idle power saver when the configured reader supports powering down."""
+
+    if config.reader_type != "pn532" or config.pn532_power_down_after_seconds is None:
+        return None
+    if config.pn532_detection_mode == "auto_poll":
+        # PowerDown would abort InAutoPoll, so the reader ignores low power mode there.
+        LOGGER.warning("jukebox.reader.pn532.power_down_after_seconds is ignored in auto_poll detection mode")
+        return None
+    return ReaderPowerSaver(reader, idle_after_seconds=config.pn532_power_down_after_seconds)
+
+
 def build_sonos_playback_target_resolver() -> SonosPlaybackTargetResolver:
-    return DefaultSonosService(SoCoSonosDiscoveryAdapter())
+    return build_sonos_service()
+
+
+def build_sonos_service() -> SonosService:
+    """Build the jukebox's Sonos service, which starts from the last group it resolved.
+
+    Build it once per process and pass it to both the runtime resolver and the
+    player, so that startup resolution and player recovery share its topology cache.
+    """
+
+    group_cache = JsonSonosGroupCacheAdapter(get_sonos_group_cache_path(FileSettingsRepository().filepath))
+    topology_cache = SonosTopologyCache(SoCoSonosDiscoveryAdapter())
+    return DefaultSonosService(topology_cache, group_cache=group_cache, topology_cache=topology_cache)
@@ -9,6 +9,8 @@ from .current_tag_state import (
 )
 from .current_tag_status import CurrentTagStatus
 from .disc import Disc, DiscMetadata, DiscOption
+from .disc_change import DiscChange, DiscChangeAction, DiscChangesSummary
+from .disc_search_index import DiscSearchIndex
 from .library import Library
 from .playback_state import (
     PLAYBACK_RETRY_DELAYS_SECONDS,
@@ -31,8 +33,12 @@ __all__ = [
     "CurrentTagState",
     "CurrentTagStatus",
     "Disc",
+    "DiscChange",
+    "DiscChangeAction",
+    "DiscChangesSummary",
     "DiscMetadata",
     "DiscOption",
+    "DiscSearchIndex",
     "Idle",
     "Library",
     "NoTag",
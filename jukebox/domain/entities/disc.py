@@ -1,9 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DiscOption(BaseModel):
     """Playback options for a disc."""
 
+    model_config = ConfigDict(frozen=True)
+
     shuffle: bool = Field(default=False, description="Enable or disable shuffle playback")
     is_test: bool = Field(default=False, description="Indicates whether this is a test disc")
 
@@ -11,6 +13,8 @@ class DiscOption(BaseModel):
 class DiscMetadata(BaseModel):
     """Metadata information for a disc."""
 
+    model_config = ConfigDict(frozen=True)
+
     artist: str | None = Field(default=None, description="Name of the artist or band", examples=["Zubi", None])
     album: str | None = Field(default=None, description="Name of the album", examples=["Dear Z", None])
     track: str | None = Field(default=None, description="Name of the track", examples=["dey ok", None])
@@ -38,7 +42,12 @@ class DiscMetadata(BaseModel):
 
 
 class Disc(BaseModel):
-    """A disc entity representing a music item with metadata and playback options."""
+    """A disc entity representing a music item with metadata and playback options.
+
+    Discs are immutable so repositories can hand out the instances they hold.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     uri: str = Field(description="Path or URI of the media file", examples=["spotify:album:3IvUwbVgAZSqNh06PVxwG7"])
     option: DiscOption = Field(default=DiscOption(), description="Playback options for the disc")
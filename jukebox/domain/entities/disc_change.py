@@ -0,0 +1,39 @@
+from typing import Literal, Self
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from jukebox.domain.entities import Disc
+
+DiscChangeAction = Literal["add", "update", "upsert", "remove"]
+
+
+class DiscChange(BaseModel):
+    """One change of a batch applied to the library.
+
+    `add` requires a new tag, `update` and `remove` an existing one, and `upsert`
+    adds or replaces the disc either way. `update` replaces the whole disc.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    action: DiscChangeAction = Field(description="What to do with the tag")
+    tag_id: str = Field(description="Tag to change")
+    disc: Disc | None = Field(default=None, description="New disc of the tag, required unless removing it")
+
+    @model_validator(mode="after")
+    def validate_disc(self) -> Self:
+        if self.action == "remove" and self.disc is not None:
+            raise ValueError("A disc cannot be given to remove a tag")
+        if self.action != "remove" and self.disc is None:
+            raise ValueError(f"A disc is required to {self.action} a tag")
+        return self
+
+
+class DiscChangesSummary(BaseModel):
+    """Number of discs added, updated and removed by a batch of changes."""
+
+    model_config = ConfigDict(frozen=True)
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
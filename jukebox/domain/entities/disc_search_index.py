@@ -0,0 +1,105 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Callable
+
+from jukebox.domain.entities import Disc
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+TAG_ID_WEIGHT = 1
+METADATA_WEIGHT = 2
+EXACT_TOKEN_FACTOR = 2
+
+
+def fold_text(text: str) -> str:
+    """Case-fold `text` and strip its accents, so `Beyoncé` and `BEYONCE` compare equal."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(fold_text(text))
+
+
+class DiscSearchIndex:
+    """Inverted index over the tag ID and metadata of a set of discs.
+
+    Every query token must match the start of a token of the disc, in any field.
+    Results are ranked by score: a whole-word match counts twice as much as a
+    prefix match, and a metadata match twice as much as a tag ID match. Discs
+    with the same score keep their library order.
+
+    When no disc matches by prefix, query tokens may match anywhere inside a
+    token instead, so `beat` still finds `Thebeatles`; this fallback scans
+    every token.
+    """
+
+    def __init__(self, discs: dict[str, Disc]):
+        self._discs = dict(discs)
+        self._positions = {tag_id: position for position, tag_id in enumerate(self._discs)}
+        postings: dict[str, dict[str, int]] = {}
+        for tag_id, disc in self._discs.items():
+            for text, weight in self._weighted_fields(tag_id, disc):
+                for token in tokenize(text):
+                    weights = postings.setdefault(token, {})
+                    weights[tag_id] = max(weights.get(tag_id, 0), weight)
+        self._postings = postings
+        self._tokens = sorted(postings)
+
+    def __len__(self) -> int:
+        return len(self._discs)
+
+    @staticmethod
+    def _weighted_fields(tag_id: str, disc: Disc) -> list[tuple[str, int]]:
+        metadata = disc.metadata
+        fields = [(tag_id, TAG_ID_WEIGHT)]
+        for text in (metadata.artist, metadata.album, metadata.track, metadata.playlist):
+            if text:
+                fields.append((text, METADATA_WEIGHT))
+        return fields
+
+    def search(self, query: str) -> dict[str, Disc]:
+        """Return the discs matching `query`, best first; a query without any word returns every disc."""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        return self._search(query_tokens, self._match) or self._search(query_tokens, self._match_substring)
+
+    def _search(self, query_tokens: list[str], match: Callable[[str], dict[str, int]]) -> dict[str, Disc]:
+        scores: dict[str, int] | None = None
+        for query_token in query_tokens:
+            token_scores = match(query_token)
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    tag_id: score + token_scores[tag_id] for tag_id, score in scores.items() if tag_id in token_scores
+                }
+            if not scores:
+                return {}
+
+        if scores is None:
+            return dict(self._discs)
+
+        ranked = sorted(scores, key=lambda tag_id: (-scores[tag_id], self._positions[tag_id]))
+        return {tag_id: self._discs[tag_id] for tag_id in ranked}
+
+    def _match(self, query_token: str) -> dict[str, int]:
+        scores: dict[str, int] = {}
+        # Tokens sharing the prefix are contiguous in the sorted token list.
+        for position in range(bisect_left(self._tokens, query_token), len(self._tokens)):
+            token = self._tokens[position]
+            if not token.startswith(query_token):
+                break
+            factor = EXACT_TOKEN_FACTOR if token == query_token else 1
+            for tag_id, weight in self._postings[token].items():
+                scores[tag_id] = max(scores.get(tag_id, 0), weight * factor)
+        return scores
+
+    def _match_substring(self, query_token: str) -> dict[str, int]:
+        scores: dict[str, int] = {}
+        for token in self._tokens:
+            if query_token in token:
+                factor = EXACT_TOKEN_FACTOR if token == query_token else 1
+                for tag_id, weight in self._postings[token].items():
+                    scores[tag_id] = max(scores.get(tag_id, 0), weight * factor)
+        return scores
@@ -1,2 +1,24 @@
 class PlaybackError(Exception):
     """Raised when a player operation fails."""
+
+
+class PlayerUnreachableError(PlaybackError):
+    """Raised when the player cannot be reached at all, as opposed to rejecting a command.
+
+    `retry_after_seconds`, when set, is the earliest time worth trying the player again.
+    """
+
+    def __init__(self, message: str, retry_after_seconds: float | None = None):
+        super().__init__(message)
+        self.retry_after_seconds = retry_after_seconds
+
+
+class InvalidDiscChangesError(ValueError):
+    """Raised when a batch of disc changes does not apply to the library; nothing was written.
+
+    `errors` lists one message per rejected change.
+    """
+
+    def __init__(self, errors: list[str]):
+        super().__init__("\n".join(errors))
+        self.errors = errors
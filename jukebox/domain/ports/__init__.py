@@ -1,4 +1,6 @@
+from .async_player_port import AsyncPlayerPort
+from .async_reader_port import AsyncReaderPort
 from .player_port import PlayerPort
 from .reader_port import ReaderPort
 
-__all__ = ["PlayerPort", "ReaderPort"]
+__all__ = ["AsyncPlayerPort", "AsyncReaderPort", "PlayerPort", "ReaderPort"]
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncPlayerPort(ABC):
+    """Port for music player implementations driven from an event loop."""
+
+    @abstractmethod
+    async def play(self, uri: str, shuffle: bool = False) -> None:
+        """Start playing a URI with optional shuffle."""
+
+    @abstractmethod
+    async def pause(self) -> None:
+        """Pause playback."""
+
+    @abstractmethod
+    async def resume(self) -> None:
+        """Resume playback."""
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop playback."""
+
+    async def close(self) -> None:
+        """Release what the player holds once the jukebox stops. Does nothing by default."""
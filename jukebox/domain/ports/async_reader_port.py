@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+
+class AsyncReaderPort(ABC):
+    """Port for tag reader implementations driven from an event loop."""
+
+    @abstractmethod
+    async def read(self) -> str | None:
+        """Read a tag ID. Returns None if no tag detected."""
+
+    @property
+    def read_budget_seconds(self) -> float:
+        """Longest time a single read may block while no tag is present."""
+        return 0.0
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Hint that no tag is expected soon; readers may power down between reads. Ignored by default."""
@@ -19,3 +19,9 @@ class PlayerPort(ABC):
     @abstractmethod
     def stop(self) -> None:
         """Stop playback."""
+
+    def prepare(self, uri: str) -> None:
+        """Hint that a URI is likely to be played soon; players may resolve it ahead of time. Ignored by default."""
+
+    def close(self) -> None:
+        """Release what the player holds once the jukebox stops. Does nothing by default."""
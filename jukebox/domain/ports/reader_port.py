@@ -7,3 +7,11 @@ class ReaderPort(ABC):
     @abstractmethod
     def read(self) -> str | None:
         """Read a tag ID. Returns None if no tag detected."""
+
+    @property
+    def read_budget_seconds(self) -> float:
+        """Longest time a single read may block while no tag is present."""
+        return 0.0
+
+    def set_low_power(self, enabled: bool) -> None:
+        """Hint that no tag is expected soon; readers may power down between reads. Ignored by default."""
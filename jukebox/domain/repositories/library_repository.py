@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection, Hashable
 
-from jukebox.domain.entities import Disc
+from jukebox.domain.entities import Disc, DiscSearchIndex
 
 
 class LibraryRepository(ABC):
@@ -23,3 +24,33 @@ class LibraryRepository(ABC):
     @abstractmethod
     def remove_disc(self, tag_id: str) -> None:
         pass
+
+    def list_tag_ids(self) -> set[str]:
+        """Every stored tag, including those whose disc could not be read; `remove_disc` accepts any of them."""
+        return set(self.list_discs())
+
+    def revision(self) -> Hashable | None:
+        """Token that changes whenever the library changes, or None when changes are not tracked."""
+        return None
+
+    def search_index(self) -> DiscSearchIndex:
+        """Search index over the current discs; implementations may keep it until the next write."""
+        return DiscSearchIndex(self.list_discs())
+
+    def replace_discs(self, discs: dict[str, Disc]) -> None:
+        """Replace every disc of the library with `discs`; implementations may do it in one write."""
+        for tag_id in self.list_discs():
+            self.remove_disc(tag_id)
+        for tag_id, disc in discs.items():
+            self.add_disc(tag_id, disc)
+
+    def save_discs(self, discs: dict[str, Disc], removed_tag_ids: Collection[str] = ()) -> None:
+        """Add or replace `discs` and remove `removed_tag_ids`; implementations may do it in one write."""
+        existing_tag_ids = set(self.list_discs())
+        for tag_id in removed_tag_ids:
+            self.remove_disc(tag_id)
+        for tag_id, disc in discs.items():
+            if tag_id in existing_tag_ids:
+                self.update_disc(tag_id, disc)
+            else:
+                self.add_disc(tag_id, disc)
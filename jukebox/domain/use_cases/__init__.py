@@ -1,21 +1,29 @@
+from .async_handle_tag_event import AsyncHandleTagEvent
 from .handle_tag_event import HandleTagEvent
 from .library.add_disc import AddDisc
+from .library.bulk_apply_disc_changes import BulkApplyDiscChanges
 from .library.edit_disc import EditDisc
 from .library.get_current_tag_status import GetCurrentTagStatus
 from .library.get_disc import GetDisc
 from .library.list_discs import ListDiscs
+from .library.migrate_library import MigrateLibrary
 from .library.remove_disc import RemoveDisc
 from .library.resolve_tag_id import ResolveTagId
 from .library.search_discs import SearchDiscs
+from .prefetch_disc import PrefetchDisc
 from .sync_current_tag import SyncCurrentTag
 
 __all__ = [
     "AddDisc",
+    "AsyncHandleTagEvent",
+    "BulkApplyDiscChanges",
     "EditDisc",
     "GetCurrentTagStatus",
     "GetDisc",
     "HandleTagEvent",
     "ListDiscs",
+    "MigrateLibrary",
+    "PrefetchDisc",
     "RemoveDisc",
     "ResolveTagId",
     "SearchDiscs",
@@ -0,0 +1,60 @@
+import asyncio
+
+from jukebox.domain.entities import Disc, PlaybackCommand, PlaybackState, TagEvent, TransitionContext
+from jukebox.domain.errors import PlaybackError
+from jukebox.domain.ports import AsyncPlayerPort
+from jukebox.domain.repositories import LibraryRepository
+
+from .handle_tag_event import TagEventPolicy
+from .prefetch_disc import PrefetchDisc
+
+
+class AsyncHandleTagEvent(TagEventPolicy):
+    """Event-loop counterpart of HandleTagEvent; same transitions and retry rules."""
+
+    def __init__(
+        self,
+        player: AsyncPlayerPort,
+        library: LibraryRepository,
+        ctx: TransitionContext,
+        prefetch_disc: PrefetchDisc | None = None,
+    ):
+        super().__init__(library, ctx, prefetch_disc)
+        self.player = player
+
+    async def execute(self, tag_event: TagEvent, state: PlaybackState) -> PlaybackState:
+        tag_id = self._tag_to_look_up(tag_event, state)
+        # Library repositories are synchronous and may hit the filesystem.
+        disc = await asyncio.to_thread(self._get_disc, tag_id) if tag_id is not None else None
+        (success_state, command) = self._transition(tag_event, state, disc)
+        if command is None:
+            return success_state
+        return await self._try_execute(state, success_state, command, tag_event, disc)
+
+    async def _try_execute(
+        self,
+        current_state: PlaybackState,
+        success_state: PlaybackState,
+        command: PlaybackCommand,
+        tag_event: TagEvent,
+        disc: Disc | None,
+    ) -> PlaybackState:
+        (retry, skip) = self._retry_for(current_state, command, tag_event)
+        if skip:
+            return current_state
+
+        try:
+            match command:
+                case "play":
+                    assert disc is not None
+                    await self.player.play(disc.uri, disc.option.shuffle)
+                case "pause":
+                    await self.player.pause()
+                case "resume":
+                    await self.player.resume()
+                case "stop":
+                    await self.player.stop()
+        except PlaybackError as err:
+            return self._failed_state(current_state, command, tag_event, retry, err)
+
+        return success_state
@@ -11,101 +11,95 @@ from jukebox.domain.entities import (
     TransitionContext,
     Waiting,
 )
-from jukebox.domain.errors import PlaybackError
+from jukebox.domain.errors import PlaybackError, PlayerUnreachableError
 from jukebox.domain.ports import PlayerPort
 from jukebox.domain.repositories import LibraryRepository
 
+from .prefetch_disc import PrefetchDisc
 from .transition_playback import transition_playback
 
 LOGGER = logging.getLogger("jukebox")
 
 
-class HandleTagEvent:
-    """Executes playback commands determined by the state transition function."""
+class TagEventPolicy:
+    """Decides playback commands and retry gating, independent of how the player is called."""
 
-    def __init__(
-        self,
-        player: PlayerPort,
-        library: LibraryRepository,
-        ctx: TransitionContext,
-    ):
-        self.player = player
+    def __init__(self, library: LibraryRepository, ctx: TransitionContext, prefetch_disc: PrefetchDisc | None = None):
         self.library = library
         self.ctx = ctx
+        self.prefetch_disc = prefetch_disc
 
-    def execute(self, tag_event: TagEvent, state: PlaybackState) -> PlaybackState:
+    def _get_disc(self, tag_id: str) -> Disc | None:
+        if self.prefetch_disc is not None:
+            return self.prefetch_disc.get_disc(tag_id)
+        return self.library.get_disc(tag_id)
+
+    def _tag_to_look_up(self, tag_event: TagEvent, state: PlaybackState) -> str | None:
+        """Return the tag whose disc is needed, or None when the current state already covers it."""
         tag_id = tag_event.tag_id
-        disc: Disc | None = None
-        if tag_id is not None and not (isinstance(state, (Playing, Waiting)) and state.tag == tag_id):
-            disc = self.library.get_disc(tag_id)
+        if tag_id is None or (isinstance(state, (Playing, Waiting)) and state.tag == tag_id):
+            return None
+        return tag_id
 
+    def _transition(
+        self, tag_event: TagEvent, state: PlaybackState, disc: Disc | None
+    ) -> tuple[PlaybackState, PlaybackCommand | None]:
+        tag_id = tag_event.tag_id
         (success_state, command) = transition_playback(state, tag_event, disc, self.ctx)
 
         LOGGER.debug("%s  %s | %s", (command or "none").upper(), tag_id, type(state).__name__)
 
-        if command is None:
-            return success_state
-
         if command == "play":
             LOGGER.info("Found card with UID: %s", tag_id)
             LOGGER.info("Found corresponding disc: %s", disc)
 
-        return self._try_execute(state, success_state, command, tag_event, disc)
+        return success_state, command
 
-    def _try_execute(
-        self,
-        current_state: PlaybackState,
-        success_state: PlaybackState,
-        command: PlaybackCommand,
-        tag_event: TagEvent,
-        disc: Disc | None,
-    ) -> PlaybackState:
+    def _retry_for(
+        self, current_state: PlaybackState, command: PlaybackCommand, tag_event: TagEvent
+    ) -> tuple[RetryState | None, bool]:
+        """Return the retry matching this command and whether the command must be skipped for now."""
         tag_id = tag_event.tag_id if command == "play" else None
         timestamp = tag_event.timestamp
         retry = current_state.retry
-        retry_matches = retry is not None and retry.matches(action=command, tag_id=tag_id)
+        if retry is None or not retry.matches(action=command, tag_id=tag_id):
+            return None, False
 
-        if retry_matches and retry.exhausted:
+        if retry.exhausted:
             LOGGER.debug(
                 "Skipping %s; retry exhausted after %d attempts",
                 command.upper(),
                 retry.attempt_count,
             )
-            return current_state
+            return retry, True
 
-        if retry_matches and retry.next_retry_at is not None and timestamp < retry.next_retry_at:
+        if retry.next_retry_at is not None and timestamp < retry.next_retry_at:
             LOGGER.debug("Skipping %s until retry time %.3f", command.upper(), retry.next_retry_at)
-            return current_state
+            return retry, True
 
-        try:
-            match command:
-                case "play":
-                    assert disc is not None
-                    self.player.play(disc.uri, disc.option.shuffle)
-                case "pause":
-                    self.player.pause()
-                case "resume":
-                    self.player.resume()
-                case "stop":
-                    self.player.stop()
-        except PlaybackError:
-            new_retry = self._build_retry(
-                existing=retry if retry_matches else None,
-                action=command,
-                tag_id=tag_id,
-                timestamp=timestamp,
-            )
-            if new_retry.exhausted:
-                LOGGER.warning(
-                    "Playback %s failed; retry exhausted after %d attempts", command, new_retry.attempt_count
-                )
-            else:
-                LOGGER.warning(
-                    "Playback %s failed; retrying in %.3fs", command, (new_retry.next_retry_at or 0) - timestamp
-                )
-            return dataclasses.replace(current_state, retry=new_retry)
+        return retry, False
 
-        return success_state
+    def _failed_state(
+        self,
+        current_state: PlaybackState,
+        command: PlaybackCommand,
+        tag_event: TagEvent,
+        retry: RetryState | None,
+        error: PlaybackError,
+    ) -> PlaybackState:
+        timestamp = tag_event.timestamp
+        new_retry = self._build_retry(
+            existing=retry,
+            action=command,
+            tag_id=tag_event.tag_id if command == "play" else None,
+            timestamp=timestamp,
+            retry_after_seconds=error.retry_after_seconds if isinstance(error, PlayerUnreachableError) else None,
+        )
+        if new_retry.exhausted:
+            LOGGER.warning("Playback %s failed; retry exhausted after %d attempts", command, new_retry.attempt_count)
+        else:
+            LOGGER.warning("Playback %s failed; retrying in %.3fs", command, (new_retry.next_retry_at or 0) - timestamp)
+        return dataclasses.replace(current_state, retry=new_retry)
 
     def _build_retry(
         self,
@@ -114,6 +108,7 @@ class HandleTagEvent:
         action: PlaybackCommand,
         tag_id: str | None,
         timestamp: float,
+        retry_after_seconds: float | None = None,
     ) -> RetryState:
         if existing is None:
             attempt_count = 1
@@ -123,6 +118,9 @@ class HandleTagEvent:
             first_failed_at = existing.first_failed_at
 
         retry_delay = self._retry_delay_for_attempt(attempt_count)
+        if retry_delay is not None and retry_after_seconds is not None:
+            # The player said when it is worth trying again; retrying earlier would be skipped anyway.
+            retry_delay = max(retry_delay, retry_after_seconds)
         return RetryState(
             action=action,
             tag_id=tag_id,
@@ -138,3 +136,53 @@ class HandleTagEvent:
         if delay_index >= len(self.ctx.retry_delays):
             return None
         return self.ctx.retry_delays[delay_index]
+
+
+class HandleTagEvent(TagEventPolicy):
+    """Executes playback commands determined by the state transition function."""
+
+    def __init__(
+        self,
+        player: PlayerPort,
+        library: LibraryRepository,
+        ctx: TransitionContext,
+        prefetch_disc: PrefetchDisc | None = None,
+    ):
+        super().__init__(library, ctx, prefetch_disc)
+        self.player = player
+
+    def execute(self, tag_event: TagEvent, state: PlaybackState) -> PlaybackState:
+        tag_id = self._tag_to_look_up(tag_event, state)
+        disc = self._get_disc(tag_id) if tag_id is not None else None
+        (success_state, command) = self._transition(tag_event, state, disc)
+        if command is None:
+            return success_state
+        return self._try_execute(state, success_state, command, tag_event, disc)
+
+    def _try_execute(
+        self,
+        current_state: PlaybackState,
+        success_state: PlaybackState,
+        command: PlaybackCommand,
+        tag_event: TagEvent,
+        disc: Disc | None,
+    ) -> PlaybackState:
+        (retry, skip) = self._retry_for(current_state, command, tag_event)
+        if skip:
+            return current_state
+
+        try:
+            match command:
+                case "play":
+                    assert disc is not None
+                    self.player.play(disc.uri, disc.option.shuffle)
+                case "pause":
+                    self.player.pause()
+                case "resume":
+                    self.player.resume()
+                case "stop":
+                    self.player.stop()
+        except PlaybackError as err:
+            return self._failed_state(current_state, command, tag_event, retry, err)
+
+        return success_state
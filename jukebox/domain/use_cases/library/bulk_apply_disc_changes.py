@@ -0,0 +1,54 @@
+from collections.abc import Sequence
+
+from jukebox.domain.entities import Disc, DiscChange, DiscChangesSummary
+from jukebox.domain.errors import InvalidDiscChangesError
+from jukebox.domain.repositories import LibraryRepository
+
+
+class BulkApplyDiscChanges:
+    """Applies a batch of disc changes with a single write, or none of them.
+
+    Every change is checked against the library before anything is written,
+    so one invalid change rejects the whole batch with all the errors found.
+    Checks follow the single-disc use cases: a stored tag whose disc could not
+    be read can be added over, upserted or removed, but not updated.
+    """
+
+    def __init__(self, repository: LibraryRepository):
+        self.repository = repository
+
+    def execute(self, changes: Sequence[DiscChange]) -> DiscChangesSummary:
+        disc_tag_ids = set(self.repository.list_discs())
+        stored_tag_ids = self.repository.list_tag_ids()
+        errors: list[str] = []
+        changed_tag_ids: set[str] = set()
+        saved_discs: dict[str, Disc] = {}
+        removed_tag_ids: list[str] = []
+        added = 0
+
+        for change in changes:
+            tag_id = change.tag_id
+            if tag_id in changed_tag_ids:
+                errors.append(f"Tag changed more than once: tag_id='{tag_id}'")
+                continue
+            changed_tag_ids.add(tag_id)
+
+            # Only a readable disc can be updated, while any stored tag can be removed.
+            required_tag_ids = stored_tag_ids if change.action == "remove" else disc_tag_ids
+            if change.action == "add" and tag_id in disc_tag_ids:
+                errors.append(f"Already existing tag: tag_id='{tag_id}'")
+            elif change.action in ("update", "remove") and tag_id not in required_tag_ids:
+                errors.append(f"Tag does not exist: tag_id='{tag_id}'")
+            elif change.action == "remove":
+                removed_tag_ids.append(tag_id)
+            elif change.disc is not None:
+                saved_discs[tag_id] = change.disc
+                if change.action == "add" or tag_id not in stored_tag_ids:
+                    added += 1
+
+        if errors:
+            raise InvalidDiscChangesError(errors)
+        if saved_discs or removed_tag_ids:
+            self.repository.save_discs(saved_discs, removed_tag_ids)
+
+        return DiscChangesSummary(added=added, updated=len(saved_discs) - added, removed=len(removed_tag_ids))
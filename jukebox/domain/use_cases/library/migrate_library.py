@@ -0,0 +1,15 @@
+from jukebox.domain.repositories import LibraryRepository
+
+
+class MigrateLibrary:
+    def __init__(self, source: LibraryRepository, target: LibraryRepository):
+        self.source = source
+        self.target = target
+
+    def execute(self, overwrite: bool = False) -> int:
+        discs = self.source.list_discs()
+        if not overwrite and self.target.list_discs():
+            raise ValueError("Target library is not empty, use --overwrite to replace it")
+
+        self.target.replace_discs(discs)
+        return len(discs)
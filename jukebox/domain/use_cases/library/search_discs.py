@@ -7,21 +7,4 @@ class SearchDiscs:
         self.repository = repository
 
     def execute(self, query: str) -> dict[str, Disc]:
-        query_lower = query.lower()
-        results = {}
-
-        for tag_id, disc in self.repository.list_discs().items():
-            if query_lower in tag_id.lower():
-                results[tag_id] = disc
-                continue
-
-            metadata = disc.metadata
-            if (
-                (metadata.artist and query_lower in metadata.artist.lower())
-                or (metadata.album and query_lower in metadata.album.lower())
-                or (metadata.track and query_lower in metadata.track.lower())
-                or (metadata.playlist and query_lower in metadata.playlist.lower())
-            ):
-                results[tag_id] = disc
-
-        return results
+        return self.repository.search_index().search(query)
@@ -0,0 +1,70 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from jukebox.domain.entities import Disc, TagEvent
+from jukebox.domain.ports import PlayerPort
+from jukebox.domain.repositories import LibraryRepository
+
+LOGGER = logging.getLogger("jukebox")
+
+PREFETCHED_DISCS_MAX_SIZE = 64
+
+
+class PrefetchDisc:
+    """Looks up the disc of a newly seen tag ahead of playback and remembers it per tag.
+
+    Run from the reader side, it resolves the disc and lets the player prepare its
+    URI while the playback side is still busy, so `play` starts from ready data.
+    Callers decide when a tag is new; every call with a tag prefetches.
+    Remembered discs are dropped as soon as the library revision changes; libraries
+    that do not track revisions are queried on every lookup.
+    """
+
+    def __init__(
+        self,
+        library: LibraryRepository,
+        player: PlayerPort | None = None,
+        max_size: int = PREFETCHED_DISCS_MAX_SIZE,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.library = library
+        self.player = player
+        self.max_size = max_size
+        self._discs: OrderedDict[str, tuple[Hashable, Disc | None]] = OrderedDict()
+        # Also serializes library reads between the reader and playback sides.
+        self._lock = threading.Lock()
+
+    def execute(self, tag_event: TagEvent) -> None:
+        """Prefetch the disc of a tag that just appeared; best effort, never raises."""
+        tag_id = tag_event.tag_id
+        if tag_id is None:
+            return
+
+        try:
+            disc = self.get_disc(tag_id)
+            if disc is not None and self.player is not None:
+                self.player.prepare(disc.uri)
+        except Exception as err:  # ruff: ignore[BLE001]
+            LOGGER.debug("Prefetch failed for tag %s: %s", tag_id, err)
+
+    def get_disc(self, tag_id: str) -> Disc | None:
+        with self._lock:
+            revision = self.library.revision()
+            cached = self._discs.get(tag_id)
+            if revision is not None and cached is not None and cached[0] == revision:
+                self._discs.move_to_end(tag_id)
+                return cached[1]
+
+            disc = self.library.get_disc(tag_id)
+            if revision is None:
+                self._discs.clear()
+                return disc
+
+            self._discs[tag_id] = (revision, disc)
+            self._discs.move_to_end(tag_id)
+            if len(self._discs) > self.max_size:
+                self._discs.popitem(last=False)
+            return disc
@@ -1,19 +1,33 @@
 from .profiles import (
+    DEFAULT_PN532_TIMING,
+    DEFAULT_SPI_MAX_SPEED_HZ,
+    MAX_SPI_MAX_SPEED_HZ,
     PN532_PROFILES,
     Pn532BoardProfile,
     Pn532BoardProfileDefaults,
     Pn532ConnectionParams,
+    Pn532DetectionMode,
     Pn532Protocol,
+    Pn532SpiTransferMode,
+    Pn532TimingParams,
     SpiConnectionParams,
     resolve_connection_params,
+    resolve_timing_params,
 )
 
 __all__ = [
+    "DEFAULT_PN532_TIMING",
+    "DEFAULT_SPI_MAX_SPEED_HZ",
+    "MAX_SPI_MAX_SPEED_HZ",
     "PN532_PROFILES",
     "Pn532BoardProfile",
     "Pn532BoardProfileDefaults",
     "Pn532ConnectionParams",
+    "Pn532DetectionMode",
     "Pn532Protocol",
+    "Pn532SpiTransferMode",
+    "Pn532TimingParams",
     "SpiConnectionParams",
     "resolve_connection_params",
+    "resolve_timing_params",
 ]
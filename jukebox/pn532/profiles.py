@@ -6,6 +6,14 @@ Pn532BoardProfile: TypeAlias = Literal["waveshare_hat", "hiletgo_v3", "custom"]
 
 Pn532Protocol: TypeAlias = Literal["spi"]
 
+Pn532DetectionMode: TypeAlias = Literal["passive_target", "auto_poll"]
+
+Pn532SpiTransferMode: TypeAlias = Literal["standard", "burst"]
+
+DEFAULT_SPI_MAX_SPEED_HZ = 1_000_000
+# Highest SPI clock supported by the PN532 datasheet.
+MAX_SPI_MAX_SPEED_HZ = 5_000_000
+
 
 @dataclass(frozen=True)
 class SpiConnectionParams:
@@ -14,6 +22,19 @@ class SpiConnectionParams:
     irq: int | None
 
 
+@dataclass(frozen=True)
+class Pn532TimingParams:
+    """Fixed delays of the PN532 SPI frame path, in seconds."""
+
+    write_delay_seconds: float | None
+    read_delay_seconds: float | None
+    cs_delay_seconds: float | None
+
+
+# Delays shipped with the vendored driver; conservative enough for every known board.
+DEFAULT_PN532_TIMING = Pn532TimingParams(write_delay_seconds=0.02, read_delay_seconds=0.005, cs_delay_seconds=0.001)
+
+
 # Today SpiConnectionParams only; SpiConnectionParams | UartConnectionParams, ...
 # will be introduced when additional protocols are added.
 Pn532ConnectionParams: TypeAlias = SpiConnectionParams
@@ -23,6 +44,7 @@ Pn532ConnectionParams: TypeAlias = SpiConnectionParams
 class Pn532BoardProfileDefaults:
     default_protocol: Pn532Protocol
     connections: dict[Pn532Protocol, Pn532ConnectionParams]
+    timing: Pn532TimingParams = DEFAULT_PN532_TIMING
 
 
 PN532_PROFILES: dict[Pn532BoardProfile, Pn532BoardProfileDefaults] = {
@@ -68,3 +90,17 @@ def resolve_connection_params(
         for f in dataclasses.fields(defaults)
     }
     return type(defaults)(**merged)
+
+
+def resolve_timing_params(board_profile: Pn532BoardProfile, overrides: Pn532TimingParams) -> Pn532TimingParams:
+    """Merge per-field timing overrides with the profile defaults.
+
+    A field value of None in *overrides* means "use the profile default".
+    """
+    defaults = PN532_PROFILES[board_profile].timing
+    return Pn532TimingParams(
+        **{
+            f.name: getattr(overrides, f.name) if getattr(overrides, f.name) is not None else getattr(defaults, f.name)
+            for f in dataclasses.fields(defaults)
+        }
+    )
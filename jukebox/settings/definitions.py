@@ -97,6 +97,20 @@ SETTINGS = {
         section="paths",
         requires_restart=True,
     ),
+    "paths.library_backend": SettingDefinition(
+        path="paths.library_backend",
+        label="Library Backend",
+        description="Storage of the library: the JSON file, the JSON file plus a change journal, or an SQLite database next to it.",
+        field_type="string",
+        section="paths",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="json", label="JSON"),
+            SettingChoice(value="json_journal", label="JSON with a change journal"),
+            SettingChoice(value="sqlite", label="SQLite"),
+        ),
+    ),
     "admin.api.port": SettingDefinition(
         path="admin.api.port",
         label="Admin API Port",
@@ -137,6 +151,61 @@ SETTINGS = {
         section="playback",
         requires_restart=True,
     ),
+    "jukebox.runtime.reader_mode": SettingDefinition(
+        path="jukebox.runtime.reader_mode",
+        label="Reader Mode",
+        description="Read tags inline with playback, on a dedicated thread, or as an asyncio task; "
+        "the last two feed an event queue.",
+        field_type="string",
+        section="playback",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="inline", label="Inline"),
+            SettingChoice(value="threaded", label="Threaded"),
+            SettingChoice(value="async", label="Asyncio"),
+        ),
+    ),
+    "jukebox.runtime.event_queue_size": SettingDefinition(
+        path="jukebox.runtime.event_queue_size",
+        label="Event Queue Size",
+        description="Maximum queued tag events in threaded and async reader modes; the oldest are dropped when full.",
+        field_type="integer",
+        section="playback",
+        requires_restart=True,
+        advanced=True,
+    ),
+    "jukebox.runtime.pacing": SettingDefinition(
+        path="jukebox.runtime.pacing",
+        label="Loop Pacing",
+        description="Read at the loop interval, or slow down after a long idle period without any tag.",
+        field_type="string",
+        section="playback",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="fixed", label="Fixed"),
+            SettingChoice(value="adaptive", label="Adaptive"),
+        ),
+    ),
+    "jukebox.runtime.idle_loop_interval_seconds": SettingDefinition(
+        path="jukebox.runtime.idle_loop_interval_seconds",
+        label="Idle Loop Interval",
+        description="Loop pacing interval in seconds once adaptive pacing considers the jukebox idle.",
+        field_type="number",
+        section="playback",
+        requires_restart=True,
+        advanced=True,
+    ),
+    "jukebox.runtime.idle_after_seconds": SettingDefinition(
+        path="jukebox.runtime.idle_after_seconds",
+        label="Idle After",
+        description="Seconds without any tag while stopped before adaptive pacing slows down.",
+        field_type="number",
+        section="playback",
+        requires_restart=True,
+        advanced=True,
+    ),
     "jukebox.player.type": SettingDefinition(
         path="jukebox.player.type",
         label="Player Type",
@@ -157,6 +226,32 @@ SETTINGS = {
         section="player",
         requires_restart=True,
     ),
+    "jukebox.player.sonos.play_strategy": SettingDefinition(
+        path="jukebox.player.sonos.play_strategy",
+        label="Sonos Play Strategy",
+        description="How playback starts: every command each time, or skipping commands already applied by jukebox.",
+        field_type="string",
+        section="player",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="standard", label="Standard"),
+            SettingChoice(value="fast", label="Fast"),
+        ),
+    ),
+    "jukebox.player.sonos.event_subscription": SettingDefinition(
+        path="jukebox.player.sonos.event_subscription",
+        label="Sonos Event Subscription",
+        description="Follow the speaker through UPnP events to skip no-op commands and notice regrouping.",
+        field_type="string",
+        section="player",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="disabled", label="Disabled"),
+            SettingChoice(value="enabled", label="Enabled"),
+        ),
+    ),
     "jukebox.reader.type": SettingDefinition(
         path="jukebox.reader.type",
         label="Reader Type",
@@ -199,6 +294,26 @@ SETTINGS = {
         requires_restart=True,
         choices=(SettingChoice(value="spi", label="SPI"),),
     ),
+    "jukebox.reader.pn532.detection_mode": SettingDefinition(
+        path="jukebox.reader.pn532.detection_mode",
+        label="PN532 Detection Mode",
+        description="How tags are detected: one InListPassiveTarget command per poll, or InAutoPoll run by the chip.",
+        field_type="string",
+        section="reader",
+        requires_restart=True,
+        choices=(
+            SettingChoice(value="passive_target", label="Passive Target Polling"),
+            SettingChoice(value="auto_poll", label="Automatic Polling (InAutoPoll)"),
+        ),
+    ),
+    "jukebox.reader.pn532.power_down_after_seconds": SettingDefinition(
+        path="jukebox.reader.pn532.power_down_after_seconds",
+        label="PN532 Power Down After",
+        description="Seconds stopped without any tag before the PN532 is powered down between reads, or null to disable.",
+        field_type="number",
+        section="reader",
+        requires_restart=True,
+    ),
     "jukebox.reader.pn532.spi.reset": SettingDefinition(
         path="jukebox.reader.pn532.spi.reset",
         label="PN532 SPI Reset Pin",
@@ -223,6 +338,55 @@ SETTINGS = {
         section="reader",
         requires_restart=True,
     ),
+    "jukebox.reader.pn532.spi.max_speed_hz": SettingDefinition(
+        path="jukebox.reader.pn532.spi.max_speed_hz",
+        label="PN532 SPI Clock",
+        description="SPI clock frequency in Hz used to talk to the PN532 (up to 5000000).",
+        field_type="integer",
+        section="reader",
+        requires_restart=True,
+        advanced=True,
+    ),
+    "jukebox.reader.pn532.spi.transfer_mode": SettingDefinition(
+        path="jukebox.reader.pn532.spi.transfer_mode",
+        label="PN532 SPI Transfer Mode",
+        description="Read the ACK and the response in one SPI transfer when possible (burst), or separately.",
+        field_type="string",
+        section="reader",
+        requires_restart=True,
+        advanced=True,
+        choices=(
+            SettingChoice(value="standard", label="Standard"),
+            SettingChoice(value="burst", label="Burst"),
+        ),
+    ),
+    "jukebox.reader.pn532.timing.write_delay_seconds": SettingDefinition(
+        path="jukebox.reader.pn532.timing.write_delay_seconds",
+        label="PN532 Write Delay",
+        description="Delay in seconds before each SPI frame write, or null for the board profile default.",
+        field_type="number",
+        section="reader",
+        requires_restart=True,
+        advanced=True,
+    ),
+    "jukebox.reader.pn532.timing.read_delay_seconds": SettingDefinition(
+        path="jukebox.reader.pn532.timing.read_delay_seconds",
+        label="PN532 Read Delay",
+        description="Delay in seconds before each SPI frame read, or null for the board profile default.",
+        field_type="number",
+        section="reader",
+        requires_restart=True,
+        advanced=True,
+    ),
+    "jukebox.reader.pn532.timing.cs_delay_seconds": SettingDefinition(
+        path="jukebox.reader.pn532.timing.cs_delay_seconds",
+        label="PN532 Chip Select Delay",
+        description="Settle delay in seconds around chip select toggles, or null for the board profile default.",
+        field_type="number",
+        section="reader",
+        requires_restart=True,
+        advanced=True,
+    ),
 }
 
 
@@ -3,11 +3,19 @@ from typing import Literal, Self
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from jukebox.pn532.profiles import SpiConnectionParams
+from jukebox.pn532.profiles import (
+    DEFAULT_PN532_TIMING,
+    DEFAULT_SPI_MAX_SPEED_HZ,
+    MAX_SPI_MAX_SPEED_HZ,
+    Pn532TimingParams,
+    SpiConnectionParams,
+)
 from jukebox.shared.timing import MIN_PAUSE_DELAY_SECONDS
 
 from .runtime_validation import validate_resolved_jukebox_runtime_rules
 
+LibraryBackend = Literal["json", "json_journal", "sqlite"]
+
 
 def _resolve_default_library_path():
     xdg_config_home = os.environ.get("XDG_CONFIG_HOME", "~/.config")
@@ -44,6 +52,8 @@ class SelectedSonosGroupSettings(StrictModel):
 
 class PersistedSonosPlayerSettings(StrictModel):
     selected_group: SelectedSonosGroupSettings | None = None
+    play_strategy: Literal["standard", "fast"] = "standard"
+    event_subscription: Literal["disabled", "enabled"] = "disabled"
 
 
 class SonosPlayerSettings(PersistedSonosPlayerSettings):
@@ -70,13 +80,24 @@ class Pn532SpiSettings(StrictModel):
     reset: int | None = Field(default=None, ge=0)
     cs: int | None = Field(default=None, ge=0)
     irq: int | None = Field(default=None, ge=0)
+    max_speed_hz: int = Field(default=DEFAULT_SPI_MAX_SPEED_HZ, gt=0, le=MAX_SPI_MAX_SPEED_HZ)
+    transfer_mode: Literal["standard", "burst"] = "standard"
+
+
+class Pn532TimingSettings(StrictModel):
+    write_delay_seconds: float | None = Field(default=None, ge=0)
+    read_delay_seconds: float | None = Field(default=None, ge=0)
+    cs_delay_seconds: float | None = Field(default=None, ge=0)
 
 
 class Pn532ReaderSettings(StrictModel):
     read_timeout_seconds: float = Field(default=0.1, gt=0)
     board_profile: Literal["waveshare_hat", "hiletgo_v3", "custom"] = "waveshare_hat"
     protocol: Literal["spi"] = "spi"
+    detection_mode: Literal["passive_target", "auto_poll"] = "passive_target"
+    power_down_after_seconds: float | None = Field(default=None, ge=0)
     spi: Pn532SpiSettings = Field(default_factory=Pn532SpiSettings)
+    timing: Pn532TimingSettings = Field(default_factory=Pn532TimingSettings)
 
 
 class ReaderSettings(StrictModel):
@@ -91,6 +112,11 @@ class PlaybackSettings(StrictModel):
 
 class RuntimeSettings(StrictModel):
     loop_interval_seconds: float = Field(default=0.1, gt=0)
+    reader_mode: Literal["inline", "threaded", "async"] = "inline"
+    event_queue_size: int = Field(default=16, ge=1)
+    pacing: Literal["fixed", "adaptive"] = "fixed"
+    idle_loop_interval_seconds: float = Field(default=1.0, gt=0)
+    idle_after_seconds: float = Field(default=60.0, ge=0)
 
 
 class PersistedJukeboxSettings(StrictModel):
@@ -110,6 +136,7 @@ class ServerSettings(StrictModel):
 
 class PathsSettings(StrictModel):
     library_path: str = _resolve_default_library_path()
+    library_backend: LibraryBackend = "json"
 
 
 class AdminSettings(StrictModel):
@@ -140,6 +167,8 @@ class SparseSelectedSonosGroupSettings(StrictModel):
 
 class SparsePersistedSonosPlayerSettings(StrictModel):
     selected_group: SparseSelectedSonosGroupSettings | None = None
+    play_strategy: Literal["standard", "fast"] | None = None
+    event_subscription: Literal["disabled", "enabled"] | None = None
 
 
 class SparseSonosPlayerSettings(SparsePersistedSonosPlayerSettings):
@@ -160,13 +189,24 @@ class SparsePn532SpiSettings(StrictModel):
     reset: int | None = Field(default=None, ge=0)
     cs: int | None = Field(default=None, ge=0)
     irq: int | None = Field(default=None, ge=0)
+    max_speed_hz: int | None = Field(default=None, gt=0, le=MAX_SPI_MAX_SPEED_HZ)
+    transfer_mode: Literal["standard", "burst"] | None = None
+
+
+class SparsePn532TimingSettings(StrictModel):
+    write_delay_seconds: float | None = None
+    read_delay_seconds: float | None = None
+    cs_delay_seconds: float | None = None
 
 
 class SparsePn532ReaderSettings(StrictModel):
     read_timeout_seconds: float | None = None
     board_profile: Literal["waveshare_hat", "hiletgo_v3", "custom"] | None = None
     protocol: Literal["spi"] | None = None
+    detection_mode: Literal["passive_target", "auto_poll"] | None = None
+    power_down_after_seconds: float | None = None
     spi: SparsePn532SpiSettings | None = None
+    timing: SparsePn532TimingSettings | None = None
 
 
 class SparseReaderSettings(StrictModel):
@@ -181,6 +221,11 @@ class SparsePlaybackSettings(StrictModel):
 
 class SparseRuntimeSettings(StrictModel):
     loop_interval_seconds: float | None = None
+    reader_mode: Literal["inline", "threaded", "async"] | None = None
+    event_queue_size: int | None = None
+    pacing: Literal["fixed", "adaptive"] | None = None
+    idle_loop_interval_seconds: float | None = None
+    idle_after_seconds: float | None = None
 
 
 class SparsePersistedJukeboxSettings(StrictModel):
@@ -200,6 +245,7 @@ class SparseServerSettings(StrictModel):
 
 class SparsePathsSettings(StrictModel):
     library_path: str | None = None
+    library_backend: LibraryBackend | None = None
 
 
 class SparseAdminSettings(StrictModel):
@@ -262,18 +308,31 @@ class ResolvedSonosGroupRuntime(StrictModel):
 
 class ResolvedJukeboxRuntimeConfig(StrictModel):
     library_path: str
+    library_backend: LibraryBackend = "json"
     player_type: Literal["dryrun", "sonos"]
     sonos_host: str | None = None
     sonos_name: str | None = None
     sonos_group: ResolvedSonosGroupRuntime | None = None
+    sonos_play_strategy: Literal["standard", "fast"] = "standard"
+    sonos_event_subscription: Literal["disabled", "enabled"] = "disabled"
     reader_type: Literal["dryrun", "pn532"]
     pause_duration_seconds: int
     pause_delay_seconds: float
     loop_interval_seconds: float
+    reader_mode: Literal["inline", "threaded", "async"] = "inline"
+    event_queue_size: int = 16
+    loop_pacing: Literal["fixed", "adaptive"] = "fixed"
+    idle_loop_interval_seconds: float = 1.0
+    idle_after_seconds: float = 60.0
     pn532_read_timeout_seconds: float
     pn532_board_profile: Literal["waveshare_hat", "hiletgo_v3", "custom"]
     pn532_protocol: Literal["spi"] = "spi"
+    pn532_detection_mode: Literal["passive_target", "auto_poll"] = "passive_target"
+    pn532_power_down_after_seconds: float | None = None
     pn532_connection: SpiConnectionParams
+    pn532_timing: Pn532TimingParams = DEFAULT_PN532_TIMING
+    pn532_spi_max_speed_hz: int = DEFAULT_SPI_MAX_SPEED_HZ
+    pn532_spi_transfer_mode: Literal["standard", "burst"] = "standard"
     verbose: bool = False
 
     @model_validator(mode="after")
@@ -284,6 +343,7 @@ class ResolvedJukeboxRuntimeConfig(StrictModel):
 
 class ResolvedAdminRuntimeConfig(StrictModel):
     library_path: str
+    library_backend: LibraryBackend = "json"
     api_port: int
     ui_port: int
     verbose: bool = False
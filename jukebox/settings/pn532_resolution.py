@@ -0,0 +1,24 @@
+from jukebox.pn532.profiles import (
+    Pn532TimingParams,
+    SpiConnectionParams,
+    resolve_connection_params,
+    resolve_timing_params,
+)
+
+from .entities import Pn532ReaderSettings
+
+
+def resolve_pn532_connection(pn532: Pn532ReaderSettings) -> SpiConnectionParams:
+    """Merge the configured PN532 pins with the defaults of its board profile."""
+    overrides = SpiConnectionParams(reset=pn532.spi.reset, cs=pn532.spi.cs, irq=pn532.spi.irq)
+    return resolve_connection_params(pn532.board_profile, pn532.protocol, overrides)
+
+
+def resolve_pn532_timing(pn532: Pn532ReaderSettings) -> Pn532TimingParams:
+    """Merge the configured PN532 delays with the defaults of its board profile."""
+    overrides = Pn532TimingParams(
+        write_delay_seconds=pn532.timing.write_delay_seconds,
+        read_delay_seconds=pn532.timing.read_delay_seconds,
+        cs_delay_seconds=pn532.timing.cs_delay_seconds,
+    )
+    return resolve_timing_params(pn532.board_profile, overrides)
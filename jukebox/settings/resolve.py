@@ -1,12 +1,12 @@
 import copy
+import dataclasses
 import json
 import os
 from typing import cast
 
 from pydantic import ValidationError
 
-from jukebox.pn532.profiles import SpiConnectionParams, resolve_connection_params
-from jukebox.shared.config_utils import get_current_tag_path
+from jukebox.shared.config_utils import get_current_tag_path, get_library_database_path
 
 from .definitions import (
     build_settings_metadata_tree,
@@ -23,6 +23,7 @@ from .entities import (
     ResolvedAdminRuntimeConfig,
 )
 from .errors import ErrorCode, InvalidSettingsError
+from .pn532_resolution import resolve_pn532_connection, resolve_pn532_timing
 from .repositories import SettingsRepository
 from .types import JsonObject, JsonValue
 from .validation_rules import validate_settings_rules
@@ -87,6 +88,7 @@ class SettingsService:
                 "paths": {
                     "expanded_library_path": _expand_path(effective_settings.paths.library_path),
                     "current_tag_path": get_current_tag_path(effective_settings.paths.library_path),
+                    "library_database_path": get_library_database_path(effective_settings.paths.library_path),
                 },
                 **_derive_pn532(effective_settings),
             },
@@ -97,6 +99,7 @@ class SettingsService:
         effective_settings = self._resolve_effective_settings()
         return ResolvedAdminRuntimeConfig(
             library_path=_expand_path(effective_settings.paths.library_path),
+            library_backend=effective_settings.paths.library_backend,
             api_port=effective_settings.admin.api.port,
             ui_port=effective_settings.admin.ui.port,
             verbose=verbose,
@@ -259,8 +262,8 @@ def _expand_path(path: str) -> str:
 
 def _derive_pn532(effective_settings: AppSettings) -> JsonObject:
     pn532 = effective_settings.jukebox.reader.pn532
-    overrides = SpiConnectionParams(reset=pn532.spi.reset, cs=pn532.spi.cs, irq=pn532.spi.irq)
-    resolved = resolve_connection_params(pn532.board_profile, pn532.protocol, overrides)
+    resolved = resolve_pn532_connection(pn532)
+    timing = resolve_pn532_timing(pn532)
     return {
         "reader": {
             "pn532": {
@@ -268,7 +271,8 @@ def _derive_pn532(effective_settings: AppSettings) -> JsonObject:
                     "reset": resolved.reset,
                     "cs": resolved.cs,
                     "irq": resolved.irq,
-                }
+                },
+                "timing": dataclasses.asdict(timing),
             }
         }
     }
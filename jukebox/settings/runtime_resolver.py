@@ -3,11 +3,11 @@ from typing import TypeAlias
 
 from pydantic import ValidationError
 
-from jukebox.pn532.profiles import SpiConnectionParams, resolve_connection_params
 from jukebox.sonos.service import SonosService
 
-from .entities import AppSettings, Pn532ReaderSettings, ResolvedJukeboxRuntimeConfig, ResolvedSonosGroupRuntime
+from .entities import AppSettings, ResolvedJukeboxRuntimeConfig, ResolvedSonosGroupRuntime
 from .errors import ErrorCode, InvalidSettingsError
+from .pn532_resolution import resolve_pn532_connection, resolve_pn532_timing
 from .service_protocols import RuntimeSettingsService
 from .validation_rules import validate_settings_rules
 
@@ -28,18 +28,31 @@ class JukeboxRuntimeResolver:
             # admin/settings inspection can still work with incomplete jukebox settings.
             return ResolvedJukeboxRuntimeConfig(
                 library_path=os.path.abspath(os.path.expanduser(effective_settings.paths.library_path)),
+                library_backend=effective_settings.paths.library_backend,
                 player_type=effective_settings.jukebox.player.type,
                 sonos_host=sonos_host,
                 sonos_name=sonos_name,
                 sonos_group=sonos_group,
+                sonos_play_strategy=effective_settings.jukebox.player.sonos.play_strategy,
+                sonos_event_subscription=effective_settings.jukebox.player.sonos.event_subscription,
                 reader_type=effective_settings.jukebox.reader.type,
                 pause_duration_seconds=effective_settings.jukebox.playback.pause_duration_seconds,
                 pause_delay_seconds=effective_settings.jukebox.playback.pause_delay_seconds,
                 loop_interval_seconds=effective_settings.jukebox.runtime.loop_interval_seconds,
+                reader_mode=effective_settings.jukebox.runtime.reader_mode,
+                event_queue_size=effective_settings.jukebox.runtime.event_queue_size,
+                loop_pacing=effective_settings.jukebox.runtime.pacing,
+                idle_loop_interval_seconds=effective_settings.jukebox.runtime.idle_loop_interval_seconds,
+                idle_after_seconds=effective_settings.jukebox.runtime.idle_after_seconds,
                 pn532_read_timeout_seconds=effective_settings.jukebox.reader.pn532.read_timeout_seconds,
                 pn532_board_profile=effective_settings.jukebox.reader.pn532.board_profile,
                 pn532_protocol=effective_settings.jukebox.reader.pn532.protocol,
-                pn532_connection=_resolve_pn532_connection(effective_settings.jukebox.reader.pn532),
+                pn532_detection_mode=effective_settings.jukebox.reader.pn532.detection_mode,
+                pn532_power_down_after_seconds=effective_settings.jukebox.reader.pn532.power_down_after_seconds,
+                pn532_connection=resolve_pn532_connection(effective_settings.jukebox.reader.pn532),
+                pn532_timing=resolve_pn532_timing(effective_settings.jukebox.reader.pn532),
+                pn532_spi_max_speed_hz=effective_settings.jukebox.reader.pn532.spi.max_speed_hz,
+                pn532_spi_transfer_mode=effective_settings.jukebox.reader.pn532.spi.transfer_mode,
                 verbose=verbose,
             )
         except (ValidationError, ValueError) as err:
@@ -64,8 +77,3 @@ class JukeboxRuntimeResolver:
             return resolved_group.coordinator.host, None, resolved_group
 
         return None, None, None
-
-
-def _resolve_pn532_connection(pn532: Pn532ReaderSettings) -> SpiConnectionParams:
-    overrides = SpiConnectionParams(reset=pn532.spi.reset, cs=pn532.spi.cs, irq=pn532.spi.irq)
-    return resolve_connection_params(pn532.board_profile, pn532.protocol, overrides)
@@ -12,3 +12,13 @@ def get_package_version(package_name: str = "gukebox") -> str:
 def get_current_tag_path(library_path: str) -> str:
     library_dir = os.path.dirname(os.path.abspath(os.path.expanduser(library_path)))
     return os.path.join(library_dir, "current-tag.txt")
+
+
+def get_library_database_path(library_path: str) -> str:
+    library_root, _ = os.path.splitext(os.path.abspath(os.path.expanduser(library_path)))
+    return f"{library_root}.sqlite3"
+
+
+def get_sonos_group_cache_path(settings_path: str) -> str:
+    settings_dir = os.path.dirname(os.path.abspath(os.path.expanduser(settings_path)))
+    return os.path.join(settings_dir, "sonos-group-cache.json")
@@ -4,6 +4,7 @@ from .discovery import (
     SonosDiscoveryPort,
     sort_sonos_speakers,
 )
+from .group_cache import SonosGroupCachePort
 from .selection import (
     GetSonosSelectionStatus,
     SaveSonosSelection,
@@ -18,6 +19,7 @@ from .service import (
     SonosService,
     playback_target_from_runtime_group,
 )
+from .topology_cache import SonosTopologyCache, SonosTopologyCachePort
 
 __all__ = [
     "DefaultSonosService",
@@ -26,12 +28,15 @@ __all__ = [
     "SaveSonosSelection",
     "SonosDiscoveryError",
     "SonosDiscoveryPort",
+    "SonosGroupCachePort",
     "SonosPlaybackTarget",
     "SonosPlaybackTargetResolver",
     "SonosSelectionAvailability",
     "SonosSelectionResult",
     "SonosSelectionStatus",
     "SonosService",
+    "SonosTopologyCache",
+    "SonosTopologyCachePort",
     "playback_target_from_runtime_group",
     "sort_sonos_speakers",
 ]
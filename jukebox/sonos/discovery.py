@@ -22,6 +22,8 @@ class SonosDiscoveryPort(Protocol):
 
     def discover_household_speakers(self, household_id: str) -> list[DiscoveredSonosSpeaker]: ...
 
+    def inspect_speaker(self, uid: str, host: str) -> DiscoveredSonosSpeaker: ...
+
 
 def sort_sonos_speakers(speakers: list[DiscoveredSonosSpeaker]) -> list[DiscoveredSonosSpeaker]:
     return sorted(speakers, key=lambda speaker: (speaker.name, speaker.host, speaker.uid))
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from jukebox.settings.entities import ResolvedSonosGroupRuntime
+
+
+class SonosGroupCachePort(Protocol):
+    def load(self) -> ResolvedSonosGroupRuntime | None: ...
+
+    def save(self, group: ResolvedSonosGroupRuntime) -> None: ...
+
+    def clear(self) -> None: ...
@@ -1,3 +1,5 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Protocol
 
@@ -10,9 +12,14 @@ from jukebox.settings.entities import (
 
 from .discovery import (
     DiscoveredSonosSpeaker,
+    SonosDiscoveryError,
     SonosDiscoveryPort,
     sort_sonos_speakers,
 )
+from .group_cache import SonosGroupCachePort
+from .topology_cache import SonosTopologyCachePort
+
+LOGGER = logging.getLogger("jukebox")
 
 
 @dataclass(frozen=True)
@@ -36,6 +43,8 @@ class SonosPlaybackTargetResolver(Protocol):
         target: SonosPlaybackTarget,
     ) -> ResolvedSonosGroupRuntime: ...
 
+    def invalidate_playback_target(self, target: SonosPlaybackTarget) -> None: ...
+
 
 class SonosService(SonosPlaybackTargetResolver, Protocol):
     def list_network_speakers(self) -> list[DiscoveredSonosSpeaker]: ...
@@ -60,8 +69,15 @@ class InspectedSelectedSonosGroup:
 
 
 class DefaultSonosService:
-    def __init__(self, discovery: SonosDiscoveryPort):
+    def __init__(
+        self,
+        discovery: SonosDiscoveryPort,
+        group_cache: SonosGroupCachePort | None = None,
+        topology_cache: SonosTopologyCachePort | None = None,
+    ):
         self.discovery = discovery
+        self.group_cache = group_cache
+        self.topology_cache = topology_cache
 
     def list_network_speakers(self) -> list[DiscoveredSonosSpeaker]:
         return self._filter_visible_speakers(self.discovery.discover_speakers())
@@ -69,6 +85,23 @@ class DefaultSonosService:
     def inspect_selected_group(
         self,
         selected_group: SelectedSonosGroupSettings,
+    ) -> InspectedSelectedSonosGroup:
+        if self.topology_cache is None:
+            return self._inspect_discovered_group(selected_group)
+
+        inspected_at = self.topology_cache.clock()
+        inspection = self._inspect_discovered_group(selected_group)
+        # Cached topology may predate the group's current state: look again before reporting it as broken.
+        if inspection.error_message is not None and self.topology_cache.invalidate(
+            selected_group.household_id,
+            discovered_before=inspected_at,
+        ):
+            inspection = self._inspect_discovered_group(selected_group)
+        return inspection
+
+    def _inspect_discovered_group(
+        self,
+        selected_group: SelectedSonosGroupSettings,
     ) -> InspectedSelectedSonosGroup:
         if selected_group.household_id is None:
             return _inspect_selected_group(
@@ -91,6 +124,51 @@ class DefaultSonosService:
     def resolve_selected_group(
         self,
         selected_group: SelectedSonosGroupSettings,
+    ) -> ResolvedSonosGroupRuntime:
+        last_known_group = self._verified_last_known_group(selected_group)
+        if last_known_group is not None:
+            return last_known_group
+
+        resolved_group = self._discover_selected_group(selected_group)
+        if self.group_cache is not None:
+            self.group_cache.save(resolved_group)
+        return resolved_group
+
+    def _verified_last_known_group(
+        self,
+        selected_group: SelectedSonosGroupSettings,
+    ) -> ResolvedSonosGroupRuntime | None:
+        """Return the last resolved group if it still matches the selection and every member answers at its host."""
+        if self.group_cache is None:
+            return None
+
+        cached_group = self.group_cache.load()
+        if cached_group is None or not _last_known_group_matches(cached_group, selected_group):
+            return None
+
+        with ThreadPoolExecutor(max_workers=len(cached_group.members)) as executor:
+            probes = list(executor.map(self._probe_last_known_member, cached_group.members))
+        for member, speaker in zip(cached_group.members, probes, strict=True):
+            if speaker is None or speaker.uid != member.uid or speaker.household_id != cached_group.household_id:
+                LOGGER.info(
+                    "Last known Sonos member `%s` is not at %s anymore, running discovery", member.name, member.host
+                )
+                return None
+
+        coordinator = cached_group.coordinator
+        LOGGER.debug("Using last known Sonos group coordinated by `%s` at %s", coordinator.name, coordinator.host)
+        return cached_group
+
+    def _probe_last_known_member(self, member: ResolvedSonosSpeakerRuntime) -> DiscoveredSonosSpeaker | None:
+        try:
+            return self.discovery.inspect_speaker(member.uid, member.host)
+        except SonosDiscoveryError as err:
+            LOGGER.debug("Last known Sonos member did not answer: %s", err)
+            return None
+
+    def _discover_selected_group(
+        self,
+        selected_group: SelectedSonosGroupSettings,
     ) -> ResolvedSonosGroupRuntime:
         inspection = self.inspect_selected_group(selected_group)
         if inspection.error_message is not None:
@@ -115,6 +193,18 @@ class DefaultSonosService:
     ) -> ResolvedSonosGroupRuntime:
         return self.resolve_selected_group(_selected_group_from_playback_target(target))
 
+    def invalidate_playback_target(self, target: SonosPlaybackTarget) -> None:
+        # The last known group is as stale as the topology: rediscover instead of trusting it again.
+        if self.group_cache is not None:
+            self.group_cache.clear()
+        self.invalidate_topology(target.household_id)
+
+    def invalidate_topology(self, household_id: str | None = None) -> bool:
+        """Drop cached discovery results so the next lookup queries the network."""
+        if self.topology_cache is None:
+            return False
+        return self.topology_cache.invalidate(household_id)
+
     @staticmethod
     def _build_runtime_speaker(speaker: DiscoveredSonosSpeaker) -> ResolvedSonosSpeakerRuntime:
         return ResolvedSonosSpeakerRuntime(
@@ -184,6 +274,20 @@ def _inspection_needs_network_fallback(
     return len(inspection.resolved_members) != len(selected_group.members)
 
 
+def _last_known_group_matches(
+    group: ResolvedSonosGroupRuntime,
+    selected_group: SelectedSonosGroupSettings,
+) -> bool:
+    # A group that was missing members is rediscovered so they can rejoin once they are back.
+    if group.missing_member_uids:
+        return False
+    if selected_group.household_id is not None and group.household_id != selected_group.household_id:
+        return False
+    return group.coordinator.uid == selected_group.coordinator_uid and {member.uid for member in group.members} == {
+        member.uid for member in selected_group.members
+    }
+
+
 def playback_target_from_runtime_group(
     group: ResolvedSonosGroupRuntime | None,
 ) -> SonosPlaybackTarget | None:
@@ -0,0 +1,109 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Protocol
+
+from .discovery import DiscoveredSonosSpeaker, SonosDiscoveryPort, sort_sonos_speakers
+
+LOGGER = logging.getLogger("jukebox")
+
+SONOS_TOPOLOGY_CACHE_TTL_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class _CachedTopology:
+    speakers: tuple[DiscoveredSonosSpeaker, ...]
+    discovered_at: float
+
+
+class SonosTopologyCachePort(Protocol):
+    clock: Callable[[], float]
+
+    def invalidate(self, household_id: str | None = None, discovered_before: float | None = None) -> bool: ...
+
+
+class SonosTopologyCache(SonosDiscoveryPort):
+    """Discovery port that reuses recent discovery results, keyed by household.
+
+    A network-wide discovery also fills the entry of every household it found, so
+    inspecting a saved group right after listing speakers does not query the
+    network again. Concurrent callers wait for a single discovery instead of each
+    running their own.
+    """
+
+    def __init__(
+        self,
+        discovery: SonosDiscoveryPort,
+        ttl_seconds: float = SONOS_TOPOLOGY_CACHE_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.discovery = discovery
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._network: _CachedTopology | None = None
+        self._households: dict[str, _CachedTopology] = {}
+        self._lock = threading.Lock()
+
+    def discover_speakers(self) -> list[DiscoveredSonosSpeaker]:
+        with self._lock:
+            network = self._network
+            if network is not None and self._is_fresh(network):
+                LOGGER.debug("Using cached Sonos network topology")
+                return list(network.speakers)
+
+            speakers = self.discovery.discover_speakers()
+            now = self.clock()
+            self._network = _CachedTopology(speakers=tuple(speakers), discovered_at=now)
+            for household_id in {speaker.household_id for speaker in speakers}:
+                self._households[household_id] = _CachedTopology(
+                    speakers=tuple(
+                        sort_sonos_speakers([speaker for speaker in speakers if speaker.household_id == household_id])
+                    ),
+                    discovered_at=now,
+                )
+            return list(speakers)
+
+    def discover_household_speakers(self, household_id: str) -> list[DiscoveredSonosSpeaker]:
+        with self._lock:
+            cached = self._households.get(household_id)
+            if cached is not None and self._is_fresh(cached):
+                LOGGER.debug("Using cached Sonos topology for household `%s`", household_id)
+                return list(cached.speakers)
+
+            speakers = self.discovery.discover_household_speakers(household_id)
+            self._households[household_id] = _CachedTopology(speakers=tuple(speakers), discovered_at=self.clock())
+            return list(speakers)
+
+    def inspect_speaker(self, uid: str, host: str) -> DiscoveredSonosSpeaker:
+        return self.discovery.inspect_speaker(uid, host)
+
+    def invalidate(self, household_id: str | None = None, discovered_before: float | None = None) -> bool:
+        """Drop cached topology, for one household or entirely. Returns whether anything was dropped.
+
+        The network-wide entry always goes too, as it includes every household. With
+        `discovered_before`, entries discovered at or after that time are kept.
+        """
+        with self._lock:
+            dropped = False
+            if self._is_droppable(self._network, discovered_before):
+                self._network = None
+                dropped = True
+            household_ids = list(self._households) if household_id is None else [household_id]
+            for cached_household_id in household_ids:
+                if self._is_droppable(self._households.get(cached_household_id), discovered_before):
+                    del self._households[cached_household_id]
+                    dropped = True
+        if dropped:
+            LOGGER.debug("Invalidated cached Sonos topology for household `%s`", household_id or "*")
+        return dropped
+
+    @staticmethod
+    def _is_droppable(cached: _CachedTopology | None, discovered_before: float | None) -> bool:
+        if cached is None:
+            return False
+        return discovered_before is None or cached.discovered_at < discovered_before
+
+    def _is_fresh(self, cached: _CachedTopology) -> bool:
+        return self.clock() - cached.discovered_at < self.ttl_seconds
@@ -75,6 +75,17 @@ _COMMAND_TGGETINITIATORCOMMAND = 0x88
 _COMMAND_TGRESPONSETOINITIATOR = 0x90
 _COMMAND_TGGETTARGETSTATUS     = 0x8A
 
+# Commands the PN532 answers without any RF activity: their response is ready
+# as soon as their ACK, so burst transfers only apply to them.
+_IMMEDIATE_COMMANDS            = frozenset((_COMMAND_GETFIRMWAREVERSION,
+                                            _COMMAND_GETGENERALSTATUS,
+                                            _COMMAND_READREGISTER,
+                                            _COMMAND_WRITEREGISTER,
+                                            _COMMAND_READGPIO,
+                                            _COMMAND_WRITEGPIO,
+                                            _COMMAND_SETPARAMETERS,
+                                            _COMMAND_SAMCONFIGURATION))
+
 _RESPONSE_INDATAEXCHANGE       = 0x41
 _RESPONSE_INLISTPASSIVETARGET  = 0x4B
 
@@ -82,6 +93,19 @@ _WAKEUP                        = 0x55
 
 _MIFARE_ISO14443A              = 0x00
 
+# InAutoPoll target types
+_AUTOPOLL_GENERIC_106KBPS      = 0x10
+_AUTOPOLL_ENDLESS              = 0xFF
+
+# PowerDown WakeUpEnable bits
+_POWERDOWN_WAKEUP_INT0         = 0x01
+_POWERDOWN_WAKEUP_INT1         = 0x02
+_POWERDOWN_WAKEUP_RF           = 0x08
+_POWERDOWN_WAKEUP_HSU          = 0x10
+_POWERDOWN_WAKEUP_SPI          = 0x20
+_POWERDOWN_WAKEUP_GPIO         = 0x40
+_POWERDOWN_WAKEUP_I2C          = 0x80
+
 # Mifare Commands
 MIFARE_CMD_AUTH_A                   = 0x60
 MIFARE_CMD_AUTH_B                   = 0x61
@@ -183,10 +207,15 @@ class BusyError(Exception):
 class PN532:
     """PN532 driver base, must be extended for I2C/SPI/UART interfacing"""
 
+    # Read the ACK and the response in one transfer when possible.
+    burst = False
+
     def __init__(self, *, debug=False, reset=None):
         """Create an instance of the PN532 class
         """
         self.debug = debug
+        self._auto_poll_running = False
+        self._powered_down = False
         if reset:
             if debug:
                 print("Resetting")
@@ -227,6 +256,11 @@ class PN532:
         # Send special command to wake up
         raise NotImplementedError
 
+    def _wake_from_power_down(self):
+        # Wake up from PowerDown before sending a command. Subclasses may
+        # override this with a faster sequence than the initial wake up.
+        self._wakeup()
+
     def _write_frame(self, data):
         """Write a frame to the PN532 with the specified data bytearray."""
         assert data is not None and 1 < len(data) < 255, 'Data must be array of 1 to 255 bytes.'
@@ -265,7 +299,12 @@ class PN532:
         response = self._read_data(length+7)
         if self.debug:
             print('Read frame:', [hex(i) for i in response])
+        return self._parse_frame(response)
 
+    def _parse_frame(self, response):
+        """Return the data inside a raw response frame, or raise an exception
+        if there is an error parsing the frame.
+        """
         # Swallow all the 0x00 values that preceed 0xFF.
         offset = 0
         while response[offset] == 0x00:
@@ -275,7 +314,7 @@ class PN532:
         if response[offset] != 0xFF:
             raise RuntimeError('Response frame preamble does not contain 0x00FF!')
         offset += 1
-        if offset >= len(response):
+        if offset + 1 >= len(response):
             raise RuntimeError('Response contains no data!')
         # Check length & length checksum match.
         frame_len = response[offset]
@@ -296,6 +335,33 @@ class PN532:
         for a response and return a bytearray of response bytes, or None if no
         response is available within the timeout.
         """
+        if not self._write_command(command, params, timeout):
+            return None
+        if self.burst and command in _IMMEDIATE_COMMANDS:
+            response = self._read_ack_and_response(command, response_length)
+            if response is not None:
+                return response
+            # Response was not ready with the ACK: wait for it as usual.
+        elif not _ACK == self._read_data(len(_ACK)):
+            raise RuntimeError('Did not receive expected ACK from PN532!')
+        if not self._wait_ready(timeout):
+            return None
+        return self._read_response(command, response_length)
+
+    def send_command(self, command, params=None, timeout=1.0):
+        """Send specified command to the PN532 and wait for its ACK, without
+        waiting for the function response.  Returns True once the command is
+        acknowledged, or False if the PN532 did not answer within timeout.
+        """
+        if not self._write_command(command, params, timeout):
+            return False
+        # Verify ACK response.
+        if not _ACK == self._read_data(len(_ACK)):
+            raise RuntimeError('Did not receive expected ACK from PN532!')
+        return True
+
+    def _write_command(self, command, params, timeout):
+        """Write a command frame and wait for the PN532 to have its ACK ready."""
         # Build frame data with command and parameters.
         if params is None:
             params = []
@@ -304,19 +370,36 @@ class PN532:
         data[1] = command & 0xFF
         for i, val in enumerate(params):
             data[2+i] = val
+        # Any new command aborts a running InAutoPoll.
+        self._auto_poll_running = False
+        if self._powered_down:
+            self._powered_down = False
+            self._wake_from_power_down()
         # Send frame and wait for response.
         try:
             self._write_frame(data)
         except OSError:
             self._wakeup()
-            return None
-        if not self._wait_ready(timeout):
-            return None
-        # Verify ACK response and wait to be ready for function response.
-        if not _ACK == self._read_data(len(_ACK)):
+            return False
+        return self._wait_ready(timeout)
+
+    def _read_ack_and_response(self, command, response_length):
+        """Read the ACK and the response frame in a single transfer.  Returns
+        None if the response was not ready yet; the ACK is consumed either way.
+        """
+        data = self._read_data(len(_ACK)+response_length+2+7)
+        if not data.startswith(_ACK):
             raise RuntimeError('Did not receive expected ACK from PN532!')
-        if not self._wait_ready(timeout):
+        try:
+            response = self._parse_frame(data[len(_ACK):])
+        except RuntimeError:
             return None
+        if not (len(response) >= 2 and response[0] == _PN532TOHOST and response[1] == (command+1)):
+            return None
+        return response[2:]
+
+    def _read_response(self, command, response_length):
+        """Read the response frame of an acknowledged command."""
         # Read response bytes.
         response = self._read_frame(response_length+2)
         # Check that response is for the called function.
@@ -344,6 +427,23 @@ class PN532:
         # check the command was executed as expected.
         self.call_function(_COMMAND_SAMCONFIGURATION, params=[0x01, 0x14, 0x01])
 
+    def power_down(self, wakeup_sources=_POWERDOWN_WAKEUP_SPI | _POWERDOWN_WAKEUP_RF, generate_irq=True):
+        """Put the PN532 in PowerDown mode.  Wakeup_sources is the WakeUpEnable
+        bit mask: the PN532 wakes up on its own when one of them fires (e.g. an
+        external RF field), pulling IRQ low if generate_irq is set, and the next
+        command wakes it up from the host side.  Returns True once the PN532
+        confirmed entering PowerDown.
+        """
+        params = [wakeup_sources, 0x01] if generate_irq else [wakeup_sources]
+        response = self.call_function(_COMMAND_POWERDOWN, response_length=1, params=params)
+        self._powered_down = response is not None and response[0] == 0x00
+        return self._powered_down
+
+    @property
+    def powered_down(self):
+        """True while the PN532 is in PowerDown and has not been woken up by a command"""
+        return self._powered_down
+
     def read_passive_target(self, card_baud=_MIFARE_ISO14443A, timeout=1.0):
         """Wait for a MiFare card to be available and return its UID when found.
         Will wait up to timeout seconds and return None if no card is found,
@@ -368,6 +468,52 @@ class PN532:
         # Return UID of card.
         return response[6:6+response[5]]
 
+    def start_passive_target(self, card_baud=_MIFARE_ISO14443A, timeout=1.0):
+        """Send InListPassiveTarget for 1 card without waiting for a card.
+        Returns True once the PN532 acknowledged the command; the next command
+        aborts the search.
+        """
+        return self.send_command(_COMMAND_INLISTPASSIVETARGET,
+                                 params=[0x01, card_baud],
+                                 timeout=timeout)
+
+    def start_auto_poll(self, card_type=_AUTOPOLL_GENERIC_106KBPS, period=0x01, timeout=1.0):
+        """Start the PN532 InAutoPoll command so it keeps polling for a card
+        on its own.  Period is the delay between two polls in units of 150ms.
+        Returns True once the PN532 acknowledged the command.
+        """
+        self._auto_poll_running = self.send_command(_COMMAND_INAUTOPOLL,
+                                                    params=[_AUTOPOLL_ENDLESS, period, card_type],
+                                                    timeout=timeout)
+        return self._auto_poll_running
+
+    def read_auto_poll_target(self, card_type=_AUTOPOLL_GENERIC_106KBPS, period=0x01, timeout=1.0):
+        """Collect the result of a running InAutoPoll command, starting it first
+        if needed.  Will wait up to timeout seconds and return None if no card
+        was found yet, otherwise a bytearray with the UID of the found card is
+        returned and polling is restarted on the next call.
+        """
+        if not self._auto_poll_running:
+            try:
+                if not self.start_auto_poll(card_type=card_type, period=period, timeout=timeout):
+                    return None
+            except BusyError:
+                return None
+        # While no card is in the field the PN532 keeps polling and is not
+        # ready, so only the ready line/status byte is checked here.
+        if not self._wait_ready(timeout):
+            return None
+        self._auto_poll_running = False
+        # Expect 1 target: NbTg, Type, Length then the InListPassiveTarget data.
+        response = self._read_response(_COMMAND_INAUTOPOLL, 22)
+        if response[0] == 0x00:
+            return None
+        target_data = response[3:3+response[2]]
+        if target_data[4] > 7:
+            raise RuntimeError('Found card with unexpectedly long UID!')
+        # Return UID of card.
+        return target_data[5:5+target_data[4]]
+
     def mifare_classic_authenticate_block(self, uid, block_number, key_number, key):   # pylint: disable=invalid-name
         """Authenticate specified block number for a MiFare classic card.  Uid
         should be a byte array with the UID of the card, block number should be
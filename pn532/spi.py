@@ -30,6 +30,7 @@ using SPI on the Raspberry Pi.
 """
 
 
+import threading
 import time
 import spidev
 try:
@@ -50,47 +51,60 @@ _SPI_DATAWRITE                 = 0x01
 _SPI_DATAREAD                  = 0x03
 _SPI_READY                     = 0x01
 
+# Default delays (seconds) of the frame path. Some boards need them, others
+# work with much shorter ones: they can be tuned per instance.
+_WRITE_DELAY                   = 0.02
+_READ_DELAY                    = 0.005
+_CS_DELAY                      = 0.001
+
+_MAX_SPEED_HZ                  = 1000000
+
+# Oscillator start-up time after a wake up from PowerDown
+_T_OSC_START                   = 0.002
+
 
 class SPIDevice:
     """Implements SPI device on spidev"""
-    def __init__(self, h, cs=None):
+    def __init__(self, h, cs=None, cs_delay=_CS_DELAY, max_speed_hz=_MAX_SPEED_HZ):
         self.spi = spidev.SpiDev(0, 0)
         self._h = h
         self._cs = cs
+        self.cs_delay = cs_delay
         if cs is not None:
             lgpio.gpio_claim_output(self._h, self._cs)
             lgpio.gpio_write(self._h, self._cs, 1)
-        self.spi.max_speed_hz = 1000000
+        self.spi.max_speed_hz = max_speed_hz
         self.spi.mode = 0b10    # CPOL=1 & CPHA=0
 
-    def writebytes(self, buf):
+    def _select(self):
         if self._cs is not None:
             lgpio.gpio_write(self._h, self._cs, 0)
-            time.sleep(0.001)
-        ret = self.spi.writebytes(list(buf))
+            if self.cs_delay:
+                time.sleep(self.cs_delay)
+
+    def _deselect(self):
         if self._cs is not None:
-            time.sleep(0.001)
+            if self.cs_delay:
+                time.sleep(self.cs_delay)
             lgpio.gpio_write(self._h, self._cs, 1)
+
+    def writebytes(self, buf):
+        self._select()
+        # writebytes2 takes any buffer, no per-call list conversion
+        ret = self.spi.writebytes2(buf)
+        self._deselect()
         return ret
 
     def readbytes(self, count):
-        if self._cs is not None:
-            lgpio.gpio_write(self._h, self._cs, 0)
-            time.sleep(0.001)
+        self._select()
         ret = bytearray(self.spi.readbytes(count))
-        if self._cs is not None:
-            time.sleep(0.001)
-            lgpio.gpio_write(self._h, self._cs, 1)
+        self._deselect()
         return ret
 
     def xfer(self, buf):
-        if self._cs is not None:
-            lgpio.gpio_write(self._h, self._cs, 0)
-            time.sleep(0.001)
+        self._select()
         buf = bytearray(self.spi.xfer(buf))
-        if self._cs is not None:
-            time.sleep(0.001)
-            lgpio.gpio_write(self._h, self._cs, 1)
+        self._deselect()
         return buf
 
 
@@ -105,26 +119,56 @@ def reverse_bit(num):
     return result
 
 
+# Precomputed for whole-frame conversion with bytes.translate().
+_REVERSE_BIT_TABLE             = bytes(reverse_bit(i) for i in range(256))
+_STATUS_REQUEST                = bytes([reverse_bit(_SPI_STATREAD), 0])
+_STATUS_READY                  = reverse_bit(_SPI_READY)
+_DATAWRITE_PREFIX              = bytes([reverse_bit(_SPI_DATAWRITE)])
+
+
 class PN532_SPI(PN532):
     """Driver for the PN532 connected over SPI. Pass in a hardware SPI device
-    & chip select digitalInOut pin. Optional IRQ pin (not used), reset pin and
-    debugging output."""
-    def __init__(self, cs=None, irq=None, reset=None, debug=False):
+    & chip select digitalInOut pin. Optional IRQ pin, reset pin and debugging
+    output. When an IRQ pin is given, readiness is detected on its falling edge
+    instead of polling the status byte. The write, read and chip select delays
+    (in seconds) default to values that work on most boards. With burst, the
+    ACK and the response of commands answered without RF activity are read
+    in one transfer."""
+    def __init__(self, cs=None, irq=None, reset=None, debug=False,
+                 write_delay=_WRITE_DELAY, read_delay=_READ_DELAY, cs_delay=_CS_DELAY,
+                 max_speed_hz=_MAX_SPEED_HZ, burst=False):
         """Create an instance of the PN532 class using SPI"""
         self.debug = debug
+        self.burst = burst
+        self.write_delay = write_delay
+        self.read_delay = read_delay
+        self._read_requests = {}   # count -> prebuilt LSB read request frame
         self._h = lgpio.gpiochip_open(0)
         self._gpio_init(cs=cs, irq=irq, reset=reset)
-        self._spi = SPIDevice(self._h, cs)
+        self._spi = SPIDevice(self._h, cs, cs_delay=cs_delay, max_speed_hz=max_speed_hz)
         super().__init__(debug=debug, reset=reset)
 
     def __del__(self):
+        if getattr(self, '_irq_callback', None) is not None:
+            self._irq_callback.cancel()
         if hasattr(self, '_h'):
             lgpio.gpiochip_close(self._h)
 
+    @property
+    def cs_delay(self):
+        """Settle delay around manual chip select toggles, in seconds"""
+        return self._spi.cs_delay
+
+    @cs_delay.setter
+    def cs_delay(self, value):
+        self._spi.cs_delay = value
+
     def _gpio_init(self, reset=None, cs=None, irq=None):
         # self._h 已在 __init__ 打开
         self._cs = cs
         self._irq = irq
+        self._irq_event = threading.Event()
+        self._irq_callback = None
         if reset is not None:
             lgpio.gpio_claim_output(self._h, reset)
             lgpio.gpio_write(self._h, reset, 1)
@@ -132,7 +176,14 @@ class PN532_SPI(PN532):
             lgpio.gpio_claim_output(self._h, cs)
             lgpio.gpio_write(self._h, cs, 1)
         if irq is not None:
-            lgpio.gpio_claim_input(self._h, irq)
+            # The PN532 pulls IRQ low once a response is ready and releases it
+            # when the host starts reading, so only the falling edge matters.
+            lgpio.gpio_claim_alert(self._h, irq, lgpio.FALLING_EDGE)
+            self._irq_callback = lgpio.callback(self._h, irq, lgpio.FALLING_EDGE, self._on_irq)
+
+    def _on_irq(self, chip, gpio, level, timestamp):
+        """lgpio alert callback, runs on the lgpio notification thread"""
+        self._irq_event.set()
 
     def _reset(self, pin):
         """Perform a hardware reset toggle"""
@@ -148,18 +199,43 @@ class PN532_SPI(PN532):
         time.sleep(1)
         if self._cs is not None:
             lgpio.gpio_write(self._h, self._cs, 0)
-        time.sleep(0.002)   # T_osc_start
+        time.sleep(_T_OSC_START)
         self._spi.writebytes(bytearray([0x00])) #pylint: disable=no-member
         time.sleep(1)
 
+    def _wake_from_power_down(self):
+        """Wake up from PowerDown: any SPI activity does, then the oscillator
+        needs to restart before the next frame"""
+        self._spi.writebytes(bytearray([0x00])) #pylint: disable=no-member
+        time.sleep(_T_OSC_START)
+
     def _wait_ready(self, timeout=1.0):
+        """Wait for the PN532 to be ready, up to `timeout` seconds"""
+        if self._irq is None:
+            return self._poll_ready(timeout)
+        return self._wait_irq(timeout)
+
+    def _wait_irq(self, timeout):
+        """Block until the PN532 pulls IRQ low, up to `timeout` seconds"""
+        deadline = time.monotonic() + timeout
+        while True:
+            # Clear before sampling the level so an edge landing between the
+            # read and the wait is not lost.
+            self._irq_event.clear()
+            if lgpio.gpio_read(self._h, self._irq) == 0:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._irq_event.wait(remaining)
+
+    def _poll_ready(self, timeout):
         """Poll PN532 if status byte is ready, up to `timeout` seconds"""
-        status = bytearray([reverse_bit(_SPI_STATREAD), 0])
         timestamp = time.monotonic()
         while (time.monotonic() - timestamp) < timeout:
             time.sleep(0.01)   # required
-            status = self._spi.xfer(status) #pylint: disable=no-member
-            if reverse_bit(status[1]) == _SPI_READY:  # LSB data is read in MSB
+            status = self._spi.xfer(_STATUS_REQUEST) #pylint: disable=no-member
+            if status[1] == _STATUS_READY:  # LSB data is read in MSB
                 return True      # Not busy anymore!
             else:
                 time.sleep(0.005)  # pause a bit till we ask again
@@ -168,14 +244,16 @@ class PN532_SPI(PN532):
 
     def _read_data(self, count):
         """Read a specified count of bytes from the PN532."""
-        # Build a read request frame.
-        frame = bytearray(count+1)
-        # Add the SPI data read signal byte, but LSB'ify it
-        frame[0] = reverse_bit(_SPI_DATAREAD)
-        time.sleep(0.005)   # required
-        frame = self._spi.xfer(frame) #pylint: disable=no-member
-        for i, val in enumerate(frame):
-            frame[i] = reverse_bit(val) # turn LSB data to MSB
+        # Read request frames only depend on count: build each one once, with
+        # the SPI data read signal byte LSB'ified.
+        request = self._read_requests.get(count)
+        if request is None:
+            request = bytes([reverse_bit(_SPI_DATAREAD)]) + bytes(count)
+            self._read_requests[count] = request
+        if self.read_delay:
+            time.sleep(self.read_delay)
+        frame = self._spi.xfer(request) #pylint: disable=no-member
+        frame = frame.translate(_REVERSE_BIT_TABLE)   # turn LSB data to MSB
         if self.debug:
             print("Reading: ", [hex(i) for i in frame[1:]])
         return frame[1:]
@@ -184,8 +262,9 @@ class PN532_SPI(PN532):
         """Write a specified count of bytes to the PN532"""
         # start by making a frame with data write in front,
         # then rest of bytes, and LSBify it
-        rev_frame = [reverse_bit(x) for x in bytes([_SPI_DATAWRITE]) + framebytes]
+        rev_frame = _DATAWRITE_PREFIX + framebytes.translate(_REVERSE_BIT_TABLE)
         if self.debug:
             print("Writing: ", [hex(i) for i in rev_frame])
-        time.sleep(0.02)   # required
-        self._spi.writebytes(bytes(rev_frame))
+        if self.write_delay:
+            time.sleep(self.write_delay)
+        self._spi.writebytes(rev_frame)
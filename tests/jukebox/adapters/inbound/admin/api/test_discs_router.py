@@ -10,18 +10,25 @@ if FASTAPI_INSTALLED:
 
     from jukebox.adapters.inbound.admin.api.discs_router import build_discs_router
     from jukebox.adapters.inbound.admin.api.models import (
+        DiscBatchInput,
+        DiscBatchOutput,
+        DiscChangeInput,
         DiscInput,
         DiscOutput,
         DiscPatchInput,
         DiscPatchMetadataInput,
         DiscPatchOptionInput,
+        DiscSearchOutput,
     )
-    from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
+    from jukebox.domain.entities import Disc, DiscChangesSummary, DiscMetadata, DiscOption
+    from jukebox.domain.errors import InvalidDiscChangesError
     from jukebox.domain.use_cases.library.add_disc import AddDisc
+    from jukebox.domain.use_cases.library.bulk_apply_disc_changes import BulkApplyDiscChanges
     from jukebox.domain.use_cases.library.edit_disc import EditDisc
     from jukebox.domain.use_cases.library.get_disc import GetDisc
     from jukebox.domain.use_cases.library.list_discs import ListDiscs
     from jukebox.domain.use_cases.library.remove_disc import RemoveDisc
+    from jukebox.domain.use_cases.library.search_discs import SearchDiscs
 
 
 def build_router(
@@ -31,6 +38,8 @@ def build_router(
     remove_disc=None,
     edit_disc=None,
     get_disc=None,
+    search_discs=None,
+    bulk_apply_disc_changes=None,
 ):
     return build_discs_router(
         add_disc=add_disc if add_disc is not None else MagicMock(),
@@ -38,6 +47,8 @@ def build_router(
         remove_disc=remove_disc if remove_disc is not None else MagicMock(),
         edit_disc=edit_disc if edit_disc is not None else MagicMock(),
         get_disc=get_disc if get_disc is not None else MagicMock(),
+        search_discs=search_discs if search_discs is not None else MagicMock(),
+        bulk_apply_disc_changes=bulk_apply_disc_changes if bulk_apply_disc_changes is not None else MagicMock(),
     )
 
 
@@ -72,6 +83,74 @@ def test_list_discs_returns_500_on_unexpected_error(get_route):
     assert err.value.detail == "Server error: boom"
 
 
+@pytest.mark.skipif(not FASTAPI_INSTALLED, reason="FastAPI dependencies are not installed")
+def test_search_discs_returns_requested_page(get_route):
+    search_discs = create_autospec(SearchDiscs, instance=True)
+    search_discs.execute.return_value = {
+        f"tag-{index}": Disc(uri=f"/music/song{index}.mp3", metadata=DiscMetadata(artist="Artist"), option=DiscOption())
+        for index in range(5)
+    }
+    router = build_router(search_discs=search_discs)
+    route = get_route(router, "/api/v1/discs:search", "GET")
+
+    response = route.endpoint(q="artist", offset=1, limit=2)
+
+    assert route.response_model == DiscSearchOutput
+    assert response.query == "artist"
+    assert response.total == 5
+    assert (response.offset, response.limit) == (1, 2)
+    assert [result.tag_id for result in response.results] == ["tag-1", "tag-2"]
+    assert response.results[0].disc.uri == "/music/song1.mp3"
+    search_discs.execute.assert_called_once_with("artist")
+
+
+@pytest.mark.skipif(not FASTAPI_INSTALLED, reason="FastAPI dependencies are not installed")
+def test_search_discs_returns_500_on_unexpected_error(get_route):
+    search_discs = create_autospec(SearchDiscs, instance=True)
+    search_discs.execute.side_effect = RuntimeError("boom")
+    router = build_router(search_discs=search_discs)
+    route = get_route(router, "/api/v1/discs:search", "GET")
+
+    with pytest.raises(HTTPException) as err:
+        route.endpoint(q="artist")
+
+    assert err.value.status_code == 500
+    assert err.value.detail == "Server error: boom"
+
+
+@pytest.mark.skipif(not FASTAPI_INSTALLED, reason="FastAPI dependencies are not installed")
+def test_apply_disc_changes_returns_summary(get_route):
+    bulk_apply_disc_changes = create_autospec(BulkApplyDiscChanges, instance=True)
+    bulk_apply_disc_changes.execute.return_value = DiscChangesSummary(added=1, removed=1)
+    router = build_router(bulk_apply_disc_changes=bulk_apply_disc_changes)
+    route = get_route(router, "/api/v1/discs:batch", "POST")
+    changes = [
+        DiscChangeInput(action="add", tag_id="tag-1", disc=Disc(uri="/music/song.mp3", metadata=DiscMetadata())),
+        DiscChangeInput(action="remove", tag_id="tag-2"),
+    ]
+
+    response = route.endpoint(DiscBatchInput(changes=changes))
+
+    assert route.response_model == DiscBatchOutput
+    assert response == DiscBatchOutput(added=1, updated=0, removed=1)
+    bulk_apply_disc_changes.execute.assert_called_once_with(changes)
+
+
+@pytest.mark.skipif(not FASTAPI_INSTALLED, reason="FastAPI dependencies are not installed")
+def test_apply_disc_changes_returns_409_with_every_error(get_route):
+    bulk_apply_disc_changes = create_autospec(BulkApplyDiscChanges, instance=True)
+    errors = ["Already existing tag: tag_id='tag-1'", "Tag does not exist: tag_id='tag-2'"]
+    bulk_apply_disc_changes.execute.side_effect = InvalidDiscChangesError(errors)
+    router = build_router(bulk_apply_disc_changes=bulk_apply_disc_changes)
+    route = get_route(router, "/api/v1/discs:batch", "POST")
+
+    with pytest.raises(HTTPException) as err:
+        route.endpoint(DiscBatchInput(changes=[]))
+
+    assert err.value.status_code == 409
+    assert err.value.detail == errors
+
+
 @pytest.mark.skipif(not FASTAPI_INSTALLED, reason="FastAPI dependencies are not installed")
 def test_get_disc_returns_disc_payload(get_route):
     get_disc = create_autospec(GetDisc, instance=True)
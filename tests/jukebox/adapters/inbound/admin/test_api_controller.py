@@ -75,6 +75,8 @@ def build_controller(
     list_discs=None,
     remove_disc=None,
     edit_disc=None,
+    search_discs=None,
+    bulk_apply_disc_changes=None,
 ):
     return APIController(
         add_disc if add_disc is not None else MagicMock(),
@@ -82,6 +84,8 @@ def build_controller(
         remove_disc if remove_disc is not None else MagicMock(),
         edit_disc if edit_disc is not None else MagicMock(),
         get_disc if get_disc is not None else MagicMock(),
+        search_discs if search_discs is not None else MagicMock(),
+        bulk_apply_disc_changes if bulk_apply_disc_changes is not None else MagicMock(),
         get_current_tag_status if get_current_tag_status is not None else MagicMock(),
         settings_service if settings_service is not None else MagicMock(),
         sonos_service if sonos_service is not None else MagicMock(),
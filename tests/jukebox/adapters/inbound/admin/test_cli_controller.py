@@ -3,8 +3,14 @@ from unittest.mock import MagicMock
 import pytest
 
 from jukebox.adapters.inbound.admin.cli_controller import CLIController
-from jukebox.admin.library_commands import CliAddCommand, CliEditCommand, CliGetCommand, CliRemoveCommand
-from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
+from jukebox.admin.library_commands import (
+    CliAddCommand,
+    CliEditCommand,
+    CliGetCommand,
+    CliImportCommand,
+    CliRemoveCommand,
+)
+from jukebox.domain.entities import Disc, DiscChange, DiscChangesSummary, DiscMetadata, DiscOption
 
 
 def build_controller():
@@ -16,6 +22,7 @@ def build_controller():
         get_disc=MagicMock(),
         search_discs=MagicMock(),
         resolve_tag_id=MagicMock(),
+        bulk_apply_disc_changes=MagicMock(),
     )
 
 
@@ -152,3 +159,23 @@ def test_run_propagates_command_errors():
 
     with pytest.raises(ValueError, match="Tag does not exist"):
         controller.run(command)
+
+
+def test_import_discs_flow_applies_csv_rows_in_one_batch(tmp_path, capsys):
+    csv_path = tmp_path / "discs.csv"
+    csv_path.write_text("tag_id,uri,artist\ntag-1,/music/one.mp3,Artist\n", encoding="utf-8")
+    controller = build_controller()
+    controller.bulk_apply_disc_changes.execute.return_value = DiscChangesSummary(added=1)
+
+    controller.run(CliImportCommand(type="import", path=str(csv_path)))
+
+    controller.bulk_apply_disc_changes.execute.assert_called_once_with(
+        [
+            DiscChange(
+                action="upsert",
+                tag_id="tag-1",
+                disc=Disc(uri="/music/one.mp3", metadata=DiscMetadata(artist="Artist")),
+            )
+        ]
+    )
+    assert "1 disc(s) added and 0 updated" in capsys.readouterr().out
@@ -0,0 +1,60 @@
+import pytest
+
+from jukebox.adapters.inbound.admin.cli_import import read_disc_changes_csv
+from jukebox.domain.entities import Disc, DiscChange, DiscMetadata, DiscOption
+
+
+def write_csv(tmp_path, text: str) -> str:
+    csv_path = tmp_path / "discs.csv"
+    csv_path.write_text(text, encoding="utf-8-sig")
+    return str(csv_path)
+
+
+@pytest.mark.parametrize("delimiter", [",", ";", "\t"])
+def test_read_disc_changes_csv_reads_one_upsert_per_row(tmp_path, delimiter):
+    rows = [
+        ["tag_id", "uri", "artist", "album", "track", "playlist", "shuffle", "notes"],
+        ["tag-1", "spotify:album:1", "Sigur Rós", "Ágætis byrjun", "", "", "yes", "shelf 2"],
+        ["tag-2", "spotify:playlist:2", "", "", "", "Road trip", "", ""],
+    ]
+    csv_path = write_csv(tmp_path, "\n".join(delimiter.join(row) for row in rows) + "\n")
+
+    changes = read_disc_changes_csv(csv_path)
+
+    assert changes == [
+        DiscChange(
+            action="upsert",
+            tag_id="tag-1",
+            disc=Disc(
+                uri="spotify:album:1",
+                metadata=DiscMetadata(artist="Sigur Rós", album="Ágætis byrjun"),
+                option=DiscOption(shuffle=True),
+            ),
+        ),
+        DiscChange(
+            action="upsert",
+            tag_id="tag-2",
+            disc=Disc(uri="spotify:playlist:2", metadata=DiscMetadata(playlist="Road trip")),
+        ),
+    ]
+
+
+def test_read_disc_changes_csv_requires_tag_id_and_uri_columns(tmp_path):
+    csv_path = write_csv(tmp_path, "tag_id,artist\ntag-1,Artist\n")
+
+    with pytest.raises(ValueError, match="Missing CSV columns: uri"):
+        read_disc_changes_csv(csv_path)
+
+
+def test_read_disc_changes_csv_reports_every_invalid_row(tmp_path):
+    csv_path = write_csv(tmp_path, "tag_id,uri,shuffle\ntag-1,uri:1,\n,uri:2,\ntag-3,,maybe\n")
+
+    with pytest.raises(ValueError) as err:
+        read_disc_changes_csv(csv_path)
+
+    message = str(err.value)
+    assert message.startswith("Invalid CSV rows, nothing was imported:")
+    assert "Line 3: tag_id:" in message
+    assert "Line 4: disc.uri:" in message
+    assert "disc.option.shuffle:" in message
+    assert "Line 2" not in message
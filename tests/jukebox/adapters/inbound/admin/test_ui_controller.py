@@ -131,6 +131,8 @@ def build_controller():
         remove_disc=MagicMock(),
         edit_disc=MagicMock(),
         get_disc=MagicMock(),
+        search_discs=MagicMock(),
+        bulk_apply_disc_changes=MagicMock(),
         get_current_tag_status=MagicMock(),
         settings_service=settings_service,
         sonos_service=sonos_service,
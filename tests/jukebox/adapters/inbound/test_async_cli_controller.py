@@ -0,0 +1,141 @@
+import asyncio
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+
+from jukebox.adapters.inbound.async_cli_controller import AsyncCLIController
+from jukebox.domain.entities import Idle, NoTag, TagEvent
+from jukebox.domain.ports import AsyncPlayerPort, AsyncReaderPort
+from jukebox.domain.use_cases import AsyncHandleTagEvent, PrefetchDisc, SyncCurrentTag
+
+
+class _Stop(Exception):
+    pass
+
+
+def _make_controller(reader, handle_tag_event, sync_current_tag=None, **kwargs):
+    if sync_current_tag is None:
+        sync_current_tag = create_autospec(SyncCurrentTag, instance=True, spec_set=True)
+        sync_current_tag.execute.side_effect = lambda ev, s: NoTag(last_event_timestamp=ev.timestamp)
+    return AsyncCLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=sync_current_tag,
+        loop_interval_seconds=0.001,
+        **kwargs,
+    )
+
+
+def test_serve_syncs_current_tag_then_handles_each_event():
+    call_order = []
+    reader = AsyncMock(spec=AsyncReaderPort)
+    reader.read.side_effect = lambda: "tag-1"
+    handle_tag_event = create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True)
+
+    async def handle(tag_event, state):
+        call_order.append(("handle", tag_event.tag_id))
+        if len(call_order) == 4:
+            raise _Stop
+        return Idle()
+
+    handle_tag_event.execute.side_effect = handle
+    sync_current_tag = create_autospec(SyncCurrentTag, instance=True, spec_set=True)
+    sync_current_tag.execute.side_effect = lambda ev, s: call_order.append(("sync", ev.tag_id)) or NoTag()
+    controller = _make_controller(reader, handle_tag_event, sync_current_tag)
+
+    with pytest.raises(_Stop):
+        asyncio.run(controller.serve())
+
+    assert call_order == [("sync", "tag-1"), ("handle", "tag-1"), ("sync", "tag-1"), ("handle", "tag-1")]
+
+
+def test_reads_continue_while_a_player_command_is_pending():
+    reads = 0
+    player_released = None
+
+    async def read():
+        nonlocal reads
+        reads += 1
+        if reads == 5:
+            player_released.set()
+        return "tag-1"
+
+    reader = AsyncMock(spec=AsyncReaderPort)
+    reader.read.side_effect = read
+    handle_tag_event = create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True)
+
+    async def slow_handle(tag_event, state):
+        await player_released.wait()
+        raise _Stop
+
+    handle_tag_event.execute.side_effect = slow_handle
+    controller = _make_controller(reader, handle_tag_event, event_queue_size=2)
+
+    async def drive():
+        nonlocal player_released
+        player_released = asyncio.Event()
+        await controller.serve()
+
+    with pytest.raises(_Stop):
+        asyncio.run(drive())
+
+    assert reads >= 5
+    assert controller.dropped_events >= 1
+
+
+def test_serve_surfaces_reader_errors():
+    reader = AsyncMock(spec=AsyncReaderPort)
+    reader.read.side_effect = OSError("spi gone")
+    handle_tag_event = create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True)
+    controller = _make_controller(reader, handle_tag_event)
+
+    with pytest.raises(OSError, match="spi gone"):
+        asyncio.run(controller.serve())
+
+    handle_tag_event.execute.assert_not_called()
+
+
+def test_serve_closes_the_player_when_it_stops():
+    reader = AsyncMock(spec=AsyncReaderPort)
+    reader.read.side_effect = OSError("spi gone")
+    player = AsyncMock(spec=AsyncPlayerPort)
+    controller = _make_controller(
+        reader, create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True), player=player
+    )
+
+    with pytest.raises(OSError, match="spi gone"):
+        asyncio.run(controller.serve())
+
+    player.close.assert_awaited_once_with()
+
+
+def test_prefetches_a_tag_again_once_it_was_removed_and_replaced():
+    reader = AsyncMock(spec=AsyncReaderPort)
+    reader.read.side_effect = ["tag-1", "tag-1", None, "tag-1", "tag-2", OSError("spi gone")]
+    handle_tag_event = create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True)
+    handle_tag_event.execute.return_value = Idle()
+    prefetch_disc = create_autospec(PrefetchDisc, instance=True, spec_set=True)
+    controller = _make_controller(reader, handle_tag_event, prefetch_disc=prefetch_disc)
+
+    with pytest.raises(OSError, match="spi gone"):
+        asyncio.run(controller.serve())
+
+    prefetched_tag_ids = [call.args[0].tag_id for call in prefetch_disc.execute.call_args_list]
+    assert prefetched_tag_ids == ["tag-1", "tag-1", "tag-2"]
+
+
+def test_put_drops_oldest_event_when_queue_is_full():
+    controller = _make_controller(
+        AsyncMock(spec=AsyncReaderPort),
+        create_autospec(AsyncHandleTagEvent, instance=True, spec_set=True),
+        event_queue_size=1,
+    )
+
+    async def drive():
+        events = asyncio.Queue(maxsize=1)
+        controller._put(events, TagEvent(tag_id="old", timestamp=1.0))
+        controller._put(events, TagEvent(tag_id="new", timestamp=2.0))
+        return events.get_nowait()
+
+    assert asyncio.run(drive()).tag_id == "new"
+    assert controller.dropped_events == 1
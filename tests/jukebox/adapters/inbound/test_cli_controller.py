@@ -3,9 +3,12 @@ from unittest.mock import create_autospec, patch
 import pytest
 
 from jukebox.adapters.inbound.cli_controller import CLIController
+from jukebox.adapters.inbound.loop_pacer import AdaptiveLoopPacer
+from jukebox.adapters.inbound.reader_power_saver import ReaderPowerSaver
 from jukebox.domain.entities import Idle, NoTag
-from jukebox.domain.ports import ReaderPort
+from jukebox.domain.ports import PlayerPort, ReaderPort
 from jukebox.domain.use_cases.handle_tag_event import HandleTagEvent
+from jukebox.domain.use_cases.prefetch_disc import PrefetchDisc
 from jukebox.domain.use_cases.sync_current_tag import SyncCurrentTag
 
 
@@ -56,6 +59,54 @@ def test_run_skips_sleep_when_reader_already_used_the_interval():
     handle_tag_event.execute.assert_called_once()
 
 
+def test_run_sleeps_for_idle_interval_once_adaptive_pacer_is_idle():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = [None, KeyboardInterrupt()]
+    handle_tag_event = create_autospec(HandleTagEvent, instance=True, spec_set=True)
+    handle_tag_event.execute.return_value = Idle()
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=create_autospec(SyncCurrentTag, instance=True, spec_set=True),
+        loop_interval_seconds=0.1,
+        pacer=AdaptiveLoopPacer(loop_interval_seconds=0.1, idle_loop_interval_seconds=1.0, idle_after_seconds=0),
+    )
+
+    with (
+        patch("jukebox.adapters.inbound.cli_controller.time.monotonic", side_effect=[100.0, 100.03, 100.04, 101.0]),
+        patch("jukebox.adapters.inbound.cli_controller.sleep") as mock_sleep,
+        pytest.raises(KeyboardInterrupt),
+    ):
+        controller.run()
+
+    mock_sleep.assert_called_once_with(pytest.approx(0.96))
+
+
+def test_run_reports_handled_events_to_power_saver():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = [None, KeyboardInterrupt()]
+    handle_tag_event = create_autospec(HandleTagEvent, instance=True, spec_set=True)
+    handle_tag_event.execute.return_value = Idle()
+    power_saver = create_autospec(ReaderPowerSaver, instance=True, spec_set=True)
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=create_autospec(SyncCurrentTag, instance=True, spec_set=True),
+        power_saver=power_saver,
+    )
+
+    with (
+        patch("jukebox.adapters.inbound.cli_controller.sleep"),
+        pytest.raises(KeyboardInterrupt),
+    ):
+        controller.run()
+
+    power_saver.observe.assert_called_once()
+    tag_event, state = power_saver.observe.call_args.args
+    assert tag_event.tag_id is None
+    assert state == Idle()
+
+
 def test_sync_current_tag_called_before_handle_tag_event():
     call_order = []
     reader = create_autospec(ReaderPort, instance=True, spec_set=True)
@@ -81,3 +132,102 @@ def test_sync_current_tag_called_before_handle_tag_event():
     assert call_order == ["sync", "handle", "sync", "handle"]
     assert all(isinstance(s, NoTag) for s in captured_states)
     assert captured_states[0] is not captured_states[1]
+
+
+def test_threaded_mode_consumes_events_from_reader_thread():
+    handled = []
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = lambda: "tag-1"
+    handle_tag_event = create_autospec(HandleTagEvent, instance=True, spec_set=True)
+
+    def handle(tag_event, state):
+        handled.append(tag_event)
+        if len(handled) == 2:
+            raise KeyboardInterrupt
+        return Idle()
+
+    handle_tag_event.execute.side_effect = handle
+    sync_current_tag = create_autospec(SyncCurrentTag, instance=True, spec_set=True)
+    sync_current_tag.execute.side_effect = lambda ev, s: NoTag(last_event_timestamp=ev.timestamp)
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=sync_current_tag,
+        loop_interval_seconds=0.001,
+        reader_mode="threaded",
+    )
+
+    with (
+        patch("jukebox.adapters.inbound.cli_controller.sleep") as mock_sleep,
+        pytest.raises(KeyboardInterrupt),
+    ):
+        controller.run()
+
+    assert [event.tag_id for event in handled] == ["tag-1", "tag-1"]
+    assert handled[0].timestamp <= handled[1].timestamp
+    mock_sleep.assert_not_called()
+
+
+def test_threaded_mode_surfaces_reader_errors():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = OSError("spi gone")
+    handle_tag_event = create_autospec(HandleTagEvent, instance=True, spec_set=True)
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=create_autospec(SyncCurrentTag, instance=True, spec_set=True),
+        reader_mode="threaded",
+    )
+
+    with pytest.raises(OSError, match="spi gone"):
+        controller.run()
+
+    handle_tag_event.execute.assert_not_called()
+
+
+def test_inline_mode_prefetches_each_newly_seen_tag_before_handling_it():
+    call_order = []
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = ["tag-1", "tag-1", None, "tag-1", KeyboardInterrupt()]
+    handle_tag_event = create_autospec(HandleTagEvent, instance=True, spec_set=True)
+    handle_tag_event.execute.side_effect = lambda tag_event, _: (
+        call_order.append(("handle", tag_event.tag_id)) or Idle()
+    )
+    prefetch_disc = create_autospec(PrefetchDisc, instance=True, spec_set=True)
+    prefetch_disc.execute.side_effect = lambda tag_event: call_order.append(("prefetch", tag_event.tag_id))
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=create_autospec(SyncCurrentTag, instance=True, spec_set=True),
+        loop_interval_seconds=0,
+        prefetch_disc=prefetch_disc,
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        controller.run()
+
+    assert call_order == [
+        ("prefetch", "tag-1"),
+        ("handle", "tag-1"),
+        ("handle", "tag-1"),
+        ("handle", None),
+        ("prefetch", "tag-1"),
+        ("handle", "tag-1"),
+    ]
+
+
+def test_run_closes_the_player_when_the_loop_stops():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = KeyboardInterrupt()
+    player = create_autospec(PlayerPort, instance=True, spec_set=True)
+    controller = CLIController(
+        reader=reader,
+        handle_tag_event=create_autospec(HandleTagEvent, instance=True, spec_set=True),
+        sync_current_tag=create_autospec(SyncCurrentTag, instance=True, spec_set=True),
+        player=player,
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        controller.run()
+
+    player.close.assert_called_once_with()
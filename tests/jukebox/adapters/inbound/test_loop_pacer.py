@@ -0,0 +1,64 @@
+import logging
+
+import pytest
+
+from jukebox.adapters.inbound.loop_pacer import AdaptiveLoopPacer, LoopPacer
+from jukebox.domain.entities import Idle, Paused, Playing, TagEvent, Waiting
+
+
+def test_fixed_pacer_counts_reader_blocking_towards_interval():
+    pacer = LoopPacer(loop_interval_seconds=0.1)
+
+    assert pacer.remaining_sleep(loop_started=100.0, now=100.03) == pytest.approx(0.07)
+    assert pacer.remaining_sleep(loop_started=100.1, now=100.25) == 0.0
+
+
+def test_pacer_reports_achieved_cadence(caplog):
+    caplog.set_level(logging.DEBUG, logger="jukebox")
+    pacer = LoopPacer(loop_interval_seconds=0.1, reader_budget_seconds=0.1, report_interval_seconds=1.0)
+
+    assert pacer.achieved_cadence_hz is None
+    for index in range(12):
+        pacer.remaining_sleep(loop_started=100.0 + index * 0.2, now=100.0 + index * 0.2)
+
+    assert pacer.achieved_cadence_hz == pytest.approx(5.0)
+    assert "Read cadence 5.00 Hz (target interval 0.100s, reader budget 0.100s)" in caplog.text
+
+
+def test_pacer_warns_when_reader_budget_exceeds_loop_interval(caplog):
+    LoopPacer(loop_interval_seconds=0.1, reader_budget_seconds=0.3)
+
+    assert "longer than the 0.100s loop interval" in caplog.text
+
+
+def test_adaptive_pacer_slows_down_after_idle_period_without_tag():
+    pacer = AdaptiveLoopPacer(loop_interval_seconds=0.1, idle_loop_interval_seconds=1.0, idle_after_seconds=30)
+
+    pacer.observe(TagEvent(tag_id=None, timestamp=100.0), Idle())
+    assert pacer.interval_seconds == 0.1
+
+    pacer.observe(TagEvent(tag_id=None, timestamp=129.9), Idle())
+    assert pacer.interval_seconds == 0.1
+
+    pacer.observe(TagEvent(tag_id=None, timestamp=130.0), Idle())
+    assert pacer.interval_seconds == 1.0
+    assert pacer.remaining_sleep(loop_started=130.0, now=130.1) == pytest.approx(0.9)
+
+
+@pytest.mark.parametrize(
+    ("tag_id", "state"),
+    [
+        pytest.param("tag-1", Idle(), id="tag-present"),
+        pytest.param(None, Waiting(tag="tag-1", removed_at=100.0), id="waiting"),
+        pytest.param(None, Paused(tag="tag-1", paused_at=100.0), id="paused"),
+        pytest.param("tag-1", Playing(tag="tag-1"), id="playing"),
+    ],
+)
+def test_adaptive_pacer_returns_to_loop_interval_when_activity_resumes(tag_id, state):
+    pacer = AdaptiveLoopPacer(loop_interval_seconds=0.1, idle_loop_interval_seconds=1.0, idle_after_seconds=0)
+    pacer.observe(TagEvent(tag_id=None, timestamp=100.0), Idle())
+    assert pacer.interval_seconds == 1.0
+
+    pacer.observe(TagEvent(tag_id=tag_id, timestamp=101.0), state)
+
+    assert pacer.interval_seconds == 0.1
@@ -0,0 +1,38 @@
+from unittest.mock import create_autospec
+
+from jukebox.adapters.inbound.reader_power_saver import ReaderPowerSaver
+from jukebox.domain.entities import Idle, Paused, Playing, TagEvent
+from jukebox.domain.ports import ReaderPort
+
+
+def test_power_saver_enters_low_power_once_idle_period_elapsed():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    saver = ReaderPowerSaver(reader, idle_after_seconds=300)
+
+    saver.observe(TagEvent(tag_id=None, timestamp=100.0), Idle())
+    saver.observe(TagEvent(tag_id=None, timestamp=399.0), Idle())
+    reader.set_low_power.assert_not_called()
+
+    saver.observe(TagEvent(tag_id=None, timestamp=400.0), Idle())
+    saver.observe(TagEvent(tag_id=None, timestamp=401.0), Idle())
+
+    reader.set_low_power.assert_called_once_with(True)
+
+
+def test_power_saver_leaves_low_power_when_a_tag_is_read():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    saver = ReaderPowerSaver(reader, idle_after_seconds=0)
+    saver.observe(TagEvent(tag_id=None, timestamp=100.0), Idle())
+
+    saver.observe(TagEvent(tag_id="tag-1", timestamp=101.0), Playing(tag="tag-1"))
+
+    assert [call.args for call in reader.set_low_power.call_args_list] == [(True,), (False,)]
+
+
+def test_power_saver_ignores_paused_playback_without_tag():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    saver = ReaderPowerSaver(reader, idle_after_seconds=0)
+
+    saver.observe(TagEvent(tag_id=None, timestamp=100.0), Paused(tag="tag-1", paused_at=90.0))
+
+    reader.set_low_power.assert_not_called()
@@ -0,0 +1,118 @@
+import threading
+from unittest.mock import create_autospec
+
+import pytest
+
+from jukebox.adapters.inbound.loop_pacer import LoopPacer
+from jukebox.adapters.inbound.tag_event_producer import ThreadedTagEventProducer
+from jukebox.domain.entities import TagEvent
+from jukebox.domain.ports import ReaderPort
+from jukebox.domain.use_cases import PrefetchDisc
+
+
+def test_producer_queues_timestamped_events_from_reader_thread():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = ["tag-1", None, *[None] * 100]
+    producer = ThreadedTagEventProducer(reader=reader, pacer=LoopPacer(0.001))
+
+    producer.start()
+    try:
+        first = producer.get(timeout=1.0)
+        second = producer.get(timeout=1.0)
+    finally:
+        producer.stop(timeout=1.0)
+
+    assert isinstance(first, TagEvent)
+    assert first.tag_id == "tag-1"
+    assert second is not None
+    assert second.tag_id is None
+    assert second.timestamp >= first.timestamp
+
+
+def test_producer_drops_oldest_event_when_queue_is_full():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    producer = ThreadedTagEventProducer(reader=reader, max_queue_size=2)
+
+    for index in range(3):
+        producer._put(TagEvent(tag_id=f"tag-{index}", timestamp=float(index)))
+
+    assert producer.dropped_events == 1
+    assert producer.get(timeout=0).tag_id == "tag-1"
+    assert producer.get(timeout=0).tag_id == "tag-2"
+    assert producer.get(timeout=0) is None
+
+
+def test_producer_reraises_reader_error_once_queue_is_drained():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = ["tag-1", OSError("spi gone")]
+    producer = ThreadedTagEventProducer(reader=reader, pacer=LoopPacer(0))
+
+    producer.start()
+    producer._thread.join(timeout=1.0)
+
+    assert producer.get(timeout=0).tag_id == "tag-1"
+    with pytest.raises(OSError, match="spi gone"):
+        producer.get(timeout=0)
+
+
+def test_producer_keeps_reading_while_consumer_is_blocked():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reads = threading.Semaphore(0)
+
+    def read():
+        reads.release()
+        return "tag-1"
+
+    reader.read.side_effect = read
+    producer = ThreadedTagEventProducer(reader=reader, pacer=LoopPacer(0.001), max_queue_size=1)
+
+    producer.start()
+    try:
+        for _ in range(5):
+            assert reads.acquire(timeout=1.0)
+    finally:
+        producer.stop(timeout=1.0)
+
+    assert producer.dropped_events >= 1
+
+
+def test_producer_prefetches_after_queueing_each_event():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = ["tag-1", *[None] * 100]
+    prefetch_disc = create_autospec(PrefetchDisc, instance=True, spec_set=True)
+    prefetched = threading.Event()
+    prefetch_disc.execute.side_effect = lambda _: prefetched.set()
+    producer = ThreadedTagEventProducer(reader=reader, pacer=LoopPacer(0.001), prefetch_disc=prefetch_disc)
+
+    producer.start()
+    try:
+        tag_event = producer.get(timeout=1.0)
+        assert prefetched.wait(timeout=1.0)
+    finally:
+        producer.stop(timeout=1.0)
+
+    assert prefetch_disc.execute.call_args_list[0].args == (tag_event,)
+
+
+def test_producer_prefetches_a_tag_again_once_it_was_removed_and_replaced():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = ["tag-1", "tag-1", None, "tag-1", "tag-2", *[None] * 100]
+    prefetch_disc = create_autospec(PrefetchDisc, instance=True, spec_set=True)
+    producer = ThreadedTagEventProducer(reader=reader, pacer=LoopPacer(0), prefetch_disc=prefetch_disc)
+
+    producer.start()
+    try:
+        for _ in range(6):
+            producer.get(timeout=1.0)
+    finally:
+        producer.stop(timeout=1.0)
+
+    prefetched_tag_ids = [call.args[0].tag_id for call in prefetch_disc.execute.call_args_list]
+    assert prefetched_tag_ids == ["tag-1", "tag-1", "tag-2"]
+
+
+def test_producer_rejects_empty_queue():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+
+    with pytest.raises(ValueError, match="max_queue_size"):
+        ThreadedTagEventProducer(reader=reader, max_queue_size=0)
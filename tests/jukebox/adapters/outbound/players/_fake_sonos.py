@@ -0,0 +1,251 @@
+import http.client
+import itertools
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Self
+from urllib.parse import urlsplit
+from xml.sax.saxutils import escape
+
+# SoCo always talks to port 1400, so each fake speaker gets its own loopback address.
+SONOS_PORT = 1400
+_NEXT_SPEAKER_ID = itertools.count(1)
+
+_DEVICE_DESCRIPTION = """<?xml version="1.0" encoding="utf-8"?>
+<root xmlns="urn:schemas-upnp-org:device-1-0">
+  <device>
+    <roomName>{room_name}</roomName>
+    <serialNum>00-00-00-00-00-01:A</serialNum>
+    <softwareVersion>fake-1.0</softwareVersion>
+    <modelName>Fake Sonos</modelName>
+  </device>
+</root>"""
+
+_ZONE_GROUP_STATE = (
+    '<ZoneGroupState><ZoneGroups><ZoneGroup Coordinator="{coordinator_uid}" ID="{coordinator_uid}:1">'
+    "{members}</ZoneGroup></ZoneGroups><VanishedDevices /></ZoneGroupState>"
+)
+_ZONE_GROUP_MEMBER = (
+    '<ZoneGroupMember UUID="{uid}" Location="http://{host}:1400/xml/device_description.xml" ZoneName="{room_name}" />'
+)
+
+_LAST_CHANGE = (
+    '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"><InstanceID val="0">{variables}</InstanceID></Event>'
+)
+
+_PROPERTY_SET = (
+    '<e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0"><e:property>{properties}</e:property></e:propertyset>'
+)
+
+# Service descriptions only need the argument-less actions SoCo calls by keyword.
+_SCPD = """<?xml version="1.0" encoding="utf-8"?>
+<scpd xmlns="urn:schemas-upnp-org:service-1-0">
+  <actionList>
+    <action><name>GetHouseholdID</name><argumentList /></action>
+    <action><name>GetZoneGroupState</name><argumentList /></action>
+  </actionList>
+  <serviceStateTable />
+</scpd>"""
+
+_SOAP_RESPONSE = """<?xml version="1.0"?>
+<s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" \
+s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/">
+<s:Body><u:{action}Response xmlns:u="{service}">{arguments}</u:{action}Response></s:Body>
+</s:Envelope>"""
+
+_SOAP_ACTION = re.compile(r'"?(?P<service>[^#"]+)#(?P<action>[^"]+)"?')
+
+
+class FakeSonosSpeaker:
+    """Minimal Sonos UPnP endpoint on loopback that counts SOAP round-trips and TCP connections."""
+
+    def __init__(self, room_name: str = "Living Room"):
+        suffix = next(_NEXT_SPEAKER_ID)
+        # SoCo caches zone group state per household, so every fake gets its own.
+        self.room_name = room_name
+        self.uid = f"RINCON_FAKE{suffix:012d}01400"
+        self.household_id = f"Sonos_fake_{suffix}"
+        self.host = f"127.0.{suffix // 250}.{suffix % 250 + 2}"
+        self.actions: Counter[str] = Counter()
+        self.connections = 0
+        self.http_requests = 0
+        self.queue_length = 0
+        # Evented service name (e.g. "AVTransport") -> (SID, callback URL)
+        self.subscriptions: dict[str, tuple[str, str]] = {}
+        self.coordinator: FakeSonosSpeaker = self
+        self._event_seq = itertools.count()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((self.host, SONOS_PORT), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    @property
+    def round_trips(self) -> int:
+        return sum(self.actions.values())
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            self.actions.clear()
+            self.connections = 0
+            self.http_requests = 0
+
+    def connected(self) -> None:
+        with self._lock:
+            self.connections += 1
+
+    def requested(self) -> None:
+        with self._lock:
+            self.http_requests += 1
+
+    def respond(self, action: str) -> dict[str, str]:
+        with self._lock:
+            self.actions[action] += 1
+            if action == "RemoveAllTracksFromQueue":
+                self.queue_length = 0
+            elif action == "AddURIToQueue":
+                self.queue_length += 1
+                return {
+                    "FirstTrackNumberEnqueued": str(self.queue_length),
+                    "NumTracksAdded": "1",
+                    "NewQueueLength": str(self.queue_length),
+                }
+            elif action == "GetZoneGroupState":
+                return {"ZoneGroupState": self.zone_group_state()}
+            elif action == "GetHouseholdID":
+                return {"CurrentHouseholdID": self.household_id}
+        return {}
+
+    def zone_group_state(self) -> str:
+        members = {self.coordinator.uid: self.coordinator, self.uid: self}
+        return _ZONE_GROUP_STATE.format(
+            coordinator_uid=self.coordinator.uid,
+            members="".join(
+                _ZONE_GROUP_MEMBER.format(uid=member.uid, host=member.host, room_name=member.room_name)
+                for member in members.values()
+            ),
+        )
+
+    def subscribe(self, path: str, callback: str) -> str:
+        service = path.rstrip("/").split("/")[-2]
+        sid = f"uuid:{self.uid}_sub{next(self._event_seq)}"
+        with self._lock:
+            self.subscriptions[service] = (sid, callback)
+        return sid
+
+    def unsubscribe(self, sid: str) -> None:
+        with self._lock:
+            self.subscriptions = {
+                service: subscription for service, subscription in self.subscriptions.items() if subscription[0] != sid
+            }
+
+    def send_transport_event(self, **variables: str) -> None:
+        """NOTIFY the AVTransport subscriber, e.g. `TransportState="PLAYING"`."""
+        last_change = _LAST_CHANGE.format(
+            variables="".join(f'<{name} val="{escape(value)}"/>' for name, value in variables.items())
+        )
+        self._notify("AVTransport", f"<LastChange>{escape(last_change)}</LastChange>")
+
+    def send_topology_event(self, coordinator: "FakeSonosSpeaker | None" = None) -> None:
+        """NOTIFY the ZoneGroupTopology subscriber, optionally after joining `coordinator`'s group."""
+        if coordinator is not None:
+            self.coordinator = coordinator
+        self._notify("ZoneGroupTopology", f"<ZoneGroupState>{escape(self.zone_group_state())}</ZoneGroupState>")
+
+    def _notify(self, service: str, properties: str) -> None:
+        sid, callback = self.subscriptions[service]
+        url = urlsplit(callback)
+        body = _PROPERTY_SET.format(properties=properties).encode("utf-8")
+        connection = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+        try:
+            connection.request(
+                "NOTIFY",
+                url.path or "/",
+                body=body,
+                headers={
+                    "Content-Type": 'text/xml; charset="utf-8"',
+                    "NT": "upnp:event",
+                    "NTS": "upnp:propchange",
+                    "SID": sid,
+                    "SEQ": str(next(self._event_seq)),
+                },
+            )
+            connection.getresponse().read()
+        finally:
+            connection.close()
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        speaker = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Sonos speakers keep connections open between requests.
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately; don't let Nagle hold the body back.
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                speaker.connected()
+
+            def do_GET(self) -> None:
+                speaker.requested()
+                if self.path == "/xml/device_description.xml":
+                    self._reply(_DEVICE_DESCRIPTION.format(room_name=speaker.room_name))
+                elif self.path.startswith("/xml/"):
+                    self._reply(_SCPD)
+                else:
+                    self.send_error(404)
+
+            def do_POST(self) -> None:
+                speaker.requested()
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                match = _SOAP_ACTION.fullmatch(self.headers.get("SOAPACTION", ""))
+                if match is None:
+                    self.send_error(400)
+                    return
+                arguments = "".join(
+                    f"<{name}>{escape(value)}</{name}>"
+                    for name, value in speaker.respond(match.group("action")).items()
+                )
+                self._reply(
+                    _SOAP_RESPONSE.format(
+                        action=match.group("action"), service=match.group("service"), arguments=arguments
+                    )
+                )
+
+            def do_SUBSCRIBE(self) -> None:
+                speaker.requested()
+                sid = speaker.subscribe(self.path, self.headers.get("Callback", "").strip("<>"))
+                self.send_response(200)
+                self.send_header("SID", sid)
+                self.send_header("TIMEOUT", "Second-86400")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def do_UNSUBSCRIBE(self) -> None:
+                speaker.requested()
+                speaker.unsubscribe(self.headers.get("SID", ""))
+                self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def _reply(self, body: str) -> None:
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", 'text/xml; charset="utf-8"')
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+        return Handler
@@ -0,0 +1,125 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from jukebox.adapters.outbound.players.circuit_breaker_player_adapter import CircuitBreakerPlayerAdapter
+from jukebox.domain.errors import PlaybackError, PlayerUnreachableError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def build_breaker(player, clock, jitter=1.0):
+    return CircuitBreakerPlayerAdapter(
+        player,
+        failure_threshold=2,
+        base_open_seconds=10.0,
+        max_open_seconds=60.0,
+        clock=clock,
+        jitter=lambda: jitter,
+    )
+
+
+def trip(breaker, player):
+    player.pause.side_effect = PlayerUnreachableError("no route to host")
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(PlayerUnreachableError):
+            breaker.pause()
+
+
+def test_breaker_opens_after_consecutive_unreachable_errors_and_short_circuits():
+    player = MagicMock()
+    clock = FakeClock()
+    breaker = build_breaker(player, clock)
+
+    trip(breaker, player)
+    clock.now += 4.0
+    with pytest.raises(PlayerUnreachableError) as exc_info:
+        breaker.play("uri:1")
+
+    assert breaker.state == "open"
+    assert exc_info.value.retry_after_seconds == pytest.approx(6.0)
+    player.play.assert_not_called()
+
+
+def test_breaker_closes_after_a_successful_half_open_probe():
+    player = MagicMock()
+    clock = FakeClock()
+    breaker = build_breaker(player, clock)
+    trip(breaker, player)
+
+    clock.now += 10.0
+    breaker.play("uri:1")
+
+    assert breaker.state == "closed"
+    player.play.assert_called_once_with("uri:1", False)
+
+
+def test_breaker_reopens_for_longer_when_the_probe_fails():
+    player = MagicMock()
+    clock = FakeClock()
+    breaker = build_breaker(player, clock)
+    trip(breaker, player)
+
+    clock.now += 10.0
+    with pytest.raises(PlayerUnreachableError):
+        breaker.pause()
+    with pytest.raises(PlayerUnreachableError) as exc_info:
+        breaker.pause()
+
+    assert breaker.state == "open"
+    assert exc_info.value.retry_after_seconds == pytest.approx(20.0)
+    assert player.pause.call_count == 3
+
+
+def test_breaker_keeps_at_least_half_of_the_backoff_when_jittered():
+    player = MagicMock()
+    clock = FakeClock()
+    breaker = build_breaker(player, clock, jitter=0.0)
+    trip(breaker, player)
+
+    with pytest.raises(PlayerUnreachableError) as exc_info:
+        breaker.pause()
+
+    assert exc_info.value.retry_after_seconds == pytest.approx(5.0)
+
+
+def test_breaker_ignores_errors_from_a_player_that_answered():
+    player = MagicMock()
+    player.play.side_effect = PlaybackError("UPnP Error 714")
+    breaker = build_breaker(player, FakeClock())
+
+    for _ in range(3):
+        with pytest.raises(PlaybackError):
+            breaker.play("uri:bad")
+
+    assert breaker.state == "closed"
+    assert player.play.call_count == 3
+
+
+def test_breaker_keeps_other_targets_usable_when_one_is_unreachable():
+    player = MagicMock()
+    clock = FakeClock()
+    target = "192.168.1.10"
+    breaker = CircuitBreakerPlayerAdapter(
+        player, failure_threshold=2, base_open_seconds=10.0, clock=clock, jitter=lambda: 1.0, target_key=lambda: target
+    )
+    trip(breaker, player)
+
+    target = "192.168.1.20"
+    player.pause.side_effect = None
+    breaker.pause()
+
+    assert breaker.state == "closed"
+    assert player.pause.call_count == 3
+
+    target = "192.168.1.10"
+    assert breaker.state == "open"
+    with pytest.raises(PlayerUnreachableError):
+        breaker.pause()
+    assert player.pause.call_count == 3
@@ -0,0 +1,55 @@
+import asyncio
+import threading
+from unittest.mock import create_autospec
+
+from jukebox.adapters.outbound.players.executor_player_adapter import ExecutorPlayerAdapter
+from jukebox.domain.ports import PlayerPort
+
+
+def test_commands_run_on_worker_thread_in_order():
+    calls = []
+    player = create_autospec(PlayerPort, instance=True, spec_set=True)
+    player.play.side_effect = lambda uri, shuffle: calls.append(("play", uri, shuffle, threading.current_thread()))
+    player.pause.side_effect = lambda: calls.append(("pause", threading.current_thread()))
+    player.resume.side_effect = lambda: calls.append(("resume", threading.current_thread()))
+    player.stop.side_effect = lambda: calls.append(("stop", threading.current_thread()))
+    adapter = ExecutorPlayerAdapter(player)
+
+    async def drive():
+        await adapter.play("uri:1", True)
+        await adapter.pause()
+        await adapter.resume()
+        await adapter.stop()
+
+    asyncio.run(drive())
+
+    assert [call[0] for call in calls] == ["play", "pause", "resume", "stop"]
+    assert calls[0][1:3] == ("uri:1", True)
+    assert all(call[-1] is not threading.main_thread() for call in calls)
+
+
+def test_player_errors_propagate_to_the_awaiting_coroutine():
+    player = create_autospec(PlayerPort, instance=True, spec_set=True)
+    player.stop.side_effect = RuntimeError("boom")
+    adapter = ExecutorPlayerAdapter(player)
+
+    async def drive():
+        try:
+            await adapter.stop()
+        except RuntimeError as err:
+            return str(err)
+        return None
+
+    assert asyncio.run(drive()) == "boom"
+
+
+def test_close_closes_the_player_on_its_worker_then_the_executor():
+    closed_on = []
+    player = create_autospec(PlayerPort, instance=True, spec_set=True)
+    player.close.side_effect = lambda: closed_on.append(threading.current_thread())
+    adapter = ExecutorPlayerAdapter(player)
+
+    asyncio.run(adapter.close())
+
+    assert closed_on and closed_on[0] is not threading.main_thread()
+    assert adapter.executor._shutdown
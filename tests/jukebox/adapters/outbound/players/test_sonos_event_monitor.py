@@ -0,0 +1,146 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from soco.exceptions import SoCoException
+
+from jukebox.adapters.outbound.players.sonos_event_monitor import SonosEventMonitor
+from jukebox.adapters.outbound.players.sonos_player_adapter import SonosPlayerAdapter
+
+from ._fake_sonos import FakeSonosSpeaker
+
+
+@pytest.fixture
+def fake_speakers():
+    speakers = []
+    try:
+        for room_name in ("Living Room", "Kitchen"):
+            speakers.append(FakeSonosSpeaker(room_name))
+    except OSError as err:
+        pytest.skip(f"cannot bind a loopback Sonos stand-in: {err}")
+    with speakers[0], speakers[1]:
+        yield speakers
+
+
+@pytest.fixture
+def fake_speaker(fake_speakers):
+    return fake_speakers[0]
+
+
+@pytest.fixture
+def build_evented_adapter():
+    monitors = []
+
+    def build(fake_speaker: FakeSonosSpeaker, resolver: MagicMock | None = None) -> SonosPlayerAdapter:
+        monitor = SonosEventMonitor(settle_seconds=0.0)
+        monitors.append(monitor)
+        adapter = SonosPlayerAdapter(
+            host=fake_speaker.host,
+            event_monitor=monitor,
+            sonos_playback_target_resolver=resolver or MagicMock(),
+        )
+        fake_speaker.send_topology_event()
+        fake_speaker.reset_counts()
+        return adapter
+
+    yield build
+    for monitor in monitors:
+        monitor.stop()
+
+
+def test_adapter_subscribes_to_transport_and_topology_events(fake_speaker, build_evented_adapter):
+    adapter = build_evented_adapter(fake_speaker)
+
+    assert set(fake_speaker.subscriptions) == {"AVTransport", "ZoneGroupTopology"}
+    assert adapter.event_monitor.is_active
+
+
+def test_resume_is_skipped_while_evented_as_playing(fake_speaker, build_evented_adapter):
+    adapter = build_evented_adapter(fake_speaker)
+    fake_speaker.send_transport_event(TransportState="PLAYING")
+
+    adapter.resume()
+
+    assert fake_speaker.round_trips == 0
+
+
+def test_pause_is_skipped_while_evented_as_paused(fake_speaker, build_evented_adapter):
+    adapter = build_evented_adapter(fake_speaker)
+    fake_speaker.send_transport_event(TransportState="PAUSED_PLAYBACK")
+
+    adapter.pause()
+    adapter.resume()
+
+    assert fake_speaker.actions == {"Play": 1}
+
+
+def test_stop_is_skipped_while_evented_queue_is_empty(fake_speaker, build_evented_adapter):
+    adapter = build_evented_adapter(fake_speaker)
+    fake_speaker.send_transport_event(NumberOfTracks="0", TransportState="STOPPED")
+
+    adapter.stop()
+
+    assert fake_speaker.round_trips == 0
+
+
+def test_play_uses_evented_queue_and_play_mode(fake_speaker, build_evented_adapter):
+    adapter = build_evented_adapter(fake_speaker)
+    fake_speaker.send_transport_event(
+        TransportState="STOPPED",
+        NumberOfTracks="0",
+        CurrentPlayMode="NORMAL",
+        AVTransportURI=f"x-rincon-queue:{fake_speaker.uid}#0",
+    )
+
+    adapter.play("x-file-cifs://nas/music/first.flac")
+
+    assert fake_speaker.actions == {"AddURIToQueue": 1, "Play": 1}
+
+
+def test_monitor_distrusts_state_evented_before_a_command_settles():
+    monitor = SonosEventMonitor(settle_seconds=60.0)
+    monitor._subscriptions = [SimpleNamespace(is_subscribed=True)]
+    monitor._on_transport_event(SimpleNamespace(variables={"transport_state": "PLAYING"}))
+    assert monitor.transport().transport_state == "PLAYING"
+
+    monitor.expect_change()
+
+    assert monitor.transport() is None
+
+
+def test_regrouping_redirects_commands_to_new_coordinator_without_discovery(fake_speakers, build_evented_adapter):
+    living_room, kitchen = fake_speakers
+    resolver = MagicMock()
+    adapter = build_evented_adapter(living_room, resolver)
+
+    living_room.send_topology_event(coordinator=kitchen)
+    adapter.pause()
+
+    assert living_room.actions == {}
+    assert kitchen.actions["Pause"] == 1
+    assert adapter.speaker_name == "Kitchen"
+    assert set(kitchen.subscriptions) == {"AVTransport", "ZoneGroupTopology"}
+    assert living_room.subscriptions == {}
+    resolver.resolve_playback_target.assert_not_called()
+
+
+def test_monitor_falls_back_to_blind_commands_when_subscription_fails():
+    speaker = MagicMock()
+    speaker.zoneGroupTopology.subscribe.side_effect = SoCoException("no route")
+    monitor = SonosEventMonitor()
+
+    assert monitor.start(speaker) is False
+
+    speaker.avTransport.subscribe.return_value.unsubscribe.assert_called_once_with()
+    assert monitor.is_active is False
+    assert monitor.transport() is None
+
+
+def test_monitor_forgets_transport_state_when_renewal_fails():
+    monitor = SonosEventMonitor(settle_seconds=0.0)
+    monitor._subscriptions = [SimpleNamespace(is_subscribed=True)]
+    monitor._on_transport_event(SimpleNamespace(variables={"transport_state": "PLAYING"}))
+
+    monitor._on_renew_failure(SoCoException("expired"))
+
+    assert monitor.transport() is None
@@ -1,12 +1,14 @@
+import logging
+import time
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 from requests.exceptions import ConnectionError as RequestConnectionError
 from soco.exceptions import SoCoUPnPException
 
-from jukebox.adapters.outbound.players.sonos_player_adapter import SonosPlayerAdapter
-from jukebox.domain.errors import PlaybackError
+from jukebox.adapters.outbound.players.sonos_player_adapter import KNOWN_TRANSPORT_STATE_TTL_SECONDS, SonosPlayerAdapter
+from jukebox.domain.errors import PlaybackError, PlayerUnreachableError
 from jukebox.settings.errors import InvalidSettingsError
 from tests.jukebox.settings._helpers import StubSonosService, build_resolved_sonos_group_runtime
 
@@ -311,11 +313,53 @@ def test_init_with_group_wraps_group_enforcement_errors(mock_sharelink, mock_soc
     )
 
     with pytest.raises(InvalidSettingsError, match="Failed to initialize Sonos player: join timed out"):
-        build_adapter(group=group)
+        build_adapter(group=group, sonos_playback_target_resolver=StubSonosService(resolved_group=group))
 
     mock_sharelink.assert_not_called()
 
 
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_init_with_group_inspects_and_joins_members_concurrently(mock_sharelink, mock_soco, caplog):
+    """Should take about as long as the slowest member, not the sum of all members."""
+    delay_seconds = 0.1
+    coordinator = MagicMock()
+    coordinator.player_name = "Living Room"
+    coordinator.uid = "speaker-0"
+    coordinator.get_speaker_info.return_value = {"software_version": "1.0"}
+    coordinator.group = MagicMock(coordinator=coordinator, members=[coordinator])
+
+    class SlowMember:
+        def __init__(self, index):
+            self.uid = f"speaker-{index}"
+            self.player_name = f"Room {index}"
+            self.join = MagicMock(side_effect=lambda _coordinator: time.sleep(delay_seconds))
+
+        @property
+        def group(self):
+            time.sleep(delay_seconds)
+
+    members = [SlowMember(index) for index in range(1, 6)]
+    speakers_by_host = {f"192.168.1.{index}": member for index, member in enumerate([coordinator, *members])}
+    mock_soco.side_effect = lambda host: speakers_by_host[host]
+    group = build_resolved_sonos_group_runtime(
+        coordinator_uid="speaker-0",
+        speakers=[
+            (f"speaker-{index}", f"Room {index}", f"192.168.1.{index}", "household-1")
+            for index in range(len(speakers_by_host))
+        ],
+    )
+
+    started_at = time.monotonic()
+    with caplog.at_level(logging.DEBUG, logger="jukebox"):
+        build_adapter(group=group)
+
+    assert time.monotonic() - started_at < 2 * len(members) * delay_seconds / 2
+    for member in members:
+        member.join.assert_called_once_with(coordinator)
+    assert "Sonos join for `Room 3` took" in caplog.text
+
+
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
 def test_init_with_group_join_failure_does_not_remove_existing_members(mock_sharelink, mock_soco):
@@ -349,7 +393,7 @@ def test_init_with_group_join_failure_does_not_remove_existing_members(mock_shar
     )
 
     with pytest.raises(InvalidSettingsError, match="Failed to initialize Sonos player: join timed out"):
-        build_adapter(group=group)
+        build_adapter(group=group, sonos_playback_target_resolver=StubSonosService(resolved_group=group))
 
     extra.unjoin.assert_not_called()
     mock_sharelink.assert_not_called()
@@ -392,7 +436,7 @@ def test_init_with_group_failure_rolls_back_earlier_joins(mock_sharelink, mock_s
     )
 
     with pytest.raises(InvalidSettingsError, match="Failed to initialize Sonos player: join timed out"):
-        build_adapter(group=group)
+        build_adapter(group=group, sonos_playback_target_resolver=StubSonosService(resolved_group=group))
 
     kitchen.join.assert_called_once_with(coordinator)
     kitchen.unjoin.assert_called_once_with()
@@ -440,7 +484,7 @@ def test_init_with_group_failure_restores_joined_member_to_original_group(mock_s
     )
 
     with pytest.raises(InvalidSettingsError, match="Failed to initialize Sonos player: join timed out"):
-        build_adapter(group=group)
+        build_adapter(group=group, sonos_playback_target_resolver=StubSonosService(resolved_group=group))
 
     assert kitchen.join.call_args_list == [((coordinator,),), ((old_coordinator,),)]
     kitchen.unjoin.assert_not_called()
@@ -489,13 +533,60 @@ def test_init_with_group_failure_rolls_back_earlier_removals(mock_sharelink, moc
     )
 
     with pytest.raises(InvalidSettingsError, match="Failed to initialize Sonos player: unjoin timed out"):
-        build_adapter(group=group)
+        build_adapter(group=group, sonos_playback_target_resolver=StubSonosService(resolved_group=group))
 
     extra_one.unjoin.assert_called_once_with()
     extra_one.join.assert_called_once_with(coordinator)
     mock_sharelink.assert_not_called()
 
 
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_init_with_stale_group_resolves_it_again_before_giving_up(mock_sharelink, mock_soco):
+    coordinator = MagicMock()
+    coordinator.player_name = "Living Room"
+    coordinator.uid = "speaker-2"
+    coordinator.get_speaker_info.return_value = {"software_version": "1.0"}
+    coordinator.group = MagicMock(coordinator=coordinator, members={coordinator})
+
+    unplugged = MagicMock()
+    type(unplugged).group = PropertyMock(side_effect=OSError("no route to host"))
+
+    kitchen = MagicMock()
+    kitchen.uid = "speaker-1"
+    kitchen.player_name = "Kitchen"
+    kitchen.group = None
+
+    speakers_by_host = {
+        "192.168.1.30": unplugged,
+        "192.168.1.31": kitchen,
+        "192.168.1.40": coordinator,
+    }
+    mock_soco.side_effect = lambda host: speakers_by_host[host]
+
+    stale_group = build_resolved_sonos_group_runtime(
+        coordinator_uid="speaker-2",
+        speakers=[
+            ("speaker-1", "Kitchen", "192.168.1.30", "household-1"),
+            ("speaker-2", "Living Room", "192.168.1.40", "household-1"),
+        ],
+    )
+    current_group = build_resolved_sonos_group_runtime(
+        coordinator_uid="speaker-2",
+        speakers=[
+            ("speaker-1", "Kitchen", "192.168.1.31", "household-1"),
+            ("speaker-2", "Living Room", "192.168.1.40", "household-1"),
+        ],
+    )
+    resolver = StubSonosService(resolved_group=current_group)
+
+    adapter = build_adapter(group=stale_group, sonos_playback_target_resolver=resolver)
+
+    assert adapter.group == current_group
+    assert len(resolver.invalidated_targets) == 1
+    kitchen.join.assert_called_once_with(coordinator)
+
+
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
 def test_play_does_not_reenforce_group_after_startup(mock_sharelink, mock_soco):
@@ -553,6 +644,41 @@ def test_play_calls_underlying_sonos_player(mock_sharelink, mock_soco):
     assert mock_speaker.play_mode == "NORMAL"
 
 
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_enqueues_prepared_share_link_through_the_plugin(mock_sharelink, mock_soco):
+    uri = "https://open.spotify.com/album/6wiUBliPe76YAVpNEdidpY"
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+    mock_sharelink.return_value.is_share_link.return_value = True
+
+    adapter = build_adapter(host="192.168.1.100")
+    adapter.prepare(uri)
+    adapter.prepare(uri)
+    adapter.play(uri)
+
+    mock_sharelink.return_value.is_share_link.assert_called_once_with(uri)
+    mock_sharelink.return_value.add_share_link_to_queue.assert_called_once_with(uri, position=1)
+    mock_speaker.add_uri_to_queue.assert_not_called()
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_skips_share_link_detection_for_prepared_plain_uri(mock_sharelink, mock_soco):
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+    mock_sharelink.return_value.is_share_link.return_value = False
+
+    adapter = build_adapter(host="192.168.1.100")
+    adapter.prepare("x-file-cifs://nas/album.flac")
+    adapter.play("x-file-cifs://nas/album.flac")
+
+    mock_sharelink.return_value.is_share_link.assert_called_once_with("x-file-cifs://nas/album.flac")
+    mock_speaker.add_uri_to_queue.assert_called_once_with("x-file-cifs://nas/album.flac", position=1)
+
+
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
 def test_play_calls_underlying_sonos_player_for_non_share_link(mock_sharelink, mock_soco):
@@ -587,6 +713,102 @@ def test_play_with_shuffle(mock_sharelink, mock_soco):
     assert mock_speaker.play_mode == "SHUFFLE_NOREPEAT"
 
 
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_standard_strategy_repeats_every_command(mock_sharelink, mock_soco):
+    """Should send the full command sequence on every play by default."""
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+    play_mode = PropertyMock()
+    type(mock_speaker).play_mode = play_mode
+
+    adapter = build_adapter(host="192.168.1.100")
+    adapter.play("uri:1")
+    adapter.play("uri:2")
+
+    assert mock_speaker.clear_queue.call_count == 2
+    assert play_mode.call_count == 2
+    assert mock_speaker.play_from_queue.call_count == 2
+    mock_speaker.avTransport.Play.assert_not_called()
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_fast_strategy_skips_commands_already_applied(mock_sharelink, mock_soco):
+    """Should only clear, enqueue and play once the queue is the known playback source."""
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+    play_mode = PropertyMock()
+    type(mock_speaker).play_mode = play_mode
+
+    adapter = build_adapter(host="192.168.1.100", play_strategy="fast")
+    adapter.play("uri:1")
+    adapter.play("uri:2")
+
+    assert mock_speaker.clear_queue.call_count == 2
+    play_mode.assert_called_once_with("NORMAL")
+    mock_speaker.play_from_queue.assert_called_once_with(index=0, start=True)
+    mock_speaker.avTransport.Play.assert_called_once_with([("InstanceID", 0), ("Speed", 1)])
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_fast_strategy_does_not_clear_queue_emptied_by_stop(mock_sharelink, mock_soco):
+    """Should not clear the queue again after its own stop, nor clear it twice on repeated stops."""
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+
+    adapter = build_adapter(host="192.168.1.100", play_strategy="fast")
+    adapter.play("uri:1")
+    adapter.stop()
+    adapter.stop()
+    adapter.play("uri:2", shuffle=True)
+
+    assert mock_speaker.clear_queue.call_count == 2
+    assert mock_speaker.play_mode == "SHUFFLE_NOREPEAT"
+    mock_speaker.avTransport.Play.assert_called_once_with([("InstanceID", 0), ("Speed", 1)])
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_fast_strategy_forgets_state_after_failure(mock_sharelink, mock_soco):
+    """Should fall back to the full command sequence after any failed command."""
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+
+    adapter = build_adapter(host="192.168.1.100", play_strategy="fast")
+    adapter.play("uri:1")
+    mock_speaker.pause.side_effect = make_exception("701")
+    with pytest.raises(PlaybackError):
+        adapter.pause()
+    adapter.play("uri:2")
+
+    assert mock_speaker.play_from_queue.call_count == 2
+    mock_speaker.avTransport.Play.assert_not_called()
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.time.monotonic")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_play_fast_strategy_forgets_state_after_ttl(mock_sharelink, mock_soco, mock_monotonic):
+    """Should not trust the known transport state once it is older than the TTL."""
+    mock_speaker = MagicMock()
+    mock_soco.return_value = mock_speaker
+    mock_speaker.get_speaker_info.return_value = {"software_version": "1.0"}
+    mock_monotonic.side_effect = [0.0, KNOWN_TRANSPORT_STATE_TTL_SECONDS + 1, KNOWN_TRANSPORT_STATE_TTL_SECONDS + 1]
+
+    adapter = build_adapter(host="192.168.1.100", play_strategy="fast")
+    adapter.play("uri:1")
+    adapter.play("uri:2")
+
+    assert mock_speaker.play_from_queue.call_count == 2
+    mock_speaker.avTransport.Play.assert_not_called()
+
+
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
 def test_pause_calls_underlying_sonos_player(mock_sharelink, mock_soco):
@@ -682,7 +904,7 @@ def test_pause_raises_playback_error_when_recovery_fails(mock_sharelink, mock_so
         host="192.168.1.24",
         sonos_playback_target_resolver=sonos_playback_target_resolver,
     )
-    with pytest.raises(PlaybackError, match="No route to host"):
+    with pytest.raises(PlayerUnreachableError, match="No route to host"):
         adapter.pause()
 
     mock_speaker.pause.assert_called_once()
@@ -728,6 +950,51 @@ def test_pause_reports_group_switch_failure_separately(mock_sharelink, mock_soco
     old_speaker.pause.assert_called_once()
     assert "pause recovered Sonos player `Living Room` but failed during group switch: switch timed out" in caplog.text
     assert "pause could not re-resolve Sonos player `Living Room`" not in caplog.text
+    assert len(sonos_playback_target_resolver.calls) == 2
+    assert len(sonos_playback_target_resolver.invalidated_targets) == 1
+
+
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_pause_re_resolves_after_cached_target_fails_to_switch(mock_sharelink, mock_soco):
+    """Should drop a cached Sonos topology that points to an unreachable host and resolve again."""
+    old_group = build_resolved_sonos_group_runtime(
+        coordinator_uid="RINCON_949F3E8DD34001400",
+        speakers=[("RINCON_949F3E8DD34001400", "Living Room", "192.168.1.24", "household-1")],
+    )
+    new_group = build_resolved_sonos_group_runtime(
+        coordinator_uid="RINCON_949F3E8DD34001400",
+        speakers=[("RINCON_949F3E8DD34001400", "Living Room", "192.168.1.25", "household-1")],
+    )
+    old_speaker = MagicMock()
+    old_speaker.uid = "RINCON_949F3E8DD34001400"
+    old_speaker.household_id = "household-1"
+    old_speaker.group = None
+    old_speaker.get_speaker_info.return_value = {"software_version": "1.0", "zone_name": "Living Room"}
+    old_speaker.pause.side_effect = RequestConnectionError("No route to host")
+    new_speaker = MagicMock()
+    new_speaker.uid = "RINCON_949F3E8DD34001400"
+    new_speaker.household_id = "household-1"
+    new_speaker.group = None
+    new_speaker.get_speaker_info.return_value = {"software_version": "1.0", "zone_name": "Living Room"}
+    mock_soco.side_effect = lambda host: {
+        "192.168.1.24": old_speaker,
+        "192.168.1.25": new_speaker,
+    }[host]
+    sonos_playback_target_resolver = MagicMock()
+    sonos_playback_target_resolver.resolve_playback_target.side_effect = [old_group, new_group]
+
+    adapter = build_adapter(
+        group=old_group,
+        sonos_playback_target_resolver=sonos_playback_target_resolver,
+    )
+    old_speaker.get_speaker_info.side_effect = RequestConnectionError("No route to host")
+    adapter.pause()
+
+    new_speaker.pause.assert_called_once()
+    assert adapter.speaker is new_speaker
+    assert sonos_playback_target_resolver.resolve_playback_target.call_count == 2
+    sonos_playback_target_resolver.invalidate_playback_target.assert_called_once_with(adapter.playback_target)
 
 
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
@@ -788,6 +1055,18 @@ def test_resume_calls_underlying_sonos_player(mock_sharelink, mock_soco):
     mock_speaker.play.assert_called_once()
 
 
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
+@patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
+def test_target_key_follows_the_current_coordinator_host(mock_sharelink, mock_soco):
+    mock_soco.return_value.ip_address = "192.168.1.100"
+    adapter = build_adapter(host="192.168.1.100")
+
+    assert adapter.target_key() == "192.168.1.100"
+
+    adapter.speaker = MagicMock(ip_address="192.168.1.101")
+    assert adapter.target_key() == "192.168.1.101"
+
+
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.SoCo")
 @patch("jukebox.adapters.outbound.players.sonos_player_adapter.ShareLinkPlugin")
 def test_stop_calls_underlying_sonos_player(mock_sharelink, mock_soco):
@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from jukebox.adapters.outbound.players.sonos_player_adapter import SonosPlayerAdapter
+
+from ._fake_sonos import FakeSonosSpeaker
+
+FIRST_DISC = "x-file-cifs://nas/music/first.flac"
+SECOND_DISC = "x-file-cifs://nas/music/second.flac"
+
+
+@pytest.fixture
+def fake_speaker():
+    try:
+        speaker = FakeSonosSpeaker()
+    except OSError as err:
+        pytest.skip(f"cannot bind a loopback Sonos stand-in: {err}")
+    with speaker:
+        yield speaker
+
+
+def play_scenario(fake_speaker: FakeSonosSpeaker, play_strategy: str) -> list[int]:
+    """Return the SOAP round-trips of: first disc, disc swap, stop, replay."""
+    adapter = SonosPlayerAdapter(
+        host=fake_speaker.host,
+        play_strategy=play_strategy,
+        sonos_playback_target_resolver=MagicMock(),
+    )
+    round_trips = []
+    for step in (
+        lambda: adapter.play(FIRST_DISC),
+        lambda: adapter.play(SECOND_DISC),
+        adapter.stop,
+        lambda: adapter.play(FIRST_DISC),
+    ):
+        fake_speaker.reset_counts()
+        step()
+        round_trips.append(fake_speaker.round_trips)
+    return round_trips
+
+
+def test_standard_play_strategy_round_trips(fake_speaker):
+    assert play_scenario(fake_speaker, "standard") == [6, 6, 1, 6]
+
+
+def test_fast_play_strategy_round_trips(fake_speaker):
+    assert play_scenario(fake_speaker, "fast") == [6, 3, 1, 2]
+    assert fake_speaker.actions == {"AddURIToQueue": 1, "Play": 1}
+    assert fake_speaker.queue_length == 1
@@ -0,0 +1,141 @@
+import gc
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import soco.core
+import soco.services
+
+from jukebox.adapters.outbound.players.sonos_player_adapter import SonosPlayerAdapter
+from jukebox.adapters.outbound.players.sonos_session_pool import SonosConnectionStats, SonosHttpSessionPool
+
+from ._fake_sonos import FakeSonosSpeaker
+
+
+@pytest.fixture
+def fake_speaker():
+    try:
+        speaker = FakeSonosSpeaker()
+    except OSError as err:
+        pytest.skip(f"cannot bind a loopback Sonos stand-in: {err}")
+    with speaker:
+        yield speaker
+
+
+@pytest.fixture
+def session_pool():
+    pool = SonosHttpSessionPool()
+    yield pool
+    pool.uninstall()
+
+
+def play_and_pause(fake_speaker: FakeSonosSpeaker, session_pool: SonosHttpSessionPool | None) -> SonosPlayerAdapter:
+    adapter = SonosPlayerAdapter(
+        host=fake_speaker.host,
+        session_pool=session_pool,
+        sonos_playback_target_resolver=MagicMock(),
+    )
+    adapter.play("x-file-cifs://nas/music/first.flac")
+    adapter.pause()
+    adapter.resume()
+    return adapter
+
+
+def test_install_routes_soco_requests_through_the_pool(session_pool):
+    session_pool.install()
+
+    assert soco.core.requests.pool is session_pool
+    assert soco.services.requests.pool is session_pool
+    assert soco.services.requests.exceptions is requests.exceptions
+
+
+def test_uninstall_restores_soco_requests(session_pool):
+    session_pool.install()
+    session_pool.uninstall()
+
+    assert soco.core.requests is requests
+    assert soco.services.requests is requests
+
+
+def test_uninstall_leaves_a_newer_pool_installed(session_pool):
+    newer_pool = SonosHttpSessionPool()
+    session_pool.install()
+    newer_pool.install()
+
+    session_pool.uninstall()
+
+    assert soco.services.requests.pool is newer_pool
+    newer_pool.uninstall()
+    assert soco.services.requests is requests
+
+
+def test_uninstall_puts_back_the_pool_installed_before(session_pool):
+    older_pool = SonosHttpSessionPool()
+    older_pool.install()
+    session_pool.install()
+
+    session_pool.uninstall()
+
+    assert soco.core.requests.pool is older_pool
+    older_pool.uninstall()
+    assert soco.core.requests is requests
+
+
+def test_each_thread_gets_its_own_session_per_host(session_pool):
+    url = "http://10.0.0.1:1400/MediaRenderer/AVTransport/Control"
+    sessions = [session_pool._session_for(url)]
+    thread = threading.Thread(target=lambda: sessions.append(session_pool._session_for(url)))
+    thread.start()
+    thread.join()
+
+    assert session_pool._session_for(url) is sessions[0]
+    assert sessions[1] is not sessions[0]
+    [stats] = session_pool.stats()
+    assert stats.requests == 3
+
+
+def test_sessions_are_closed_when_their_thread_ends(fake_speaker, session_pool):
+    url = f"http://{fake_speaker.host}:1400/xml/device_description.xml"
+    sessions = []
+
+    def request():
+        session_pool.request("get", url, timeout=5)
+        sessions.append(session_pool._session_for(url))
+
+    thread = threading.Thread(target=request)
+    thread.start()
+    thread.join()
+    del thread
+    gc.collect()
+
+    assert session_pool._thread_sessions == {}
+    assert len(sessions[0].get_adapter(url).poolmanager.pools) == 0
+    [stats] = session_pool.stats()
+    assert stats.connections == 1
+    assert stats.requests == 2
+
+
+def test_connection_stats_reused_never_negative():
+    assert SonosConnectionStats(host="10.0.0.1:1400", requests=5, connections=2).reused == 3
+    assert SonosConnectionStats(host="10.0.0.1:1400", requests=0, connections=1).reused == 0
+
+
+def test_soco_opens_a_connection_per_request_without_the_pool(fake_speaker):
+    play_and_pause(fake_speaker, session_pool=None)
+
+    assert fake_speaker.connections == fake_speaker.http_requests
+
+
+def test_pool_reuses_one_connection_per_speaker(fake_speaker, session_pool):
+    adapter = play_and_pause(fake_speaker, session_pool)
+
+    assert fake_speaker.connections == 1
+    [stats] = session_pool.stats()
+    assert stats == SonosConnectionStats(
+        host=f"{fake_speaker.host}:1400",
+        requests=fake_speaker.http_requests,
+        connections=1,
+    )
+    adapter.close()
+    assert soco.core.requests is requests
@@ -0,0 +1,24 @@
+import asyncio
+import threading
+from unittest.mock import create_autospec
+
+from jukebox.adapters.outbound.readers.executor_reader_adapter import ExecutorReaderAdapter
+from jukebox.domain.ports import ReaderPort
+
+
+def test_read_runs_blocking_reader_off_the_event_loop():
+    reader_threads = []
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+    reader.read.side_effect = lambda: reader_threads.append(threading.current_thread()) or "tag-1"
+    adapter = ExecutorReaderAdapter(reader)
+
+    assert asyncio.run(adapter.read()) == "tag-1"
+    assert reader_threads[0] is not threading.main_thread()
+
+
+def test_set_low_power_is_forwarded_to_wrapped_reader():
+    reader = create_autospec(ReaderPort, instance=True, spec_set=True)
+
+    ExecutorReaderAdapter(reader).set_low_power(True)
+
+    reader.set_low_power.assert_called_once_with(True)
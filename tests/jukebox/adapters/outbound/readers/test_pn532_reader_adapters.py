@@ -1,4 +1,6 @@
+import importlib
 import sys
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -38,5 +40,99 @@ def test_dependencies_import_failure(mocker):
     assert "uv run --extra pn532 jukebox ..." in str(err.value)
 
 
-# Note: Pn532ReaderAdapter tests would require hardware mocking (PN532_SPI)
-# which is complex and not critical since it's a thin wrapper.
+@pytest.fixture()
+def mock_pn532_spi(mocker):
+    pn532_spi_class = MagicMock()
+    pn532_spi_class.return_value.get_firmware_version.return_value = (0x32, 1, 6, 7)
+    mocker.patch.dict("sys.modules", {"pn532": MagicMock(PN532_SPI=pn532_spi_class)})
+    sys.modules.pop("jukebox.adapters.outbound.readers.pn532_reader_adapter", None)
+    module = importlib.import_module("jukebox.adapters.outbound.readers.pn532_reader_adapter")
+    mocker.patch.object(module, "spi_active", return_value=True)
+    return module, pn532_spi_class.return_value
+
+
+def test_read_uses_passive_target_by_default(mock_pn532_spi):
+    module, pn532 = mock_pn532_spi
+    pn532.read_passive_target.return_value = bytearray(b"\x04\xf2=v")
+
+    reader = module.Pn532ReaderAdapter(read_timeout_seconds=0.2)
+
+    assert reader.read() == "04:f2:3d:76"
+    assert reader.read_budget_seconds == 0.2
+    pn532.read_passive_target.assert_called_once_with(timeout=0.2)
+    pn532.read_auto_poll_target.assert_not_called()
+
+
+def test_read_collects_auto_poll_result_in_auto_poll_mode(mock_pn532_spi):
+    module, pn532 = mock_pn532_spi
+    pn532.read_auto_poll_target.side_effect = [None, bytearray(b"\x04\xf2=v")]
+
+    reader = module.Pn532ReaderAdapter(read_timeout_seconds=0.2, detection_mode="auto_poll")
+
+    assert reader.read() is None
+    assert reader.read() == "04:f2:3d:76"
+    assert pn532.read_auto_poll_target.call_count == 2
+    pn532.read_passive_target.assert_not_called()
+
+
+def test_read_powers_down_after_missed_read_in_low_power_mode(mock_pn532_spi):
+    module, pn532 = mock_pn532_spi
+    pn532.read_passive_target.side_effect = [None, None, bytearray(b"\x04\xf2=v")]
+    reader = module.Pn532ReaderAdapter()
+
+    assert reader.read() is None
+    pn532.power_down.assert_not_called()
+
+    reader.set_low_power(True)
+    assert reader.read() is None
+    assert reader.read() == "04:f2:3d:76"
+
+    pn532.power_down.assert_called_once_with()
+
+
+def test_read_never_powers_down_in_auto_poll_mode(mock_pn532_spi):
+    module, pn532 = mock_pn532_spi
+    pn532.read_auto_poll_target.side_effect = [None, None, bytearray(b"\x04\xf2=v")]
+    reader = module.Pn532ReaderAdapter(detection_mode="auto_poll")
+    reader.set_low_power(True)
+
+    assert reader.read() is None
+    assert reader.read() is None
+    assert reader.read() == "04:f2:3d:76"
+
+    pn532.power_down.assert_not_called()
+
+
+def test_read_keeps_going_when_power_down_fails(mock_pn532_spi, caplog):
+    module, pn532 = mock_pn532_spi
+    pn532.read_passive_target.return_value = None
+    pn532.power_down.side_effect = RuntimeError("Did not receive expected ACK from PN532!")
+    reader = module.Pn532ReaderAdapter()
+    reader.set_low_power(True)
+
+    assert reader.read() is None
+    assert "Failed to put the PN532 in PowerDown" in caplog.text
+
+
+def test_probe_detection_starts_both_detection_commands(mock_pn532_spi):
+    module, pn532 = mock_pn532_spi
+    pn532.start_passive_target.return_value = True
+    pn532.start_auto_poll.return_value = True
+    reader = module.Pn532ReaderAdapter(read_timeout_seconds=0.2)
+
+    assert reader.probe_detection() is True
+    pn532.start_passive_target.assert_called_once_with(timeout=0.2)
+    pn532.start_auto_poll.assert_called_once_with(timeout=0.2)
+
+
+@pytest.mark.parametrize("failure", [False, RuntimeError("Did not receive expected ACK from PN532!")])
+def test_probe_detection_fails_when_a_detection_command_is_not_acknowledged(mock_pn532_spi, failure):
+    module, pn532 = mock_pn532_spi
+    pn532.start_passive_target.return_value = True
+    if isinstance(failure, Exception):
+        pn532.start_auto_poll.side_effect = failure
+    else:
+        pn532.start_auto_poll.return_value = failure
+    reader = module.Pn532ReaderAdapter()
+
+    assert reader.probe_detection() is False
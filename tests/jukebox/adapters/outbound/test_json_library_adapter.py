@@ -1,9 +1,13 @@
 import json
+import threading
 
 import pytest
+from pydantic import ValidationError
 
+from jukebox.adapters.outbound import json_library_adapter
 from jukebox.adapters.outbound.json_library_adapter import JsonLibraryAdapter
-from jukebox.domain.entities import Disc, DiscMetadata, DiscOption, Library
+from jukebox.domain.entities import Disc, DiscChange, DiscChangesSummary, DiscMetadata, DiscOption, Library
+from jukebox.domain.use_cases.library.bulk_apply_disc_changes import BulkApplyDiscChanges
 
 
 def write_library(filepath, library: Library | dict) -> None:
@@ -155,14 +159,29 @@ def test_external_file_changes_invalidate_cache(tmp_path, mocker):
     assert load_spy.call_count == 2
 
 
-def test_list_discs_returns_copies_not_live_cached_state(tmp_path):
+def test_revision_changes_when_library_is_written(tmp_path):
+    filepath = tmp_path / "library.json"
+    adapter = JsonLibraryAdapter(str(filepath))
+    assert adapter.revision() is None
+
+    adapter.add_disc("tag-1", Disc(uri="first.mp3", metadata=DiscMetadata()))
+    first_revision = adapter.revision()
+    adapter.add_disc("tag-2", Disc(uri="second.mp3", metadata=DiscMetadata()))
+
+    assert first_revision is not None
+    assert adapter.revision() != first_revision
+
+
+def test_list_discs_returns_shared_frozen_discs_in_a_fresh_mapping(tmp_path):
     filepath = tmp_path / "library.json"
     write_library(filepath, Library(discs={"test-tag": Disc(uri="original.mp3", metadata=DiscMetadata())}))
     adapter = JsonLibraryAdapter(str(filepath))
 
     discs = adapter.list_discs()
-    discs["test-tag"].uri = "mutated.mp3"
+    with pytest.raises(ValidationError, match="frozen"):
+        discs["test-tag"].uri = "mutated.mp3"
     discs["new-tag"] = Disc(uri="phantom.mp3", metadata=DiscMetadata())
+    assert adapter.list_discs()["test-tag"] is discs["test-tag"]
 
     fresh_disc = adapter.get_disc("test-tag")
 
@@ -171,6 +190,26 @@ def test_list_discs_returns_copies_not_live_cached_state(tmp_path):
     assert adapter.get_disc("new-tag") is None
 
 
+def test_update_disc_keeps_unchanged_discs_shared(tmp_path):
+    filepath = tmp_path / "library.json"
+    write_library(
+        filepath,
+        Library(
+            discs={
+                "kept-tag": Disc(uri="kept.mp3", metadata=DiscMetadata()),
+                "test-tag": Disc(uri="before.mp3", metadata=DiscMetadata()),
+            }
+        ),
+    )
+    adapter = JsonLibraryAdapter(str(filepath))
+    kept_disc = adapter.get_disc("kept-tag")
+
+    adapter.update_disc("test-tag", Disc(uri="after.mp3", metadata=DiscMetadata()))
+
+    assert adapter.get_disc("kept-tag") is kept_disc
+    assert adapter.get_disc("test-tag").uri == "after.mp3"
+
+
 def test_add_disc_persists_and_updates_cache(tmp_path, mocker):
     filepath = tmp_path / "library.json"
     adapter = JsonLibraryAdapter(str(filepath))
@@ -329,3 +368,251 @@ def test_failed_write_during_remove_disc_does_not_hide_on_disk_state(tmp_path, m
         adapter.remove_disc("test-tag")
 
     assert adapter.get_disc("test-tag") == original_disc
+
+
+def test_search_index_is_reused_until_the_library_changes(tmp_path):
+    filepath = tmp_path / "library.json"
+    write_library(filepath, Library(discs={"tag-1": Disc(uri="one.mp3", metadata=DiscMetadata(artist="Björk"))}))
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    search_index = adapter.search_index()
+
+    assert adapter.search_index() is search_index
+    assert list(search_index.search("bjork")) == ["tag-1"]
+
+    adapter.add_disc("tag-2", Disc(uri="two.mp3", metadata=DiscMetadata(artist="Bjorn")))
+
+    assert adapter.search_index() is not search_index
+    assert list(adapter.search_index().search("bjor")) == ["tag-1", "tag-2"]
+
+
+def test_invalid_disc_is_skipped_and_reported(tmp_path, caplog):
+    filepath = tmp_path / "library.json"
+    write_library(
+        filepath,
+        {
+            "discs": {
+                "valid-tag": {"uri": "valid.mp3", "metadata": {}},
+                "invalid-tag": {"uri": "invalid.mp3", "metadata": {}, "option": {"shuffle": "sometimes"}},
+            }
+        },
+    )
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    with caplog.at_level("WARNING", logger="jukebox"):
+        discs = adapter.list_discs()
+
+    assert list(discs) == ["valid-tag"]
+    assert "Skipping invalid disc" in caplog.text
+    assert "tag_id: invalid-tag" in caplog.text
+
+
+def test_invalid_disc_is_written_back_until_removed(tmp_path):
+    filepath = tmp_path / "library.json"
+    invalid_entry = {"uri": "invalid.mp3", "metadata": {}, "option": {"shuffle": "sometimes"}}
+    write_library(filepath, {"discs": {"invalid-tag": invalid_entry}})
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    adapter.add_disc("new-tag", Disc(uri="new.mp3", metadata=DiscMetadata()))
+
+    assert read_library(filepath)["discs"]["invalid-tag"] == invalid_entry
+
+    adapter.remove_disc("invalid-tag")
+
+    assert list(read_library(filepath)["discs"]) == ["new-tag"]
+
+
+def test_bulk_changes_can_remove_or_replace_invalid_discs(tmp_path):
+    filepath = tmp_path / "library.json"
+    invalid_entry = {"uri": "invalid.mp3", "metadata": {}, "option": {"shuffle": "sometimes"}}
+    write_library(filepath, {"discs": {"invalid-tag": invalid_entry, "other-invalid-tag": invalid_entry}})
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    assert adapter.list_tag_ids() == {"invalid-tag", "other-invalid-tag"}
+
+    summary = BulkApplyDiscChanges(adapter).execute(
+        [
+            DiscChange(action="remove", tag_id="invalid-tag"),
+            DiscChange(action="upsert", tag_id="other-invalid-tag", disc=Disc(uri="new.mp3", metadata=DiscMetadata())),
+        ]
+    )
+
+    assert summary == DiscChangesSummary(updated=1, removed=1)
+    discs = read_library(filepath)["discs"]
+    assert list(discs) == ["other-invalid-tag"]
+    assert discs["other-invalid-tag"]["uri"] == "new.mp3"
+
+
+def test_malformed_disc_is_skipped_and_written_back_as_text(tmp_path, caplog):
+    filepath = tmp_path / "library.json"
+    filepath.write_text(
+        '{"discs": {"tag-1": {"uri": "one.mp3", "metadata": {}}, "tag-2": {"uri": oops}, '
+        '"tag-3": {"uri": "three.mp3", "metadata": {}}}}',
+        encoding="utf-8",
+    )
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    with caplog.at_level("WARNING", logger="jukebox"):
+        assert list(adapter.list_discs()) == ["tag-1", "tag-3"]
+    assert "tag_id: tag-2" in caplog.text
+
+    adapter.add_disc("tag-4", Disc(uri="four.mp3", metadata=DiscMetadata()))
+
+    assert read_library(filepath)["discs"]["tag-2"] == '{"uri": oops}'
+
+
+def test_truncated_file_keeps_discs_read_before_the_error(tmp_path):
+    filepath = tmp_path / "library.json"
+    filepath.write_text(
+        '{"discs": {"tag-1": {"uri": "one.mp3", "metadata": {}}, "tag-2": {"uri": "tw', encoding="utf-8"
+    )
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    assert list(adapter.list_discs()) == ["tag-1"]
+
+
+def read_journal(adapter: JsonLibraryAdapter) -> list[dict]:
+    with open(adapter.journal_path, encoding="utf-8") as journal_file:
+        return [json.loads(line) for line in journal_file]
+
+
+def test_journaled_changes_are_appended_without_rewriting_the_library(tmp_path):
+    filepath = tmp_path / "library.json"
+    write_library(filepath, Library(discs={"kept-tag": Disc(uri="kept.mp3", metadata=DiscMetadata())}))
+    library_text = filepath.read_text(encoding="utf-8")
+    adapter = JsonLibraryAdapter(str(filepath), journaled=True)
+
+    adapter.add_disc("new-tag", Disc(uri="new.mp3", metadata=DiscMetadata(artist="Artist")))
+    adapter.update_disc("new-tag", Disc(uri="updated.mp3", metadata=DiscMetadata()))
+    adapter.remove_disc("kept-tag")
+
+    assert filepath.read_text(encoding="utf-8") == library_text
+    assert [(entry["op"], entry["tag_id"]) for entry in read_journal(adapter)] == [
+        ("put", "new-tag"),
+        ("put", "new-tag"),
+        ("remove", "kept-tag"),
+    ]
+    assert JsonLibraryAdapter(str(filepath)).list_discs() == {
+        "new-tag": Disc(uri="updated.mp3", metadata=DiscMetadata())
+    }
+
+
+def test_journal_replay_skips_invalid_and_incomplete_lines(tmp_path, caplog):
+    filepath = tmp_path / "library.json"
+    adapter = JsonLibraryAdapter(str(filepath), journaled=True)
+    adapter.add_disc("tag-1", Disc(uri="one.mp3", metadata=DiscMetadata()))
+    with open(adapter.journal_path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"op": "put", "tag_id": "tag-2", "disc": {"uri": 2}}\n')
+        journal_file.write('{"op": "remove", "tag_id": "tag-1"')
+
+    with caplog.at_level("WARNING", logger="jukebox"):
+        discs = JsonLibraryAdapter(str(filepath)).list_discs()
+
+    assert list(discs) == ["tag-1"]
+    assert "Skipping invalid journal entry" in caplog.text
+
+
+def test_journal_is_compacted_into_the_library_at_the_size_threshold(tmp_path, mocker):
+    mocker.patch.object(json_library_adapter, "JOURNAL_COMPACTION_SIZE", 200)
+    filepath = tmp_path / "library.json"
+    adapter = JsonLibraryAdapter(str(filepath), journaled=True)
+
+    adapter.add_disc("tag-1", Disc(uri="one.mp3", metadata=DiscMetadata()))
+    assert not filepath.exists()
+
+    adapter.add_disc("tag-2", Disc(uri="two.mp3", metadata=DiscMetadata()))
+
+    assert list(read_library(filepath)["discs"]) == ["tag-1", "tag-2"]
+    assert not (tmp_path / "library.journal.jsonl").exists()
+    assert list(adapter.list_discs()) == ["tag-1", "tag-2"]
+
+
+def test_full_write_folds_a_leftover_journal_into_the_library(tmp_path):
+    filepath = tmp_path / "library.json"
+    JsonLibraryAdapter(str(filepath), journaled=True).add_disc("tag-1", Disc(uri="one.mp3", metadata=DiscMetadata()))
+    adapter = JsonLibraryAdapter(str(filepath))
+
+    adapter.add_disc("tag-2", Disc(uri="two.mp3", metadata=DiscMetadata()))
+
+    assert list(read_library(filepath)["discs"]) == ["tag-1", "tag-2"]
+    assert not (tmp_path / "library.journal.jsonl").exists()
+
+
+def test_journaled_change_from_another_process_invalidates_cache(tmp_path):
+    filepath = tmp_path / "library.json"
+    reader = JsonLibraryAdapter(str(filepath))
+    assert reader.list_discs() == {}
+    revision = reader.revision()
+
+    JsonLibraryAdapter(str(filepath), journaled=True).add_disc("tag-1", Disc(uri="one.mp3", metadata=DiscMetadata()))
+
+    assert reader.revision() != revision
+    assert list(reader.list_discs()) == ["tag-1"]
+
+
+def test_append_from_another_process_waits_for_compaction_instead_of_being_lost(tmp_path, mocker):
+    mocker.patch.object(json_library_adapter, "JOURNAL_COMPACTION_SIZE", 1)
+    filepath = tmp_path / "library.json"
+    compacting = JsonLibraryAdapter(str(filepath), journaled=True)
+    other_process = JsonLibraryAdapter(str(filepath), journaled=True)
+    write_library = compacting._write_library
+    other_append = threading.Thread(
+        target=other_process.add_disc, args=("tag-2", Disc(uri="two.mp3", metadata=DiscMetadata()))
+    )
+
+    def write_library_while_another_process_appends(library, invalid_entries):
+        other_append.start()
+        other_append.join(timeout=0.2)
+        assert other_append.is_alive()
+        write_library(library, invalid_entries)
+
+    mocker.patch.object(compacting, "_write_library", side_effect=write_library_while_another_process_appends)
+
+    compacting.add_disc("tag-1", Disc(uri="one.mp3", metadata=DiscMetadata()))
+    other_append.join(timeout=1.0)
+
+    assert list(JsonLibraryAdapter(str(filepath)).list_discs()) == ["tag-1", "tag-2"]
+
+
+@pytest.mark.parametrize("journaled", [False, True], ids=["full_write", "journaled"])
+def test_save_discs_applies_every_change_in_one_write(tmp_path, mocker, journaled):
+    filepath = tmp_path / "library.json"
+    write_library(
+        filepath,
+        Library(
+            discs={
+                "kept-tag": Disc(uri="kept.mp3", metadata=DiscMetadata()),
+                "updated-tag": Disc(uri="before.mp3", metadata=DiscMetadata()),
+                "removed-tag": Disc(uri="removed.mp3", metadata=DiscMetadata()),
+            }
+        ),
+    )
+    adapter = JsonLibraryAdapter(str(filepath), journaled=journaled)
+    write_spy = mocker.spy(adapter, "_write_library")
+    append_spy = mocker.spy(adapter, "_append_to_journal")
+
+    adapter.save_discs(
+        {
+            "updated-tag": Disc(uri="after.mp3", metadata=DiscMetadata()),
+            "new-tag": Disc(uri="new.mp3", metadata=DiscMetadata()),
+        },
+        ["removed-tag"],
+    )
+
+    assert write_spy.call_count + append_spy.call_count == 1
+    assert {tag_id: disc.uri for tag_id, disc in JsonLibraryAdapter(str(filepath)).list_discs().items()} == {
+        "kept-tag": "kept.mp3",
+        "updated-tag": "after.mp3",
+        "new-tag": "new.mp3",
+    }
+
+
+def test_save_discs_raises_for_missing_removed_tag_without_writing(tmp_path, mocker):
+    filepath = tmp_path / "library.json"
+    adapter = JsonLibraryAdapter(str(filepath))
+    write_spy = mocker.spy(adapter, "_write_library")
+
+    with pytest.raises(ValueError, match="Tag does not exist"):
+        adapter.save_discs({"new-tag": Disc(uri="new.mp3", metadata=DiscMetadata())}, ["missing-tag"])
+
+    write_spy.assert_not_called()
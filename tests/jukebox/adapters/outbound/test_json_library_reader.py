@@ -0,0 +1,82 @@
+import io
+import json
+
+import pytest
+
+from jukebox.adapters.outbound.json_library_reader import iter_library_entries
+
+LIBRARY = {
+    "version": 1.25,
+    "discs": {
+        "tag:1": {"uri": "uri:1", "metadata": {"artist": "Sigur Rós"}},
+        "tag:2": {"uri": "uri:2", "metadata": {}, "option": {"shuffle": True}},
+        "tag:3": {"uri": 123, "metadata": None},
+    },
+    "extra": [1, {"nested": "value"}],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_library_entries_yields_raw_entries_in_file_order(chunk_size):
+    text = json.dumps(LIBRARY, indent=2, ensure_ascii=False)
+
+    entries = list(iter_library_entries(io.StringIO(text), chunk_size=chunk_size))
+
+    assert entries == list(LIBRARY["discs"].items())
+
+
+@pytest.mark.parametrize("text", ["{}", '{"discs": {}}', '  {"other": 1}  '])
+def test_iter_library_entries_yields_nothing_without_discs(text):
+    assert list(iter_library_entries(io.StringIO(text))) == []
+
+
+def test_iter_library_entries_yields_entries_read_before_a_syntax_error():
+    text = '{"discs": {"tag:1": {"uri": "uri:1", "metadata": {}}, "tag:2": {"uri": '
+    entries = iter_library_entries(io.StringIO(text), chunk_size=8)
+
+    assert next(entries) == ("tag:1", {"uri": "uri:1", "metadata": {}})
+    with pytest.raises(ValueError):
+        next(entries)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+def test_iter_library_entries_yields_a_malformed_disc_as_text_and_goes_on(chunk_size):
+    text = (
+        '{"discs": {"tag:1": {"uri": "uri:1"}, "tag:2": {"uri": oops, "metadata": {"a": [1, "}"]}}, '
+        '"tag:3": {"uri": "uri:3"}, "tag:4": tru, "tag:5": {"uri": "uri:5"}}}'
+    )
+
+    entries = list(iter_library_entries(io.StringIO(text), chunk_size=chunk_size))
+
+    assert entries == [
+        ("tag:1", {"uri": "uri:1"}),
+        ("tag:2", '{"uri": oops, "metadata": {"a": [1, "}"]}}'),
+        ("tag:3", {"uri": "uri:3"}),
+        ("tag:4", "tru"),
+        ("tag:5", {"uri": "uri:5"}),
+    ]
+
+
+def test_iter_library_entries_does_not_read_past_a_malformed_disc():
+    discs = {"tag:1": '{"uri": oops}'} | {f"tag:{index}": '{"uri": "uri"}' for index in range(2, 1000)}
+    text = '{"discs": {' + ", ".join(f'"{tag_id}": {disc}' for tag_id, disc in discs.items()) + "}}"
+    file = io.StringIO(text)
+    entries = iter_library_entries(file, chunk_size=64)
+
+    assert next(entries) == ("tag:1", '{"uri": oops}')
+    assert file.tell() < 256
+    assert next(entries) == ("tag:2", {"uri": "uri"})
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[]",
+        '{"discs": []}',
+        '{"discs": {1: {}}}',
+        '{"discs": {}} {}',
+    ],
+)
+def test_iter_library_entries_rejects_unexpected_structure(text):
+    with pytest.raises(ValueError):
+        list(iter_library_entries(io.StringIO(text)))
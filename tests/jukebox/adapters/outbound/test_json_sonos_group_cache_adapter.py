@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from jukebox.adapters.outbound.json_sonos_group_cache_adapter import JsonSonosGroupCacheAdapter
+from tests.jukebox.settings._helpers import build_resolved_sonos_group_runtime
+
+
+def build_adapter(tmp_path: Path) -> JsonSonosGroupCacheAdapter:
+    return JsonSonosGroupCacheAdapter(str(tmp_path / "sonos-group-cache.json"))
+
+
+def test_save_then_load_returns_the_same_group(tmp_path):
+    adapter = build_adapter(tmp_path)
+    group = build_resolved_sonos_group_runtime()
+
+    adapter.save(group)
+
+    assert adapter.load() == group
+    assert list(tmp_path.glob(".sonos-group-*.tmp")) == []
+
+
+def test_load_returns_none_when_file_is_missing(tmp_path):
+    assert build_adapter(tmp_path).load() is None
+
+
+def test_clear_forgets_the_saved_group(tmp_path):
+    adapter = build_adapter(tmp_path)
+    adapter.save(build_resolved_sonos_group_runtime())
+
+    adapter.clear()
+    adapter.clear()
+
+    assert adapter.load() is None
+
+
+def test_load_ignores_malformed_or_invalid_cache(tmp_path, caplog):
+    adapter = build_adapter(tmp_path)
+
+    Path(adapter.filepath).write_text("{not json", encoding="utf-8")
+    assert adapter.load() is None
+
+    Path(adapter.filepath).write_text('{"household_id": "household-1"}', encoding="utf-8")
+    assert adapter.load() is None
+    assert "Ignoring unreadable Sonos group cache" in caplog.text
+
+
+def test_save_logs_instead_of_raising_when_write_fails(tmp_path, monkeypatch, caplog):
+    adapter = build_adapter(tmp_path)
+
+    def raise_replace_error(_source, _target):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr("jukebox.adapters.outbound.json_sonos_group_cache_adapter.os.replace", raise_replace_error)
+
+    adapter.save(build_resolved_sonos_group_runtime())
+
+    assert adapter.load() is None
+    assert "Error writing Sonos group cache" in caplog.text
+    assert list(tmp_path.glob(".sonos-group-*.tmp")) == []
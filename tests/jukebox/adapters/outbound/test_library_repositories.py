@@ -0,0 +1,16 @@
+from jukebox.adapters.outbound.json_library_adapter import JsonLibraryAdapter
+from jukebox.adapters.outbound.library_repositories import build_library_repository
+from jukebox.adapters.outbound.sqlite_library_adapter import SqliteLibraryAdapter
+
+
+def test_build_library_repository_keeps_sqlite_database_beside_json_library(tmp_path):
+    library_path = str(tmp_path / "library.json")
+
+    assert isinstance(build_library_repository(library_path, "json"), JsonLibraryAdapter)
+    journaled_library = build_library_repository(library_path, "json_journal")
+    assert isinstance(journaled_library, JsonLibraryAdapter)
+    assert journaled_library.journaled is True
+    assert journaled_library.journal_path == str(tmp_path / "library.journal.jsonl")
+    sqlite_library = build_library_repository(library_path, "sqlite")
+    assert isinstance(sqlite_library, SqliteLibraryAdapter)
+    assert sqlite_library.filepath == str(tmp_path / "library.sqlite3")
@@ -1,4 +1,5 @@
 import logging
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
@@ -9,6 +10,7 @@ import pytest
 from jukebox.adapters.outbound.sonos_discovery_adapter import (
     SoCoSonosDiscoveryAdapter,
     _build_private_ipv4_networks_to_scan,
+    _extract_location_host,
     _extract_sonos_household_id,
 )
 from jukebox.sonos.discovery import SonosDiscoveryError
@@ -422,6 +424,8 @@ def test_soco_sonos_discovery_adapter_recovers_stale_household_speaker_by_host(m
         ),
     )
 
+    mocker.patch.object(SoCoSonosDiscoveryAdapter, "_discover_targeted_household_speakers", return_value=None)
+
     speakers = SoCoSonosDiscoveryAdapter().discover_household_speakers(household_id)
 
     assert [speaker.model_dump() for speaker in speakers] == [
@@ -441,6 +445,41 @@ def test_soco_sonos_discovery_adapter_recovers_stale_household_speaker_by_host(m
     )
 
 
+def test_soco_sonos_discovery_adapter_builds_household_from_targeted_search(mocker):
+    class HouseholdlessSpeaker(FakeSpeaker):
+        @property
+        def household_id(self):
+            raise AssertionError("household should come from the SSDP answer")
+
+        @household_id.setter
+        def household_id(self, value):
+            pass
+
+    kitchen = HouseholdlessSpeaker("speaker-1", "Kitchen", "192.168.1.30", "Sonos_A")
+    bar = HouseholdlessSpeaker("speaker-2", "Bar", "192.168.1.20", "Sonos_A")
+    kitchen.all_zones = {kitchen, bar}
+    discover = mocker.Mock()
+    mocker.patch.object(SoCoSonosDiscoveryAdapter, "_open_multicast_sockets", return_value=[])
+    collect = mocker.patch.object(SoCoSonosDiscoveryAdapter, "_collect_household_host", return_value="192.168.1.30")
+    mocker.patch.dict(
+        "sys.modules",
+        build_fake_soco_module(
+            scan_network=lambda **kwargs: set(),
+            discover=discover,
+            soco_constructor=lambda host: {"192.168.1.30": kitchen}[host],
+        ),
+    )
+
+    speakers = SoCoSonosDiscoveryAdapter().discover_household_speakers("Sonos_A")
+
+    assert [(speaker.uid, speaker.host, speaker.household_id) for speaker in speakers] == [
+        ("speaker-2", "192.168.1.20", "Sonos_A"),
+        ("speaker-1", "192.168.1.30", "Sonos_A"),
+    ]
+    collect.assert_called_once_with([], "Sonos_A")
+    discover.assert_not_called()
+
+
 def test_soco_sonos_discovery_adapter_ignores_mismatched_host_retry_results(mocker):
     healthy_speaker = FakeSpeaker("speaker-3", "Office", "192.168.1.30", "household-1")
 
@@ -540,6 +579,65 @@ def test_soco_sonos_discovery_adapter_keeps_reachable_speakers_when_some_fail_no
     assert [speaker.uid for speaker in speakers] == ["speaker-1"]
 
 
+class SlowSpeaker(FakeSpeaker):
+    def __init__(self, uid, name, host, household_id, delay_seconds):
+        super().__init__(uid, name, host, household_id)
+        self._player_name = name
+        self.delay_seconds = delay_seconds
+
+    @property
+    def player_name(self):
+        time.sleep(self.delay_seconds)
+        return self._player_name
+
+    @player_name.setter
+    def player_name(self, value):
+        self._player_name = value
+
+
+def test_soco_sonos_discovery_adapter_probes_speakers_concurrently(mocker):
+    speakers = [
+        SlowSpeaker(f"speaker-{index}", f"Room {index}", f"192.168.1.{index}", "household-1", 0.2) for index in range(6)
+    ]
+    seed = speakers[0]
+    seed.all_zones = set(speakers)
+    mocker.patch.object(SoCoSonosDiscoveryAdapter, "_discover_multicast_network_speakers", return_value={seed})
+    mocker.patch.dict("sys.modules", build_fake_soco_module(scan_network=lambda **kwargs: {seed}))
+
+    started_at = time.monotonic()
+    discovered = SoCoSonosDiscoveryAdapter(max_workers=6).discover_speakers()
+
+    assert len(discovered) == 6
+    assert time.monotonic() - started_at < 0.2 * 6 / 2
+
+
+def test_soco_sonos_discovery_adapter_gives_up_on_speakers_past_the_probe_deadline(mocker):
+    kitchen = FakeSpeaker("speaker-1", "Kitchen", "192.168.1.30", "household-1")
+    stuck = SlowSpeaker("speaker-2", "Bar", "192.168.1.20", "household-1", 1.0)
+    kitchen.all_zones = {kitchen, stuck}
+    mocker.patch.object(SoCoSonosDiscoveryAdapter, "_discover_multicast_network_speakers", return_value={kitchen})
+    mocker.patch.dict("sys.modules", build_fake_soco_module(scan_network=lambda **kwargs: {kitchen}))
+
+    started_at = time.monotonic()
+    discovered = SoCoSonosDiscoveryAdapter(probe_timeout_seconds=0.1).discover_speakers()
+
+    assert [speaker.uid for speaker in discovered] == ["speaker-1"]
+    assert time.monotonic() - started_at < 1.0
+
+
+def test_soco_sonos_discovery_adapter_inspects_a_single_speaker_by_host(mocker):
+    kitchen = FakeSpeaker("speaker-1", "Kitchen", "192.168.1.30", "household-1")
+    mocker.patch.dict(
+        "sys.modules",
+        build_fake_soco_module(scan_network=lambda **kwargs: set(), soco_constructor=lambda host: kitchen),
+    )
+    adapter = SoCoSonosDiscoveryAdapter()
+
+    assert adapter.inspect_speaker("speaker-1", "192.168.1.30").name == "Kitchen"
+    with pytest.raises(SonosDiscoveryError, match="UID mismatch"):
+        adapter.inspect_speaker("speaker-2", "192.168.1.30")
+
+
 def test_soco_sonos_discovery_adapter_wraps_discovery_errors(mocker):
     mocker.patch.object(SoCoSonosDiscoveryAdapter, "_discover_multicast_network_speakers", return_value=set())
     mocker.patch.dict(
@@ -637,3 +735,55 @@ def test_collect_multicast_household_hosts_tracks_all_seed_hosts_per_household(m
         "Sonos_B": ["192.168.1.30"],
     }
     assert select_mock.call_count == 2
+
+
+def test_collect_household_host_stops_at_first_answer_from_expected_household(mocker):
+    multicast_socket = mocker.Mock()
+    multicast_socket.recvfrom.side_effect = [
+        (
+            b"HTTP/1.1 200 OK\r\nX-RINCON-HOUSEHOLD: Sonos_B\r\n\r\n",
+            ("192.168.1.30", 1900),
+        ),
+        (
+            (
+                b"HTTP/1.1 200 OK\r\n"
+                b"LOCATION: http://192.168.1.21:1400/xml/device_description.xml\r\n"
+                b"X-RINCON-HOUSEHOLD: Sonos_A\r\n\r\n"
+            ),
+            ("192.168.1.20", 1900),
+        ),
+    ]
+    select_mock = mocker.patch(
+        "jukebox.adapters.outbound.sonos_discovery_adapter.select.select",
+        return_value=([multicast_socket], [], []),
+    )
+
+    host = SoCoSonosDiscoveryAdapter()._collect_household_host([multicast_socket], "Sonos_A")
+
+    assert host == "192.168.1.21"
+    assert select_mock.call_count == 2
+    multicast_socket.sendto.assert_called_once()
+
+
+def test_collect_household_host_repeats_the_search_until_the_deadline(mocker):
+    multicast_socket = mocker.Mock()
+    mocker.patch(
+        "jukebox.adapters.outbound.sonos_discovery_adapter.select.select",
+        return_value=([], [], []),
+    )
+    mocker.patch(
+        "jukebox.adapters.outbound.sonos_discovery_adapter.time.monotonic",
+        side_effect=[0.0, 0.0, 0.0, 0.1, 0.3, 0.4, 0.6, 0.8, 1.0],
+    )
+
+    host = SoCoSonosDiscoveryAdapter()._collect_household_host([multicast_socket], "Sonos_A")
+
+    assert host is None
+    assert multicast_socket.sendto.call_count == 3
+
+
+def test_extract_location_host_reads_host_from_location_header():
+    response = b"HTTP/1.1 200 OK\r\nLocation: http://192.168.1.21:1400/xml/device_description.xml\r\n\r\n"
+
+    assert _extract_location_host(response) == "192.168.1.21"
+    assert _extract_location_host(b"HTTP/1.1 200 OK\r\n\r\n") is None
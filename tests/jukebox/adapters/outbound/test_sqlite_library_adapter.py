@@ -0,0 +1,141 @@
+import sqlite3
+
+import pytest
+
+from jukebox.adapters.outbound.sqlite_library_adapter import SqliteLibraryAdapter
+from jukebox.domain.entities import Disc, DiscMetadata, DiscOption
+
+
+def build_disc(uri="uri:1", **metadata):
+    return Disc(uri=uri, metadata=DiscMetadata(**metadata), option=DiscOption(shuffle=True))
+
+
+def test_read_returns_empty_library_and_creates_database(tmp_path):
+    filepath = tmp_path / "nested" / "library.sqlite3"
+    adapter = SqliteLibraryAdapter(str(filepath))
+
+    assert adapter.list_discs() == {}
+    assert adapter.get_disc("missing") is None
+    assert filepath.exists()
+
+
+def test_discs_round_trip_in_insertion_order(tmp_path):
+    adapter = SqliteLibraryAdapter(str(tmp_path / "library.sqlite3"))
+    first = build_disc("uri:1", artist="Artist", album="Album", track="Track")
+    second = build_disc("uri:2", playlist="Playlist")
+
+    adapter.add_disc("tag-b", first)
+    adapter.add_disc("tag-a", second)
+    adapter.update_disc("tag-b", first.model_copy(update={"uri": "uri:updated"}))
+
+    reopened = SqliteLibraryAdapter(str(tmp_path / "library.sqlite3"))
+    assert reopened.list_discs() == {"tag-b": first.model_copy(update={"uri": "uri:updated"}), "tag-a": second}
+    assert reopened.get_disc("tag-a") == second
+
+
+def test_writes_reject_missing_and_duplicate_tags(tmp_path):
+    adapter = SqliteLibraryAdapter(str(tmp_path / "library.sqlite3"))
+    adapter.add_disc("tag-1", build_disc())
+
+    with pytest.raises(ValueError, match="Already existing tag: tag_id='tag-1'"):
+        adapter.add_disc("tag-1", build_disc())
+    with pytest.raises(ValueError, match="Tag does not exist: tag_id='tag-2'"):
+        adapter.update_disc("tag-2", build_disc())
+    with pytest.raises(ValueError, match="Tag does not exist: tag_id='tag-2'"):
+        adapter.remove_disc("tag-2")
+
+    adapter.remove_disc("tag-1")
+    assert adapter.list_discs() == {}
+
+
+def test_database_uses_wal_without_unused_metadata_indexes(tmp_path):
+    filepath = tmp_path / "library.sqlite3"
+    connection = sqlite3.connect(filepath)
+    try:
+        connection.executescript(
+            "CREATE TABLE discs (tag_id TEXT PRIMARY KEY, uri TEXT NOT NULL, artist TEXT, album TEXT, track TEXT, "
+            "playlist TEXT, shuffle INTEGER NOT NULL DEFAULT 0, is_test INTEGER NOT NULL DEFAULT 0);"
+            "CREATE INDEX discs_artist ON discs (artist);"
+        )
+    finally:
+        connection.close()
+
+    SqliteLibraryAdapter(str(filepath)).list_discs()
+
+    connection = sqlite3.connect(filepath)
+    try:
+        (journal_mode,) = connection.execute("PRAGMA journal_mode").fetchone()
+        indexes = {row[1] for row in connection.execute("PRAGMA index_list(discs)")}
+    finally:
+        connection.close()
+
+    assert journal_mode == "wal"
+    assert not {"discs_artist", "discs_album", "discs_playlist"} & indexes
+
+
+def test_revision_changes_on_own_and_external_writes(tmp_path):
+    filepath = str(tmp_path / "library.sqlite3")
+    reader = SqliteLibraryAdapter(filepath)
+    writer = SqliteLibraryAdapter(filepath)
+    initial_revision = reader.revision()
+
+    reader.add_disc("tag-1", build_disc())
+    own_write_revision = reader.revision()
+    writer.add_disc("tag-2", build_disc())
+
+    assert own_write_revision != initial_revision
+    assert reader.revision() != own_write_revision
+    assert reader.get_disc("tag-2") == build_disc()
+
+
+def test_replace_discs_swaps_the_whole_library_in_one_transaction(tmp_path):
+    adapter = SqliteLibraryAdapter(str(tmp_path / "library.sqlite3"))
+    adapter.add_disc("old-tag", build_disc())
+
+    adapter.replace_discs({"new-tag": build_disc("uri:new")})
+
+    assert adapter.list_discs() == {"new-tag": build_disc("uri:new")}
+
+
+def test_newer_database_schema_is_rejected(tmp_path):
+    filepath = tmp_path / "library.sqlite3"
+    connection = sqlite3.connect(filepath)
+    connection.execute("PRAGMA user_version=99")
+    connection.close()
+
+    with pytest.raises(RuntimeError, match="Unsupported library database version 99"):
+        SqliteLibraryAdapter(str(filepath)).list_discs()
+
+
+def test_search_index_is_reused_until_the_library_changes(tmp_path):
+    filepath = str(tmp_path / "library.sqlite3")
+    adapter = SqliteLibraryAdapter(filepath)
+    adapter.add_disc("tag-1", build_disc(artist="Björk"))
+
+    search_index = adapter.search_index()
+
+    assert adapter.search_index() is search_index
+    assert list(search_index.search("bjork")) == ["tag-1"]
+
+    SqliteLibraryAdapter(filepath).remove_disc("tag-1")
+
+    assert adapter.search_index() is not search_index
+    assert adapter.search_index().search("bjork") == {}
+
+
+def test_save_discs_upserts_and_removes_in_one_transaction(tmp_path):
+    adapter = SqliteLibraryAdapter(str(tmp_path / "library.sqlite3"))
+    adapter.replace_discs({"tag-a": build_disc("uri:a"), "tag-b": build_disc("uri:b"), "tag-c": build_disc("uri:c")})
+
+    adapter.save_discs({"tag-a": build_disc("uri:a2"), "tag-d": build_disc("uri:d")}, ["tag-b"])
+
+    assert {tag_id: disc.uri for tag_id, disc in adapter.list_discs().items()} == {
+        "tag-a": "uri:a2",
+        "tag-c": "uri:c",
+        "tag-d": "uri:d",
+    }
+
+    with pytest.raises(ValueError, match="Tag does not exist"):
+        adapter.save_discs({"tag-e": build_disc("uri:e")}, ["tag-b"])
+
+    assert adapter.get_disc("tag-e") is None
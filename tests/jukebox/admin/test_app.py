@@ -22,13 +22,20 @@ from jukebox.admin.library_commands import (
     CliAddCommand,
     CliEditCommand,
     CliGetCommand,
+    CliImportCommand,
     CliListCommand,
     CliListCommandModes,
+    CliMigrateCommand,
     CliRemoveCommand,
     CliSearchCommand,
     InteractiveCliCommand,
 )
-from jukebox.admin.pn532_commands import Pn532ProbeCommand, Pn532ProfilesCommand, Pn532SelectCommand
+from jukebox.admin.pn532_commands import (
+    Pn532CalibrateCommand,
+    Pn532ProbeCommand,
+    Pn532ProfilesCommand,
+    Pn532SelectCommand,
+)
 from jukebox.admin.sonos_households import GroupedSonosHousehold
 from jukebox.sonos.discovery import DiscoveredSonosSpeaker
 
@@ -50,6 +57,7 @@ def app_mocks(mocker):
         build_ui_app = mocker.patch("jukebox.admin.app.build_admin_ui_app")
         build_cli_controller = mocker.patch("jukebox.admin.app.build_cli_controller")
         build_interactive_cli_controller = mocker.patch("jukebox.admin.app.build_interactive_cli_controller")
+        build_library_repository = mocker.patch("jukebox.admin.app.build_library_repository")
 
     return Mocks()
 
@@ -81,6 +89,11 @@ def app_mocks(mocker):
             "execute_pn532_command",
         ),
         (["pn532", "probe"], Pn532ProbeCommand(type="pn532_probe"), "execute_pn532_command"),
+        (
+            ["pn532", "calibrate", "--samples", "5"],
+            Pn532CalibrateCommand(type="pn532_calibrate", samples=5),
+            "execute_pn532_command",
+        ),
         (["api", "--port", "9000"], ApiCommand(type="api", port=9000), "execute_server_command"),
         (["ui", "--port", "9100"], UiCommand(type="ui", port=9100), "execute_server_command"),
     ],
@@ -349,6 +362,14 @@ def test_prompt_for_sonos_household_selection_prints_full_list_and_uses_short_la
             ["library", "interactive"],
             InteractiveCliCommand(type="interactive"),
         ),
+        (
+            ["library", "migrate", "--to", "sqlite", "--overwrite"],
+            CliMigrateCommand(type="migrate", to="sqlite", overwrite=True),
+        ),
+        (
+            ["library", "import", "discs.csv"],
+            CliImportCommand(type="import", path="discs.csv"),
+        ),
     ],
 )
 def test_jukebox_admin_routes_library_commands_to_shared_handler(app_mocks, args, expected_command):
@@ -369,6 +390,7 @@ def test_jukebox_admin_routes_library_commands_to_shared_handler(app_mocks, args
         settings_service=settings_service,
         build_cli_controller=app_mocks.build_cli_controller,
         build_interactive_cli_controller=app_mocks.build_interactive_cli_controller,
+        build_library_repository=app_mocks.build_library_repository,
     )
     app_mocks.execute_settings_command.assert_not_called()
     app_mocks.execute_sonos_command.assert_not_called()
@@ -877,10 +877,10 @@ def test_execute_server_command_starts_server_with_resolved_runtime(mocker, comm
 
     services.settings.resolve_admin_runtime.assert_called_once_with(verbose=True)
     if builder_name == "build_api_app":
-        build_api_app.assert_called_once_with("/resolved/library.json", services)
+        build_api_app.assert_called_once_with("/resolved/library.json", services, "json")
         build_ui_app.assert_not_called()
     else:
-        build_ui_app.assert_called_once_with("/resolved/library.json", services)
+        build_ui_app.assert_called_once_with("/resolved/library.json", services, "json")
         build_api_app.assert_not_called()
     mock_uvicorn.run.assert_called_once_with(fake_app.app, host="0.0.0.0", port=expected_port)
 
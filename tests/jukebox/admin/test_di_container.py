@@ -60,13 +60,15 @@ def test_build_admin_services_builds_peer_settings_and_sonos_services(mocker):
 @pytest.fixture
 def bootstrap_mocks(mocker):
     class Mocks:
-        repo_class = mocker.patch("jukebox.admin.di_container.JsonLibraryAdapter")
+        repo_class = mocker.patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
         current_tag_repo_class = mocker.patch("jukebox.admin.di_container.TextCurrentTagAdapter")
         add_disc_class = mocker.patch("jukebox.admin.di_container.AddDisc")
         list_discs_class = mocker.patch("jukebox.admin.di_container.ListDiscs")
         remove_disc_class = mocker.patch("jukebox.admin.di_container.RemoveDisc")
         edit_disc_class = mocker.patch("jukebox.admin.di_container.EditDisc")
         get_disc_class = mocker.patch("jukebox.admin.di_container.GetDisc")
+        search_discs_class = mocker.patch("jukebox.admin.di_container.SearchDiscs")
+        bulk_apply_disc_changes_class = mocker.patch("jukebox.admin.di_container.BulkApplyDiscChanges")
         get_current_tag_status_class = mocker.patch("jukebox.admin.di_container.GetCurrentTagStatus")
         repo_instance = MagicMock()
         current_tag_repo_instance = MagicMock()
@@ -75,6 +77,8 @@ def bootstrap_mocks(mocker):
         remove_disc_instance = MagicMock()
         edit_disc_instance = MagicMock()
         get_disc_instance = MagicMock()
+        search_discs_instance = MagicMock()
+        bulk_apply_disc_changes_instance = MagicMock()
         get_current_tag_status_instance = MagicMock()
 
     mocks = Mocks()
@@ -85,6 +89,8 @@ def bootstrap_mocks(mocker):
     mocks.remove_disc_class.return_value = mocks.remove_disc_instance
     mocks.edit_disc_class.return_value = mocks.edit_disc_instance
     mocks.get_disc_class.return_value = mocks.get_disc_instance
+    mocks.search_discs_class.return_value = mocks.search_discs_instance
+    mocks.bulk_apply_disc_changes_class.return_value = mocks.bulk_apply_disc_changes_instance
     mocks.get_current_tag_status_class.return_value = mocks.get_current_tag_status_instance
     return mocks
 
@@ -108,6 +114,8 @@ def test_build_admin_api_app_wiring(mocker, bootstrap_mocks):
         bootstrap_mocks.remove_disc_instance,
         bootstrap_mocks.edit_disc_instance,
         bootstrap_mocks.get_disc_instance,
+        bootstrap_mocks.search_discs_instance,
+        bootstrap_mocks.bulk_apply_disc_changes_instance,
         bootstrap_mocks.get_current_tag_status_instance,
         services.settings,
         services.sonos,
@@ -134,6 +142,8 @@ def test_build_admin_ui_app_wiring(mocker, bootstrap_mocks):
         bootstrap_mocks.remove_disc_instance,
         bootstrap_mocks.edit_disc_instance,
         bootstrap_mocks.get_disc_instance,
+        bootstrap_mocks.search_discs_instance,
+        bootstrap_mocks.bulk_apply_disc_changes_instance,
         bootstrap_mocks.get_current_tag_status_instance,
         services.settings,
         services.sonos,
@@ -1,11 +1,15 @@
 from unittest.mock import MagicMock, create_autospec
 
+import pytest
+
+from jukebox.admin.di_container import build_library_repository
 from jukebox.admin.library_command_handlers import (
     InteractiveLibraryController,
     LibraryController,
     execute_library_command,
 )
-from jukebox.admin.library_commands import CliSearchCommand, InteractiveCliCommand
+from jukebox.admin.library_commands import CliMigrateCommand, CliSearchCommand, InteractiveCliCommand
+from jukebox.domain.entities import Disc, DiscMetadata
 from jukebox.settings.entities import ResolvedAdminRuntimeConfig
 from jukebox.settings.service_protocols import SettingsService
 
@@ -29,10 +33,11 @@ def test_execute_library_command_runs_standard_cli_with_resolved_library_path():
         settings_service=settings_service,
         build_cli_controller=build_cli_controller,
         build_interactive_cli_controller=build_interactive_cli_controller,
+        build_library_repository=MagicMock(),
     )
 
     settings_service.resolve_admin_runtime.assert_called_once_with(verbose=True)
-    build_cli_controller.assert_called_once_with("/resolved/library.json")
+    build_cli_controller.assert_called_once_with("/resolved/library.json", "json")
     cli.run.assert_called_once_with(command)
     build_interactive_cli_controller.assert_not_called()
 
@@ -55,9 +60,75 @@ def test_execute_library_command_runs_interactive_cli_with_resolved_library_path
         settings_service=settings_service,
         build_cli_controller=build_cli_controller,
         build_interactive_cli_controller=build_interactive_cli_controller,
+        build_library_repository=MagicMock(),
     )
 
     settings_service.resolve_admin_runtime.assert_called_once_with(verbose=False)
-    build_interactive_cli_controller.assert_called_once_with("/resolved/library.json")
+    build_interactive_cli_controller.assert_called_once_with("/resolved/library.json", "json")
     interactive_cli.run.assert_called_once_with()
     build_cli_controller.assert_not_called()
+
+
+def _run_migrate(library_path: str, command: CliMigrateCommand, library_backend="json") -> list[str]:
+    settings_service = create_autospec(SettingsService)
+    settings_service.resolve_admin_runtime.return_value = ResolvedAdminRuntimeConfig(
+        library_path=library_path,
+        library_backend=library_backend,
+        api_port=8000,
+        ui_port=9000,
+    )
+    output: list[str] = []
+    execute_library_command(
+        verbose=False,
+        command=command,
+        settings_service=settings_service,
+        build_cli_controller=MagicMock(),
+        build_interactive_cli_controller=MagicMock(),
+        build_library_repository=build_library_repository,
+        stdout_fn=output.append,
+    )
+    return output
+
+
+def test_execute_library_command_migrates_json_library_to_sqlite_and_back(tmp_path):
+    library_path = str(tmp_path / "library.json")
+    discs = {
+        "tag-1": Disc(uri="uri:1", metadata=DiscMetadata(artist="Artist", album="Album")),
+        "tag-2": Disc(uri="uri:2", metadata=DiscMetadata(playlist="Playlist")),
+    }
+    build_library_repository(library_path, "json").replace_discs(discs)
+
+    output = _run_migrate(library_path, CliMigrateCommand(type="migrate", to="sqlite"))
+
+    assert build_library_repository(library_path, "sqlite").list_discs() == discs
+    assert output == [
+        "Migrated 2 discs from the json library to the sqlite library",
+        "Run `jukebox-admin settings set paths.library_backend sqlite` to use it",
+    ]
+
+    (tmp_path / "library.json").unlink()
+    _run_migrate(library_path, CliMigrateCommand(type="migrate", to="json"), library_backend="sqlite")
+
+    assert build_library_repository(library_path, "json").list_discs() == discs
+
+
+def test_execute_library_command_refuses_to_migrate_into_a_non_empty_library(tmp_path):
+    library_path = str(tmp_path / "library.json")
+    build_library_repository(library_path, "json").add_disc("tag-1", Disc(uri="uri:1", metadata=DiscMetadata()))
+    build_library_repository(library_path, "sqlite").add_disc("tag-2", Disc(uri="uri:2", metadata=DiscMetadata()))
+
+    with pytest.raises(ValueError, match="--overwrite"):
+        _run_migrate(library_path, CliMigrateCommand(type="migrate", to="sqlite"))
+
+    _run_migrate(library_path, CliMigrateCommand(type="migrate", to="sqlite", overwrite=True))
+    assert list(build_library_repository(library_path, "sqlite").list_discs()) == ["tag-1"]
+
+
+def test_execute_library_command_migrating_to_json_keeps_the_journaled_backend(tmp_path):
+    library_path = str(tmp_path / "library.json")
+    build_library_repository(library_path, "sqlite").add_disc("tag-1", Disc(uri="uri:1", metadata=DiscMetadata()))
+
+    output = _run_migrate(library_path, CliMigrateCommand(type="migrate", to="json"), library_backend="json_journal")
+
+    assert output == ["Migrated 1 discs from the sqlite library to the json library"]
+    assert list(build_library_repository(library_path, "json_journal").list_discs()) == ["tag-1"]
@@ -4,14 +4,22 @@ from unittest.mock import MagicMock
 import pytest
 
 from jukebox.admin.pn532_command_handlers import (
+    CALIBRATION_MIN_DELAY_SECONDS,
+    PROBE_LATENCY_SAMPLES,
     _parse_pin,
+    calibrate_pn532_timing,
     execute_pn532_command,
     render_pn532_probe_setup_output,
     render_pn532_profiles_output,
     render_pn532_select_output,
 )
-from jukebox.admin.pn532_commands import Pn532ProbeCommand, Pn532ProfilesCommand, Pn532SelectCommand
-from jukebox.pn532.profiles import PN532_PROFILES, SpiConnectionParams
+from jukebox.admin.pn532_commands import (
+    Pn532CalibrateCommand,
+    Pn532ProbeCommand,
+    Pn532ProfilesCommand,
+    Pn532SelectCommand,
+)
+from jukebox.pn532.profiles import DEFAULT_PN532_TIMING, PN532_PROFILES, Pn532TimingParams, SpiConnectionParams
 from jukebox.settings.errors import ErrorCode, InvalidSettingsError
 from jukebox.shared.errors import MissingOptionalDependencyError
 
@@ -21,10 +29,16 @@ def _make_settings_service(board_profile="waveshare_hat"):
     pn532 = MagicMock()
     pn532.board_profile = board_profile
     pn532.protocol = "spi"
+    pn532.detection_mode = "passive_target"
     pn532.read_timeout_seconds = 0.1
     pn532.spi.reset = None
     pn532.spi.cs = None
     pn532.spi.irq = None
+    pn532.spi.max_speed_hz = 1_000_000
+    pn532.spi.transfer_mode = "standard"
+    pn532.timing.write_delay_seconds = None
+    pn532.timing.read_delay_seconds = None
+    pn532.timing.cs_delay_seconds = None
     service.get_effective_settings.return_value.jukebox.reader.pn532 = pn532
     return service
 
@@ -342,6 +356,55 @@ def test_execute_pn532_command_probe_build_reader_receives_protocol_and_connecti
     assert "spi_irq" not in call_kwargs
 
 
+def test_execute_pn532_command_probe_build_reader_receives_detection_mode():
+    service = _make_settings_service()
+    service.get_effective_settings.return_value.jukebox.reader.pn532.detection_mode = "auto_poll"
+    build_fn = _make_reader()
+
+    execute_pn532_command(
+        command=Pn532ProbeCommand(type="pn532_probe"),
+        settings_service=service,
+        build_pn532_reader=build_fn,
+    )
+
+    assert build_fn.call_args.kwargs["detection_mode"] == "auto_poll"
+
+
+def test_execute_pn532_command_probe_reports_latency_per_transfer_mode_and_restores_mode():
+    service = _make_settings_service()
+    stdout_fn = MagicMock()
+    build_fn = _make_reader()
+    reader = build_fn.return_value
+    reader.transfer_mode = "standard"
+    modes_seen = []
+
+    def ping():
+        modes_seen.append(reader.transfer_mode)
+        return reader.transfer_mode == "standard"
+
+    reader.ping.side_effect = ping
+    reader.probe_detection.return_value = True
+
+    execute_pn532_command(
+        command=Pn532ProbeCommand(type="pn532_probe"),
+        settings_service=service,
+        build_pn532_reader=build_fn,
+        stdout_fn=stdout_fn,
+    )
+
+    latency_output = next(c.args[0] for c in stdout_fn.call_args_list if c.args[0].startswith("Round-trip latency"))
+    firmware_line, detection_line = latency_output.splitlines()
+    assert firmware_line.startswith("Round-trip latency (GetFirmwareVersion)")
+    assert "standard=" in firmware_line
+    assert "ms" in firmware_line
+    assert "burst=failed" in firmware_line
+    assert detection_line.startswith("Round-trip latency (target detection)")
+    assert "burst=failed" not in detection_line
+    assert set(modes_seen) == {"standard", "burst"}
+    assert reader.probe_detection.call_count == 2 * PROBE_LATENCY_SAMPLES
+    assert reader.transfer_mode == "standard"
+
+
 def test_execute_pn532_command_probe_shows_no_tag_detected():
     service = _make_settings_service()
     stdout_fn = MagicMock()
@@ -384,3 +447,112 @@ def test_execute_pn532_command_probe_gpio_error_shows_friendly_message(raw_error
             settings_service=service,
             build_pn532_reader=failing_builder,
         )
+
+
+# ── calibrate ──────────────────────────────────────────────────────────────────
+
+
+class _ThresholdReader:
+    """Fake reader whose exchanges fail when any delay is below its threshold.
+
+    Target detection exchanges use *detection_thresholds* when given, so they can
+    fail with delays that GetFirmwareVersion still accepts.
+    """
+
+    def __init__(self, thresholds: Pn532TimingParams, detection_thresholds: Pn532TimingParams | None = None):
+        self.thresholds = thresholds
+        self.detection_thresholds = detection_thresholds or thresholds
+        self.timing = DEFAULT_PN532_TIMING
+        self.firmware_version = (1, 6)
+
+    def _meets(self, thresholds: Pn532TimingParams) -> bool:
+        return all(
+            (getattr(self.timing, f.name) or 0.0) >= (getattr(thresholds, f.name) or 0.0)
+            for f in dataclasses.fields(thresholds)
+        )
+
+    def ping(self) -> bool:
+        return self._meets(self.thresholds)
+
+    def probe_detection(self) -> bool:
+        return self._meets(self.detection_thresholds)
+
+
+def test_calibrate_pn532_timing_keeps_safety_margin_above_shortest_passing_delay():
+    reader = _ThresholdReader(
+        Pn532TimingParams(write_delay_seconds=0.004, read_delay_seconds=0.0, cs_delay_seconds=0.0005)
+    )
+
+    calibrated = calibrate_pn532_timing(reader, DEFAULT_PN532_TIMING, samples=3)
+
+    # 0.02 halves to 0.005 (passes) then 0.0025 (fails): 0.005 x2 = 0.01
+    # 0.005 halves down to 0.0003125, the last value above the floor: 0.0003125 x2 = 0.000625
+    assert calibrated == Pn532TimingParams(
+        write_delay_seconds=0.01, read_delay_seconds=0.000625, cs_delay_seconds=0.001
+    )
+    assert reader.timing == calibrated
+
+
+def test_calibrate_pn532_timing_never_goes_below_the_floor():
+    reader = _ThresholdReader(Pn532TimingParams(write_delay_seconds=0.0, read_delay_seconds=0.0, cs_delay_seconds=0.0))
+
+    calibrated = calibrate_pn532_timing(reader, DEFAULT_PN532_TIMING, samples=1)
+
+    assert calibrated is not None
+    for f in dataclasses.fields(calibrated):
+        assert getattr(calibrated, f.name) >= CALIBRATION_MIN_DELAY_SECONDS
+
+
+def test_calibrate_pn532_timing_validates_delays_with_target_detection_exchanges():
+    reader = _ThresholdReader(
+        thresholds=Pn532TimingParams(write_delay_seconds=0.0, read_delay_seconds=0.0, cs_delay_seconds=0.0),
+        detection_thresholds=Pn532TimingParams(write_delay_seconds=0.01, read_delay_seconds=0.0, cs_delay_seconds=0.0),
+    )
+
+    calibrated = calibrate_pn532_timing(reader, DEFAULT_PN532_TIMING, samples=1)
+
+    # GetFirmwareVersion alone would accept 0.0003125; target detection stops at 0.01.
+    assert calibrated is not None
+    assert calibrated.write_delay_seconds == 0.02
+
+
+def test_calibrate_pn532_timing_returns_none_when_baseline_fails():
+    reader = _ThresholdReader(Pn532TimingParams(write_delay_seconds=1.0, read_delay_seconds=0.0, cs_delay_seconds=0.0))
+
+    assert calibrate_pn532_timing(reader, DEFAULT_PN532_TIMING, samples=3) is None
+
+
+def test_execute_pn532_command_calibrate_persists_calibrated_timing():
+    service = _make_settings_service()
+    stdout_fn = MagicMock()
+    reader = _ThresholdReader(Pn532TimingParams(write_delay_seconds=0.0, read_delay_seconds=0.0, cs_delay_seconds=0.0))
+    build_fn = MagicMock(return_value=reader)
+
+    execute_pn532_command(
+        command=Pn532CalibrateCommand(type="pn532_calibrate", samples=2),
+        settings_service=service,
+        build_pn532_reader=build_fn,
+        stdout_fn=stdout_fn,
+    )
+
+    assert build_fn.call_args.kwargs["timing"] == PN532_PROFILES["waveshare_hat"].timing
+    assert [call.args for call in service.set_persisted_value.call_args_list] == [
+        ("jukebox.reader.pn532.timing.write_delay_seconds", "0.000625"),
+        ("jukebox.reader.pn532.timing.read_delay_seconds", "0.000625"),
+        ("jukebox.reader.pn532.timing.cs_delay_seconds", "0.0005"),
+    ]
+    assert "Calibrated PN532 timing saved" in stdout_fn.call_args.args[0]
+
+
+def test_execute_pn532_command_calibrate_fails_when_default_timing_fails():
+    service = _make_settings_service()
+    reader = _ThresholdReader(Pn532TimingParams(write_delay_seconds=1.0, read_delay_seconds=0.0, cs_delay_seconds=0.0))
+
+    with pytest.raises(RuntimeError, match="fail even with the default timing"):
+        execute_pn532_command(
+            command=Pn532CalibrateCommand(type="pn532_calibrate", samples=2),
+            settings_service=service,
+            build_pn532_reader=MagicMock(return_value=reader),
+        )
+
+    service.set_persisted_value.assert_not_called()
@@ -0,0 +1,77 @@
+from jukebox.domain.entities import Disc, DiscMetadata, DiscSearchIndex
+from jukebox.domain.entities.disc_search_index import fold_text, tokenize
+
+
+def build_disc(**metadata):
+    return Disc(uri="uri", metadata=DiscMetadata(**metadata))
+
+
+def test_fold_text_ignores_case_and_accents():
+    assert fold_text("Beyoncé") == fold_text("BEYONCE") == "beyonce"
+
+
+def test_tokenize_splits_on_punctuation():
+    assert tokenize("tag:Pink-Floyd, Wish You Were Here") == ["tag", "pink", "floyd", "wish", "you", "were", "here"]
+
+
+def test_search_matches_token_prefixes_in_every_field():
+    index = DiscSearchIndex(
+        {
+            "tag:1": build_disc(artist="Sigur Rós"),
+            "tag:2": build_disc(playlist="Rose garden"),
+            "tag:3": build_disc(album="Prose"),
+        }
+    )
+
+    assert list(index.search("ros")) == ["tag:1", "tag:2"]
+    assert list(index.search("ROS")) == ["tag:1", "tag:2"]
+
+
+def test_search_falls_back_to_substrings_when_no_prefix_matches():
+    index = DiscSearchIndex(
+        {
+            "tag:1": build_disc(artist="Thebeatles"),
+            "tag:2": build_disc(artist="Beat Happening"),
+            "tag:3": build_disc(album="Upbeat"),
+        }
+    )
+
+    assert list(index.search("beat")) == ["tag:2"]
+    assert list(index.search("ebeat")) == ["tag:1"]
+    assert list(DiscSearchIndex({"tag:1": build_disc(artist="Thebeatles")}).search("beat")) == ["tag:1"]
+    assert list(index.search("the eat")) == ["tag:1"]
+    assert list(index.search("ink")) == []
+
+
+def test_search_requires_every_query_token():
+    index = DiscSearchIndex(
+        {
+            "tag:1": build_disc(artist="Pink Floyd", album="Animals"),
+            "tag:2": build_disc(artist="Pink Panther"),
+        }
+    )
+
+    assert list(index.search("pink anim")) == ["tag:1"]
+    assert index.search("pink zebra") == {}
+
+
+def test_search_ranks_whole_words_and_metadata_first():
+    index = DiscSearchIndex(
+        {
+            "moon:tag": build_disc(artist="Other"),
+            "tag:2": build_disc(track="Moonlight"),
+            "tag:3": build_disc(album="Dark Side of the Moon"),
+            "tag:4": build_disc(track="Moon river"),
+        }
+    )
+
+    assert list(index.search("moon")) == ["tag:3", "tag:4", "moon:tag", "tag:2"]
+
+
+def test_search_without_words_returns_every_disc_in_library_order():
+    discs = {"tag:2": build_disc(artist="B"), "tag:1": build_disc(artist="A")}
+    index = DiscSearchIndex(discs)
+
+    assert index.search("") == discs
+    assert list(index.search(" :: ")) == ["tag:2", "tag:1"]
+    assert len(index) == 2
@@ -3,8 +3,9 @@ from jukebox.domain.repositories import LibraryRepository
 
 
 class MockRepo(LibraryRepository):
-    def __init__(self, library: Library):
+    def __init__(self, library: Library, invalid_tag_ids: set[str] | None = None):
         self.library = library.model_copy(deep=True)
+        self.invalid_tag_ids = set(invalid_tag_ids or ())
         self.add_calls: list[tuple[str, Disc]] = []
         self.update_calls: list[tuple[str, Disc]] = []
         self.remove_calls: list[str] = []
@@ -19,6 +20,9 @@ class MockRepo(LibraryRepository):
         self.list_calls += 1
         return {tag_id: self._copy_disc(disc) for tag_id, disc in self.library.discs.items()}
 
+    def list_tag_ids(self):
+        return set(self.library.discs) | self.invalid_tag_ids
+
     def get_disc(self, tag_id: str):
         self.get_calls.append(tag_id)
         disc = self.library.discs.get(tag_id)
@@ -33,6 +37,7 @@ class MockRepo(LibraryRepository):
             raise ValueError(f"Already existing tag: tag_id='{tag_id}'")
 
         self.library.discs[tag_id] = self._copy_disc(disc)
+        self.invalid_tag_ids.discard(tag_id)
 
     def update_disc(self, tag_id: str, disc: Disc):
         self.update_calls.append((tag_id, self._copy_disc(disc)))
@@ -43,7 +48,8 @@ class MockRepo(LibraryRepository):
 
     def remove_disc(self, tag_id: str):
         self.remove_calls.append(tag_id)
-        if tag_id not in self.library.discs:
+        if tag_id not in self.library.discs and tag_id not in self.invalid_tag_ids:
             raise ValueError(f"Tag does not exist: tag_id='{tag_id}'")
 
-        self.library.discs.pop(tag_id)
+        self.library.discs.pop(tag_id, None)
+        self.invalid_tag_ids.discard(tag_id)
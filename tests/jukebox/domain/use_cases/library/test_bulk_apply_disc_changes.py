@@ -0,0 +1,96 @@
+import pytest
+
+from jukebox.domain.entities import Disc, DiscChange, DiscChangesSummary, DiscMetadata, Library
+from jukebox.domain.errors import InvalidDiscChangesError
+from jukebox.domain.use_cases.library.bulk_apply_disc_changes import BulkApplyDiscChanges
+
+from .mock_repo import MockRepo
+
+
+def build_disc(uri: str) -> Disc:
+    return Disc(uri=uri, metadata=DiscMetadata())
+
+
+def test_bulk_apply_disc_changes_applies_every_change():
+    repo = MockRepo(Library(discs={"tag:1": build_disc("uri1"), "tag:2": build_disc("uri2")}))
+    use_case = BulkApplyDiscChanges(repo)
+
+    summary = use_case.execute(
+        [
+            DiscChange(action="add", tag_id="tag:3", disc=build_disc("uri3")),
+            DiscChange(action="update", tag_id="tag:1", disc=build_disc("uri1-updated")),
+            DiscChange(action="upsert", tag_id="tag:4", disc=build_disc("uri4")),
+            DiscChange(action="remove", tag_id="tag:2"),
+        ]
+    )
+
+    assert summary == DiscChangesSummary(added=2, updated=1, removed=1)
+    assert repo.library.discs == {
+        "tag:1": build_disc("uri1-updated"),
+        "tag:3": build_disc("uri3"),
+        "tag:4": build_disc("uri4"),
+    }
+
+
+def test_bulk_apply_disc_changes_rejects_the_whole_batch_with_every_error():
+    repo = MockRepo(Library(discs={"tag:1": build_disc("uri1")}))
+    use_case = BulkApplyDiscChanges(repo)
+
+    with pytest.raises(InvalidDiscChangesError) as err:
+        use_case.execute(
+            [
+                DiscChange(action="upsert", tag_id="tag:2", disc=build_disc("uri2")),
+                DiscChange(action="add", tag_id="tag:1", disc=build_disc("uri1")),
+                DiscChange(action="remove", tag_id="tag:missing"),
+                DiscChange(action="remove", tag_id="tag:2"),
+            ]
+        )
+
+    assert err.value.errors == [
+        "Already existing tag: tag_id='tag:1'",
+        "Tag does not exist: tag_id='tag:missing'",
+        "Tag changed more than once: tag_id='tag:2'",
+    ]
+    assert repo.add_calls == []
+    assert repo.update_calls == []
+    assert repo.remove_calls == []
+
+
+def test_bulk_apply_disc_changes_treats_unreadable_tags_like_the_single_disc_use_cases():
+    repo = MockRepo(Library(discs={}), invalid_tag_ids={"tag:1", "tag:2", "tag:3", "tag:4"})
+    use_case = BulkApplyDiscChanges(repo)
+
+    with pytest.raises(InvalidDiscChangesError) as err:
+        use_case.execute([DiscChange(action="update", tag_id="tag:1", disc=build_disc("uri1"))])
+    assert err.value.errors == ["Tag does not exist: tag_id='tag:1'"]
+
+    summary = use_case.execute(
+        [
+            DiscChange(action="remove", tag_id="tag:1"),
+            DiscChange(action="upsert", tag_id="tag:2", disc=build_disc("uri2")),
+            DiscChange(action="add", tag_id="tag:3", disc=build_disc("uri3")),
+        ]
+    )
+
+    assert summary == DiscChangesSummary(added=1, updated=1, removed=1)
+    assert repo.library.discs == {"tag:2": build_disc("uri2"), "tag:3": build_disc("uri3")}
+    assert repo.invalid_tag_ids == {"tag:4"}
+
+
+def test_bulk_apply_disc_changes_does_not_write_an_empty_batch():
+    repo = MockRepo(Library(discs={}))
+
+    assert BulkApplyDiscChanges(repo).execute([]) == DiscChangesSummary()
+    assert repo.add_calls == []
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"action": "add", "tag_id": "tag:1"},
+        {"action": "remove", "tag_id": "tag:1", "disc": {"uri": "uri1", "metadata": {}}},
+    ],
+)
+def test_disc_change_requires_a_disc_unless_removing(payload):
+    with pytest.raises(ValueError):
+        DiscChange.model_validate(payload)
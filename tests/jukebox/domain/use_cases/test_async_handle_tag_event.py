@@ -0,0 +1,84 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from jukebox.domain.entities import (
+    PLAYBACK_RETRY_DELAYS_SECONDS,
+    Disc,
+    DiscMetadata,
+    DiscOption,
+    Idle,
+    Paused,
+    Playing,
+    TagEvent,
+    TransitionContext,
+    Waiting,
+)
+from jukebox.domain.errors import PlaybackError
+from jukebox.domain.ports import AsyncPlayerPort
+from jukebox.domain.use_cases import AsyncHandleTagEvent
+
+
+@pytest.fixture
+def mock_player():
+    return AsyncMock(spec=AsyncPlayerPort)
+
+
+@pytest.fixture
+def mock_library():
+    library = MagicMock()
+    library.get_disc.return_value = Disc(
+        uri="uri:123",
+        metadata=DiscMetadata(artist="Test Artist", album="Test Album", track="Test Track"),
+        option=DiscOption(shuffle=True),
+    )
+    return library
+
+
+@pytest.fixture
+def handle_tag_event(mock_player, mock_library):
+    ctx = TransitionContext(pause_delay=3, max_pause_duration=50, retry_delays=PLAYBACK_RETRY_DELAYS_SECONDS)
+    return AsyncHandleTagEvent(player=mock_player, library=mock_library, ctx=ctx)
+
+
+def test_async_play_awaits_player_and_updates_state(handle_tag_event, mock_player, mock_library):
+    new_state = asyncio.run(handle_tag_event.execute(TagEvent(tag_id="tag-1", timestamp=100.0), Idle()))
+
+    assert new_state == Playing(tag="tag-1")
+    mock_library.get_disc.assert_called_once_with("tag-1")
+    mock_player.play.assert_awaited_once_with("uri:123", True)
+
+
+def test_async_same_tag_while_playing_skips_library_lookup(handle_tag_event, mock_player, mock_library):
+    new_state = asyncio.run(handle_tag_event.execute(TagEvent(tag_id="tag-1", timestamp=100.0), Playing(tag="tag-1")))
+
+    assert new_state == Playing(tag="tag-1")
+    mock_library.get_disc.assert_not_called()
+    mock_player.play.assert_not_awaited()
+
+
+def test_async_pause_after_removal_delay(handle_tag_event, mock_player):
+    state = Waiting(tag="tag-1", removed_at=100.0)
+
+    new_state = asyncio.run(handle_tag_event.execute(TagEvent(tag_id=None, timestamp=104.0), state))
+
+    assert new_state == Paused(tag="tag-1", paused_at=104.0)
+    mock_player.pause.assert_awaited_once_with()
+
+
+def test_async_player_failure_keeps_state_and_schedules_retry(handle_tag_event, mock_player):
+    mock_player.play.side_effect = PlaybackError("speaker unreachable")
+
+    new_state = asyncio.run(handle_tag_event.execute(TagEvent(tag_id="tag-1", timestamp=100.0), Idle()))
+
+    assert isinstance(new_state, Idle)
+    assert new_state.retry is not None
+    assert new_state.retry.action == "play"
+    assert new_state.retry.next_retry_at == pytest.approx(100.0 + PLAYBACK_RETRY_DELAYS_SECONDS[0])
+
+    mock_player.play.reset_mock()
+    retried_state = asyncio.run(handle_tag_event.execute(TagEvent(tag_id="tag-1", timestamp=100.05), new_state))
+
+    assert retried_state is new_state
+    mock_player.play.assert_not_awaited()
@@ -14,8 +14,9 @@ from jukebox.domain.entities import (
     TransitionContext,
     Waiting,
 )
-from jukebox.domain.errors import PlaybackError
+from jukebox.domain.errors import PlaybackError, PlayerUnreachableError
 from jukebox.domain.use_cases.handle_tag_event import HandleTagEvent
+from jukebox.domain.use_cases.prefetch_disc import PrefetchDisc
 
 
 @pytest.fixture
@@ -313,6 +314,17 @@ def test_handle_play_failure_keeps_retry_after_brief_missed_read(handle_tag_even
     assert state.retry.next_retry_at == pytest.approx(100.1)
 
 
+def test_handle_play_failure_waits_until_unreachable_player_can_be_retried(handle_tag_event, mock_player):
+    mock_player.play.side_effect = PlayerUnreachableError("speaker offline", retry_after_seconds=7.5)
+
+    state = handle_tag_event.execute(TagEvent(tag_id="test-tag", timestamp=100.0), Idle())
+    state = handle_tag_event.execute(TagEvent(tag_id="test-tag", timestamp=105.0), state)
+
+    mock_player.play.assert_called_once()
+    assert state.retry is not None
+    assert state.retry.next_retry_at == pytest.approx(107.5)
+
+
 def test_handle_play_failure_gives_up_after_retry_delays_are_exhausted(mock_player, mock_library):
     ctx = TransitionContext(pause_delay=3, max_pause_duration=50, retry_delays=(0.5,))
     hte = HandleTagEvent(player=mock_player, library=mock_library, ctx=ctx)
@@ -550,3 +562,16 @@ def test_handle_stop_failure_gives_up_after_retry_delays_are_exhausted(mock_play
     assert state.retry.attempt_count == 2
     assert state.retry.exhausted is True
     assert state.retry.next_retry_at is None
+
+
+def test_handle_play_uses_prefetched_disc(mock_player, mock_library, ctx):
+    prefetch_disc = PrefetchDisc(library=mock_library, player=mock_player)
+    handle_tag_event = HandleTagEvent(player=mock_player, library=mock_library, ctx=ctx, prefetch_disc=prefetch_disc)
+
+    prefetch_disc.execute(TagEvent(tag_id="tag-1", timestamp=0.0))
+    state = handle_tag_event.execute(TagEvent(tag_id="tag-1", timestamp=0.1), Idle())
+
+    assert state == Playing(tag="tag-1")
+    mock_library.get_disc.assert_called_once_with("tag-1")
+    mock_player.prepare.assert_called_once_with("uri:123")
+    mock_player.play.assert_called_once_with("uri:123", False)
@@ -0,0 +1,81 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from jukebox.domain.entities import Disc, DiscMetadata, TagEvent
+from jukebox.domain.use_cases.prefetch_disc import PrefetchDisc
+
+
+def build_disc(uri="uri:123"):
+    return Disc(uri=uri, metadata=DiscMetadata(artist="Test Artist"))
+
+
+@pytest.fixture
+def library():
+    library = MagicMock()
+    library.revision.return_value = (1, 100)
+    library.get_disc.return_value = build_disc()
+    return library
+
+
+def test_get_disc_reuses_disc_until_library_revision_changes(library):
+    prefetch_disc = PrefetchDisc(library=library)
+
+    assert prefetch_disc.get_disc("tag-1") == build_disc()
+    prefetch_disc.get_disc("tag-1")
+    assert library.get_disc.call_count == 1
+
+    library.revision.return_value = (2, 120)
+    library.get_disc.return_value = build_disc("uri:456")
+
+    assert prefetch_disc.get_disc("tag-1").uri == "uri:456"
+    assert library.get_disc.call_count == 2
+
+
+def test_get_disc_remembers_unknown_tags(library):
+    library.get_disc.return_value = None
+    prefetch_disc = PrefetchDisc(library=library)
+
+    assert prefetch_disc.get_disc("unknown") is None
+    assert prefetch_disc.get_disc("unknown") is None
+    library.get_disc.assert_called_once_with("unknown")
+
+
+def test_get_disc_queries_library_every_time_without_revision(library):
+    library.revision.return_value = None
+    prefetch_disc = PrefetchDisc(library=library)
+
+    prefetch_disc.get_disc("tag-1")
+    prefetch_disc.get_disc("tag-1")
+
+    assert library.get_disc.call_count == 2
+
+
+def test_get_disc_forgets_least_recently_used_tag(library):
+    prefetch_disc = PrefetchDisc(library=library, max_size=2)
+
+    for tag_id in ("tag-1", "tag-2", "tag-1", "tag-3", "tag-1", "tag-2"):
+        prefetch_disc.get_disc(tag_id)
+
+    assert [call.args[0] for call in library.get_disc.call_args_list] == ["tag-1", "tag-2", "tag-3", "tag-2"]
+
+
+def test_execute_prepares_player_for_every_tag_and_skips_no_tag(library):
+    player = MagicMock()
+    prefetch_disc = PrefetchDisc(library=library, player=player)
+
+    for tag_id in ("tag-1", None, "tag-1"):
+        prefetch_disc.execute(TagEvent(tag_id=tag_id, timestamp=0.0))
+
+    assert player.prepare.call_count == 2
+    player.prepare.assert_called_with("uri:123")
+
+
+def test_execute_swallows_prefetch_errors(library):
+    player = MagicMock()
+    player.prepare.side_effect = RuntimeError("boom")
+    prefetch_disc = PrefetchDisc(library=library, player=player)
+
+    prefetch_disc.execute(TagEvent(tag_id="tag-1", timestamp=0.0))
+
+    player.prepare.assert_called_once_with("uri:123")
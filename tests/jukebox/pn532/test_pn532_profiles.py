@@ -2,7 +2,14 @@ from dataclasses import dataclass
 
 import pytest
 
-from jukebox.pn532.profiles import PN532_PROFILES, SpiConnectionParams, resolve_connection_params
+from jukebox.pn532.profiles import (
+    DEFAULT_PN532_TIMING,
+    PN532_PROFILES,
+    Pn532TimingParams,
+    SpiConnectionParams,
+    resolve_connection_params,
+    resolve_timing_params,
+)
 
 
 def test_waveshare_hat_profile_defaults():
@@ -96,3 +103,13 @@ def test_resolve_connection_params_raises_for_mismatched_override_type():
             "spi",
             UartConnectionParams(tx=None, rx=None),  # ty: ignore[invalid-argument-type]
         )
+
+
+def test_resolve_timing_params_uses_profile_defaults_for_none_fields():
+    resolved = resolve_timing_params(
+        "waveshare_hat",
+        Pn532TimingParams(write_delay_seconds=0.002, read_delay_seconds=None, cs_delay_seconds=0.0),
+    )
+    assert resolved.write_delay_seconds == 0.002
+    assert resolved.read_delay_seconds == DEFAULT_PN532_TIMING.read_delay_seconds
+    assert resolved.cs_delay_seconds == 0.0
@@ -58,6 +58,7 @@ class StubSonosService:
         self.inspected_group = inspected_group
         self.error = error
         self.calls = []
+        self.invalidated_targets = []
 
     def resolve_selected_group(self, selected_group):
         self.calls.append(selected_group)
@@ -73,6 +74,9 @@ class StubSonosService:
         assert self.resolved_group is not None
         return self.resolved_group
 
+    def invalidate_playback_target(self, target):
+        self.invalidated_targets.append(target)
+
     def inspect_selected_group(self, selected_group):
         self.calls.append(selected_group)
         if self.error is not None:
@@ -84,7 +84,7 @@ def test_build_editable_setting_displays_flattens_values_and_collapses_object_pr
         },
     )
 
-    assert displays[0].path == "paths.library_path"
+    assert [display.path for display in displays[:2]] == ["paths.library_backend", "paths.library_path"]
     assert displays[0].section_label == "Paths"
     assert displays[0].section_description == "Shared file locations used by the admin tools and jukebox runtime."
 
@@ -2,8 +2,10 @@ import json
 import os
 
 import pytest
+from pydantic import ValidationError
 
 from jukebox.pn532.profiles import SpiConnectionParams
+from jukebox.settings.entities import SparsePn532SpiSettings
 from jukebox.settings.errors import InvalidSettingsError
 from jukebox.settings.file_settings_repository import FileSettingsRepository
 from jukebox.settings.resolve import SettingsService, build_environment_settings_overrides
@@ -324,6 +326,102 @@ def test_settings_service_applies_board_profile_cli_override_at_runtime(tmp_path
     assert runtime_config.pn532_connection.cs == 8  # hiletgo_v3 default
 
 
+def test_runtime_resolver_defaults_and_overrides_pn532_detection_mode(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
+
+    default_config = resolve_jukebox_runtime(SettingsService(repository=FileSettingsRepository(str(settings_path))))
+    override_config = resolve_jukebox_runtime(
+        SettingsService(
+            repository=FileSettingsRepository(str(settings_path)),
+            cli_overrides={"jukebox": {"reader": {"pn532": {"detection_mode": "auto_poll"}}}},
+        )
+    )
+
+    assert default_config.pn532_detection_mode == "passive_target"
+    assert override_config.pn532_detection_mode == "auto_poll"
+
+
+def test_runtime_resolver_resolves_pn532_power_down_after_seconds(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
+    service = SettingsService(repository=FileSettingsRepository(str(settings_path)))
+
+    assert resolve_jukebox_runtime(service).pn532_power_down_after_seconds is None
+
+    service.set_persisted_value("jukebox.reader.pn532.power_down_after_seconds", "300")
+
+    assert resolve_jukebox_runtime(service).pn532_power_down_after_seconds == 300
+
+
+def test_runtime_resolver_resolves_pn532_spi_clock_and_transfer_mode(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "jukebox": {"reader": {"pn532": {"spi": {"max_speed_hz": 4000000, "transfer_mode": "burst"}}}},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    runtime_config = resolve_jukebox_runtime(SettingsService(repository=FileSettingsRepository(str(settings_path))))
+
+    assert runtime_config.pn532_spi_max_speed_hz == 4_000_000
+    assert runtime_config.pn532_spi_transfer_mode == "burst"
+
+
+def test_runtime_resolver_resolves_threaded_reader_mode(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(
+        json.dumps({"schema_version": 1, "jukebox": {"runtime": {"reader_mode": "threaded", "event_queue_size": 4}}}),
+        encoding="utf-8",
+    )
+
+    runtime_config = resolve_jukebox_runtime(SettingsService(repository=FileSettingsRepository(str(settings_path))))
+
+    assert runtime_config.reader_mode == "threaded"
+    assert runtime_config.event_queue_size == 4
+    assert runtime_config.loop_pacing == "fixed"
+
+
+def test_runtime_resolver_resolves_adaptive_pacing(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(
+        json.dumps(
+            {
+                "schema_version": 1,
+                "jukebox": {
+                    "runtime": {"pacing": "adaptive", "idle_loop_interval_seconds": 0.5, "idle_after_seconds": 10}
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    runtime_config = resolve_jukebox_runtime(SettingsService(repository=FileSettingsRepository(str(settings_path))))
+
+    assert runtime_config.loop_pacing == "adaptive"
+    assert runtime_config.idle_loop_interval_seconds == 0.5
+    assert runtime_config.idle_after_seconds == 10
+
+
+def test_settings_service_rejects_pn532_spi_clock_above_datasheet_limit(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
+    service = SettingsService(repository=FileSettingsRepository(str(settings_path)))
+
+    with pytest.raises(InvalidSettingsError):
+        service.set_persisted_value("jukebox.reader.pn532.spi.max_speed_hz", "10000000")
+
+
+@pytest.mark.parametrize("max_speed_hz", [0, 10_000_000])
+def test_sparse_spi_settings_reject_out_of_range_clock(max_speed_hz):
+    with pytest.raises(ValidationError):
+        SparsePn532SpiSettings(max_speed_hz=max_speed_hz)
+
+
 def test_settings_service_applies_spi_pin_cli_override_at_runtime(tmp_path):
     settings_path = tmp_path / "settings.json"
     settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
@@ -338,3 +436,27 @@ def test_settings_service_applies_spi_pin_cli_override_at_runtime(tmp_path):
     assert isinstance(runtime_config.pn532_connection, SpiConnectionParams)
     assert runtime_config.pn532_connection.reset == 24  # cli override
     assert runtime_config.pn532_connection.cs == 4  # waveshare_hat default (default profile)
+
+
+def test_runtime_resolver_resolves_sonos_play_strategy(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
+    service = SettingsService(repository=FileSettingsRepository(str(settings_path)))
+
+    assert resolve_jukebox_runtime(service).sonos_play_strategy == "standard"
+
+    service.set_persisted_value("jukebox.player.sonos.play_strategy", "fast")
+
+    assert resolve_jukebox_runtime(service).sonos_play_strategy == "fast"
+
+
+def test_runtime_resolver_resolves_sonos_event_subscription(tmp_path):
+    settings_path = tmp_path / "settings.json"
+    settings_path.write_text(json.dumps({"schema_version": 1}), encoding="utf-8")
+    service = SettingsService(repository=FileSettingsRepository(str(settings_path)))
+
+    assert resolve_jukebox_runtime(service).sonos_event_subscription == "disabled"
+
+    service.set_persisted_value("jukebox.player.sonos.event_subscription", "enabled")
+
+    assert resolve_jukebox_runtime(service).sonos_event_subscription == "enabled"
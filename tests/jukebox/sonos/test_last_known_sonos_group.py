@@ -0,0 +1,190 @@
+from jukebox.settings.entities import SelectedSonosGroupSettings, SelectedSonosSpeakerSettings
+from jukebox.sonos.discovery import DiscoveredSonosSpeaker, SonosDiscoveryError
+from jukebox.sonos.service import DefaultSonosService, playback_target_from_runtime_group
+from tests.jukebox.settings._helpers import build_resolved_sonos_group_runtime
+
+
+class StubDiscovery:
+    def __init__(self, network_speakers, unreachable_hosts=()):
+        self.network_speakers = network_speakers
+        self.unreachable_hosts = set(unreachable_hosts)
+        self.requests = []
+
+    def discover_speakers(self):
+        self.requests.append(("network", None))
+        return list(self.network_speakers)
+
+    def discover_household_speakers(self, household_id):
+        self.requests.append(("household", household_id))
+        return [speaker for speaker in self.network_speakers if speaker.household_id == household_id]
+
+    def inspect_speaker(self, uid, host):
+        self.requests.append(("inspect", host))
+        speaker = next((speaker for speaker in self.network_speakers if speaker.host == host), None)
+        if host in self.unreachable_hosts or speaker is None:
+            raise SonosDiscoveryError(f"Failed to contact saved Sonos speaker at {host}")
+        if speaker.uid != uid:
+            raise SonosDiscoveryError(f"Saved Sonos speaker {uid} is not at {host}")
+        return speaker
+
+
+class InMemoryGroupCache:
+    def __init__(self, group=None):
+        self.group = group
+        self.saved = []
+
+    def load(self):
+        return self.group
+
+    def save(self, group):
+        self.saved.append(group)
+        self.group = group
+
+    def clear(self):
+        self.group = None
+
+
+def build_discovered_speaker(uid, name, host, household_id="household-1"):
+    return DiscoveredSonosSpeaker(uid=uid, name=name, host=host, household_id=household_id, is_visible=True)
+
+
+SELECTED_GROUP = SelectedSonosGroupSettings(
+    household_id="household-1",
+    coordinator_uid="speaker-1",
+    members=[SelectedSonosSpeakerSettings(uid="speaker-1")],
+)
+
+SELECTED_PAIR = SelectedSonosGroupSettings(
+    household_id="household-1",
+    coordinator_uid="speaker-1",
+    members=[SelectedSonosSpeakerSettings(uid="speaker-1"), SelectedSonosSpeakerSettings(uid="speaker-2")],
+)
+
+
+def build_cached_pair():
+    return build_resolved_sonos_group_runtime(
+        speakers=[
+            ("speaker-1", "Living Room", "192.168.1.20", "household-1"),
+            ("speaker-2", "Kitchen", "192.168.1.30", "household-1"),
+        ],
+    )
+
+
+def test_resolve_selected_group_uses_last_known_group_when_coordinator_answers():
+    cached_group = build_resolved_sonos_group_runtime()
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Living Room", "192.168.1.20")])
+    group_cache = InMemoryGroupCache(cached_group)
+
+    resolved_group = DefaultSonosService(discovery, group_cache=group_cache).resolve_selected_group(SELECTED_GROUP)
+
+    assert resolved_group == cached_group
+    assert discovery.requests == [("inspect", "192.168.1.20")]
+    assert group_cache.saved == []
+
+
+def test_resolve_selected_group_discovers_and_saves_when_last_known_coordinator_moved():
+    discovery = StubDiscovery(
+        [build_discovered_speaker("speaker-1", "Living Room", "192.168.1.25")],
+        unreachable_hosts={"192.168.1.20"},
+    )
+    group_cache = InMemoryGroupCache(build_resolved_sonos_group_runtime())
+
+    resolved_group = DefaultSonosService(discovery, group_cache=group_cache).resolve_selected_group(SELECTED_GROUP)
+
+    assert resolved_group.coordinator.host == "192.168.1.25"
+    assert discovery.requests == [("inspect", "192.168.1.20"), ("household", "household-1")]
+    assert group_cache.saved == [resolved_group]
+
+
+def test_resolve_selected_group_ignores_last_known_group_of_another_selection():
+    discovery = StubDiscovery(
+        [
+            build_discovered_speaker("speaker-1", "Living Room", "192.168.1.20"),
+            build_discovered_speaker("speaker-2", "Kitchen", "192.168.1.30"),
+        ]
+    )
+    group_cache = InMemoryGroupCache(build_resolved_sonos_group_runtime())
+    selected_group = SelectedSonosGroupSettings(
+        household_id="household-1",
+        coordinator_uid="speaker-1",
+        members=[SelectedSonosSpeakerSettings(uid="speaker-1"), SelectedSonosSpeakerSettings(uid="speaker-2")],
+    )
+
+    resolved_group = DefaultSonosService(discovery, group_cache=group_cache).resolve_selected_group(selected_group)
+
+    assert [member.uid for member in resolved_group.members] == ["speaker-1", "speaker-2"]
+    assert discovery.requests == [("household", "household-1")]
+
+
+def test_resolve_selected_group_rediscovers_last_known_group_with_missing_members():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Living Room", "192.168.1.20")])
+    group_cache = InMemoryGroupCache(build_resolved_sonos_group_runtime(missing_member_uids=["speaker-2"]))
+    selected_group = SelectedSonosGroupSettings(
+        household_id="household-1",
+        coordinator_uid="speaker-1",
+        members=[SelectedSonosSpeakerSettings(uid="speaker-1"), SelectedSonosSpeakerSettings(uid="speaker-2")],
+    )
+
+    DefaultSonosService(discovery, group_cache=group_cache).resolve_selected_group(selected_group)
+
+    assert ("inspect", "192.168.1.20") not in discovery.requests
+
+
+def test_resolve_selected_group_probes_every_last_known_member():
+    discovery = StubDiscovery(
+        [
+            build_discovered_speaker("speaker-1", "Living Room", "192.168.1.20"),
+            build_discovered_speaker("speaker-2", "Kitchen", "192.168.1.30"),
+        ]
+    )
+    cached_group = build_cached_pair()
+
+    resolved_group = DefaultSonosService(
+        discovery, group_cache=InMemoryGroupCache(cached_group)
+    ).resolve_selected_group(SELECTED_PAIR)
+
+    assert resolved_group == cached_group
+    assert sorted(discovery.requests) == [("inspect", "192.168.1.20"), ("inspect", "192.168.1.30")]
+
+
+def test_resolve_selected_group_discovers_when_a_last_known_member_is_unreachable():
+    discovery = StubDiscovery(
+        [build_discovered_speaker("speaker-1", "Living Room", "192.168.1.20")],
+        unreachable_hosts={"192.168.1.30"},
+    )
+    group_cache = InMemoryGroupCache(build_cached_pair())
+
+    resolved_group = DefaultSonosService(discovery, group_cache=group_cache).resolve_selected_group(SELECTED_PAIR)
+
+    assert [member.uid for member in resolved_group.members] == ["speaker-1"]
+    assert resolved_group.missing_member_uids == ["speaker-2"]
+    assert ("household", "household-1") in discovery.requests
+    assert group_cache.saved == [resolved_group]
+
+
+def test_resolve_selected_group_discovers_when_last_known_members_swapped_hosts():
+    discovery = StubDiscovery(
+        [
+            build_discovered_speaker("speaker-1", "Living Room", "192.168.1.30"),
+            build_discovered_speaker("speaker-2", "Kitchen", "192.168.1.20"),
+        ]
+    )
+
+    resolved_group = DefaultSonosService(
+        discovery, group_cache=InMemoryGroupCache(build_cached_pair())
+    ).resolve_selected_group(SELECTED_PAIR)
+
+    assert {member.uid: member.host for member in resolved_group.members} == {
+        "speaker-1": "192.168.1.30",
+        "speaker-2": "192.168.1.20",
+    }
+    assert ("household", "household-1") in discovery.requests
+
+
+def test_invalidate_playback_target_forgets_the_last_known_group():
+    group_cache = InMemoryGroupCache(build_resolved_sonos_group_runtime())
+    service = DefaultSonosService(StubDiscovery([]), group_cache=group_cache)
+
+    service.invalidate_playback_target(playback_target_from_runtime_group(group_cache.group))
+
+    assert group_cache.load() is None
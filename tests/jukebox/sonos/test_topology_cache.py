@@ -0,0 +1,171 @@
+import pytest
+
+from jukebox.settings.entities import SelectedSonosGroupSettings, SelectedSonosSpeakerSettings
+from jukebox.sonos.discovery import DiscoveredSonosSpeaker, SonosDiscoveryError
+from jukebox.sonos.service import DefaultSonosService, SonosPlaybackTarget
+from jukebox.sonos.topology_cache import SonosTopologyCache
+
+
+class StubDiscovery:
+    def __init__(self, network_speakers, error=None):
+        self.network_speakers = network_speakers
+        self.error = error
+        self.requests = []
+
+    def discover_speakers(self):
+        self.requests.append(("network", None))
+        if self.error is not None:
+            raise self.error
+        return list(self.network_speakers)
+
+    def discover_household_speakers(self, household_id):
+        self.requests.append(("household", household_id))
+        if self.error is not None:
+            raise self.error
+        return [speaker for speaker in self.network_speakers if speaker.household_id == household_id]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def build_discovered_speaker(uid, name, host, household_id="household-1"):
+    return DiscoveredSonosSpeaker(uid=uid, name=name, host=host, household_id=household_id, is_visible=True)
+
+
+def build_selected_group(coordinator_uid, *uids):
+    return SelectedSonosGroupSettings(
+        household_id="household-1",
+        coordinator_uid=coordinator_uid,
+        members=[SelectedSonosSpeakerSettings(uid=uid) for uid in uids],
+    )
+
+
+def test_topology_cache_reuses_discovery_until_ttl_expires():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    clock = FakeClock()
+    cache = SonosTopologyCache(discovery, ttl_seconds=60.0, clock=clock)
+
+    cache.discover_speakers()
+    clock.now += 59.0
+    cache.discover_speakers()
+    assert discovery.requests == [("network", None)]
+
+    clock.now += 1.0
+    cache.discover_speakers()
+    assert discovery.requests == [("network", None), ("network", None)]
+
+
+def test_topology_cache_answers_household_lookups_from_network_discovery():
+    discovery = StubDiscovery(
+        [
+            build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30", "household-1"),
+            build_discovered_speaker("speaker-2", "Office", "192.168.1.40", "household-2"),
+        ]
+    )
+    cache = SonosTopologyCache(discovery, clock=FakeClock())
+
+    cache.discover_speakers()
+    speakers = cache.discover_household_speakers("household-2")
+
+    assert [speaker.uid for speaker in speakers] == ["speaker-2"]
+    assert discovery.requests == [("network", None)]
+
+
+def test_topology_cache_invalidation_drops_household_and_network_entries():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    cache = SonosTopologyCache(discovery, clock=FakeClock())
+    cache.discover_speakers()
+
+    assert cache.invalidate("household-1") is True
+    assert cache.invalidate("household-1") is False
+
+    cache.discover_household_speakers("household-1")
+    cache.discover_speakers()
+    assert discovery.requests == [("network", None), ("household", "household-1"), ("network", None)]
+
+
+def test_topology_cache_does_not_remember_failed_discovery():
+    discovery = StubDiscovery([], error=SonosDiscoveryError("multicast failed"))
+    cache = SonosTopologyCache(discovery, clock=FakeClock())
+
+    with pytest.raises(SonosDiscoveryError):
+        cache.discover_speakers()
+    discovery.error = None
+    cache.discover_speakers()
+
+    assert discovery.requests == [("network", None), ("network", None)]
+
+
+def test_sonos_service_rediscovers_when_cached_topology_misses_the_coordinator():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    clock = FakeClock()
+    topology_cache = SonosTopologyCache(discovery, clock=clock)
+    service = DefaultSonosService(topology_cache, topology_cache=topology_cache)
+    service.list_network_speakers()
+    clock.now += 5.0
+    discovery.network_speakers.append(build_discovered_speaker("speaker-2", "Living Room", "192.168.1.40"))
+
+    resolved_group = service.resolve_selected_group(build_selected_group("speaker-2", "speaker-1", "speaker-2"))
+
+    assert resolved_group.coordinator.host == "192.168.1.40"
+    assert discovery.requests == [("network", None), ("household", "household-1")]
+
+
+def test_sonos_service_does_not_rediscover_a_topology_it_just_discovered():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    topology_cache = SonosTopologyCache(discovery, clock=FakeClock())
+    service = DefaultSonosService(topology_cache, topology_cache=topology_cache)
+
+    inspection = service.inspect_selected_group(build_selected_group("speaker-2", "speaker-2"))
+
+    assert inspection.error_message is not None
+    assert discovery.requests == [("household", "household-1"), ("network", None)]
+
+
+def test_sonos_service_invalidates_cached_playback_target_household():
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    topology_cache = SonosTopologyCache(discovery, clock=FakeClock())
+    service = DefaultSonosService(topology_cache, topology_cache=topology_cache)
+    service.list_network_speakers()
+
+    service.invalidate_playback_target(
+        SonosPlaybackTarget(household_id="household-1", coordinator_uid="speaker-1", member_uids=("speaker-1",))
+    )
+    service.list_network_speakers()
+
+    assert discovery.requests == [("network", None), ("network", None)]
+
+
+def test_sonos_service_invalidates_the_injected_topology_cache():
+    class RecordingTopologyCache:
+        clock = FakeClock()
+
+        def __init__(self):
+            self.invalidated = []
+
+        def invalidate(self, household_id=None, discovered_before=None):
+            self.invalidated.append((household_id, discovered_before))
+            return False
+
+    discovery = StubDiscovery([build_discovered_speaker("speaker-1", "Kitchen", "192.168.1.30")])
+    topology_cache = RecordingTopologyCache()
+    service = DefaultSonosService(discovery, topology_cache=topology_cache)
+
+    inspection = service.inspect_selected_group(build_selected_group("speaker-2", "speaker-2"))
+    service.invalidate_playback_target(
+        SonosPlaybackTarget(household_id="household-1", coordinator_uid="speaker-1", member_uids=("speaker-1",))
+    )
+
+    assert inspection.error_message is not None
+    assert topology_cache.invalidated == [("household-1", 100.0), ("household-1", None)]
+
+
+def test_sonos_service_without_topology_cache_has_nothing_to_invalidate():
+    service = DefaultSonosService(StubDiscovery([]))
+
+    assert service.invalidate_topology("household-1") is False
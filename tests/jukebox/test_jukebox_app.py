@@ -19,8 +19,13 @@ def app_mocks(mocker):
         set_logger = mocker.patch("jukebox.app.set_logger")
         build_settings_service = mocker.patch("jukebox.app.build_settings_service")
         build_runtime_resolver = mocker.patch("jukebox.app.build_runtime_resolver")
+        build_sonos_service = mocker.patch("jukebox.app.build_sonos_service")
         build_jukebox = mocker.patch("jukebox.app.build_jukebox")
+        build_async_jukebox = mocker.patch("jukebox.app.build_async_jukebox")
+        build_loop_pacer = mocker.patch("jukebox.app.build_loop_pacer")
+        build_reader_power_saver = mocker.patch("jukebox.app.build_reader_power_saver")
         controller_class = mocker.patch("jukebox.app.CLIController")
+        async_controller_class = mocker.patch("jukebox.app.AsyncCLIController")
 
     return Mocks()
 
@@ -52,14 +57,59 @@ def test_main_uses_resolved_runtime_config(app_mocks):
     app_mocks.build_settings_service.assert_called_once_with(
         **{k: v for k, v in asdict(app.JukeboxCliState()).items() if k != "verbose"}
     )
-    app_mocks.build_runtime_resolver.assert_called_once_with(settings_service)
+    app_mocks.build_runtime_resolver.assert_called_once_with(
+        settings_service, app_mocks.build_sonos_service.return_value
+    )
     runtime_resolver.resolve.assert_called_once_with(verbose=False)
-    app_mocks.build_jukebox.assert_called_once_with(runtime_config)
+    app_mocks.build_jukebox.assert_called_once_with(runtime_config, app_mocks.build_sonos_service.return_value)
     app_mocks.controller_class.assert_called_once()
     assert app_mocks.controller_class.call_args.kwargs["loop_interval_seconds"] == 0.5
+    assert app_mocks.controller_class.call_args.kwargs["reader_mode"] == "inline"
     app_mocks.controller_class.return_value.run.assert_called_once_with()
 
 
+def test_main_runs_async_controller_in_async_reader_mode(app_mocks):
+    runtime_config = ResolvedJukeboxRuntimeConfig(
+        library_path="/resolved/library.json",
+        player_type="dryrun",
+        reader_type="dryrun",
+        pause_duration_seconds=100,
+        pause_delay_seconds=1.0,
+        loop_interval_seconds=0.5,
+        reader_mode="async",
+        event_queue_size=4,
+        pn532_read_timeout_seconds=0.1,
+        pn532_board_profile="waveshare_hat",
+        pn532_connection=SpiConnectionParams(reset=20, cs=4, irq=None),
+    )
+    runtime_resolver = MagicMock()
+    runtime_resolver.resolve.return_value = runtime_config
+    app_mocks.build_runtime_resolver.return_value = runtime_resolver
+    reader, handle_tag_event, sync_current_tag = MagicMock(), MagicMock(), MagicMock()
+    app_mocks.build_async_jukebox.return_value = (reader, handle_tag_event, sync_current_tag)
+
+    result = runner.invoke(app.app)
+
+    assert result.exit_code == 0
+    app_mocks.build_async_jukebox.assert_called_once_with(runtime_config, app_mocks.build_sonos_service.return_value)
+    app_mocks.build_jukebox.assert_not_called()
+    app_mocks.controller_class.assert_not_called()
+    app_mocks.async_controller_class.assert_called_once_with(
+        reader=reader,
+        handle_tag_event=handle_tag_event,
+        sync_current_tag=sync_current_tag,
+        loop_interval_seconds=0.5,
+        event_queue_size=4,
+        pacer=app_mocks.build_loop_pacer.return_value,
+        power_saver=app_mocks.build_reader_power_saver.return_value,
+        prefetch_disc=handle_tag_event.prefetch_disc,
+        player=handle_tag_event.player,
+    )
+    app_mocks.build_loop_pacer.assert_called_once_with(runtime_config, reader.read_budget_seconds)
+    app_mocks.build_reader_power_saver.assert_called_once_with(runtime_config, reader)
+    app_mocks.async_controller_class.return_value.run.assert_called_once_with()
+
+
 def test_main_exits_on_settings_error(app_mocks):
     app_mocks.build_settings_service.side_effect = InvalidSettingsError(
         "broken settings", code=ErrorCode.INVALID_EFFECTIVE
@@ -176,15 +226,25 @@ def test_main_builds_runtime_from_cli_arguments(mocker, app_mocks, args, expecte
     app_mocks.build_settings_service.assert_called_once_with(
         **{k: v for k, v in asdict(expected_config).items() if k != "verbose"}
     )
-    app_mocks.build_runtime_resolver.assert_called_once_with(settings_service)
+    app_mocks.build_runtime_resolver.assert_called_once_with(
+        settings_service, app_mocks.build_sonos_service.return_value
+    )
     runtime_resolver.resolve.assert_called_once_with(verbose=expected_config.verbose)
-    app_mocks.build_jukebox.assert_called_once_with(runtime_config)
+    app_mocks.build_jukebox.assert_called_once_with(runtime_config, app_mocks.build_sonos_service.return_value)
     app_mocks.controller_class.assert_called_once_with(
         reader=reader,
         handle_tag_event=handle_tag_event,
         sync_current_tag=sync_current_tag,
         loop_interval_seconds=loop_interval_seconds,
+        reader_mode=runtime_config.reader_mode,
+        event_queue_size=runtime_config.event_queue_size,
+        pacer=app_mocks.build_loop_pacer.return_value,
+        power_saver=app_mocks.build_reader_power_saver.return_value,
+        prefetch_disc=handle_tag_event.prefetch_disc,
+        player=handle_tag_event.player,
     )
+    app_mocks.build_loop_pacer.assert_called_once_with(runtime_config, reader.read_budget_seconds)
+    app_mocks.build_reader_power_saver.assert_called_once_with(runtime_config, reader)
     controller.run.assert_called_once()
 
 
@@ -1,7 +1,19 @@
-from unittest.mock import MagicMock, patch
-
-from jukebox.di_container import build_jukebox, build_settings_service
-from jukebox.pn532.profiles import SpiConnectionParams
+from unittest.mock import ANY, MagicMock, patch
+
+from jukebox.adapters.inbound.loop_pacer import AdaptiveLoopPacer, LoopPacer
+from jukebox.adapters.inbound.reader_power_saver import ReaderPowerSaver
+from jukebox.adapters.outbound.players.circuit_breaker_player_adapter import CircuitBreakerPlayerAdapter
+from jukebox.adapters.outbound.players.sonos_event_monitor import SonosEventMonitor
+from jukebox.adapters.outbound.players.sonos_session_pool import SonosHttpSessionPool
+from jukebox.di_container import (
+    build_async_jukebox,
+    build_jukebox,
+    build_loop_pacer,
+    build_reader_power_saver,
+    build_runtime_resolver,
+    build_settings_service,
+)
+from jukebox.pn532.profiles import Pn532TimingParams, SpiConnectionParams
 from jukebox.settings.entities import ResolvedJukeboxRuntimeConfig
 from jukebox.settings.file_settings_repository import FileSettingsRepository
 from jukebox.shared.config_utils import get_current_tag_path
@@ -21,7 +33,7 @@ def test_get_current_tag_path_derives_path_beside_library(tmp_path):
 class TestBuildJukebox:
     @patch("jukebox.di_container.SonosPlayerAdapter")
     @patch("jukebox.di_container.TextCurrentTagAdapter")
-    @patch("jukebox.di_container.JsonLibraryAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
     def test_build_jukebox_with_sonos_and_pn532(self, mock_library, mock_current_tag, mock_player, mocker):
         mock_pn532_instance = MagicMock()
         mock_pn532_class = MagicMock(return_value=mock_pn532_instance)
@@ -49,6 +61,10 @@ class TestBuildJukebox:
             loop_interval_seconds=0.1,
             pn532_read_timeout_seconds=0.25,
             pn532_board_profile="waveshare_hat",
+            pn532_detection_mode="auto_poll",
+            pn532_spi_max_speed_hz=4_000_000,
+            pn532_spi_transfer_mode="burst",
+            pn532_timing=Pn532TimingParams(write_delay_seconds=0.002, read_delay_seconds=0.001, cs_delay_seconds=0.0),
             pn532_connection=SpiConnectionParams(reset=20, cs=4, irq=None),
             verbose=False,
         )
@@ -61,22 +77,32 @@ class TestBuildJukebox:
             host="192.168.1.100",
             name=None,
             group=config.sonos_group,
+            play_strategy="standard",
+            session_pool=ANY,
+            event_monitor=None,
             sonos_playback_target_resolver=sonos_playback_target_resolver,
         )
+        assert isinstance(mock_player.call_args.kwargs["session_pool"], SonosHttpSessionPool)
         build_sonos_playback_target_resolver.assert_called_once_with()
         mock_pn532_class.assert_called_once_with(
             read_timeout_seconds=0.25,
+            detection_mode="auto_poll",
+            timing=Pn532TimingParams(write_delay_seconds=0.002, read_delay_seconds=0.001, cs_delay_seconds=0.0),
             spi_reset=20,
             spi_cs=4,
             spi_irq=None,
+            spi_max_speed_hz=4_000_000,
+            spi_transfer_mode="burst",
         )
         assert reader == mock_pn532_instance
-        assert handle_tag_event is not None
+        assert isinstance(handle_tag_event.player, CircuitBreakerPlayerAdapter)
+        assert handle_tag_event.player.player == mock_player.return_value
+        assert handle_tag_event.player.target_key == mock_player.return_value.target_key
 
     @patch("jukebox.di_container.SonosPlayerAdapter")
     @patch("jukebox.di_container.DryrunReaderAdapter")
     @patch("jukebox.di_container.TextCurrentTagAdapter")
-    @patch("jukebox.di_container.JsonLibraryAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
     def test_build_jukebox_with_sonos_name(self, mock_library, mock_current_tag, mock_reader, mock_player):
         config = ResolvedJukeboxRuntimeConfig(
             library_path="/test/library.json",
@@ -106,6 +132,9 @@ class TestBuildJukebox:
             host=None,
             name="Living Room",
             group=None,
+            play_strategy="standard",
+            session_pool=ANY,
+            event_monitor=None,
             sonos_playback_target_resolver=sonos_playback_target_resolver,
         )
         mock_reader.assert_called_once_with()
@@ -115,7 +144,7 @@ class TestBuildJukebox:
     @patch("jukebox.di_container.SonosPlayerAdapter")
     @patch("jukebox.di_container.DryrunReaderAdapter")
     @patch("jukebox.di_container.TextCurrentTagAdapter")
-    @patch("jukebox.di_container.JsonLibraryAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
     def test_build_jukebox_with_sonos_autodiscovery(self, mock_library, mock_current_tag, mock_reader, mock_player):
         config = ResolvedJukeboxRuntimeConfig(
             library_path="/test/library.json",
@@ -145,16 +174,43 @@ class TestBuildJukebox:
             host=None,
             name=None,
             group=None,
+            play_strategy="standard",
+            session_pool=ANY,
+            event_monitor=None,
             sonos_playback_target_resolver=sonos_playback_target_resolver,
         )
         mock_reader.assert_called_once_with()
         assert reader == mock_reader.return_value
         assert handle_tag_event is not None
 
+    @patch("jukebox.di_container.SonosPlayerAdapter")
+    @patch("jukebox.di_container.DryrunReaderAdapter")
+    @patch("jukebox.di_container.TextCurrentTagAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
+    def test_build_jukebox_with_sonos_event_subscription(
+        self, mock_library, mock_current_tag, mock_reader, mock_player
+    ):
+        config = ResolvedJukeboxRuntimeConfig(
+            library_path="/test/library.json",
+            player_type="sonos",
+            sonos_event_subscription="enabled",
+            reader_type="dryrun",
+            pause_duration_seconds=50,
+            pause_delay_seconds=3,
+            loop_interval_seconds=0.1,
+            pn532_read_timeout_seconds=0.25,
+            pn532_board_profile="waveshare_hat",
+            pn532_connection=SpiConnectionParams(reset=20, cs=4, irq=None),
+        )
+
+        build_jukebox(config, sonos_playback_target_resolver=MagicMock())
+
+        assert isinstance(mock_player.call_args.kwargs["event_monitor"], SonosEventMonitor)
+
     @patch("jukebox.di_container.DryrunPlayerAdapter")
     @patch("jukebox.di_container.DryrunReaderAdapter")
     @patch("jukebox.di_container.TextCurrentTagAdapter")
-    @patch("jukebox.di_container.JsonLibraryAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
     def test_build_jukebox_with_dryrun(self, mock_library, mock_current_tag, mock_reader, mock_player):
         config = ResolvedJukeboxRuntimeConfig(
             library_path="/test/library.json",
@@ -184,7 +240,7 @@ class TestBuildJukebox:
     @patch("jukebox.di_container.DryrunPlayerAdapter")
     @patch("jukebox.di_container.DryrunReaderAdapter")
     @patch("jukebox.di_container.TextCurrentTagAdapter")
-    @patch("jukebox.di_container.JsonLibraryAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
     def test_build_jukebox_passes_correct_parameters_to_transition_context(
         self, mock_library, mock_current_tag, mock_reader, mock_player
     ):
@@ -212,6 +268,108 @@ class TestBuildJukebox:
         assert handle_tag_event.ctx.max_pause_duration == 200
         assert handle_tag_event.ctx.retry_delays == PLAYBACK_RETRY_DELAYS_SECONDS
 
+    @patch("jukebox.di_container.DryrunPlayerAdapter")
+    @patch("jukebox.di_container.DryrunReaderAdapter")
+    @patch("jukebox.di_container.TextCurrentTagAdapter")
+    @patch("jukebox.adapters.outbound.library_repositories.JsonLibraryAdapter")
+    def test_build_async_jukebox_wraps_blocking_adapters(
+        self, mock_library, mock_current_tag, mock_reader, mock_player
+    ):
+        from jukebox.adapters.outbound.players.executor_player_adapter import ExecutorPlayerAdapter
+        from jukebox.adapters.outbound.readers.executor_reader_adapter import ExecutorReaderAdapter
+        from jukebox.domain.use_cases import AsyncHandleTagEvent
+
+        config = ResolvedJukeboxRuntimeConfig(
+            library_path="/test/library.json",
+            player_type="dryrun",
+            reader_type="dryrun",
+            pause_duration_seconds=200,
+            pause_delay_seconds=0.2,
+            loop_interval_seconds=0.1,
+            reader_mode="async",
+            pn532_read_timeout_seconds=0.1,
+            pn532_board_profile="waveshare_hat",
+            pn532_connection=SpiConnectionParams(reset=20, cs=4, irq=None),
+        )
+
+        reader, handle_tag_event, _sync_current_tag = build_async_jukebox(config)
+
+        assert isinstance(reader, ExecutorReaderAdapter)
+        assert reader.reader == mock_reader.return_value
+        assert isinstance(handle_tag_event, AsyncHandleTagEvent)
+        assert isinstance(handle_tag_event.player, ExecutorPlayerAdapter)
+        assert handle_tag_event.player.player == mock_player.return_value
+        assert handle_tag_event.library == mock_library.return_value
+        assert handle_tag_event.ctx.pause_delay == 0.2
+
+
+class TestBuildRuntimeHelpers:
+    def _config(self, **overrides):
+        overrides.setdefault("reader_type", "dryrun")
+        overrides.setdefault("player_type", "dryrun")
+        return ResolvedJukeboxRuntimeConfig(
+            library_path="/test/library.json",
+            pause_duration_seconds=200,
+            pause_delay_seconds=0.5,
+            loop_interval_seconds=0.1,
+            pn532_read_timeout_seconds=0.1,
+            pn532_board_profile="waveshare_hat",
+            pn532_connection=SpiConnectionParams(reset=20, cs=4, irq=None),
+            **overrides,
+        )
+
+    def test_build_loop_pacer_defaults_to_fixed_pacing(self):
+        pacer = build_loop_pacer(self._config(), reader_budget_seconds=0.1)
+
+        assert type(pacer) is LoopPacer
+        assert pacer.interval_seconds == 0.1
+        assert pacer.reader_budget_seconds == 0.1
+
+    def test_build_loop_pacer_builds_adaptive_pacer(self):
+        pacer = build_loop_pacer(
+            self._config(loop_pacing="adaptive", idle_loop_interval_seconds=2.0, idle_after_seconds=120.0),
+            reader_budget_seconds=0.15,
+        )
+
+        assert isinstance(pacer, AdaptiveLoopPacer)
+        assert pacer.loop_interval_seconds == 0.1
+        assert pacer.idle_loop_interval_seconds == 2.0
+        assert pacer.idle_after_seconds == 120.0
+        assert pacer.reader_budget_seconds == 0.15
+
+    def test_build_reader_power_saver_only_for_pn532_with_idle_period(self):
+        reader = MagicMock()
+
+        assert build_reader_power_saver(self._config(), reader) is None
+        assert build_reader_power_saver(self._config(pn532_power_down_after_seconds=300.0), reader) is None
+        assert build_reader_power_saver(self._config(reader_type="pn532"), reader) is None
+
+        power_saver = build_reader_power_saver(
+            self._config(reader_type="pn532", pn532_power_down_after_seconds=300.0), reader
+        )
+
+        assert isinstance(power_saver, ReaderPowerSaver)
+        assert power_saver.reader is reader
+
+    def test_build_reader_power_saver_skips_auto_poll_detection(self):
+        config = self._config(
+            reader_type="pn532", pn532_detection_mode="auto_poll", pn532_power_down_after_seconds=300.0
+        )
+
+        assert build_reader_power_saver(config, MagicMock()) is None
+
+    def test_runtime_resolver_and_player_share_the_given_sonos_service(self, mocker):
+        sonos_service = MagicMock()
+        mock_player = mocker.patch("jukebox.di_container.SonosPlayerAdapter")
+        build_sonos_playback_target_resolver = mocker.patch("jukebox.di_container.build_sonos_playback_target_resolver")
+
+        runtime_resolver = build_runtime_resolver(MagicMock(), sonos_service)
+        build_jukebox(self._config(player_type="sonos"), sonos_service)
+
+        assert runtime_resolver.sonos_service is sonos_service
+        assert mock_player.call_args.kwargs["sonos_playback_target_resolver"] is sonos_service
+        build_sonos_playback_target_resolver.assert_not_called()
+
 
 class TestBuildSettingService:
     def test_build_settings_service_maps_sonos_name_override(self):